@@ -1,11 +1,97 @@
 import os
+import sys
+import subprocess
+import json
+import hashlib
+import tempfile
+
+# 실행 결과 기록 (변경되어 쓴 파일 / 내용이 같아 건너뛴 파일)
+manifest = {'written': [], 'skipped': []}
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+# 이 스크립트가 쓴 파일의 첫 줄 (--spec 생성 파일도 이 문구로 시작)
+GENERATED_MARKER = '// 🔹 생성됨: python update_announcements.py'
 
 # 파일 생성 헬퍼 함수
+# - 생성 표시가 없는(이후 손으로 고친) 파일은 --force 없이는 덮어쓰지 않는다
+#   (스크립트 안의 내용은 작성 당시 기준이라 현재 소스를 되돌릴 수 있음)
+# - 디스크 내용과 해시가 같으면 쓰지 않는다 (nodemon/Vite 불필요한 재시작 방지)
+# - 임시 파일에 쓴 뒤 os.replace 로 교체해 watcher 가 반쯤 쓰인 파일을 읽지 않게 한다
 def create_file(path, content):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    if not content.startswith(GENERATED_MARKER):
+        content = f"{GENERATED_MARKER}\n{content}"
+    if os.path.exists(path) and '--force' not in sys.argv:
+        with open(path, encoding='utf-8') as f:
+            if not f.readline().startswith(GENERATED_MARKER):
+                manifest['skipped'].append({'path': path, 'reason': 'hand-written'})
+                print(f"Skipped (생성 파일 아님, --force 로 덮어쓰기): {path}")
+                return False
+
+    data = content.encode('utf-8')
+    digest = sha256(data)
+
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if sha256(f.read()) == digest:
+                manifest['skipped'].append({'path': path, 'sha256': digest})
+                print(f"Unchanged: {path}")
+                return False
+
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    # 같은 디렉터리에 만들어야 rename 이 원자적으로 동작
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        else:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    manifest['written'].append({'path': path, 'sha256': digest})
     print(f"Updated: {path}")
+    return True
+
+# --manifest <경로> 로 JSON 저장 (파일을 쓰기 전에 인자부터 확인)
+def manifest_path():
+    if '--manifest' not in sys.argv:
+        return None
+    args = sys.argv[sys.argv.index('--manifest') + 1:]
+    if not args or args[0].startswith('--'):
+        sys.exit("❌ 사용법: python update_announcements.py [--spec <명세.json>] --manifest <경로> [--force]")
+    return args[0]
+
+MANIFEST_PATH = manifest_path()
+
+# 결과 요약 후 종료: 손으로 고친 파일을 건너뛰어 아무것도 쓰지 않았으면 (--force 없이는) 실패로 끝낸다
+def write_manifest(success_message):
+    hand_written = [s for s in manifest['skipped'] if s.get('reason') == 'hand-written']
+    unchanged = len(manifest['skipped']) - len(hand_written)
+    print(
+        f"\n📋 written {len(manifest['written'])}, "
+        f"skipped {len(manifest['skipped'])} (hand-written {len(hand_written)}, unchanged {unchanged})"
+    )
+    if MANIFEST_PATH:
+        with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        print(f"Manifest: {MANIFEST_PATH}")
+
+    if not manifest['written'] and '--force' not in sys.argv:
+        sys.exit(
+            f"❌ 쓴 파일이 없습니다 (손으로 고친 파일 {len(hand_written)}개, 내용이 같은 파일 {unchanged}개). "
+            "덮어쓰려면 --force"
+        )
+    print(success_message)
 
 # 1. Backend Model: Post.ts (신고 구조 변경: ID 문자열 -> 객체)
 post_model = """import mongoose, { Document, Schema } from 'mongoose';
@@ -1285,6 +1371,463 @@ const Community = () => {
 export default Community
 """
 
+# 6. 명세 기반 생성 모드: --spec <명세.json>
+# 모델 명세(필드, 인덱스, 목록 필터, 카운터)로 Mongoose 모델 / 컨트롤러 / 라우터를 만든다.
+# 생성 코드는 기본으로
+# - 매장(storeId) 필드 + 목록 정렬/필터 인덱스 선언
+# - 목록: lean + 필드 프로젝션 + [정렬 값, _id] 커서 페이지 ({ items, nextCursor })
+# - 카운터: 문서를 읽지 않는 $inc 한 번
+# - 생성/수정: 명세에 있는 필드만 받음
+#
+# 명세 예시 (notice.spec.json)
+# {
+#   "name": "Notice",
+#   "fields": {
+#     "title": { "type": "String", "required": true },
+#     "category": { "type": "String", "enum": ["info", "event"], "default": "info" },
+#     "authorId": { "type": "String", "required": true },
+#     "tags": { "type": "[String]" }
+#   },
+#   "author": "authorId",
+#   "list": { "fields": ["title", "category"], "filters": ["category"], "sort": "createdAt" },
+#   "indexes": [{ "fields": { "tags": 1 } }],
+#   "counters": ["views"],
+#   "write": "author"
+# }
+# - route: /api 아래 경로 (기본: 이름 소문자 + s), plural: 함수 이름용 복수형 (기본: 이름 + s)
+# - write: owner(사장님만, 기본) | author(작성자 또는 사장님) | staff(로그인 사용자)
+# - list.pageSize: 기본 페이지 크기 (기본 20, 최대 50), cache: 목록 응답 캐시 (기본 true)
+# 손으로 고친 파일은 덮어쓰지 않는다 (생성 표시가 없으면 건너뜀, --force 로 강제)
+
+FIELD_TYPES = {
+    'String': ('String', 'string'),
+    'Number': ('Number', 'number'),
+    'Boolean': ('Boolean', 'boolean'),
+    'Date': ('Date', 'Date'),
+    'ObjectId': ('Schema.Types.ObjectId', 'Types.ObjectId'),
+    'Mixed': ('Schema.Types.Mixed', 'unknown'),
+}
+SORTABLE_TYPES = ('Date', 'Number')
+WRITE_MODES = ('owner', 'author', 'staff')
+SCAFFOLD_MARKER = '// 🔹 생성됨: python update_announcements.py --spec'
+
+
+class SpecError(Exception):
+    pass
+
+
+def ts_literal(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, str):
+        return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+    if isinstance(value, list):
+        return '[' + ', '.join(ts_literal(v) for v in value) + ']'
+    if value is None:
+        return 'null'
+    return json.dumps(value)
+
+
+def lower_first(name):
+    return name[:1].lower() + name[1:]
+
+
+def field_type(name, field):
+    raw = field.get('type', 'String')
+    is_array = raw.startswith('[') and raw.endswith(']')
+    base = raw[1:-1] if is_array else raw
+    if base not in FIELD_TYPES:
+        raise SpecError(f"{name}: 지원하지 않는 타입 {raw} ({', '.join(FIELD_TYPES)})")
+    return base, is_array
+
+
+def load_spec(path):
+    with open(path, encoding='utf-8') as f:
+        spec = json.load(f)
+
+    name = spec.get('name', '')
+    if not name.isidentifier() or not name[:1].isupper():
+        raise SpecError('name 은 대문자로 시작하는 식별자여야 합니다 (예: Notice)')
+    fields = spec.get('fields') or {}
+    if not fields:
+        raise SpecError('fields 가 비어 있습니다')
+    for key, field in fields.items():
+        if key in ('_id', 'storeId', 'createdAt', 'updatedAt'):
+            raise SpecError(f'{key}: 자동으로 추가되는 필드입니다')
+        field_type(key, field)
+
+    counters = spec.get('counters', [])
+    for key in counters:
+        if key in fields:
+            raise SpecError(f'{key}: 카운터는 fields 에 따로 적지 않습니다')
+
+    # 정렬/필터/프로젝션에 쓸 수 있는 필드 (타임스탬프 포함)
+    known = {**{k: field_type(k, f)[0] for k, f in fields.items()},
+             **{k: 'Number' for k in counters},
+             'createdAt': 'Date', 'updatedAt': 'Date'}
+
+    listing = spec.get('list') or {}
+    sort = listing.get('sort', 'createdAt')
+    if known.get(sort) not in SORTABLE_TYPES:
+        raise SpecError(f'list.sort: {sort} 는 Date/Number 필드여야 합니다')
+    for key in listing.get('filters', []) + listing.get('fields', []):
+        if key not in known:
+            raise SpecError(f'list: 알 수 없는 필드 {key}')
+
+    write = spec.get('write', 'owner')
+    if write not in WRITE_MODES:
+        raise SpecError(f"write: {' | '.join(WRITE_MODES)} 중 하나여야 합니다")
+    author = spec.get('author')
+    if author and author not in fields:
+        raise SpecError(f'author: fields 에 {author} 가 없습니다')
+    if write == 'author' and not author:
+        raise SpecError('write=author 에는 author 필드가 필요합니다')
+
+    for index in spec.get('indexes', []):
+        for key in index.get('fields', {}):
+            if key not in known and key not in ('storeId', '_id'):
+                raise SpecError(f'indexes: 알 수 없는 필드 {key}')
+
+    plural = spec.get('plural', name + 's')
+    return {
+        'name': name,
+        'plural': plural,
+        'route': spec.get('route', plural.lower()),
+        'fields': fields,
+        'counters': counters,
+        'sort': sort,
+        'sort_type': known[sort],
+        'filters': listing.get('filters', []),
+        'list_fields': listing.get('fields') or list(fields),
+        'page_size': min(max(int(listing.get('pageSize', 20)), 1), 50),
+        'indexes': spec.get('indexes', []),
+        'write': write,
+        'author': author,
+        'cache': spec.get('cache', True),
+        'source': os.path.basename(path),
+    }
+
+
+def render_model(spec):
+    name = spec['name']
+    lines = [
+        f"{SCAFFOLD_MARKER} {spec['source']}",
+        "import mongoose, { Schema, Document, Types, models, model } from 'mongoose'",
+        "import { storeIdField } from '../utils/tenant'",
+        '',
+        f'export interface I{name} extends Document {{',
+    ]
+    for key, field in spec['fields'].items():
+        base, is_array = field_type(key, field)
+        ts = ' | '.join(ts_literal(v) for v in field['enum']) if field.get('enum') else FIELD_TYPES[base][1]
+        if is_array:
+            ts = f'({ts})[]' if field.get('enum') else f'{ts}[]'
+        optional = '' if field.get('required') or is_array or 'default' in field else '?'
+        lines.append(f'  {key}{optional}: {ts}')
+    for key in spec['counters']:
+        lines.append(f'  {key}: number')
+    lines += ['  storeId: string', '  createdAt: Date', '  updatedAt: Date', '}', '']
+
+    lines += [f'const {name}Schema: Schema = new Schema(', '  {']
+    for key, field in spec['fields'].items():
+        base, is_array = field_type(key, field)
+        mongoose_type = FIELD_TYPES[base][0]
+        props = [f'type: [{mongoose_type}]' if is_array else f'type: {mongoose_type}']
+        if field.get('ref'):
+            props.append(f"ref: {ts_literal(field['ref'])}")
+        if field.get('required'):
+            props.append('required: true')
+        if field.get('enum'):
+            props.append(f"enum: {ts_literal(field['enum'])}")
+        if 'default' in field:
+            props.append(f"default: {ts_literal(field['default'])}")
+        lines.append(f"    {key}: {{ {', '.join(props)} }},")
+    for key in spec['counters']:
+        lines.append(f'    {key}: {{ type: Number, default: 0 }},')
+    lines += ['    storeId: storeIdField,', '  },', '  { timestamps: true }', ')', '']
+
+    # 목록 인덱스: 정렬 + _id (커서), 필터마다 필터 값 + 정렬
+    sort = spec['sort']
+    lines.append(f'// 목록 조회 ({sort} 내림차순 + _id 커서)')
+    lines.append(f'{name}Schema.index({{ storeId: 1, {sort}: -1, _id: -1 }})')
+    for key in spec['filters']:
+        lines.append(f'{name}Schema.index({{ storeId: 1, {key}: 1, {sort}: -1, _id: -1 }})')
+    for index in spec['indexes']:
+        keys = index['fields']
+        parts = [] if 'storeId' in keys else ['storeId: 1']
+        parts += [f'{k}: {ts_literal(v)}' for k, v in keys.items()]
+        options = [f'{k}: true' for k in ('unique', 'sparse') if index.get(k)]
+        suffix = f", {{ {', '.join(options)} }}" if options else ''
+        lines.append(f"{name}Schema.index({{ {', '.join(parts)} }}{suffix})")
+    lines += [
+        '',
+        f'export default (models.{name} as mongoose.Model<I{name}>) ||',
+        f"  model<I{name}>('{name}', {name}Schema)",
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+def render_controller(spec):
+    name, plural = spec['name'], spec['plural']
+    sort = spec['sort']
+    author = spec['author']
+    writable = [k for k in spec['fields'] if k != author]
+    projection = list(dict.fromkeys(spec['list_fields'] + [sort]))
+    if spec['sort_type'] == 'Date':
+        decode = ['    const value = new Date(raw)', '    if (isNaN(value.getTime())) return null']
+    else:
+        decode = ['    const value = Number(raw)', '    if (!Number.isFinite(value)) return null']
+
+    lines = [
+        f"{SCAFFOLD_MARKER} {spec['source']}",
+        "import { Request, Response } from 'express'",
+        "import mongoose from 'mongoose'",
+        f"import {name} from '../models/{name}'",
+        "import { logger } from '../utils/logger'",
+        '',
+        f"const PAGE_SIZE = {spec['page_size']}",
+        'const PAGE_MAX = 50',
+        '// 목록 응답 필드 (정렬 필드 포함: 커서에 사용)',
+        f"const LIST_PROJECTION = '{' '.join(projection)}'",
+        '// 생성/수정 시 받는 필드',
+        f'const WRITABLE = {ts_literal(writable)} as const',
+        f"const FILTERS = {ts_literal(spec['filters'])} as const",
+        '',
+        f'// 커서: 마지막 항목의 [{sort}, _id] (base64url)',
+        'const encodeCursor = (doc: any) =>',
+        f"  Buffer.from(JSON.stringify([doc.{sort}, String(doc._id)])).toString('base64url')",
+        '',
+        'const decodeCursor = (cursor: string) => {',
+        '  try {',
+        "    const [raw, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString())",
+        *decode,
+        '    if (!mongoose.Types.ObjectId.isValid(id)) return null',
+        '    return { value, id: new mongoose.Types.ObjectId(id) }',
+        '  } catch {',
+        '    return null',
+        '  }',
+        '}',
+        '',
+        'const pick = (body: any) =>',
+        '  Object.fromEntries(WRITABLE.filter((k) => body?.[k] !== undefined).map((k) => [k, body[k]]))',
+        '',
+        '// 잘못된 id/필터 값은 400',
+        'const fail = (res: Response, err: unknown, message: string) => {',
+        '  if (err instanceof mongoose.Error.CastError || err instanceof mongoose.Error.ValidationError) {',
+        "    return res.status(400).json({ message: '잘못된 요청입니다.' })",
+        '  }',
+        '  logger.error(message, { err })',
+        "  res.status(500).json({ message: '서버 오류' })",
+        '}',
+        '',
+    ]
+
+    # 작성자 모드: 사장님이 아니면 본인 문서만 (조건을 필터에 넣어 한 번에)
+    if spec['write'] == 'author':
+        lines += [
+            'const ownFilter = (req: Request) =>',
+            "  req.user?.role === 'owner'",
+            '    ? { _id: req.params.id }',
+            f'    : {{ _id: req.params.id, {author}: req.user?.userId }}',
+            '',
+        ]
+        target = 'ownFilter(req)'
+        missing = "'없거나 권한이 없습니다.'"
+    else:
+        target = '{ _id: req.params.id }'
+        missing = "'없음'"
+
+    lines += [
+        f"// 목록: ?{''.join(f + '=&' for f in spec['filters'])}limit=&cursor= → {{ items, nextCursor }}",
+        f'export const list{plural} = async (req: Request, res: Response) => {{',
+        '  try {',
+        '    const limit = Math.min(Math.max(Number(req.query.limit) || PAGE_SIZE, 1), PAGE_MAX)',
+        '    const query: any = {}',
+        '    for (const key of FILTERS) {',
+        '      const value = req.query[key]',
+        "      if (typeof value === 'string' && value !== '') query[key] = value",
+        '    }',
+        '    if (req.query.cursor) {',
+        '      const after = decodeCursor(String(req.query.cursor))',
+        "      if (!after) return res.status(400).json({ message: '잘못된 커서입니다.' })",
+        '      query.$or = [',
+        f'        {{ {sort}: {{ $lt: after.value }} }},',
+        f'        {{ {sort}: after.value, _id: {{ $lt: after.id }} }},',
+        '      ]',
+        '    }',
+        '',
+        '    // 한 건 더 읽어 다음 페이지 여부 판단',
+        f'    const docs = await {name}.find(query)',
+        '      .select(LIST_PROJECTION)',
+        f'      .sort({{ {sort}: -1, _id: -1 }})',
+        '      .limit(limit + 1)',
+        '      .lean()',
+        '    const hasMore = docs.length > limit',
+        '    const items = hasMore ? docs.slice(0, limit) : docs',
+        '    res.json({ items, nextCursor: hasMore ? encodeCursor(items[items.length - 1]) : null })',
+        '  } catch (err) {',
+        f"    fail(res, err, '{name} 목록 조회 실패')",
+        '  }',
+        '}',
+        '',
+        f'export const get{name} = async (req: Request, res: Response) => {{',
+        '  try {',
+        f'    const doc = await {name}.findById(req.params.id).lean()',
+        "    if (!doc) return res.status(404).json({ message: '없음' })",
+        '    res.json(doc)',
+        '  } catch (err) {',
+        f"    fail(res, err, '{name} 조회 실패')",
+        '  }',
+        '}',
+        '',
+        f'export const create{name} = async (req: Request, res: Response) => {{',
+        '  try {',
+    ]
+    if author:
+        lines.append(f'    const doc = await {name}.create({{ ...pick(req.body), {author}: req.user?.userId }})')
+    else:
+        lines.append(f'    const doc = await {name}.create(pick(req.body))')
+    lines += [
+        '    res.status(201).json(doc)',
+        '  } catch (err) {',
+        f"    fail(res, err, '{name} 생성 실패')",
+        '  }',
+        '}',
+        '',
+        f'export const update{name} = async (req: Request, res: Response) => {{',
+        '  try {',
+        f'    const doc = await {name}.findOneAndUpdate({target}, {{ $set: pick(req.body) }}, {{',
+        '      new: true,',
+        '      runValidators: true,',
+        '    }).lean()',
+        f'    if (!doc) return res.status(404).json({{ message: {missing} }})',
+        '    res.json(doc)',
+        '  } catch (err) {',
+        f"    fail(res, err, '{name} 수정 실패')",
+        '  }',
+        '}',
+        '',
+        f'export const delete{name} = async (req: Request, res: Response) => {{',
+        '  try {',
+        f'    const result = await {name}.deleteOne({target})',
+        f'    if (result.deletedCount === 0) return res.status(404).json({{ message: {missing} }})',
+        "    res.json({ message: '삭제 완료' })",
+        '  } catch (err) {',
+        f"    fail(res, err, '{name} 삭제 실패')",
+        '  }',
+        '}',
+        '',
+    ]
+    for key in spec['counters']:
+        handler = f'increase{name}{key[:1].upper()}{key[1:]}'
+        lines += [
+            f'// {key} +1 (문서를 읽지 않는 $inc 한 번)',
+            f'export const {handler} = async (req: Request, res: Response) => {{',
+            '  try {',
+            f'    const result = await {name}.updateOne({{ _id: req.params.id }}, {{ $inc: {{ {key}: 1 }} }})',
+            "    if (result.matchedCount === 0) return res.status(404).json({ message: '없음' })",
+            f"    res.json({{ message: '{key} 증가' }})",
+            '  } catch (err) {',
+            f"    fail(res, err, '{name} {key} 증가 실패')",
+            '  }',
+            '}',
+            '',
+        ]
+    return '\n'.join(lines)
+
+
+def render_routes(spec):
+    name, plural = spec['name'], spec['plural']
+    tag = spec['route']
+    counters = [(key, f'increase{name}{key[:1].upper()}{key[1:]}') for key in spec['counters']]
+    handlers = [f'list{plural}', f'get{name}', f'create{name}', f'update{name}', f'delete{name}']
+    handlers += [h for _, h in counters]
+    guard = 'auth, ownerOnly' if spec['write'] == 'owner' else 'auth'
+    middleware = ['auth', 'ownerOnly'] if spec['write'] == 'owner' else ['auth']
+    cache_imports = ['cacheResponse', 'invalidates'] if spec['cache'] else ['invalidates']
+
+    lines = [
+        f"{SCAFFOLD_MARKER} {spec['source']}",
+        "import { Router } from 'express'",
+        f"import {{ {', '.join(middleware)} }} from '../middleware/auth'",
+        f"import {{ {', '.join(cache_imports)} }} from '../middleware/responseCache'",
+        'import {',
+        *[f'  {h},' for h in handlers],
+        f"}} from '../controllers/{lower_first(name)}Controller'",
+        '',
+        'const router = Router()',
+        '',
+    ]
+    if spec['cache']:
+        lines.append(f"router.get('/', auth, cacheResponse({{ tags: ['{tag}'] }}), list{plural})")
+    else:
+        lines.append(f"router.get('/', auth, list{plural})")
+    lines.append(f"router.get('/:id', auth, get{name})")
+    for key, handler in counters:
+        lines.append(f'// {key} 는 캐시 TTL 동안 지연 반영 (증가마다 무효화하지 않음)')
+        lines.append(f"router.put('/:id/{key}', auth, {handler})")
+    lines += [
+        '',
+        f"router.post('/', {guard}, invalidates('{tag}'), create{name})",
+        f"router.put('/:id', {guard}, invalidates('{tag}'), update{name})",
+        f"router.delete('/:id', {guard}, invalidates('{tag}'), delete{name})",
+        '',
+        'export default router',
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+# 생성 표시가 없는(손으로 만든/고친) 파일은 --force 없이는 덮어쓰지 않는다
+def create_scaffold_file(path, content):
+    if os.path.exists(path) and '--force' not in sys.argv:
+        with open(path, encoding='utf-8') as f:
+            if not f.readline().startswith(SCAFFOLD_MARKER):
+                manifest['skipped'].append({'path': path, 'reason': 'hand-written'})
+                print(f"Skipped (생성 파일 아님, --force 로 덮어쓰기): {path}")
+                return False
+    return create_file(path, content)
+
+
+def scaffold(spec_path):
+    try:
+        spec = load_spec(spec_path)
+    except (OSError, ValueError, SpecError) as err:
+        sys.exit(f"❌ 명세 오류 ({spec_path}): {err}")
+
+    name = spec['name']
+    camel = lower_first(name)
+    create_scaffold_file(f'server/src/models/{name}.ts', render_model(spec))
+    create_scaffold_file(f'server/src/controllers/{camel}Controller.ts', render_controller(spec))
+    create_scaffold_file(f'server/src/routes/{camel}Routes.ts', render_routes(spec))
+    write_manifest(f"{name} scaffold generated.")
+
+    print("\n📌 server/src/app.ts 에 라우터 등록:")
+    print(f"  import {camel}Routes from './routes/{camel}Routes'")
+    print(f"  app.use('/api/{spec['route']}', {camel}Routes)")
+    print("📌 기존 데이터에 storeId 가 필요하면 scripts/migrateStoreId.ts 의 TENANT_MODELS 에 추가")
+
+
+if '--spec' in sys.argv:
+    spec_args = sys.argv[sys.argv.index('--spec') + 1:]
+    if not spec_args or spec_args[0].startswith('--'):
+        sys.exit("❌ 사용법: python update_announcements.py --spec <명세.json> [--force]")
+    scaffold(spec_args[0])
+    sys.exit(0)
+
+# 기존 문서의 reports(문자열 배열)를 객체 배열로 변환 (파일 생성 없이 마이그레이션만)
+# MONGO_URI 는 server/.env 에서 읽는다. 중단되면 같은 명령으로 체크포인트부터 이어서 실행된다.
+if '--migrate' in sys.argv:
+    print("🔹 Post.reports 마이그레이션 실행")
+    subprocess.run(
+        ['npx', 'ts-node', 'src/scripts/migratePostReports.ts'],
+        cwd='server',
+        check=True,
+        shell=os.name == 'nt',
+    )
+    sys.exit(0)
+
 # 파일 덮어쓰기 실행
 create_file('server/src/models/Post.ts', post_model)
 create_file('server/src/controllers/communityController.ts', community_controller)
@@ -1292,4 +1835,4 @@ create_file('server/src/routes/communityRoutes.ts', community_routes)
 create_file('src/pages/owner/BoardManagement.tsx', board_management)
 create_file('src/pages/common/Community.tsx', frontend_community)
 
-print("Board Statistics updated successfully!")
\ No newline at end of file
+write_manifest("Board Statistics updated successfully!")
\ No newline at end of file
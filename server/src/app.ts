@@ -0,0 +1,78 @@
+// 쿼리 계측 플러그인은 모델 컴파일 전에 등록되어야 한다
+import './utils/queryMetrics'
+import express from 'express'
+import cors from 'cors'
+import { scrapeMetrics } from './utils/clusterMetrics'
+import { httpMetrics } from './middleware/httpMetrics'
+import { requestId } from './middleware/requestId'
+import { compression } from './middleware/compression'
+import { isReady, readinessReport } from './utils/readiness'
+import { storeScope } from './middleware/tenant'
+
+import authRoutes from './routes/authRoutes'
+import staffRoutes from './routes/staffRoutes'
+import announcementRoutes from './routes/announcementRoutes'
+import communityRoutes from './routes/communityRoutes'
+import qrRoutes from './routes/qrRoutes'
+import productRoutes from './routes/productRoutes'
+import kioskRoutes from './routes/kioskRoutes'
+import analyticsRoutes from './routes/analyticsRoutes'
+import dashboardRoutes from './routes/dashboardRoutes'
+import scheduleRoutes from './routes/scheduleRoutes'
+import subRoutes from './routes/subRoutes'
+import handoverRoutes from './routes/handoverRoutes'
+
+const app = express()
+
+app.use(httpMetrics)
+app.use(requestId)
+app.use(compression)
+app.use(cors())
+app.use(express.json())
+
+// 🔹 상태 확인
+// healthz: 프로세스 생존 여부 (liveness)
+app.get('/healthz', (_req, res) => {
+  res.json({ status: 'ok', uptime: process.uptime() })
+})
+// readyz: Mongo 연결 + 인덱스 동기화 완료 후에만 200 (readiness)
+app.get('/readyz', (_req, res) => {
+  const report = readinessReport()
+  res.status(report.ready ? 200 : 503).json(report)
+})
+
+// 준비 전 API 요청은 버퍼링하지 않고 바로 503
+app.use('/api', (_req, res, next) => {
+  if (isReady()) return next()
+  res.setHeader('Retry-After', '5')
+  res.status(503).json({ message: '서버 준비 중입니다. 잠시 후 다시 시도해주세요.' })
+})
+
+// 요청 대상 매장 (인증 라우트는 auth 미들웨어가 토큰 기준으로 다시 정한다)
+app.use('/api', storeScope)
+
+// Routes
+app.use('/api/auth', authRoutes)
+app.use('/api/staff', staffRoutes)
+app.use('/api/announcements', announcementRoutes)
+app.use('/api/community', communityRoutes)
+app.use('/api/products', productRoutes)
+app.use('/api/kiosk', kioskRoutes)
+app.use('/api/analytics', analyticsRoutes)
+app.use('/api/dashboard', dashboardRoutes)
+app.use('/api/schedule', scheduleRoutes)
+app.use('/api/sub', subRoutes)
+app.use('/api/handovers', handoverRoutes)
+app.use('/api', qrRoutes)
+
+// Prometheus 수집용 메트릭 (METRICS_TOKEN 설정 시 Bearer 토큰 필요)
+// 클러스터 모드에서는 모든 워커 값을 worker 라벨로 구분해 함께 응답
+app.get('/metrics', async (req, res) => {
+  const token = process.env.METRICS_TOKEN
+  if (token && req.headers.authorization !== `Bearer ${token}`) {
+    return res.status(401).end()
+  }
+  res.type('text/plain; version=0.0.4').send(await scrapeMetrics())
+})
+
+export default app
@@ -0,0 +1,227 @@
+// 벤치마크/테스트 공용: 인메모리 MongoDB 기동 + 시드 데이터 + 앱 서버
+import '../utils/queryMetrics'
+import http from 'http'
+import { AddressInfo } from 'net'
+import mongoose from 'mongoose'
+import jwt from 'jsonwebtoken'
+import { MongoMemoryServer, MongoMemoryReplSet } from 'mongodb-memory-server'
+import dayjs from 'dayjs'
+import app from '../app'
+import { dbOptions, syncIndexes } from '../config/db'
+import User from '../models/User'
+import Product from '../models/Product'
+import Order from '../models/Order'
+import Post from '../models/Post'
+import Comment from '../models/Comment'
+import Announcement from '../models/Announcement'
+import Handover from '../models/Handover'
+import Schedule from '../models/Schedule'
+import Counter from '../models/Counter'
+import { createRandom } from '../utils/random'
+import { rebuildHourlySales } from '../services/salesRollup'
+import { rebuildSalesRollup } from '../services/reorderEngine'
+import { DEFAULT_STORE_ID } from '../utils/tenant'
+
+export { createRandom }
+
+export interface FixtureSizes {
+  products: number
+  orders: number
+  posts: number
+  commentsPerPost: number
+  staff: number
+  announcements: number
+  handovers: number
+}
+
+export const DEFAULT_SIZES: FixtureSizes = {
+  products: 300,
+  orders: 2000,
+  posts: 200,
+  commentsPerPost: 3,
+  staff: 8,
+  announcements: 30,
+  handovers: 40,
+}
+
+export interface Fixtures {
+  ownerId: string
+  staffIds: string[]
+  productIds: string[]
+  barcodes: string[]
+  postIds: string[]
+  ownerToken: string
+  staffToken: string
+}
+
+// replSet: change stream 이 필요한 경우 (단일 노드 레플리카셋)
+// monitorCommands: 드라이버 명령 이벤트(commandStarted 등) 수신 (queryBudget)
+export const startMemoryMongo = async ({ replSet = false, monitorCommands = false } = {}) => {
+  const server = replSet
+    ? await MongoMemoryReplSet.create({ replSet: { count: 1 } })
+    : await MongoMemoryServer.create()
+  const uri = server.getUri()
+
+  process.env.MONGO_URI = uri
+  process.env.JWT_SECRET = process.env.JWT_SECRET || 'bench-secret'
+  await mongoose.connect(uri, { ...dbOptions(), monitorCommands })
+  await syncIndexes() // /readyz 통과 (API 503 게이트 해제)
+
+  return {
+    uri,
+    stop: async () => {
+      await mongoose.disconnect()
+      await server.stop()
+    },
+  }
+}
+
+export const signToken = (
+  userId: string,
+  role: 'owner' | 'staff',
+  storeId = DEFAULT_STORE_ID,
+  staffIndex?: number
+) => jwt.sign({ userId, role, storeId, staffIndex }, process.env.JWT_SECRET!, { expiresIn: '1d' })
+
+const SEARCH_WORDS = ['재고', '청소', '야간', '손님', '발주', '폐기', '시재', '포스']
+
+export const seedFixtures = async (
+  sizes: FixtureSizes = DEFAULT_SIZES,
+  seed = 42
+): Promise<Fixtures> => {
+  const rand = createRandom(seed)
+
+  // 해시 비용은 벤치 대상이 아니므로 고정 문자열 사용
+  const owner = await User.create({
+    username: 'owner',
+    password: 'bench',
+    role: 'owner',
+    name: '점주',
+  })
+  const staff = await User.insertMany(
+    Array.from({ length: sizes.staff }, (_, i) => ({
+      username: `staff${i + 1}`,
+      password: 'bench',
+      role: 'staff',
+      name: `직원${i + 1}`,
+      phone: `010-0000-${String(i).padStart(4, '0')}`,
+      joinDate: new Date(),
+      status: '활성',
+      staffIndex: i,
+    }))
+  )
+  // 로그인 시 발급과 같은 상태로 (다음 직원 번호 = 직원 수)
+  await Counter.create({ name: 'staffIndex', seq: sizes.staff, storeId: DEFAULT_STORE_ID })
+  const staffIds = staff.map((s) => s._id.toString())
+
+  const categories = ['커피', '음료', '식품', '과자', '생활용품', '기타']
+  const products = await Product.insertMany(
+    Array.from({ length: sizes.products }, (_, i) => ({
+      name: `상품${i + 1}`,
+      category: rand.pick(categories),
+      stock: rand.int(1_000_000, 2_000_000), // 체크아웃 폭주 중 품절 방지
+      minStock: rand.int(3, 20),
+      price: rand.int(5, 50) * 100,
+      barcode: `88${String(i).padStart(8, '0')}`,
+      expiryDate: dayjs().add(rand.int(-2, 60), 'day').toDate(),
+    }))
+  )
+
+  const orders = Array.from({ length: sizes.orders }, (_, i) => {
+    const items = Array.from({ length: rand.int(1, 4) }, () => {
+      const p = rand.pick(products)
+      return {
+        productId: p._id,
+        productName: p.name,
+        price: p.price,
+        quantity: rand.int(1, 3),
+      }
+    })
+    return {
+      orderNumber: `BENCH-${i}`,
+      items,
+      totalAmount: items.reduce((acc, it) => acc + it.price * it.quantity, 0),
+      paymentMethod: rand.next() < 0.8 ? 'card' : 'cash',
+      createdAt: dayjs().subtract(rand.int(0, 60 * 24 * 90), 'minute').toDate(),
+    }
+  })
+  await Order.insertMany(orders)
+  // 분석/대시보드 시나리오는 주문 집계를 읽는다
+  await rebuildHourlySales(dayjs().subtract(91, 'day').toDate())
+  await rebuildSalesRollup(91)
+
+  const posts = await Post.insertMany(
+    Array.from({ length: sizes.posts }, (_, i) => ({
+      title: `${rand.pick(SEARCH_WORDS)} 관련 글 ${i + 1}`,
+      content: `${rand.pick(SEARCH_WORDS)} ${rand.pick(SEARCH_WORDS)} 공유합니다.`,
+      category: rand.next() < 0.6 ? 'tips' : 'suggestions',
+      authorId: rand.pick(staffIds),
+      authorName: `익명${rand.int(1, 999)}`,
+      views: rand.int(0, 200),
+      likes: staffIds.filter(() => rand.next() < 0.3),
+    }))
+  )
+  await Comment.insertMany(
+    posts.flatMap((p) =>
+      Array.from({ length: sizes.commentsPerPost }, () => ({
+        postId: p._id,
+        content: '좋은 정보 감사합니다',
+        authorId: rand.pick(staffIds),
+      }))
+    )
+  )
+
+  await Announcement.insertMany(
+    Array.from({ length: sizes.announcements }, (_, i) => ({
+      title: `공지 ${i + 1}`,
+      content: '매장 운영 공지입니다.',
+      important: rand.next() < 0.2,
+      likes: staffIds.filter(() => rand.next() < 0.5),
+    }))
+  )
+
+  await Handover.insertMany(
+    Array.from({ length: sizes.handovers }, () => ({
+      writer: rand.pick(staff)._id,
+      content: '인수인계 내용',
+      checklist: [{ item: '시재 점검', done: true }],
+      isImportant: rand.next() < 0.2,
+    }))
+  )
+
+  // 이번 주 스케줄
+  const weekStart = dayjs().startOf('week')
+  await Schedule.insertMany(
+    staff.flatMap((s, i) =>
+      Array.from({ length: 7 }, (_, d) => ({
+        staff: s._id,
+        date: weekStart.add(d, 'day').format('YYYY-MM-DD'),
+        startTime: `${String((i * 3) % 24).padStart(2, '0')}:00`,
+        endTime: `${String((i * 3 + 8) % 24).padStart(2, '0')}:00`,
+      }))
+    )
+  )
+
+  const ownerId = owner._id.toString()
+  return {
+    ownerId,
+    staffIds,
+    productIds: products.map((p) => p._id.toString()),
+    barcodes: products.map((p) => p.barcode),
+    postIds: posts.map((p) => p._id.toString()),
+    ownerToken: signToken(ownerId, 'owner'),
+    staffToken: signToken(staffIds[0], 'staff', DEFAULT_STORE_ID, 0),
+  }
+}
+
+// 앱을 임의 포트로 기동
+export const startServer = async () => {
+  const server = http.createServer(app)
+  await new Promise<void>((resolve) => server.listen(0, resolve))
+  const { port } = server.address() as AddressInfo
+
+  return {
+    baseUrl: `http://127.0.0.1:${port}/api`,
+    close: () => new Promise<void>((resolve) => server.close(() => resolve())),
+  }
+}
@@ -0,0 +1,105 @@
+// 수요 예측 커널 벤치: 상품 × 일 행렬 전체를 한 번에 계산하는 데 걸리는 시간
+//
+// 사용법:
+//   npm run bench:forecast -- --skus 10000 --days 365 --runs 5
+//
+// DB 없이 합성 판매 이력(요일 패턴 + 노이즈 + 일부 추세)을 만들어 forecastDemand 만 측정한다.
+// 비교용으로 상품별 객체 배열을 map/filter 로 처리하는 단순 구현도 함께 돌린다.
+import { forecastDemand, ForecastParams } from '../services/forecast'
+import { createRandom } from '../utils/random'
+
+const arg = (name: string, fallback: number) => {
+  const idx = process.argv.indexOf(`--${name}`)
+  return idx !== -1 ? Number(process.argv[idx + 1]) : fallback
+}
+
+const SKUS = arg('skus', 10_000)
+const DAYS = arg('days', 365)
+const RUNS = arg('runs', 5)
+const SEED = arg('seed', 42)
+
+const params: ForecastParams = { days: DAYS, startDow: 1, horizon: 9, leadTime: 2 }
+
+const synthesize = () => {
+  const rand = createRandom(SEED)
+  const sales = new Float64Array(SKUS * DAYS)
+  const weekly = [1.3, 0.8, 0.9, 0.9, 1.0, 1.2, 1.5] // 일~토
+  for (let s = 0; s < SKUS; s++) {
+    const base = rand.next() * 20
+    const slope = rand.next() < 0.1 ? (rand.next() - 0.5) / DAYS : 0
+    for (let t = 0; t < DAYS; t++) {
+      const mean = base * weekly[(params.startDow + t) % 7] * (1 + slope * t)
+      sales[s * DAYS + t] = Math.max(0, Math.round(mean + (rand.next() - 0.5) * mean))
+    }
+  }
+  return sales
+}
+
+// 📌 비교 기준: 상품마다 { dow, qty } 객체 배열을 만들어 요일별로 거르는 방식
+const naiveForecast = (sales: Float64Array) => {
+  const daily: number[] = []
+  for (let s = 0; s < SKUS; s++) {
+    const history = Array.from({ length: DAYS }, (_, t) => ({
+      dow: (params.startDow + t) % 7,
+      weeksAgo: Math.floor((DAYS - 1 - t) / 7),
+      qty: sales[s * DAYS + t],
+    }))
+    const dowAvg = [0, 1, 2, 3, 4, 5, 6].map((d) => {
+      const rows = history.filter((h) => h.dow === d)
+      const w = rows.map((h) => Math.pow(0.85, h.weeksAgo))
+      const sum = rows.reduce((acc, h, i) => acc + h.qty * w[i], 0)
+      const total = w.reduce((a, b) => a + b, 0)
+      return total > 0 ? sum / total : 0
+    })
+    let total = 0
+    for (let h = 0; h < params.horizon; h++) total += dowAvg[(params.startDow + DAYS + h) % 7]
+    daily.push(total / params.horizon)
+  }
+  return daily
+}
+
+const measure = (label: string, fn: () => unknown) => {
+  fn() // JIT 워밍업
+  const samples: number[] = []
+  for (let i = 0; i < RUNS; i++) {
+    const started = performance.now()
+    fn()
+    samples.push(performance.now() - started)
+  }
+  samples.sort((a, b) => a - b)
+  const median = samples[Math.floor(samples.length / 2)]
+  return {
+    impl: label,
+    medianMs: Math.round(median * 10) / 10,
+    minMs: Math.round(samples[0] * 10) / 10,
+    skusPerSec: Math.round(SKUS / (median / 1000)),
+  }
+}
+
+const main = () => {
+  const genStarted = performance.now()
+  const sales = synthesize()
+  const generateMs = Math.round(performance.now() - genStarted)
+
+  const results = [
+    measure('typed-array', () => forecastDemand(sales, SKUS, params)),
+    measure('naive', () => naiveForecast(sales)),
+  ]
+
+  process.stdout.write(
+    JSON.stringify(
+      {
+        node: process.version,
+        skus: SKUS,
+        days: DAYS,
+        matrixMB: Math.round((sales.byteLength / 1024 / 1024) * 10) / 10,
+        generateMs,
+        results,
+      },
+      null,
+      2
+    ) + '\n'
+  )
+}
+
+main()
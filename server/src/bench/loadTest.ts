@@ -0,0 +1,252 @@
+// 부하 테스트: 인메모리 MongoDB 위에서 시나리오별 처리량/지연시간(p50/p95/p99) 측정
+//
+// 사용법:
+//   npm run bench:load -- --duration 15 --concurrency 32 --scenario kiosk,dashboard
+//   npm run bench:load -- --out bench-result.json
+//
+// 결과는 JSON 으로 출력되며 커밋 간 비교를 위해 git 커밋 해시를 함께 기록한다.
+import { execSync } from 'child_process'
+import fs from 'fs'
+import os from 'os'
+import dayjs from 'dayjs'
+import {
+  createRandom,
+  DEFAULT_SIZES,
+  Fixtures,
+  seedFixtures,
+  startMemoryMongo,
+  startServer,
+} from './fixtures'
+
+interface Options {
+  duration: number // 초
+  concurrency: number
+  scenarios: string[]
+  seed: number
+  out?: string
+}
+
+interface RequestSpec {
+  method: 'GET' | 'POST' | 'PUT'
+  path: string
+  token?: string
+  body?: unknown
+}
+
+type Scenario = (
+  fx: Fixtures,
+  rand: ReturnType<typeof createRandom>,
+  iteration: number
+) => RequestSpec[]
+
+// 📌 시나리오 정의 (한 iteration = 가상 사용자 1회 행동)
+const scenarios: Record<string, Scenario> = {
+  // 키오스크 결제 폭주: 1~5개 상품 결제
+  kiosk: (fx, rand) => {
+    const items = Array.from({ length: rand.int(1, 5) }, () => {
+      const i = rand.int(0, fx.productIds.length - 1)
+      return {
+        productId: fx.productIds[i],
+        barcode: fx.barcodes[i],
+        name: `상품${i + 1}`,
+        price: 1000,
+        quantity: rand.int(1, 2),
+      }
+    })
+    return [
+      {
+        method: 'POST',
+        path: '/kiosk/checkout',
+        body: {
+          items,
+          totalAmount: items.reduce((a, it) => a + it.price * it.quantity, 0),
+          paymentMethod: 'card',
+        },
+      },
+    ]
+  },
+
+  // 점주 대시보드 새로고침 루프
+  dashboard: (fx) => [
+    { method: 'GET', path: '/dashboard/summary', token: fx.ownerToken },
+    { method: 'GET', path: '/analytics/dashboard', token: fx.ownerToken },
+    { method: 'GET', path: '/staff/list', token: fx.ownerToken },
+    { method: 'GET', path: '/announcements/list', token: fx.ownerToken },
+  ],
+
+  // 커뮤니티 목록/검색/상세
+  community: (fx, rand) => {
+    const words = ['재고', '청소', '야간', '발주', '']
+    const search = encodeURIComponent(rand.pick(words))
+    const category = rand.next() < 0.5 ? 'tips' : 'suggestions'
+    return [
+      {
+        method: 'GET',
+        path: `/community/posts?category=${category}&search=${search}`,
+        token: fx.staffToken,
+      },
+      {
+        method: 'GET',
+        path: `/community/posts/${rand.pick(fx.postIds)}`,
+        token: fx.staffToken,
+      },
+    ]
+  },
+
+  // 반복 스케줄 등록 (4주, 주 5일)
+  schedule: (fx, rand, iteration) => {
+    const start = dayjs().add(30 + (iteration % 300) * 7, 'day')
+    return [
+      {
+        method: 'POST',
+        path: '/schedule/template',
+        token: fx.ownerToken,
+        body: {
+          staffId: rand.pick(fx.staffIds),
+          startDate: start.format('YYYY-MM-DD'),
+          endDate: start.add(27, 'day').format('YYYY-MM-DD'),
+          days: [1, 2, 3, 4, 5],
+          startTime: '09:00',
+          endTime: '18:00',
+        },
+      },
+    ]
+  },
+}
+
+const parseArgs = (argv: string[]): Options => {
+  const get = (name: string) => {
+    const idx = argv.indexOf(`--${name}`)
+    return idx !== -1 ? argv[idx + 1] : undefined
+  }
+  return {
+    duration: Number(get('duration')) || 10,
+    concurrency: Number(get('concurrency')) || 16,
+    scenarios: (get('scenario') ?? Object.keys(scenarios).join(','))
+      .split(',')
+      .filter((s) => s in scenarios),
+    seed: Number(get('seed')) || 42,
+    out: get('out'),
+  }
+}
+
+const percentile = (sorted: number[], p: number) =>
+  sorted.length === 0
+    ? 0
+    : sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)]
+
+const round = (n: number) => Math.round(n * 100) / 100
+
+const send = async (baseUrl: string, spec: RequestSpec) => {
+  const res = await fetch(baseUrl + spec.path, {
+    method: spec.method,
+    headers: {
+      'Content-Type': 'application/json',
+      ...(spec.token ? { Authorization: `Bearer ${spec.token}` } : {}),
+    },
+    body: spec.body ? JSON.stringify(spec.body) : undefined,
+  })
+  await res.arrayBuffer() // 본문까지 수신해야 전체 응답 시간
+  return res.status
+}
+
+const runScenario = async (
+  name: string,
+  baseUrl: string,
+  fx: Fixtures,
+  opts: Options
+) => {
+  const scenario = scenarios[name]
+  const latencies: number[] = []
+  const statuses: Record<string, number> = {}
+  let errors = 0
+  let iteration = 0
+
+  const began = performance.now()
+  const deadline = began + opts.duration * 1000
+
+  const worker = async (id: number) => {
+    const rand = createRandom(opts.seed + id)
+    while (performance.now() < deadline) {
+      for (const spec of scenario(fx, rand, iteration++)) {
+        const t0 = performance.now()
+        try {
+          const status = await send(baseUrl, spec)
+          statuses[status] = (statuses[status] ?? 0) + 1
+          if (status >= 400) errors++
+        } catch {
+          errors++
+        }
+        latencies.push(performance.now() - t0)
+      }
+    }
+  }
+
+  await Promise.all(
+    Array.from({ length: opts.concurrency }, (_, i) => worker(i))
+  )
+
+  const elapsed = (performance.now() - began) / 1000
+  latencies.sort((a, b) => a - b)
+  const mean = latencies.reduce((a, b) => a + b, 0) / (latencies.length || 1)
+
+  return {
+    requests: latencies.length,
+    errors,
+    statuses,
+    durationSec: round(elapsed),
+    throughputRps: round(latencies.length / elapsed),
+    latencyMs: {
+      mean: round(mean),
+      p50: round(percentile(latencies, 50)),
+      p95: round(percentile(latencies, 95)),
+      p99: round(percentile(latencies, 99)),
+      max: round(latencies[latencies.length - 1] ?? 0),
+    },
+  }
+}
+
+const gitCommit = () => {
+  try {
+    return execSync('git rev-parse --short HEAD', { stdio: ['ignore', 'pipe', 'ignore'] })
+      .toString()
+      .trim()
+  } catch {
+    return 'unknown'
+  }
+}
+
+const main = async () => {
+  const opts = parseArgs(process.argv.slice(2))
+  const mongo = await startMemoryMongo()
+  const fx = await seedFixtures(DEFAULT_SIZES, opts.seed)
+  const server = await startServer()
+
+  const results: Record<string, unknown> = {}
+  try {
+    for (const name of opts.scenarios) {
+      results[name] = await runScenario(name, server.baseUrl, fx, opts)
+    }
+  } finally {
+    await server.close()
+    await mongo.stop()
+  }
+
+  const report = {
+    commit: gitCommit(),
+    timestamp: new Date().toISOString(),
+    node: process.version,
+    cpus: os.cpus().length,
+    options: { ...opts, sizes: DEFAULT_SIZES },
+    scenarios: results,
+  }
+
+  const json = JSON.stringify(report, null, 2)
+  if (opts.out) fs.writeFileSync(opts.out, json)
+  process.stdout.write(json + '\n')
+}
+
+main().catch((err) => {
+  console.error(err)
+  process.exit(1)
+})
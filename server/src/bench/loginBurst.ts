@@ -0,0 +1,75 @@
+// 로그인 폭주 시 이벤트 루프 지연 측정: 메인 스레드 bcrypt vs worker_threads 풀
+//
+// 사용법:
+//   npm run bench:login -- --logins 200 --concurrency 50
+//
+// bcrypt.compare 가 돌아가는 동안 같은 프로세스의 다른 요청(키오스크 결제 등)이
+// 얼마나 밀리는지를 monitorEventLoopDelay 로 측정한다.
+import bcrypt from 'bcryptjs'
+import { monitorEventLoopDelay } from 'perf_hooks'
+import { closePasswordPool, comparePassword } from '../utils/passwordPool'
+
+const arg = (name: string, fallback: number) => {
+  const idx = process.argv.indexOf(`--${name}`)
+  return idx !== -1 ? Number(process.argv[idx + 1]) : fallback
+}
+
+const LOGINS = arg('logins', 200)
+const CONCURRENCY = arg('concurrency', 50)
+const ms = (ns: number) => Math.round((ns / 1e6) * 100) / 100
+
+const burst = async (
+  label: string,
+  compare: (password: string, hash: string) => Promise<boolean>,
+  hash: string
+) => {
+  const lag = monitorEventLoopDelay({ resolution: 1 })
+  let next = 0
+  const started = performance.now()
+  lag.enable()
+
+  await Promise.all(
+    Array.from({ length: CONCURRENCY }, async () => {
+      while (next < LOGINS) {
+        next++
+        await compare('1234', hash)
+      }
+    })
+  )
+
+  lag.disable()
+  const sec = (performance.now() - started) / 1000
+  return {
+    mode: label,
+    logins: LOGINS,
+    durationSec: Math.round(sec * 100) / 100,
+    loginsPerSec: Math.round(LOGINS / sec),
+    eventLoopLagMs: {
+      mean: ms(lag.mean),
+      p50: ms(lag.percentile(50)),
+      p99: ms(lag.percentile(99)),
+      max: ms(lag.max),
+    },
+  }
+}
+
+const main = async () => {
+  const hash = await bcrypt.hash('1234', 10)
+  // 워커 기동 비용은 측정에서 제외
+  await comparePassword('warmup', hash)
+
+  const results = [
+    await burst('inline', (p, h) => bcrypt.compare(p, h), hash),
+    await burst('pool', comparePassword, hash),
+  ]
+  await closePasswordPool()
+
+  process.stdout.write(
+    JSON.stringify({ node: process.version, concurrency: CONCURRENCY, results }, null, 2) + '\n'
+  )
+}
+
+main().catch((err) => {
+  console.error(err)
+  process.exit(1)
+})
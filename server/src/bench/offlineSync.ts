@@ -0,0 +1,100 @@
+// 키오스크 오프라인 판매 일괄 동기화 검증: 잘못된 판매가 섞여도 나머지 판매는 저장되는지
+//
+// 사용법:
+//   npm run bench:offline-sync
+//
+// 1) 정상 판매 + 형식이 잘못된 판매(항목 null, 수량 없음, 상품 단서 없음 등)를 한 배치로 전송
+//    → 정상 판매는 created, 잘못된 판매는 rejected, 잘못된 판매의 수신 기록은 없음
+// 2) 같은 배치 재전송 → 정상 판매는 duplicate (같은 주문번호), 잘못된 판매는 다시 rejected
+// 기대와 다르면 종료 코드 1
+import { seedFixtures, startMemoryMongo, startServer } from './fixtures'
+import CheckoutReceipt from '../models/CheckoutReceipt'
+import Order from '../models/Order'
+
+const item = (productId: string) => ({ productId, name: '상품', price: 1000, quantity: 1 })
+
+const sale = (key: string, items: unknown[]) => ({
+  idempotencyKey: key,
+  items,
+  totalAmount: 1000,
+  paymentMethod: 'card',
+  soldAt: new Date().toISOString(),
+})
+
+const post = async (baseUrl: string, sales: unknown[]) => {
+  const res = await fetch(`${baseUrl}/kiosk/checkout/batch`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ sales }),
+  })
+  const body: any = await res.json()
+  return { status: res.status, results: (body.results ?? []) as any[] }
+}
+
+const main = async () => {
+  const mongo = await startMemoryMongo()
+  try {
+    const fx = await seedFixtures()
+    const server = await startServer()
+
+    const good = [
+      sale('good-sale-0001', [item(fx.productIds[0])]),
+      sale('good-sale-0002', [{ barcode: fx.barcodes[1], quantity: 2 }]),
+    ]
+    const bad = [
+      sale('bad-null-item', [item(fx.productIds[0]), null]),
+      sale('bad-string-item', ['콜라']),
+      sale('bad-no-quantity', [{ productId: fx.productIds[0] }]),
+      sale('bad-zero-quantity', [{ productId: fx.productIds[0], quantity: 0 }]),
+      sale('bad-nan-quantity', [{ productId: fx.productIds[0], quantity: 'many' }]),
+      sale('bad-no-product', [{ name: '상품', quantity: 1 }]),
+    ]
+    const batch = [good[0], ...bad.slice(0, 3), good[1], ...bad.slice(3)]
+
+    const first = await post(server.baseUrl, batch)
+    const second = await post(server.baseUrl, batch)
+    await server.close()
+
+    const goodKeys = new Set(good.map((s) => s.idempotencyKey))
+    const failures: string[] = []
+    for (const [name, round, expectGood] of [
+      ['first', first, 'created'],
+      ['resend', second, 'duplicate'],
+    ] as const) {
+      if (round.status !== 200) failures.push(`${name}: HTTP ${round.status}`)
+      for (const r of round.results) {
+        const want = goodKeys.has(r.idempotencyKey) ? expectGood : 'rejected'
+        if (r.status !== want) failures.push(`${name}: ${r.idempotencyKey} ${r.status} (기대 ${want})`)
+      }
+    }
+    const orderNumbers = (round: typeof first) =>
+      round.results
+        .filter((r) => goodKeys.has(r.idempotencyKey))
+        .map((r) => r.orderNumber)
+        .join(',')
+    if (orderNumbers(first) !== orderNumbers(second)) failures.push('재전송 주문번호가 다름')
+
+    const [receipts, badReceipts, orders] = await Promise.all([
+      CheckoutReceipt.countDocuments({ key: { $in: [...goodKeys] }, status: 'committed' }),
+      CheckoutReceipt.countDocuments({ key: { $in: bad.map((s) => s.idempotencyKey) } }),
+      Order.countDocuments({
+        orderNumber: { $in: first.results.map((r) => r.orderNumber).filter(Boolean) },
+      }),
+    ])
+    if (receipts !== good.length) failures.push(`확정된 수신 기록 ${receipts}건 (기대 ${good.length})`)
+    if (badReceipts !== 0) failures.push(`잘못된 판매의 수신 기록 ${badReceipts}건`)
+    if (orders !== good.length) failures.push(`저장된 주문 ${orders}건 (기대 ${good.length})`)
+
+    process.stdout.write(
+      JSON.stringify({ batch: batch.length, first: first.results, failures }, null, 2) + '\n'
+    )
+    if (failures.length > 0) process.exitCode = 1
+  } finally {
+    await mongo.stop()
+  }
+}
+
+main().catch((err) => {
+  console.error(err)
+  process.exit(1)
+})
@@ -0,0 +1,149 @@
+// 주문 저장 방식 비교: 일반 컬렉션 vs time-series 컬렉션 vs 시간당 집계
+//
+// 사용법:
+//   npm run bench:orders -- --orders 5000000 --days 365 --runs 5
+//
+// 같은 합성 주문을 두 컬렉션에 넣고 저장 용량(데이터/인덱스)과
+// 분석 페이지와 같은 형태의 기간 집계 쿼리 시간을 측정한다.
+import mongoose from 'mongoose'
+import dayjs from 'dayjs'
+import { startMemoryMongo } from './fixtures'
+import Order from '../models/Order'
+import SalesHourly from '../models/SalesHourly'
+import {
+  generateOrders,
+  generateProducts,
+  ProductSeed,
+  withStore,
+} from '../scripts/generateDataset'
+import { storageFootprint } from '../scripts/migrateOrdersTimeseries'
+import { rebuildHourlySales, STORE_TZ } from '../services/salesRollup'
+import { createRandom } from '../utils/random'
+import { DEFAULT_STORE_ID } from '../utils/tenant'
+
+const arg = (name: string, fallback: number) => {
+  const idx = process.argv.indexOf(`--${name}`)
+  return idx !== -1 ? Number(process.argv[idx + 1]) : fallback
+}
+
+const ORDERS = arg('orders', 5_000_000)
+const DAYS = arg('days', 365)
+const RUNS = arg('runs', 5)
+const BATCH = 10_000
+const PLAIN = 'orders_plain'
+
+const ms = (n: number) => Math.round(n * 10) / 10
+
+const load = async () => {
+  const rand = createRandom(arg('seed', 42))
+  const products: ProductSeed[] = []
+  for (const p of generateProducts(1500, rand)) {
+    products.push({ ...p, popularity: 1 / (products.length + 1) })
+  }
+
+  // 기존 스키마와 같은 인덱스 구성 (orderNumber unique + createdAt 범위 조회)
+  const plain = mongoose.connection.db!.collection(PLAIN)
+  await plain.createIndex({ orderNumber: 1 }, { unique: true })
+  await plain.createIndex({ createdAt: 1 })
+
+  const insertMs = { plain: 0, timeseries: 0 }
+  let batch: any[] = []
+  const flush = async () => {
+    if (batch.length === 0) return
+    let t = performance.now()
+    await plain.insertMany(batch.map((d) => ({ ...d })), { ordered: false })
+    insertMs.plain += performance.now() - t
+    t = performance.now()
+    await Order.collection.insertMany(batch, { ordered: false })
+    insertMs.timeseries += performance.now() - t
+    batch = []
+  }
+  for (const doc of withStore(generateOrders(ORDERS, DAYS, products, rand), DEFAULT_STORE_ID)) {
+    batch.push(doc)
+    if (batch.length >= BATCH) await flush()
+  }
+  await flush()
+  return { plainMs: Math.round(insertMs.plain), timeseriesMs: Math.round(insertMs.timeseries) }
+}
+
+// 최근 30일 일별 매출 (분석 페이지 주간/월간 집계와 같은 형태)
+const rawDaily = (collection: string, since: Date) =>
+  mongoose.connection
+    .db!.collection(collection)
+    .aggregate([
+      { $match: { createdAt: { $gte: since } } },
+      {
+        $group: {
+          _id: { $dateToString: { format: '%Y-%m-%d', date: '$createdAt', timezone: STORE_TZ } },
+          sales: { $sum: '$totalAmount' },
+        },
+      },
+    ])
+    .toArray()
+
+const rollupDaily = (since: Date) =>
+  SalesHourly.aggregate([
+    { $match: { hour: { $gte: since } } },
+    {
+      $group: {
+        _id: { $dateToString: { format: '%Y-%m-%d', date: '$hour', timezone: STORE_TZ } },
+        sales: { $sum: '$revenue' },
+      },
+    },
+  ])
+
+const measure = async (label: string, fn: () => Promise<unknown>) => {
+  await fn() // 캐시 워밍업
+  const samples: number[] = []
+  for (let i = 0; i < RUNS; i++) {
+    const started = performance.now()
+    await fn()
+    samples.push(performance.now() - started)
+  }
+  samples.sort((a, b) => a - b)
+  return { query: label, medianMs: ms(samples[Math.floor(samples.length / 2)]), minMs: ms(samples[0]) }
+}
+
+const main = async () => {
+  const mongo = await startMemoryMongo()
+  try {
+    console.error(`🔹 주문 ${ORDERS.toLocaleString()}건 생성/적재 중...`)
+    const insert = await load()
+
+    const rollupStarted = performance.now()
+    await rebuildHourlySales(dayjs().subtract(DAYS + 1, 'day').toDate())
+    const rollupMs = Math.round(performance.now() - rollupStarted)
+
+    const last30 = dayjs().subtract(30, 'day').toDate()
+    const year = dayjs().subtract(DAYS, 'day').toDate()
+    const queries = [
+      await measure('30d daily / plain', () => rawDaily(PLAIN, last30)),
+      await measure('30d daily / timeseries', () => rawDaily(Order.collection.collectionName, last30)),
+      await measure('30d daily / rollup', () => rollupDaily(last30)),
+      await measure('1y daily / plain', () => rawDaily(PLAIN, year)),
+      await measure('1y daily / timeseries', () => rawDaily(Order.collection.collectionName, year)),
+      await measure('1y daily / rollup', () => rollupDaily(year)),
+    ]
+
+    const storage = [
+      await storageFootprint(PLAIN),
+      await storageFootprint(Order.collection.collectionName),
+      await storageFootprint(SalesHourly.collection.collectionName),
+    ]
+
+    process.stdout.write(
+      JSON.stringify(
+        { node: process.version, orders: ORDERS, days: DAYS, insert, rollupMs, storage, queries },
+        null,
+        2
+      ) + '\n'
+    )
+  } finally {
+    await mongo.stop()
+  }
+}
+
+main().catch((err) => {
+  console.error(err)
+  process.exit(1)
+})
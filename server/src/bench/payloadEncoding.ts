@@ -0,0 +1,100 @@
+// 대용량 목록 응답 인코딩 비교: JSON vs MessagePack × 무압축/gzip/brotli
+//
+// 사용법:
+//   npm run bench:payload -- --products 10000 --runs 20
+//
+// GET /api/products 와 같은 필드의 합성 상품 목록을 만들어
+// - 전송 바이트 (압축 미들웨어와 같은 설정: gzip 기본 레벨, brotli COMPRESSION_BROTLI_QUALITY)
+// - 서버 직렬화 시간, 압축 시간
+// - 클라이언트 파싱 시간 (JSON.parse vs src/lib/msgpack.ts 와 같은 디코더)
+// 을 측정한다. DB 없이 동작한다.
+import zlib from 'zlib'
+import { performance } from 'perf_hooks'
+import { generateProducts } from '../scripts/generateDataset'
+import { serializeProductList } from '../dto/productDto'
+import { decodeMsgpack } from '../utils/msgpack'
+import { createRandom } from '../utils/random'
+
+const arg = (name: string, fallback: number) => {
+  const idx = process.argv.indexOf(`--${name}`)
+  return idx !== -1 ? Number(process.argv[idx + 1]) : fallback
+}
+
+const PRODUCTS = arg('products', 10_000)
+const RUNS = arg('runs', 20)
+const BROTLI_QUALITY = Number(process.env.COMPRESSION_BROTLI_QUALITY ?? 4)
+
+// 여러 번 실행한 중앙값 (ms)
+const median = (fn: () => unknown) => {
+  const times: number[] = []
+  for (let i = 0; i < RUNS; i++) {
+    const start = performance.now()
+    fn()
+    times.push(performance.now() - start)
+  }
+  times.sort((a, b) => a - b)
+  return times[Math.floor(times.length / 2)]
+}
+
+const codings = {
+  identity: (buf: Buffer) => buf,
+  gzip: (buf: Buffer) => zlib.gzipSync(buf),
+  br: (buf: Buffer) =>
+    zlib.brotliCompressSync(buf, {
+      params: { [zlib.constants.BROTLI_PARAM_QUALITY]: BROTLI_QUALITY },
+    }),
+}
+
+const kb = (n: number) => `${(n / 1024).toFixed(1)} KB`
+
+const main = () => {
+  const createdAt = new Date()
+  const products = [...generateProducts(PRODUCTS, createRandom(42))].map((p) => ({
+    ...p,
+    createdAt,
+  }))
+
+  const json = Buffer.from(serializeProductList(products))
+  const msgpack = serializeProductList.msgpack(products)
+
+  // 두 형식이 클라이언트에서 같은 값으로 풀리는지 확인
+  if (JSON.stringify(decodeMsgpack(msgpack)) !== JSON.stringify(JSON.parse(json.toString()))) {
+    console.error('❌ msgpack 디코딩 결과가 JSON 과 다름')
+    process.exit(1)
+  }
+
+  const formats = [
+    {
+      format: 'json',
+      body: json,
+      encodeMs: median(() => serializeProductList(products)),
+      parseMs: median(() => JSON.parse(json.toString())),
+    },
+    {
+      format: 'msgpack',
+      body: msgpack,
+      encodeMs: median(() => serializeProductList.msgpack(products)),
+      parseMs: median(() => decodeMsgpack(msgpack)),
+    },
+  ]
+
+  const rows = formats.flatMap(({ format, body, encodeMs, parseMs }) =>
+    Object.entries(codings).map(([coding, compress]) => {
+      const wire = compress(body)
+      return {
+        format,
+        coding,
+        bytes: kb(wire.length),
+        ratio: `${((wire.length / json.length) * 100).toFixed(1)}%`,
+        'encode ms': encodeMs.toFixed(2),
+        'compress ms': coding === 'identity' ? '-' : median(() => compress(body)).toFixed(2),
+        'parse ms': parseMs.toFixed(2),
+      }
+    })
+  )
+
+  console.log(`상품 ${PRODUCTS.toLocaleString()}개, ${RUNS}회 중앙값 (ratio 는 무압축 JSON 대비)`)
+  console.table(rows)
+}
+
+main()
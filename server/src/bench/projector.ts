@@ -0,0 +1,251 @@
+// 변경 스트림 프로젝터 검증: 인메모리 레플리카셋에서 파생 컬렉션이 원본과 일치하는지
+//
+// 사용법:
+//   npm run bench:projector -- --ops 500 --rounds 3
+//
+// 1) 시드 후 프로젝터 기동 → 전체 재계산 완료 대기
+// 2) 라운드마다 원본에 무작위 쓰기(생성/수정/삭제) → 반영 지연 측정 → 원본에서 다시 계산한 값과 비교
+// 3) 라운드 사이에 프로젝터를 멈췄다가(크래시 대신) 그동안 쓰기 후 재기동 → resume token 으로 이어받는지 확인
+// 4) 최근 24시간 커뮤니티 활동: 버킷 합계(첫 시간 보정 포함)가 원본 countDocuments 와 같은지
+// 불일치가 있으면 종료 코드 1
+import dayjs from 'dayjs'
+import { seedFixtures, startMemoryMongo, createRandom } from './fixtures'
+import Post from '../models/Post'
+import Comment from '../models/Comment'
+import Product from '../models/Product'
+import Schedule from '../models/Schedule'
+import ProjectorCheckpoint from '../models/ProjectorCheckpoint'
+import { PROJECTIONS, communityActivitySince } from '../services/projections'
+import { projectionReady, startProjector } from '../services/projector'
+
+const arg = (name: string, fallback: number) => {
+  const idx = process.argv.indexOf(`--${name}`)
+  return idx !== -1 ? Number(process.argv[idx + 1]) : fallback
+}
+
+const OPS = arg('ops', 500)
+const ROUNDS = arg('rounds', 3)
+const TIMEOUT = 30_000
+
+// 파생 문서 키 필드
+const KEY_FIELDS: Record<string, string[]> = {
+  CommunityActivityHourly: ['storeId', 'hour'],
+  StockSummary: ['storeId'],
+  StaffWeeklyHours: ['storeId', 'week', 'staff'],
+}
+
+const keyOf = (target: string, doc: any) =>
+  `${target}|${JSON.stringify(Object.fromEntries(KEY_FIELDS[target].map((k) => [k, doc[k]])))}`
+
+// 원본 전체에서 다시 계산한 기대값 (프로젝터와 같은 entries 함수, 원장/증분 경로 없이)
+const expected = async () => {
+  const totals = new Map<string, Record<string, number>>()
+  for (const p of PROJECTIONS) {
+    for (const source of p.sources) {
+      const collection = source.model.collection.collectionName
+      const docs = await source.model.find(source.rebuildFilter?.() ?? {}).lean()
+      for (const doc of docs) {
+        for (const entry of p.entries(collection, doc)) {
+          const key = `${entry.target}|${JSON.stringify(entry.filter)}`
+          const sum = totals.get(key) ?? {}
+          for (const [field, value] of Object.entries(entry.inc)) {
+            sum[field] = (sum[field] ?? 0) + value
+          }
+          totals.set(key, sum)
+        }
+      }
+    }
+  }
+  return totals
+}
+
+const projected = async () => {
+  const totals = new Map<string, Record<string, number>>()
+  for (const p of PROJECTIONS) {
+    for (const target of p.targets) {
+      for (const doc of await target.find({}).lean<any[]>()) {
+        const values: Record<string, number> = {}
+        for (const [field, value] of Object.entries(doc)) {
+          if (typeof value === 'number' && field !== '__v' && value !== 0) values[field] = value
+        }
+        if (Object.keys(values).length > 0) totals.set(keyOf(target.modelName, doc), values)
+      }
+    }
+  }
+  return totals
+}
+
+const mismatches = async () => {
+  const [want, got] = await Promise.all([expected(), projected()])
+  const diff: { key: string; expected?: unknown; projected?: unknown }[] = []
+  for (const key of new Set([...want.keys(), ...got.keys()])) {
+    const a = Object.fromEntries(Object.entries(want.get(key) ?? {}).filter(([, v]) => v !== 0))
+    const b = got.get(key) ?? {}
+    const fields = new Set([...Object.keys(a), ...Object.keys(b)])
+    if ([...fields].some((f) => Math.abs((a[f] ?? 0) - (b[f] ?? 0)) > 1e-9)) {
+      diff.push({ key, expected: a, projected: b })
+    }
+  }
+  return diff
+}
+
+// 커뮤니티 통계 원본 계산 (communityController 의 프로젝션 미준비 경로와 같은 조건)
+const liveActivity = async (since: Date) => {
+  const [tips, suggestions, comments, [reports]] = await Promise.all([
+    Post.countDocuments({ category: 'tips', createdAt: { $gte: since } }),
+    Post.countDocuments({ category: 'suggestions', createdAt: { $gte: since } }),
+    Comment.countDocuments({ createdAt: { $gte: since } }),
+    Post.aggregate([
+      { $unwind: '$reports' },
+      { $match: { 'reports.createdAt': { $gte: since } } },
+      { $count: 'count' },
+    ]),
+  ])
+  return { tips, suggestions, comments, reports: reports?.count ?? 0 }
+}
+
+const activityMismatch = async () => {
+  const since = new Date(Date.now() - 86_400_000)
+  const [live, projected] = await Promise.all([liveActivity(since), communityActivitySince(since)])
+  return JSON.stringify(live) === JSON.stringify(projected) ? null : { live, projected }
+}
+
+// 원본 무작위 쓰기 (쓰기 핸들러와 같은 형태의 단순 저장만, 파생 데이터는 건드리지 않음)
+const mutate = async (rand: ReturnType<typeof createRandom>, staffIds: string[], ops: number) => {
+  for (let i = 0; i < ops; i++) {
+    const kind = rand.next()
+    if (kind < 0.2) {
+      await Product.create({
+        name: `상품-${i}`,
+        barcode: `P${Date.now()}${i}`,
+        price: 1000,
+        stock: Math.floor(rand.next() * 50),
+        category: '기타',
+      })
+    } else if (kind < 0.4) {
+      const [p] = await Product.aggregate([{ $sample: { size: 1 } }])
+      if (p) await Product.updateOne({ _id: p._id }, { $inc: { stock: -1 } })
+    } else if (kind < 0.45) {
+      const [p] = await Product.aggregate([{ $sample: { size: 1 } }])
+      if (p) await Product.deleteOne({ _id: p._id })
+    } else if (kind < 0.6) {
+      const [post] = await Post.aggregate([{ $sample: { size: 1 } }])
+      if (post) {
+        await Comment.create({ postId: post._id, authorId: rand.pick(staffIds), content: '댓글' })
+      }
+    } else if (kind < 0.65) {
+      const [c] = await Comment.aggregate([{ $sample: { size: 1 } }])
+      if (c) await Comment.deleteOne({ _id: c._id })
+    } else if (kind < 0.75) {
+      const [post] = await Post.aggregate([{ $sample: { size: 1 } }])
+      if (post) {
+        await Post.updateOne(
+          { _id: post._id },
+          { $push: { reports: { userId: rand.pick(staffIds), createdAt: new Date() } } }
+        )
+      }
+    } else if (kind < 0.8) {
+      // 조회수 증가는 관심 필드가 아니므로 스트림에서 걸러진다
+      const [post] = await Post.aggregate([{ $sample: { size: 1 } }])
+      if (post) await Post.updateOne({ _id: post._id }, { $inc: { views: 1 } })
+    } else if (kind < 0.9) {
+      const [s] = await Schedule.aggregate([{ $sample: { size: 1 } }])
+      if (s) {
+        await Schedule.updateOne(
+          { _id: s._id },
+          { $set: { staff: rand.pick(staffIds), endTime: rand.pick(['18:00', '20:00', '22:00']) } }
+        )
+      }
+    } else if (kind < 0.95) {
+      await Schedule.create({
+        staff: rand.pick(staffIds),
+        date: dayjs().add(Math.floor(rand.next() * 14) - 7, 'day').format('YYYY-MM-DD'),
+        startTime: '09:00',
+        endTime: '15:00',
+      })
+    } else {
+      const [s] = await Schedule.aggregate([{ $sample: { size: 1 } }])
+      if (s) await Schedule.deleteOne({ _id: s._id })
+    }
+  }
+}
+
+// 프로젝터가 마지막 쓰기까지 반영할 때까지 대기 (반영 시각이 쓰기 이후 + 기대값과 일치)
+const waitForCatchUp = async (since: number) => {
+  const started = Date.now()
+  for (;;) {
+    const checkpoint = await ProjectorCheckpoint.findOne({ name: 'projector' }).lean()
+    if ((checkpoint?.appliedAt?.getTime() ?? 0) >= since) {
+      const diff = await mismatches()
+      if (diff.length === 0) return { ms: Date.now() - since, diff }
+      if (Date.now() - started > TIMEOUT) return { ms: Date.now() - since, diff }
+    } else if (Date.now() - started > TIMEOUT) {
+      return { ms: Date.now() - since, diff: await mismatches() }
+    }
+    await new Promise((resolve) => setTimeout(resolve, 200))
+  }
+}
+
+const main = async () => {
+  const mongo = await startMemoryMongo({ replSet: true })
+  const rand = createRandom(arg('seed', 7))
+  let stop: (() => Promise<void>) | null = null
+  try {
+    const fx = await seedFixtures()
+
+    let started = Date.now()
+    stop = startProjector(PROJECTIONS)
+    while (!(await Promise.all(PROJECTIONS.map((p) => projectionReady(p.name)))).every(Boolean)) {
+      await new Promise((resolve) => setTimeout(resolve, 200))
+    }
+    const rebuildMs = Date.now() - started
+    const initial = await mismatches()
+
+    const rounds = []
+    for (let round = 1; round <= ROUNDS; round++) {
+      // 짝수 라운드: 프로젝터를 멈춘 상태에서 쓰기 → 재기동 후 이어받기
+      const resume = round % 2 === 0
+      if (resume) {
+        await stop?.()
+        stop = null
+      }
+      started = Date.now()
+      await mutate(rand, fx.staffIds, OPS)
+      const writeMs = Date.now() - started
+      if (resume) stop = startProjector(PROJECTIONS)
+
+      const { ms, diff } = await waitForCatchUp(started)
+      const checkpoint = await ProjectorCheckpoint.findOne({ name: 'projector' }).lean()
+      const activity = await activityMismatch()
+      rounds.push({
+        round,
+        resumed: resume,
+        ops: OPS,
+        writeMs,
+        catchUpMs: ms,
+        rebuilt: checkpoint?.rebuilt,
+        mismatches: diff.length,
+        sample: diff.slice(0, 3),
+        activity,
+      })
+    }
+
+    const failed = initial.length > 0 || rounds.some((r) => r.mismatches > 0 || r.activity)
+    process.stdout.write(
+      JSON.stringify(
+        { node: process.version, rebuildMs, initialMismatches: initial.length, rounds },
+        null,
+        2
+      ) + '\n'
+    )
+    if (failed) process.exitCode = 1
+  } finally {
+    await stop?.()
+    await mongo.stop()
+  }
+}
+
+main().catch((err) => {
+  console.error(err)
+  process.exit(1)
+})
@@ -0,0 +1,373 @@
+// 엔드포인트별 DB 왕복 예산 검사
+//
+// 사용법:
+//   npm run bench:queries              # 예산 초과 또는 데이터 증가에 따라 늘어나면 exit 1
+//   npm run bench:queries -- --report  # 측정값만 출력 (예산 조정용)
+//
+// 인메모리 MongoDB 에 작은/큰 두 데이터셋을 차례로 넣고 같은 요청을 보내
+// 드라이버가 실제로 보낸 명령 수(commandStarted)를 요청 ID 별로 센다.
+// - 요청 안에서 시작된 작업(응답 후 마무리되는 롤업 기록 포함)은 모두 그 요청으로 집계
+// - 요청 밖으로 넘긴 작업(재고 알림 flush 등)과 getMore(커서 이어받기)는 제외
+// 줄/행마다 쿼리하는 코드가 들어오면 큰 데이터셋에서 수가 늘어나 실패한다.
+import crypto from 'crypto'
+import mongoose from 'mongoose'
+import dayjs from 'dayjs'
+import { syncIndexes } from '../config/db'
+import { currentContext } from '../utils/requestContext'
+import {
+  DEFAULT_SIZES,
+  FixtureSizes,
+  Fixtures,
+  seedFixtures,
+  startMemoryMongo,
+  startServer,
+} from './fixtures'
+
+interface RequestSpec {
+  method: 'GET' | 'POST' | 'PUT' | 'PATCH'
+  path: string
+  token?: string
+  body?: unknown
+}
+
+interface Endpoint {
+  name: string
+  budget: number // 요청당 최대 명령 수
+  // scale: 0 = 작은 데이터셋, 1 = 큰 데이터셋 (요청 자체의 크기도 함께 키운다)
+  request: (fx: Fixtures, scale: number) => RequestSpec
+}
+
+const SIZES: FixtureSizes[] = [
+  DEFAULT_SIZES,
+  {
+    products: DEFAULT_SIZES.products * 4,
+    orders: DEFAULT_SIZES.orders * 4,
+    posts: DEFAULT_SIZES.posts * 4,
+    commentsPerPost: DEFAULT_SIZES.commentsPerPost * 2,
+    staff: DEFAULT_SIZES.staff * 2,
+    announcements: DEFAULT_SIZES.announcements * 4,
+    handovers: DEFAULT_SIZES.handovers * 4,
+  },
+]
+
+const cartOf = (fx: Fixtures, lines: number) =>
+  Array.from({ length: lines }, (_, i) => ({
+    productId: fx.productIds[i],
+    barcode: fx.barcodes[i],
+    name: `상품${i + 1}`,
+    price: 1000,
+    quantity: 1,
+  }))
+
+// 📌 예산 (괄호: 예산을 구성하는 명령)
+const ENDPOINTS: Endpoint[] = [
+  {
+    name: 'GET /kiosk/scan/:barcode',
+    budget: 1, // findOne
+    request: (fx) => ({ method: 'GET', path: `/kiosk/scan/${fx.barcodes[0]}` }),
+  },
+  {
+    name: 'GET /kiosk/products/quick',
+    budget: 1, // find
+    request: () => ({ method: 'GET', path: '/kiosk/products/quick' }),
+  },
+  {
+    // 상품 조회 find + 재고 bulkWrite + 주문 insert + 시간당 매출 update + 일별 판매 bulkWrite
+    name: 'POST /kiosk/checkout',
+    budget: 5,
+    request: (fx, scale) => {
+      const items = cartOf(fx, scale === 0 ? 1 : 8)
+      return {
+        method: 'POST',
+        path: '/kiosk/checkout',
+        body: {
+          items,
+          totalAmount: items.reduce((acc, it) => acc + it.price * it.quantity, 0),
+          paymentMethod: 'card',
+        },
+      }
+    },
+  },
+  {
+    // 수신 기록 bulkWrite + 상품 find + 주문 insert + 수신 기록 committed + 재고 bulkWrite + 롤업 bulkWrite 2
+    name: 'POST /kiosk/checkout/batch',
+    budget: 7,
+    request: (fx, scale) => ({
+      method: 'POST',
+      path: '/kiosk/checkout/batch',
+      body: {
+        sales: Array.from({ length: scale === 0 ? 1 : 20 }, (_, i) => {
+          const items = cartOf(fx, (i % 4) + 1)
+          return {
+            idempotencyKey: crypto.randomUUID(),
+            items,
+            totalAmount: items.reduce((acc, it) => acc + it.price * it.quantity, 0),
+            paymentMethod: 'card',
+            soldAt: dayjs().subtract(i, 'hour').toISOString(),
+          }
+        }),
+      },
+    }),
+  },
+  {
+    name: 'GET /products',
+    budget: 1, // find
+    request: (fx) => ({ method: 'GET', path: '/products', token: fx.ownerToken }),
+  },
+  {
+    name: 'PATCH /products/:id/stock',
+    budget: 3, // findById + save + 발주 제안 update
+    request: (fx) => ({
+      method: 'PATCH',
+      path: `/products/${fx.productIds[0]}/stock`,
+      token: fx.ownerToken,
+      body: { quantity: 10 },
+    }),
+  },
+  {
+    name: 'GET /products/reorder-suggestions',
+    budget: 1, // find
+    request: (fx) => ({
+      method: 'GET',
+      path: '/products/reorder-suggestions',
+      token: fx.ownerToken,
+    }),
+  },
+  {
+    // 시간당 매출 + 알림/상품 수/재고 합계 + 직원 수 + 오늘 스케줄(+populate)
+    // + 중요 인수인계(+populate) + 중요 공지
+    name: 'GET /dashboard/summary',
+    budget: 10,
+    request: (fx) => ({ method: 'GET', path: '/dashboard/summary', token: fx.ownerToken }),
+  },
+  {
+    name: 'GET /dashboard/alerts',
+    budget: 1, // find
+    request: (fx) => ({ method: 'GET', path: '/dashboard/alerts', token: fx.ownerToken }),
+  },
+  {
+    name: 'GET /analytics/dashboard',
+    budget: 6, // 매출 집계 4 + 상품별 집계 + 상위/하위 상품 이름
+    request: (fx) => ({ method: 'GET', path: '/analytics/dashboard', token: fx.ownerToken }),
+  },
+  {
+    name: 'GET /community/posts',
+    budget: 1, // find (댓글 수는 게시글에 저장)
+    request: (fx) => ({ method: 'GET', path: '/community/posts', token: fx.staffToken }),
+  },
+  {
+    name: 'GET /community/posts?sort=hot',
+    budget: 1, // find (hotScore 인덱스 커서 페이지)
+    request: (fx) => ({
+      method: 'GET',
+      path: '/community/posts?sort=hot&limit=20',
+      token: fx.staffToken,
+    }),
+  },
+  {
+    name: 'GET /community/posts/:id',
+    budget: 2, // 조회수 증가 findOneAndUpdate + 댓글 find
+    request: (fx) => ({
+      method: 'GET',
+      path: `/community/posts/${fx.postIds[0]}`,
+      token: fx.staffToken,
+    }),
+  },
+  {
+    name: 'GET /community/stats',
+    budget: 4, // count 3 + 신고 집계 (프로젝션 준비 시: 버킷 집계 + 첫 시간 보정 게시글 집계/댓글 count)
+    request: (fx) => ({ method: 'GET', path: '/community/stats', token: fx.staffToken }),
+  },
+  {
+    name: 'GET /announcements/list',
+    budget: 1, // find
+    request: (fx) => ({ method: 'GET', path: '/announcements/list', token: fx.staffToken }),
+  },
+  {
+    name: 'GET /announcements/unread',
+    budget: 1, // find (직원 번호는 토큰에서)
+    request: (fx) => ({ method: 'GET', path: '/announcements/unread', token: fx.staffToken }),
+  },
+  {
+    name: 'GET /announcements/coverage',
+    budget: 2, // 공지 find + 직원 find
+    request: (fx) => ({ method: 'GET', path: '/announcements/coverage', token: fx.ownerToken }),
+  },
+  {
+    name: 'GET /sub/list',
+    budget: 1, // find (근무 정보 사본, populate 없음)
+    request: (fx) => ({ method: 'GET', path: '/sub/list', token: fx.staffToken }),
+  },
+  {
+    name: 'GET /sub/owner?mode=pending',
+    budget: 1, // find
+    request: (fx) => ({ method: 'GET', path: '/sub/owner?mode=pending', token: fx.ownerToken }),
+  },
+  {
+    name: 'GET /handovers/feed',
+    budget: 5, // find + populate 2 + 미확인 count 1 + 가입 시각(사용자별 첫 요청만)
+    request: (fx) => ({ method: 'GET', path: '/handovers/feed', token: fx.staffToken }),
+  },
+  {
+    name: 'GET /staff/list',
+    budget: 1, // find
+    request: (fx) => ({ method: 'GET', path: '/staff/list', token: fx.ownerToken }),
+  },
+  {
+    name: 'GET /schedule/week',
+    budget: 2, // find + populate
+    request: (fx) => ({ method: 'GET', path: '/schedule/week', token: fx.ownerToken }),
+  },
+  {
+    name: 'GET /schedule/my',
+    budget: 1, // find
+    request: (fx) => ({ method: 'GET', path: '/schedule/my', token: fx.staffToken }),
+  },
+  {
+    name: 'POST /schedule/template',
+    budget: 1, // insertMany
+    request: (fx, scale) => {
+      const start = dayjs().add(1, 'year')
+      return {
+        method: 'POST',
+        path: '/schedule/template',
+        token: fx.ownerToken,
+        body: {
+          staffId: fx.staffIds[0],
+          startDate: start.format('YYYY-MM-DD'),
+          endDate: start.add(scale === 0 ? 6 : 55, 'day').format('YYYY-MM-DD'),
+          days: [1, 2, 3, 4, 5, 6, 7],
+          startTime: '09:00',
+          endTime: '18:00',
+        },
+      }
+    },
+  },
+]
+
+// 연결/인증/세션 관리 명령은 요청 비용이 아니다
+const IGNORED_COMMANDS = new Set([
+  'hello',
+  'ismaster',
+  'isMaster',
+  'ping',
+  'saslStart',
+  'saslContinue',
+  'endSessions',
+  'getMore',
+  'killCursors',
+])
+
+// 요청 ID 별 명령 수 + 진행 중인 명령 수
+const trackCommands = (client: mongoose.mongo.MongoClient) => {
+  const counts = new Map<string, { commands: string[]; inFlight: number }>()
+  const owners = new Map<number, string>() // 드라이버 requestId → 요청 ID
+
+  client.on('commandStarted', (event) => {
+    const id = currentContext()?.requestId
+    if (!id || IGNORED_COMMANDS.has(event.commandName)) return
+    const entry = counts.get(id) ?? { commands: [], inFlight: 0 }
+    const collection = event.command[event.commandName]
+    entry.commands.push(
+      typeof collection === 'string' ? `${event.commandName}:${collection}` : event.commandName
+    )
+    entry.inFlight++
+    counts.set(id, entry)
+    owners.set(event.requestId, id)
+  })
+  const done = (event: { requestId: number }) => {
+    const id = owners.get(event.requestId)
+    if (!id) return
+    owners.delete(event.requestId)
+    counts.get(id)!.inFlight--
+  }
+  client.on('commandSucceeded', done)
+  client.on('commandFailed', done)
+
+  // 응답 후 마무리되는 작업까지 끝날 때까지 대기
+  const settle = async (id: string) => {
+    for (let i = 0; i < 100; i++) {
+      await new Promise((r) => setTimeout(r, 20))
+      if ((counts.get(id)?.inFlight ?? 0) === 0) break
+    }
+    return counts.get(id)?.commands ?? []
+  }
+  return { settle }
+}
+
+const send = async (baseUrl: string, spec: RequestSpec, requestId: string, run: number) => {
+  // 실행마다 URL 을 달리해 응답 캐시를 타지 않게 한다
+  const sep = spec.path.includes('?') ? '&' : '?'
+  const res = await fetch(`${baseUrl}${spec.path}${sep}_run=${run}`, {
+    method: spec.method,
+    headers: {
+      'Content-Type': 'application/json',
+      'X-Request-Id': requestId,
+      ...(spec.token ? { Authorization: `Bearer ${spec.token}` } : {}),
+    },
+    body: spec.body ? JSON.stringify(spec.body) : undefined,
+  })
+  await res.arrayBuffer()
+  return res.status
+}
+
+const main = async () => {
+  const reportOnly = process.argv.includes('--report')
+  const mongo = await startMemoryMongo({ monitorCommands: true })
+  const tracker = trackCommands(mongoose.connection.getClient())
+  const server = await startServer()
+
+  // endpoint → scale 별 명령 목록
+  const measured = new Map<string, string[][]>()
+  const failures: string[] = []
+
+  try {
+    for (const [scale, sizes] of SIZES.entries()) {
+      if (scale > 0) {
+        await mongoose.connection.dropDatabase()
+        await syncIndexes()
+      }
+      const fx = await seedFixtures(sizes)
+
+      for (const [i, endpoint] of ENDPOINTS.entries()) {
+        const requestId = `budget-${scale}-${String(i).padStart(2, '0')}`
+        const status = await send(server.baseUrl, endpoint.request(fx, scale), requestId, scale)
+        if (status >= 400) failures.push(`${endpoint.name}: HTTP ${status}`)
+        const commands = await tracker.settle(requestId)
+        measured.set(endpoint.name, [...(measured.get(endpoint.name) ?? []), commands])
+      }
+    }
+  } finally {
+    await server.close()
+    await mongo.stop()
+  }
+
+  const rows = ENDPOINTS.map(({ name, budget }) => {
+    const [small, large] = measured.get(name) ?? [[], []]
+    const over = Math.max(small.length, large.length) > budget
+    const grows = large.length > small.length
+    if (!reportOnly && over) {
+      failures.push(`${name}: 예산 ${budget} 초과 (${small.length} → ${large.length})`)
+    }
+    if (!reportOnly && grows) {
+      failures.push(
+        `${name}: 데이터 크기에 따라 증가 (${small.length} → ${large.length}) ${large.join(', ')}`
+      )
+    }
+    return { endpoint: name, budget, small: small.length, large: large.length }
+  })
+  console.table(rows)
+
+  if (failures.length > 0) {
+    console.error('❌ DB 왕복 예산 위반')
+    for (const f of failures) console.error(`  - ${f}`)
+    process.exit(1)
+  }
+  console.log('✅ 모든 엔드포인트가 예산 이내')
+  process.exit(0)
+}
+
+main().catch((err) => {
+  console.error(err)
+  process.exit(1)
+})
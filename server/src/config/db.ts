@@ -1,11 +1,83 @@
 import mongoose from 'mongoose'
+import { instrumentPool } from '../utils/poolMetrics'
+import { setIndexState, setMongoConnected } from '../utils/readiness'
+import { flushLogs, logger } from '../utils/logger'
+
+const num = (value: string | undefined, fallback: number) =>
+  value !== undefined && value !== '' ? Number(value) : fallback
+
+// 📌 커넥션 풀/타임아웃 설정 (환경 변수로 조정)
+// maxPoolSize 는 워커 1개 기준. 클러스터 모드면 워커 수만큼 곱해진 연결이 열린다.
+export const dbOptions = (): mongoose.ConnectOptions => ({
+  maxPoolSize: num(process.env.MONGO_MAX_POOL_SIZE, 20),
+  minPoolSize: num(process.env.MONGO_MIN_POOL_SIZE, 2),
+  maxConnecting: num(process.env.MONGO_MAX_CONNECTING, 4),
+  // 풀이 가득 찼을 때 연결을 기다리는 최대 시간
+  waitQueueTimeoutMS: num(process.env.MONGO_WAIT_QUEUE_TIMEOUT_MS, 5000),
+  serverSelectionTimeoutMS: num(process.env.MONGO_SERVER_SELECTION_TIMEOUT_MS, 5000),
+  connectTimeoutMS: num(process.env.MONGO_CONNECT_TIMEOUT_MS, 10_000),
+  socketTimeoutMS: num(process.env.MONGO_SOCKET_TIMEOUT_MS, 45_000),
+  maxIdleTimeMS: num(process.env.MONGO_MAX_IDLE_TIME_MS, 60_000),
+  readPreference:
+    (process.env.MONGO_READ_PREFERENCE as mongoose.mongo.ReadPreferenceMode) ||
+    'primary',
+  // 인덱스는 syncIndexes 에서 한 번에 생성하고 완료 여부를 준비 상태에 반영
+  autoIndex: false,
+})
+
+mongoose.connection.on('connected', () => setMongoConnected(true))
+mongoose.connection.on('reconnected', () => setMongoConnected(true))
+mongoose.connection.on('disconnected', () => setMongoConnected(false))
 
 export const connectDB = async () => {
   try {
-    await mongoose.connect(process.env.MONGO_URI!)
-    console.log('MongoDB Connected')
+    await mongoose.connect(process.env.MONGO_URI!, dbOptions())
+    instrumentPool(mongoose.connection.getClient())
+    logger.info('MongoDB Connected')
   } catch (err) {
-    console.error(err)
+    logger.error('MongoDB 연결 실패', { err })
+    await flushLogs()
     process.exit(1)
   }
 }
+
+// 스키마에서 인덱스를 교체한 모델: 이전 인덱스는 쓰기마다 갱신 비용만 들므로 스키마에 없는 인덱스를 지운다
+// - Post: { storeId, createdAt } → { storeId, createdAt, _id } (커서 페이징)
+// - Handover: { storeId, confirmedBy, createdAt } → { storeId, createdAt, confirmedBy } (미확인 건수)
+// 나머지 모델은 운영 중 직접 만든 인덱스가 있을 수 있어 생성만 한다
+const DROP_STALE_INDEXES = new Set(['Post', 'Handover'])
+
+// 클러스터에서는 워커마다 동시에 실행되므로 다른 워커가 먼저 지운 인덱스는 무시
+const INDEX_NOT_FOUND = 27
+
+const dropStaleIndexes = async (model: mongoose.Model<any>) => {
+  const { toDrop } = await model.diffIndexes()
+  for (const name of toDrop) {
+    await model.collection.dropIndex(name).catch((err) => {
+      if (err?.code !== INDEX_NOT_FOUND) throw err
+    })
+  }
+  if (toDrop.length > 0) {
+    logger.info('이전 인덱스 삭제', { collection: model.collection.collectionName, dropped: toDrop })
+  }
+}
+
+// 등록된 모든 모델의 인덱스 생성 (이미 있으면 no-op)
+// 모델이 로드된 뒤(app import 이후) 호출해야 한다
+export const syncIndexes = async () => {
+  try {
+    const models = mongoose.modelNames().map((name) => mongoose.model(name))
+    // init: 컬렉션 옵션(time-series 등)으로 먼저 생성. 인덱스 생성이 일반 컬렉션을 만들어 버리지 않도록
+    await Promise.all(models.map((model) => model.init()))
+    await Promise.all(
+      models.filter((model) => DROP_STALE_INDEXES.has(model.modelName)).map(dropStaleIndexes)
+    )
+    await Promise.all(models.map((model) => model.createIndexes()))
+    setIndexState('synced')
+    logger.info('MongoDB indexes synced')
+  } catch (err) {
+    // 중복 데이터 등으로 실패하면 not-ready 로 남겨 원인을 확인하게 한다
+    setIndexState('failed')
+    logger.error('인덱스 생성 실패', { err })
+  }
+}
@@ -1,12 +1,26 @@
 import { Request, Response } from 'express';
 import Announcement from '../models/Announcement';
+import User from '../models/User';
+import {
+  announcementListProjection,
+  serializeAnnouncementList,
+  AnnouncementListItem,
+} from '../dto/announcementDto';
+import { sendJson } from '../utils/serializer';
+import { markRead, readerIndexes, staffIndexOf, unreadFilter } from '../services/readReceipts';
+import { logger } from '../utils/logger';
 
 // 공지사항 목록 조회
 export const getAnnouncements = async (req: Request, res: Response) => {
   try {
     // 중요 공지 우선, 그 다음 최신순 정렬
-    const announcements = await Announcement.find().sort({ important: -1, createdAt: -1 });
-    res.json(announcements);
+    const announcements = await Announcement.find(
+      {},
+      announcementListProjection(req.user?.userId)
+    )
+      .sort({ important: -1, createdAt: -1 })
+      .lean<AnnouncementListItem[]>();
+    sendJson(res, serializeAnnouncementList(announcements));
   } catch (err) {
     res.status(500).json({ message: '서버 오류' });
   }
@@ -65,11 +79,15 @@ export const deleteAnnouncement = async (req: Request, res: Response) => {
   }
 };
 
-// 조회수 증가
+// 조회수 증가 (직원이면 열람 기록도 함께)
 export const increaseView = async (req: Request, res: Response) => {
   try {
     const { id } = req.params;
-    await Announcement.findByIdAndUpdate(id, { $inc: { views: 1 } });
+    const staffIndex = await staffIndexOf(req.user);
+    await Promise.all([
+      Announcement.findByIdAndUpdate(id, { $inc: { views: 1 } }),
+      staffIndex !== null ? markRead(id, staffIndex) : null,
+    ]);
     res.json({ message: '조회수 증가' });
   } catch (err) {
     res.status(500).json({ message: '오류 발생' });
@@ -104,3 +122,65 @@ export const toggleLike = async (req: Request, res: Response) => {
     res.status(500).json({ message: '오류 발생' });
   }
 };
+
+// 내가 안 읽은 중요 공지 (직원)
+export const getUnreadImportant = async (req: Request, res: Response) => {
+  try {
+    const staffIndex = await staffIndexOf(req.user);
+    if (staffIndex === null) return res.json([]);
+
+    const announcements = await Announcement.find({
+      important: true,
+      ...unreadFilter(staffIndex),
+    })
+      .select('title author important createdAt')
+      .sort({ createdAt: -1 })
+      .lean();
+    res.json(announcements);
+  } catch (err) {
+    logger.error('미열람 공지 조회 실패', { err });
+    res.status(500).json({ message: '서버 오류' });
+  }
+};
+
+// 공지별 열람 현황 (사장님 전용): 기본은 중요 공지, ?all=true 면 전체
+export const getReadCoverage = async (req: Request, res: Response) => {
+  try {
+    const filter = req.query.all === 'true' ? {} : { important: true };
+    const [announcements, staff] = await Promise.all([
+      Announcement.find(filter)
+        .select('title important createdAt readMask readCount')
+        .sort({ createdAt: -1 })
+        .lean(),
+      User.find({ role: 'staff' }).select('name staffIndex').lean(),
+    ]);
+
+    // 현재 직원 기준 (삭제된 직원의 열람 비트는 세지 않음)
+    const byIndex = new Map(
+      staff
+        .filter((s) => typeof s.staffIndex === 'number')
+        .map((s) => [s.staffIndex as number, { _id: s._id, name: s.name }])
+    );
+
+    const coverage = announcements.map(({ readMask, readCount, ...a }) => {
+      const readers = readerIndexes(readMask)
+        .map((i) => byIndex.get(i))
+        .filter((s) => s !== undefined);
+      const readerIds = new Set(readers.map((s) => String(s._id)));
+      return {
+        ...a,
+        readCount: readers.length,
+        staffCount: staff.length,
+        coverage: staff.length > 0 ? readers.length / staff.length : 0,
+        readers,
+        unread: staff
+          .filter((s) => !readerIds.has(String(s._id)))
+          .map((s) => ({ _id: s._id, name: s.name })),
+      };
+    });
+    res.json(coverage);
+  } catch (err) {
+    logger.error('공지 열람 현황 조회 실패', { err });
+    res.status(500).json({ message: '서버 오류' });
+  }
+};
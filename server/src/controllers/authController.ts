@@ -1,26 +1,36 @@
 import { Request, Response } from 'express'
-import bcrypt from 'bcryptjs'
 import jwt from 'jsonwebtoken'
 import User from '../models/User'
+import { comparePassword, PasswordPoolBusyError } from '../utils/passwordPool'
+import { logger } from '../utils/logger'
+import { assignStaffIndex } from '../services/readReceipts'
 
 export const login = async (req: Request, res: Response) => {
   try {
     const { username, password } = req.body
 
-    const user = await User.findOne({ username })
+    // 로그인 시점에는 매장을 모르므로 전체 매장에서 조회 (username 은 전역 unique)
+    const user = await User.findOne({ username }).setOptions({ allStores: true })
     if (!user) {
       return res.status(400).json({ message: '존재하지 않는 계정입니다.' })
     }
 
-    const isMatch = await bcrypt.compare(password, user.password)
+    const isMatch = await comparePassword(password, user.password)
     if (!isMatch) {
       return res.status(400).json({ message: '비밀번호가 틀렸습니다.' })
     }
 
+    // 직원은 공지 열람 기록용 번호를 토큰에 담아 요청마다 조회하지 않는다
+    const staffIndex = await assignStaffIndex(user)
+
     const token = jwt.sign(
       {
         userId: user._id,
         role: user.role,
+        storeId: user.storeId,
+        ...(staffIndex !== null ? { staffIndex } : {}),
+        // 여러 지점을 운영하는 사장은 X-Store-Id 로 매장을 전환
+        ...(user.role === 'owner' && user.stores?.length ? { stores: user.stores } : {}),
       },
       process.env.JWT_SECRET!,
       { expiresIn: '1d' }
@@ -35,10 +45,17 @@ export const login = async (req: Request, res: Response) => {
         name: user.name,
         phone: user.phone,
         joinDate: user.joinDate,
+        storeId: user.storeId,
+        stores: user.stores,
       },
     })
   } catch (err) {
-    console.error(err)
+    // 로그인 폭주로 해시 대기열이 가득 찬 경우
+    if (err instanceof PasswordPoolBusyError) {
+      res.setHeader('Retry-After', '1')
+      return res.status(503).json({ message: '요청이 많습니다. 잠시 후 다시 시도해주세요.' })
+    }
+    logger.error('로그인 처리 실패', { err })
     res.status(500).json({ message: '서버 오류' })
   }
 }
@@ -1,6 +1,41 @@
 import { Request, Response } from 'express';
+import mongoose from 'mongoose';
 import Post from '../models/Post';
 import Comment from '../models/Comment';
+import {
+  postListProjection,
+  serializePostList,
+  serializePostPage,
+  PostListItem,
+} from '../dto/postDto';
+import { sendJson } from '../utils/serializer';
+import { logger } from '../utils/logger';
+import { adjustCommentCount, hotScoreOf, viewPost } from '../services/postRanking';
+import { communityActivitySince } from '../services/projections';
+
+// 목록 정렬: 최신순 / 인기순 (hotScore, services/postRanking)
+type PostSort = 'latest' | 'hot';
+const SORT_FIELD: Record<PostSort, 'createdAt' | 'hotScore'> = {
+  latest: 'createdAt',
+  hot: 'hotScore',
+};
+const PAGE_MAX = 50;
+
+// 커서: 마지막 글의 [정렬 값, _id] (base64url)
+const encodeCursor = (sort: PostSort, post: any) =>
+  Buffer.from(JSON.stringify([post[SORT_FIELD[sort]], String(post._id)])).toString('base64url');
+
+const decodeCursor = (sort: PostSort, cursor: string) => {
+  try {
+    const [raw, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+    const value = sort === 'latest' ? new Date(raw) : Number(raw);
+    if (!mongoose.Types.ObjectId.isValid(id)) return null;
+    if (sort === 'latest' ? isNaN((value as Date).getTime()) : !Number.isFinite(value)) return null;
+    return { value, id: new mongoose.Types.ObjectId(id) };
+  } catch {
+    return null;
+  }
+};
 
 // --- 통계 API (NEW) ---
 export const getCommunityStats = async (req: Request, res: Response) => {
@@ -8,6 +43,17 @@ export const getCommunityStats = async (req: Request, res: Response) => {
     const yesterday = new Date();
     yesterday.setDate(yesterday.getDate() - 1);
 
+    // 변경 스트림 프로젝션(시간당 활동)이 준비돼 있으면 최근 버킷 합계만 읽는다
+    const activity = await communityActivitySince(yesterday);
+    if (activity) {
+      return res.json({
+        tipsToday: activity.tips,
+        suggestionsToday: activity.suggestions,
+        commentsToday: activity.comments,
+        reportsToday: activity.reports
+      });
+    }
+
     // 1. 카테고리별 오늘 신규 게시글
     const tipsToday = await Post.countDocuments({ 
       category: 'tips', 
@@ -39,35 +85,65 @@ export const getCommunityStats = async (req: Request, res: Response) => {
       reportsToday
     });
   } catch (err) {
-    console.error(err);
+    logger.error('커뮤니티 통계 로드 실패', { err });
     res.status(500).json({ message: '통계 로드 실패' });
   }
 };
 
 // 게시글 목록 조회
+// limit 을 주면 커서 페이지 응답 { posts, nextCursor } (sort=latest|hot), 없으면 기존처럼 전체 배열
 export const getPosts = async (req: Request, res: Response) => {
   try {
-    const { category, search } = req.query;
+    const { category, search, cursor } = req.query;
+    const sort: PostSort = req.query.sort === 'hot' ? 'hot' : 'latest';
+    const field = SORT_FIELD[sort];
+    const limit = req.query.limit
+      ? Math.min(Math.max(Number(req.query.limit) || 20, 1), PAGE_MAX)
+      : undefined;
+
     const query: any = {};
+    const conditions: any[] = [];
 
     if (category && category !== 'all') query.category = category;
     if (search) {
-      query.$or = [
-        { title: { $regex: search, $options: 'i' } },
-        { content: { $regex: search, $options: 'i' } }
-      ];
+      conditions.push({
+        $or: [
+          { title: { $regex: search, $options: 'i' } },
+          { content: { $regex: search, $options: 'i' } }
+        ]
+      });
     }
-
-    const posts = await Post.find(query).sort({ createdAt: -1 });
-    
-    const postsWithCommentCount = await Promise.all(posts.map(async (p) => {
-        const commentCount = await Comment.countDocuments({ postId: p._id as any });
-        return { ...p.toObject(), commentCount };
-    }));
-
-    res.json(postsWithCommentCount);
+    if (cursor) {
+      const after = decodeCursor(sort, String(cursor));
+      if (!after) return res.status(400).json({ message: '잘못된 커서입니다.' });
+      conditions.push({
+        $or: [
+          { [field]: { $lt: after.value } },
+          { [field]: after.value, _id: { $lt: after.id } }
+        ]
+      });
+    }
+    if (conditions.length > 0) query.$and = conditions;
+
+    // 댓글 수는 게시글에 저장된 commentCount 사용 (댓글 작성/삭제 시 증감)
+    const find = Post.find(query, postListProjection(req.user?.userId))
+      .sort({ [field]: -1, _id: -1 });
+    if (limit) find.limit(limit + 1); // 한 건 더 읽어 다음 페이지 여부 판단
+    const posts = await find.lean<PostListItem[]>();
+
+    if (!limit) return sendJson(res, serializePostList(posts));
+
+    const hasMore = posts.length > limit;
+    const page = hasMore ? posts.slice(0, limit) : posts;
+    sendJson(
+      res,
+      serializePostPage({
+        posts: page,
+        nextCursor: hasMore ? encodeCursor(sort, page[page.length - 1]) : null,
+      })
+    );
   } catch (err) {
-    console.error(err);
+    logger.error('게시글 목록 로드 실패', { err });
     res.status(500).json({ message: '서버 오류' });
   }
 };
@@ -76,7 +152,8 @@ export const getPosts = async (req: Request, res: Response) => {
 export const getPostDetail = async (req: Request, res: Response) => {
   try {
     const { id } = req.params;
-    const post = await Post.findByIdAndUpdate(id, { $inc: { views: 1 } }, { new: true });
+    // 조회수 증가와 인기 점수 갱신을 한 번에
+    const post = await viewPost(id);
     if (!post) return res.status(404).json({ message: '게시글 없음' });
 
     const comments = await Comment.find({ postId: id }).sort({ createdAt: 1 });
@@ -99,7 +176,8 @@ export const createPost = async (req: Request, res: Response) => {
       content,
       category,
       authorId: userId,
-      authorName: `익명${randomNum}`
+      authorName: `익명${randomNum}`,
+      hotScore: hotScoreOf({})
     });
     res.status(201).json(newPost);
   } catch (err) {
@@ -168,6 +246,7 @@ export const togglePostLike = async (req: Request, res: Response) => {
     if (index === -1) post.likes.push(userId);
     else post.likes.splice(index, 1);
 
+    post.hotScore = hotScoreOf(post);
     await post.save();
     res.json({ likes: post.likes });
   } catch (err) {
@@ -231,6 +310,10 @@ export const createComment = async (req: Request, res: Response) => {
       authorId: userId,
       authorName: '익명'
     });
+    // 실패해도 댓글은 저장된 상태 (postRanking 배치가 보정)
+    await adjustCommentCount(postId, 1).catch((err) =>
+      logger.error('댓글 수 갱신 실패', { err })
+    );
     res.status(201).json(newComment);
   } catch (err) {
     res.status(500).json({ message: '작성 실패' });
@@ -274,6 +357,9 @@ export const deleteComment = async (req: Request, res: Response) => {
     }
 
     await Comment.findByIdAndDelete(id);
+    await adjustCommentCount(comment.postId, -1).catch((err) =>
+      logger.error('댓글 수 갱신 실패', { err })
+    );
     res.json({ message: '삭제 완료' });
   } catch (err) {
     res.status(500).json({ message: '삭제 오류' });
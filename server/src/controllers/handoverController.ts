@@ -1,6 +1,18 @@
 import { Response } from 'express';
+import mongoose from 'mongoose';
 import { UserRequest } from '../middleware/auth';
 import Handover from '../models/Handover';
+import User from '../models/User';
+import {
+  HANDOVER_FIELDS,
+  HANDOVER_USER_FIELDS,
+  serializeHandover,
+  serializeHandoverFeed,
+  serializeHandoverList,
+} from '../dto/handoverDto';
+import { sendJson } from '../utils/serializer';
+import { LruCache } from '../utils/lruCache';
+import { logger } from '../utils/logger';
 
 // Create a new handover
 export const createHandover = async (req: UserRequest, res: Response) => {
@@ -22,7 +34,7 @@ export const createHandover = async (req: UserRequest, res: Response) => {
     await newHandover.save();
     res.status(201).json(newHandover);
   } catch (error) {
-    console.error('Error creating handover:', error);
+    logger.error('Error creating handover', { err: error });
     res.status(500).json({ message: 'Server error' });
   }
 };
@@ -32,19 +44,108 @@ export const getHandovers = async (req: UserRequest, res: Response) => {
   try {
     // Fetch recent handovers, populated with writer info
     const handovers = await Handover.find()
+      .select(HANDOVER_FIELDS)
       .sort({ createdAt: -1 })
       .limit(10)
-      .populate('writer', 'name username')
-      .populate('confirmedBy', 'name username');
+      .populate('writer', HANDOVER_USER_FIELDS)
+      .populate('confirmedBy', HANDOVER_USER_FIELDS)
+      .lean();
 
-    res.json(handovers);
+    sendJson(res, serializeHandoverList(handovers));
   } catch (error) {
-    console.error('Error fetching handovers:', error);
+    logger.error('Error fetching handovers', { err: error });
     res.status(500).json({ message: 'Server error' });
   }
 };
 
-// Confirm a handover
+// 커서: 마지막 항목의 (createdAt, _id) 를 base64url 로 인코딩
+const encodeCursor = (createdAt: Date, id: unknown) =>
+  Buffer.from(`${createdAt.getTime()}_${id}`).toString('base64url');
+
+const decodeCursor = (cursor: string) => {
+  const [ms, id] = Buffer.from(cursor, 'base64url').toString().split('_');
+  if (!id || !mongoose.Types.ObjectId.isValid(id) || isNaN(Number(ms))) return null;
+  return { createdAt: new Date(Number(ms)), _id: new mongoose.Types.ObjectId(id) };
+};
+
+// 가입 시각: 가입 전에 작성된 인수인계는 미확인으로 세지 않는다
+// 바뀌지 않는 값이라 프로세스 안에서 캐시 (요청마다 사용자 조회를 하지 않도록)
+const joinedAtCache = new LruCache<Date>({ maxEntries: 5000, ttl: 60 * 60_000 });
+
+const joinedAt = async (userId: string) => {
+  const cached = joinedAtCache.get(userId);
+  if (cached) return cached;
+  const user = await User.findById(userId)
+    .select('createdAt')
+    .setOptions({ allStores: true })
+    .lean<{ createdAt?: Date }>();
+  const at = user?.createdAt ?? new Date(0);
+  joinedAtCache.set(userId, at);
+  return at;
+};
+
+// 미확인 건수: 가입 이후 작성 + 내가 확인하지 않은 건 (countDocuments 1회, { storeId, createdAt } 범위)
+const countUnread = async (userId: string, since: Date) =>
+  Handover.countDocuments({ confirmedBy: { $ne: userId }, createdAt: { $gte: since } });
+
+// Handover feed: cursor paging + per-user unread count
+// GET /handovers/feed?cursor=...&limit=20&unread=true
+export const getHandoverFeed = async (req: UserRequest, res: Response) => {
+  try {
+    const userId = req.user?.userId;
+    if (!userId) {
+      return res.status(401).json({ message: 'Unauthorized' });
+    }
+
+    const limit = Math.min(Math.max(Number(req.query.limit) || 20, 1), 50);
+    const filter: Record<string, unknown> = {};
+
+    if (typeof req.query.cursor === 'string') {
+      const cursor = decodeCursor(req.query.cursor);
+      if (!cursor) {
+        return res.status(400).json({ message: 'Invalid cursor' });
+      }
+      filter.$or = [
+        { createdAt: { $lt: cursor.createdAt } },
+        { createdAt: cursor.createdAt, _id: { $lt: cursor._id } },
+      ];
+    }
+    const since = await joinedAt(userId);
+    if (req.query.unread === 'true') {
+      filter.confirmedBy = { $ne: new mongoose.Types.ObjectId(userId) };
+      filter.createdAt = { $gte: since };
+    }
+
+    const [items, unreadCount] = await Promise.all([
+      Handover.find(filter)
+        .select(HANDOVER_FIELDS)
+        .sort({ createdAt: -1, _id: -1 })
+        .limit(limit + 1) // 다음 페이지 존재 여부 확인용 1건 추가
+        .populate('writer', HANDOVER_USER_FIELDS)
+        .populate('confirmedBy', HANDOVER_USER_FIELDS)
+        .lean(),
+      countUnread(userId, since),
+    ]);
+
+    const hasMore = items.length > limit;
+    const page = hasMore ? items.slice(0, limit) : items;
+    const last = page[page.length - 1];
+
+    sendJson(
+      res,
+      serializeHandoverFeed({
+        items: page,
+        nextCursor: hasMore && last ? encodeCursor(last.createdAt, last._id) : null,
+        unreadCount,
+      })
+    );
+  } catch (error) {
+    logger.error('Error fetching handover feed', { err: error });
+    res.status(500).json({ message: 'Server error' });
+  }
+};
+
+// Confirm a handover (single atomic update)
 export const confirmHandover = async (req: UserRequest, res: Response) => {
   try {
     const { id } = req.params;
@@ -53,37 +154,73 @@ export const confirmHandover = async (req: UserRequest, res: Response) => {
     if (!userId) {
       return res.status(401).json({ message: 'Unauthorized' });
     }
-
-    const handover = await Handover.findById(id);
-    if (!handover) {
+    if (!mongoose.Types.ObjectId.isValid(id)) {
       return res.status(404).json({ message: 'Handover not found' });
     }
 
-    const alreadyConfirmed = handover.confirmedBy.some(
-      (id: any) => id.toString() === userId
-    );
+    // 아직 확인하지 않은 경우에만 갱신 → 동시 요청에도 중복 없이 한 번만 반영
+    const updatedHandover = await Handover.findOneAndUpdate(
+      { _id: id, confirmedBy: { $ne: userId } },
+      { $addToSet: { confirmedBy: userId }, $set: { confirmed: true } },
+      { new: true }
+    )
+      .select(HANDOVER_FIELDS)
+      .populate('writer', HANDOVER_USER_FIELDS)
+      .populate('confirmedBy', HANDOVER_USER_FIELDS)
+      .lean();
 
-    if (alreadyConfirmed) {
-      return res.status(400).json({ message: 'Already confirmed by you' });
+    if (!updatedHandover) {
+      // 실패 원인 구분은 예외 경로에서만 조회
+      const exists = await Handover.exists({ _id: id });
+      return exists
+        ? res.status(400).json({ message: 'Already confirmed by you' })
+        : res.status(404).json({ message: 'Handover not found' });
     }
 
-    handover.confirmed = true;
-    handover.confirmedBy.push(userId as any);
-    await handover.save();
+    sendJson(res, serializeHandover(updatedHandover));
+  } catch (error) {
+    logger.error('Error confirming handover', { err: error });
+    res.status(500).json({ message: 'Server error' });
+  }
+};
 
-    // Return the updated handover with populated fields
-    const updatedHandover = await Handover.findById(id)
-        .populate('writer', 'name username')
-        .populate('confirmedBy', 'name username');
+// Confirm many handovers at once (catch up after a day off)
+// body: { ids?: string[], before?: ISO date } — 둘 다 없으면 지금까지의 전체
+export const confirmAllHandovers = async (req: UserRequest, res: Response) => {
+  try {
+    const userId = req.user?.userId;
+    if (!userId) {
+      return res.status(401).json({ message: 'Unauthorized' });
+    }
 
-    res.json(updatedHandover);
+    const { ids, before } = req.body ?? {};
+    const until = before ? new Date(before) : new Date();
+    if (isNaN(until.getTime())) {
+      return res.status(400).json({ message: 'Invalid before date' });
+    }
+    const filter: Record<string, unknown> = { confirmedBy: { $ne: userId } };
+
+    if (Array.isArray(ids)) {
+      filter._id = { $in: ids.filter((i: string) => mongoose.Types.ObjectId.isValid(i)) };
+    }
+    filter.createdAt = { $lte: until };
+
+    const result = await Handover.updateMany(filter, {
+      $addToSet: { confirmedBy: userId },
+      $set: { confirmed: true },
+    });
+
+    res.json({
+      confirmed: result.modifiedCount,
+      unreadCount: await countUnread(userId, await joinedAt(userId)),
+    });
   } catch (error) {
-    console.error('Error confirming handover:', error);
+    logger.error('Error confirming handovers', { err: error });
     res.status(500).json({ message: 'Server error' });
   }
 };
 
-// Update a handover
+// Update a handover (only the writer, single update)
 export const updateHandover = async (req: UserRequest, res: Response) => {
   try {
     const { id } = req.params;
@@ -93,31 +230,35 @@ export const updateHandover = async (req: UserRequest, res: Response) => {
     if (!userId) {
       return res.status(401).json({ message: 'Unauthorized' });
     }
-
-    const handover = await Handover.findById(id);
-    if (!handover) {
+    if (!mongoose.Types.ObjectId.isValid(id)) {
       return res.status(404).json({ message: 'Handover not found' });
     }
 
-    if (handover.writer.toString() !== userId) {
-      return res.status(403).json({ message: 'You can only edit your own handovers' });
-    }
+    const update: Record<string, unknown> = {};
+    if (content) update.content = content;
+    if (checklist) update.checklist = checklist;
+    if (typeof isImportant === 'boolean') update.isImportant = isImportant;
 
-    handover.content = content || handover.content;
-    handover.checklist = checklist || handover.checklist;
-    if (typeof isImportant === 'boolean') {
-        handover.isImportant = isImportant;
-    }
+    const updatedHandover = await Handover.findOneAndUpdate(
+      { _id: id, writer: userId },
+      { $set: update },
+      { new: true, runValidators: true }
+    )
+      .select(HANDOVER_FIELDS)
+      .populate('writer', HANDOVER_USER_FIELDS)
+      .populate('confirmedBy', HANDOVER_USER_FIELDS)
+      .lean();
 
-    await handover.save();
-    
-    const updatedHandover = await Handover.findById(id)
-        .populate('writer', 'name username')
-        .populate('confirmedBy', 'name username');
+    if (!updatedHandover) {
+      const exists = await Handover.exists({ _id: id });
+      return exists
+        ? res.status(403).json({ message: 'You can only edit your own handovers' })
+        : res.status(404).json({ message: 'Handover not found' });
+    }
 
-    res.json(updatedHandover);
+    sendJson(res, serializeHandover(updatedHandover));
   } catch (error) {
-    console.error('Error updating handover:', error);
+    logger.error('Error updating handover', { err: error });
     res.status(500).json({ message: 'Server error' });
   }
 };
@@ -1,6 +1,7 @@
 import { Request, Response } from 'express'
 import Schedule from '../models/Schedule'
 import dayjs from 'dayjs'
+import { logger } from '../utils/logger'
 
 // 시간 겹침 체크
 function isOverlap(
@@ -61,7 +62,7 @@ export const addSchedule = async (req: Request, res: Response) => {
 
     res.json(newSchedule)
   } catch (e) {
-    console.error(e)
+    logger.error('스케줄 생성 실패', { err: e })
     res.status(500).json({ message: '스케줄 생성 실패' })
   }
 }
@@ -90,7 +91,7 @@ export const getWeekSchedule = async (_req: Request, res: Response) => {
 
     res.json(result)
   } catch (e) {
-    console.error(e)
+    logger.error('주간 스케줄 조회 실패', { err: e })
     res.status(500).json({ message: '조회 실패' })
   }
 }
@@ -1,6 +1,10 @@
 import { Request, Response } from 'express'
-import bcrypt from 'bcryptjs'
 import User from '../models/User'
+import { STAFF_LIST_FIELDS, serializeStaffList } from '../dto/staffDto'
+import { sendSerialized } from '../utils/serializer'
+import { hashPassword, PasswordPoolBusyError } from '../utils/passwordPool'
+import { revokeUser } from '../utils/tokenCache'
+import { logger } from '../utils/logger'
 
 // 직원 추가
 export const addStaff = async (req: Request, res: Response) => {
@@ -13,7 +17,7 @@ export const addStaff = async (req: Request, res: Response) => {
 
     const username = `${name}_${Date.now()}`
     const rawPassword = Math.floor(100000 + Math.random() * 900000).toString()
-    const hashedPassword = await bcrypt.hash(rawPassword, 10)
+    const hashedPassword = await hashPassword(rawPassword, 10)
 
     await User.create({
       username,
@@ -33,25 +37,42 @@ export const addStaff = async (req: Request, res: Response) => {
       password: rawPassword,
     })
   } catch (err) {
-    console.error(err)
+    if (err instanceof PasswordPoolBusyError) {
+      res.setHeader('Retry-After', '1')
+      return res.status(503).json({ message: '요청이 많습니다. 잠시 후 다시 시도해주세요.' })
+    }
+    logger.error('직원 추가 실패', { err })
     return res.status(500).json({ message: '서버 오류' })
   }
 }
 
 // 직원 목록 조회
 export const getStaffList = async (req: Request, res: Response) => {
-  const staff = await User.find({ role: 'staff' })
-  res.json(staff)
+  try {
+    const staff = await User.find({ role: 'staff' })
+      .select(STAFF_LIST_FIELDS)
+      .lean()
+    sendSerialized(req, res, serializeStaffList, staff)
+  } catch (err) {
+    logger.error('직원 목록 로드 실패', { err })
+    res.status(500).json({ message: '서버 오류' })
+  }
 }
 
 // 직원 삭제
 export const deleteStaff = async (req: Request, res: Response) => {
   try {
     const { id } = req.params
-    await User.findByIdAndDelete(id)
+    // 매장 범위 안에서 실제로 삭제된 경우에만 토큰 폐기 (다른 매장 사용자 ID 는 건드리지 않음)
+    const deleted = await User.findByIdAndDelete(id)
+    if (!deleted) {
+      return res.status(404).json({ message: '직원을 찾을 수 없습니다.' })
+    }
+    // 삭제된 직원이 가진 토큰은 즉시 사용 불가
+    await revokeUser(id)
     res.json({ message: '삭제 완료' })
   } catch (err) {
-    console.error(err)
+    logger.error('직원 삭제 실패', { err })
     res.status(500).json({ message: '서버 오류' })
   }
 }
@@ -1,9 +1,11 @@
 import { Request, Response } from 'express'
-import SubRequest from '../models/SubRequest'
+import SubRequest, { ACTIVE_SUB_STATUSES } from '../models/SubRequest'
 import Schedule from '../models/Schedule'
 import User from '../models/User'
 import { Types } from 'mongoose'
 import { UserRequest } from '../middleware/auth'
+import { logger } from '../utils/logger'
+import { keepSince, storeToday } from '../services/subRequestArchive'
 
 // 직원이 대타 신청
 export const requestSub = async (req: UserRequest, res: Response) => {
@@ -42,6 +44,12 @@ export const requestSub = async (req: UserRequest, res: Response) => {
       scheduleId: new Types.ObjectId(scheduleId),
       requester: new Types.ObjectId(requesterId),
       requesterName: user.name as string, // TS 안전하게 명시
+      // 목록 조회 때 스케줄을 populate 하지 않도록 근무 정보를 함께 저장
+      shift: {
+        date: schedule.date,
+        startTime: schedule.startTime,
+        endTime: schedule.endTime,
+      },
       reason,
       substitute: undefined, // null 대신 undefined
       substituteName: undefined, // string | undefined로 처리
@@ -50,7 +58,7 @@ export const requestSub = async (req: UserRequest, res: Response) => {
 
     return res.json({ message: '대타 요청 생성 완료' })
   } catch (err) {
-    console.error(err)
+    logger.error('대타 요청 생성 실패', { err })
     return res.status(500).json({ message: 'error' })
   }
 }
@@ -131,45 +139,47 @@ export const finalApprove = async (req: Request, res: Response) => {
 
     return res.json({ message: '대타 최종 승인 및 근무표 반영 완료' })
   } catch (err) {
-    console.error(err)
+    logger.error('대타 최종 승인 실패', { err })
     return res.status(500).json({ message: 'error' })
   }
 }
 
 // 점주 → 목록 조회
+// 근무일이 지난 요청은 보관 컬렉션으로 옮겨지므로 { 상태, 근무일 } 인덱스 범위만 읽는다
 export const getSubListForOwner = async (req: Request, res: Response) => {
   try {
     const { mode } = req.query
 
-    let query: any = {}
+    let query: any = { 'shift.date': { $gte: keepSince() } }
     if (mode === 'pending') {
       query = {
-        status: { $in: ['requested', 'approved_by_owner', 'accepted_by_sub'] },
+        status: { $in: ACTIVE_SUB_STATUSES },
+        'shift.date': { $gte: storeToday() },
       }
     } else if (mode === 'approved') {
-      query = { status: 'approved_final' }
+      query = { status: 'approved_final', 'shift.date': { $gte: keepSince() } }
     }
 
-    const list = await SubRequest.find(query)
-      .populate('scheduleId')
-      .sort({ createdAt: -1 })
+    const list = await SubRequest.find(query).sort({ createdAt: -1 }).lean()
     return res.json(list)
   } catch {
     return res.status(500).json({ message: 'error' })
   }
 }
 
-// 직원 → 전체 대타 요청 목록 조회
+// 직원 → 진행 중인 대타 요청 목록 조회 (오늘 이후 근무만)
 export const getSubList = async (req: Request, res: Response) => {
   try {
-    // 취소된 것 제외하고 모든 요청 조회 (혹은 필요한 상태만)
-    const list = await SubRequest.find({ status: { $ne: 'cancelled' } })
-      .populate('scheduleId') // 스케줄 정보(날짜, 시간 등) 필요
+    const list = await SubRequest.find({
+      status: { $in: [...ACTIVE_SUB_STATUSES] },
+      'shift.date': { $gte: storeToday() },
+    })
       .sort({ createdAt: -1 })
+      .lean()
 
     return res.json(list)
   } catch (err) {
-    console.error(err)
+    logger.error('대타 목록 로드 실패', { err })
     return res.status(500).json({ message: 'error' })
   }
 }
@@ -199,7 +209,7 @@ export const updateSubRequest = async (req: UserRequest, res: Response) => {
 
     return res.json({ message: '수정 완료' })
   } catch (err) {
-    console.error(err)
+    logger.error('대타 요청 수정 실패', { err })
     return res.status(500).json({ message: 'error' })
   }
 }
@@ -229,7 +239,7 @@ export const cancelSubRequest = async (req: UserRequest, res: Response) => {
 
     return res.json({ message: '삭제 완료' })
   } catch (err) {
-    console.error(err)
+    logger.error('대타 요청 취소 실패', { err })
     return res.status(500).json({ message: 'error' })
   }
 }
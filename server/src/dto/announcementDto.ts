@@ -0,0 +1,48 @@
+import { compileSerializer } from '../utils/serializer'
+
+// 공지 목록: likes 배열 대신 개수와 "내가 눌렀는지"만 내려준다
+export const announcementListProjection = (userId = '') => ({
+  title: 1,
+  content: 1,
+  author: 1,
+  important: 1,
+  views: 1,
+  createdAt: 1,
+  updatedAt: 1,
+  likeCount: { $size: { $ifNull: ['$likes', []] } },
+  liked: { $in: [userId, { $ifNull: ['$likes', []] }] },
+})
+
+export interface AnnouncementListItem {
+  _id: unknown
+  title: string
+  content: string
+  author: string
+  important: boolean
+  views: number
+  likeCount: number
+  liked: boolean
+  createdAt: Date
+  updatedAt: Date
+}
+
+export const serializeAnnouncementList = compileSerializer<
+  AnnouncementListItem[]
+>({
+  type: 'array',
+  items: {
+    type: 'object',
+    properties: {
+      _id: 'id',
+      title: 'string',
+      content: 'string',
+      author: 'string',
+      important: 'boolean',
+      views: 'number',
+      likeCount: 'number',
+      liked: 'boolean',
+      createdAt: 'date',
+      updatedAt: 'date',
+    },
+  },
+})
@@ -0,0 +1,57 @@
+import { compileSerializer } from '../utils/serializer'
+
+export const HANDOVER_FIELDS =
+  'writer content checklist confirmed confirmedBy isImportant createdAt updatedAt'
+
+// populate 시 작성자/확인자에서 가져올 필드
+export const HANDOVER_USER_FIELDS = 'name username'
+
+const userRef = {
+  type: 'object' as const,
+  properties: {
+    _id: 'id' as const,
+    name: 'string' as const,
+    username: 'string' as const,
+  },
+}
+
+const handoverItem = {
+  type: 'object' as const,
+  properties: {
+    _id: 'id' as const,
+    writer: userRef,
+    content: 'string' as const,
+    checklist: {
+      type: 'array' as const,
+      items: {
+        type: 'object' as const,
+        properties: {
+          _id: 'id' as const,
+          item: 'string' as const,
+          done: 'boolean' as const,
+        },
+      },
+    },
+    confirmed: 'boolean' as const,
+    confirmedBy: { type: 'array' as const, items: userRef },
+    isImportant: 'boolean' as const,
+    createdAt: 'date' as const,
+    updatedAt: 'date' as const,
+  },
+}
+
+export const serializeHandover = compileSerializer(handoverItem)
+
+export const serializeHandoverList = compileSerializer({
+  type: 'array',
+  items: handoverItem,
+})
+
+export const serializeHandoverFeed = compileSerializer({
+  type: 'object',
+  properties: {
+    items: { type: 'array', items: handoverItem },
+    nextCursor: 'string',
+    unreadCount: 'number',
+  },
+})
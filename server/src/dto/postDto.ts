@@ -0,0 +1,68 @@
+import { compileSerializer } from '../utils/serializer'
+
+// 게시글 목록: 본문 외의 배열(likes, reports)은 개수로만 내려준다
+export const postListProjection = (userId = '') => ({
+  title: 1,
+  content: 1,
+  category: 1,
+  authorId: 1,
+  authorName: 1,
+  views: 1,
+  commentCount: 1,
+  hotScore: 1, // 인기순 커서용 (응답에는 포함하지 않음)
+  createdAt: 1,
+  likeCount: { $size: { $ifNull: ['$likes', []] } },
+  liked: { $in: [userId, { $ifNull: ['$likes', []] }] },
+  reportCount: { $size: { $ifNull: ['$reports', []] } },
+})
+
+export interface PostListItem {
+  _id: unknown
+  title: string
+  content: string
+  category: string
+  authorId: string
+  authorName: string
+  views: number
+  likeCount: number
+  liked: boolean
+  reportCount: number
+  commentCount: number
+  hotScore?: number
+  createdAt: Date
+}
+
+const postItem = {
+  type: 'object' as const,
+  properties: {
+    _id: 'id' as const,
+    title: 'string' as const,
+    content: 'string' as const,
+    category: 'string' as const,
+    authorId: 'string' as const,
+    authorName: 'string' as const,
+    views: 'number' as const,
+    likeCount: 'number' as const,
+    liked: 'boolean' as const,
+    reportCount: 'number' as const,
+    commentCount: 'number' as const,
+    createdAt: 'date' as const,
+  },
+}
+
+export const serializePostList = compileSerializer<PostListItem[]>({
+  type: 'array',
+  items: postItem,
+})
+
+// 커서 페이지 응답 (nextCursor 가 null 이면 마지막 페이지)
+export const serializePostPage = compileSerializer<{
+  posts: PostListItem[]
+  nextCursor: string | null
+}>({
+  type: 'object',
+  properties: {
+    posts: { type: 'array', items: postItem },
+    nextCursor: 'string',
+  },
+})
@@ -0,0 +1,28 @@
+import { compileSerializer } from '../utils/serializer'
+
+// 인벤토리/입고 화면용 상품 목록
+export const PRODUCT_LIST_FIELDS =
+  'name category stock minStock price barcode expiryDate createdAt'
+
+// 키오스크 빠른 선택 메뉴용 (결제에 필요한 필드만)
+export const KIOSK_PRODUCT_FIELDS = 'name category stock price barcode'
+
+const productItem = {
+  type: 'object' as const,
+  properties: {
+    _id: 'id' as const,
+    name: 'string' as const,
+    category: 'string' as const,
+    stock: 'number' as const,
+    minStock: 'number' as const,
+    price: 'number' as const,
+    barcode: 'string' as const,
+    expiryDate: 'date' as const,
+    createdAt: 'date' as const,
+  },
+}
+
+export const serializeProductList = compileSerializer({
+  type: 'array',
+  items: productItem,
+})
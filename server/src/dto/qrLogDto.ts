@@ -0,0 +1,21 @@
+import { compileSerializer } from '../utils/serializer'
+
+export const QR_LOG_LIST_FIELDS =
+  'productName barcode price entryDate expireDate quantity scannedAt'
+
+export const serializeQrLogList = compileSerializer({
+  type: 'array',
+  items: {
+    type: 'object',
+    properties: {
+      _id: 'id',
+      productName: 'string',
+      barcode: 'string',
+      price: 'number',
+      entryDate: 'string',
+      expireDate: 'string',
+      quantity: 'number',
+      scannedAt: 'date',
+    },
+  },
+})
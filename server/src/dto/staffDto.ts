@@ -0,0 +1,19 @@
+import { compileSerializer } from '../utils/serializer'
+
+// 직원 목록: password / rawPassword 는 절대 내려주지 않는다
+export const STAFF_LIST_FIELDS = 'name phone username joinDate status'
+
+export const serializeStaffList = compileSerializer({
+  type: 'array',
+  items: {
+    type: 'object',
+    properties: {
+      _id: 'id',
+      name: 'string',
+      phone: 'string',
+      username: 'string',
+      joinDate: 'date',
+      status: 'string',
+    },
+  },
+})
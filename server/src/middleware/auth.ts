@@ -1,11 +1,15 @@
 import { Request, Response, NextFunction } from 'express'
-import jwt from 'jsonwebtoken'
+import { verifyToken } from '../utils/tokenCache'
+import { enterStore, resolveStore } from './tenant'
+import { DecodedToken } from '../types/token'
 
 // 🔹 기존 타입에 맞게 userId 유지
 export interface UserRequest extends Request {
-  user?: { userId: string; role: string }
+  user?: { userId: string; role: string; storeId?: string; staffIndex?: number }
 }
 
+const STORE_FORBIDDEN = { message: '접근 권한이 없는 매장입니다.' }
+
 // 🔹 기존 코드 유지 + 타입 호환
 export const authMiddleware = (
   req: UserRequest,
@@ -18,20 +22,28 @@ export const authMiddleware = (
   }
 
   const token = authHeader.split(' ')[1]
+  let decoded: DecodedToken
   try {
-    const decoded = jwt.verify(token, process.env.JWT_SECRET!)
-
-    if (typeof decoded === 'object' && 'userId' in decoded) {
-      req.user = {
-        userId: (decoded as any).userId,
-        role: (decoded as any).role,
-      }
-    }
-
-    next()
+    decoded = verifyToken(token) as DecodedToken
   } catch {
     return res.status(403).json({ message: '유효하지 않은 토큰입니다.' })
   }
+
+  // 토큰의 소속 매장 (또는 사장이 고른 매장) 으로 이후 쿼리 범위 고정
+  const storeId = resolveStore(req, decoded)
+  if (!storeId) return res.status(403).json(STORE_FORBIDDEN)
+  enterStore(storeId)
+
+  if (typeof decoded === 'object' && 'userId' in decoded) {
+    req.user = {
+      userId: decoded.userId,
+      role: decoded.role,
+      storeId,
+      staffIndex: decoded.staffIndex,
+    }
+  }
+
+  next()
 }
 
 // 🔹 모든 로그인 사용자 접근 가능
@@ -39,13 +51,19 @@ export const auth = (req: UserRequest, res: Response, next: NextFunction) => {
   const token = req.headers.authorization?.split(' ')[1]
   if (!token) return res.status(401).json({ message: 'Token missing' })
 
+  let decoded: DecodedToken
   try {
-    const decoded = jwt.verify(token, process.env.JWT_SECRET!)
-    req.user = decoded as { userId: string; role: string }
-    next()
+    decoded = verifyToken(token) as DecodedToken
   } catch {
     return res.status(401).json({ message: 'Token invalid' })
   }
+
+  const storeId = resolveStore(req, decoded)
+  if (!storeId) return res.status(403).json(STORE_FORBIDDEN)
+  enterStore(storeId)
+
+  req.user = { ...decoded, storeId }
+  next()
 }
 
 // 🔹 사장 전용 API 접근 제한
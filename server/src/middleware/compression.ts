@@ -0,0 +1,110 @@
+import { Request, Response, NextFunction } from 'express'
+import zlib from 'zlib'
+import { promisify } from 'util'
+import { LruCache } from '../utils/lruCache'
+import { counter } from '../utils/metrics'
+import { logger } from '../utils/logger'
+
+// 🔹 응답 압축 (Accept-Encoding 협상: br > gzip)
+// res.send 로 한 번에 보내는 본문만 대상으로 한다 (스트리밍 응답은 그대로 통과).
+// 압축은 zlib 스레드풀에서 비동기로 하고, ETag 가 있는 응답은 결과를 메모해 두어
+// 캐시 HIT 응답(상품 목록 등)을 매번 다시 압축하지 않는다.
+//
+// 환경 변수
+// - COMPRESSION_THRESHOLD: 이 크기(바이트) 미만은 압축하지 않음 (기본 1024)
+// - COMPRESSION_BROTLI_QUALITY: 0~11, 높을수록 작지만 느림 (기본 4)
+// - COMPRESSION_CACHE_BYTES: 압축 결과 메모 상한 (기본 16MB)
+
+type Coding = 'br' | 'gzip'
+
+const THRESHOLD = Number(process.env.COMPRESSION_THRESHOLD ?? 1024)
+const BROTLI_QUALITY = Number(process.env.COMPRESSION_BROTLI_QUALITY ?? 4)
+
+const COMPRESSIBLE = /^(application\/(json|msgpack|javascript|xml)|text\/)/i
+
+const brotli = promisify(zlib.brotliCompress)
+const gzip = promisify(zlib.gzip)
+
+const encoders: Record<Coding, (body: Buffer) => Promise<Buffer>> = {
+  br: (body) =>
+    brotli(body, {
+      params: {
+        [zlib.constants.BROTLI_PARAM_QUALITY]: BROTLI_QUALITY,
+        [zlib.constants.BROTLI_PARAM_SIZE_HINT]: body.length,
+      },
+    }),
+  gzip: (body) => gzip(body, { level: zlib.constants.Z_DEFAULT_COMPRESSION }),
+}
+
+const bytesTotal = counter('http_compression_bytes_total', 'Response bytes before/after compression')
+
+// `코딩:ETag` → 압축 결과
+const memo = new LruCache<Buffer>({
+  maxEntries: 1000,
+  maxSize: Number(process.env.COMPRESSION_CACHE_BYTES) || 16 * 1024 * 1024,
+  ttl: 5 * 60_000,
+  sizeOf: (buf) => buf.length,
+})
+
+const compressible = (req: Request, res: Response, body: Buffer) =>
+  req.method !== 'HEAD' &&
+  res.statusCode !== 204 &&
+  res.statusCode !== 304 &&
+  body.length >= THRESHOLD &&
+  !res.getHeader('Content-Encoding') &&
+  COMPRESSIBLE.test(String(res.getHeader('Content-Type') ?? ''))
+
+export const compression = (req: Request, res: Response, next: NextFunction) => {
+  const end = res.end.bind(res) as (...args: any[]) => Response
+
+  res.end = ((chunk?: any, encoding?: any, cb?: any) => {
+    res.end = end as Response['end']
+    if (res.headersSent || (typeof chunk !== 'string' && !Buffer.isBuffer(chunk))) {
+      return end(chunk, encoding, cb)
+    }
+
+    const body = Buffer.isBuffer(chunk)
+      ? chunk
+      : Buffer.from(chunk, typeof encoding === 'string' ? (encoding as BufferEncoding) : 'utf8')
+    if (!compressible(req, res, body)) return end(chunk, encoding, cb)
+
+    // 압축 여부가 요청 헤더에 따라 달라지므로 중간 캐시에 알린다
+    res.vary('Accept-Encoding')
+    const coding = req.acceptsEncodings(['br', 'gzip', 'identity'])
+    if (coding !== 'br' && coding !== 'gzip') return end(chunk, encoding, cb)
+
+    const etag = res.getHeader('ETag') as string | undefined
+    const key = etag ? `${coding}:${etag}` : undefined
+    const done = typeof encoding === 'function' ? encoding : cb
+
+    const send = (compressed: Buffer) => {
+      bytesTotal.inc({ encoding: coding, stage: 'in' }, body.length)
+      bytesTotal.inc({ encoding: coding, stage: 'out' }, compressed.length)
+      res.setHeader('Content-Encoding', coding)
+      res.setHeader('Content-Length', compressed.length)
+      // 바이트가 달라졌으므로 약한 ETag 로 (If-None-Match 비교는 그대로 동작)
+      if (etag && !etag.startsWith('W/')) res.setHeader('ETag', `W/${etag}`)
+      end(compressed, done)
+    }
+
+    const memoized = key ? memo.get(key) : undefined
+    if (memoized) {
+      send(memoized)
+      return res
+    }
+
+    encoders[coding](body).then(
+      (compressed) => {
+        if (key) memo.set(key, compressed)
+        send(compressed)
+      },
+      (err) => {
+        logger.warn('응답 압축 실패, 원본 전송', { err, coding })
+        end(body, done)
+      }
+    )
+    return res
+  }) as Response['end']
+
+  next()
+}
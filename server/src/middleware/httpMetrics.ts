@@ -0,0 +1,61 @@
+import { Request, Response, NextFunction } from 'express'
+import { counter, histogram } from '../utils/metrics'
+import { requestContext, RequestContext } from '../utils/requestContext'
+
+// 🔹 라우트별 응답 시간 히스토그램 + 상태 코드 카운트 + 요청당 Mongo 쿼리 수
+
+const requestDuration = histogram(
+  'http_request_duration_seconds',
+  'HTTP request latency by route',
+  [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+)
+const requestsTotal = counter(
+  'http_requests_total',
+  'HTTP requests by route and status code'
+)
+const queriesPerRequest = histogram(
+  'http_request_db_queries',
+  'Mongo queries issued per request',
+  [0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89]
+)
+// 매장별 지연 (한 지점의 데이터/트래픽이 다른 지점에 영향을 주는지 확인용)
+const storeRequestDuration = histogram(
+  'http_store_request_duration_seconds',
+  'HTTP request latency by store',
+  [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+)
+
+// SERVER_TIMING=true 이면 브라우저 개발자도구에서 app/db 시간을 확인할 수 있다
+const serverTiming = process.env.SERVER_TIMING === 'true'
+
+// 경로 파라미터가 들어간 URL 대신 등록된 라우트 패턴으로 집계 (카디널리티 제한)
+const routeOf = (req: Request) =>
+  req.route ? `${req.baseUrl}${req.route.path}` : 'unmatched'
+
+export const httpMetrics = (req: Request, res: Response, next: NextFunction) => {
+  const began = performance.now()
+  const ctx: RequestContext = { queryCount: 0, queryTime: 0 }
+
+  if (serverTiming) {
+    const writeHead = res.writeHead
+    res.writeHead = function (this: Response, ...args: any[]) {
+      const total = performance.now() - began
+      res.setHeader(
+        'Server-Timing',
+        `app;dur=${total.toFixed(1)}, db;dur=${ctx.queryTime.toFixed(1)};desc="${ctx.queryCount} queries"`
+      )
+      return writeHead.apply(this, args as any)
+    } as Response['writeHead']
+  }
+
+  res.on('finish', () => {
+    const route = routeOf(req)
+    const seconds = (performance.now() - began) / 1000
+    requestDuration.observe({ method: req.method, route }, seconds)
+    requestsTotal.inc({ method: req.method, route, status: res.statusCode })
+    queriesPerRequest.observe({ route }, ctx.queryCount)
+    if (ctx.storeId) storeRequestDuration.observe({ store: ctx.storeId }, seconds)
+  })
+
+  requestContext.run(ctx, next)
+}
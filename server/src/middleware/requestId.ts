@@ -0,0 +1,23 @@
+import { Request, Response, NextFunction } from 'express'
+import crypto from 'crypto'
+import { currentContext } from '../utils/requestContext'
+import { sampleRateFor } from '../utils/logger'
+
+// 🔹 요청 ID + 로그 샘플링 결정
+// 앞단(프록시/클라이언트)이 보낸 X-Request-Id 를 이어 쓰고, 없으면 새로 만든다.
+// 샘플링은 요청 단위로 정해서 한 요청의 로그는 모두 남거나 모두 빠진다 (warn/error 는 항상 남음)
+
+const REQUEST_ID_PATTERN = /^[\w.-]{8,64}$/
+
+export const requestId = (req: Request, res: Response, next: NextFunction) => {
+  const incoming = req.get('x-request-id')
+  const id = incoming && REQUEST_ID_PATTERN.test(incoming) ? incoming : crypto.randomUUID()
+  res.setHeader('X-Request-Id', id)
+
+  const ctx = currentContext()
+  if (ctx) {
+    ctx.requestId = id
+    ctx.logSampled = Math.random() < sampleRateFor(req.path)
+  }
+  next()
+}
@@ -0,0 +1,176 @@
+import { Request, Response, NextFunction } from 'express'
+import crypto from 'crypto'
+import { LruCache } from '../utils/lruCache'
+import { counter, gauge } from '../utils/metrics'
+import { publish, subscribe } from '../utils/messageBus'
+import { currentStoreId, DEFAULT_STORE_ID } from '../utils/tenant'
+import { wantsMsgpack } from '../utils/msgpack'
+
+// 🔹 읽기 빈도가 높은 GET 응답을 메모리에 캐싱하고 쓰기 라우트에서 태그 단위로 무효화
+// 태그는 응답이 의존하는 컬렉션 이름 (products, orders, users ...)
+// 캐시 키와 무효화는 매장 단위: 한 매장의 쓰기가 다른 매장 캐시를 비우지 않는다
+
+interface CachedResponse {
+  body: Buffer
+  etag: string
+  contentType: string
+  tags: string[]
+  storeId: string
+}
+
+interface CacheOptions {
+  tags: string[]
+  ttl?: number // ms
+  perUser?: boolean // 사용자별 필드(liked 등)가 포함된 응답
+}
+
+const INVALIDATE_TOPIC = 'response-cache:invalidate'
+const DEFAULT_TTL = Number(process.env.RESPONSE_CACHE_TTL_MS) || 30_000
+
+const hits = counter('response_cache_hits_total', 'Response cache hits')
+const misses = counter('response_cache_misses_total', 'Response cache misses')
+const evictions = counter(
+  'response_cache_evictions_total',
+  'Entries evicted by the size bound'
+)
+const invalidations = counter(
+  'response_cache_invalidations_total',
+  'Tag invalidations triggered by writes'
+)
+
+const store = new LruCache<CachedResponse>({
+  maxEntries: Number(process.env.RESPONSE_CACHE_MAX_ENTRIES) || 500,
+  maxSize: Number(process.env.RESPONSE_CACHE_MAX_BYTES) || 32 * 1024 * 1024,
+  ttl: DEFAULT_TTL,
+  sizeOf: (entry) => entry.body.length,
+  onEvict: () => evictions.inc(),
+})
+
+const routes = new Set<string>()
+
+gauge('response_cache_entries', 'Entries in the response cache', (g) =>
+  g.set(undefined, store.size)
+)
+gauge('response_cache_bytes', 'Body bytes held by the response cache', (g) =>
+  g.set(undefined, store.bytes)
+)
+gauge('response_cache_hit_ratio', 'Hit ratio per cached route', (g) => {
+  for (const route of routes) {
+    const h = hits.get({ route })
+    const total = h + misses.get({ route })
+    g.set({ route }, total > 0 ? h / total : 0)
+  }
+})
+
+interface Invalidation {
+  tags: string[]
+  storeId?: string // 없으면 전체 매장 (요청 밖 배치/엔진)
+}
+
+// 태그별 세대 번호: 조회 도중 무효화가 일어나면 그 결과는 저장하지 않는다
+// 키는 `매장:태그`, 전체 매장 무효화는 `*:태그`
+const generations = new Map<string, number>()
+const bump = (key: string) => generations.set(key, (generations.get(key) ?? 0) + 1)
+const generationOf = (storeId: string, tags: string[]) =>
+  tags
+    .map((t) => `${generations.get(`*:${t}`) ?? 0}.${generations.get(`${storeId}:${t}`) ?? 0}`)
+    .join(':')
+
+const applyInvalidation = ({ tags, storeId }: Invalidation) => {
+  for (const tag of tags) bump(`${storeId ?? '*'}:${tag}`)
+  store.deleteWhere(
+    (entry) =>
+      (storeId === undefined || entry.storeId === storeId) &&
+      entry.tags.some((t) => tags.includes(t))
+  )
+}
+
+// 클러스터 모드: 다른 워커에서 발생한 쓰기도 이 워커의 캐시에 반영
+subscribe(INVALIDATE_TOPIC, applyInvalidation)
+
+export const invalidateTags = (tags: string[], storeId = currentStoreId()) => {
+  for (const tag of tags) invalidations.inc({ tag })
+  publish(INVALIDATE_TOPIC, { tags, storeId } satisfies Invalidation)
+}
+
+const etagMatches = (header: string | undefined, etag: string) =>
+  !!header &&
+  (header.trim() === '*' ||
+    header.split(',').some((t) => t.trim().replace(/^W\//, '') === etag))
+
+export const cacheResponse =
+  ({ tags, ttl = DEFAULT_TTL, perUser = false }: CacheOptions) =>
+  (req: Request, res: Response, next: NextFunction) => {
+    if (req.method !== 'GET') return next()
+
+    const route = req.baseUrl + (req.route?.path ?? req.path)
+    routes.add(route)
+
+    const storeId = currentStoreId() ?? DEFAULT_STORE_ID
+    const scope = perUser ? req.user?.userId ?? 'anonymous' : '*'
+    // 같은 URL 이라도 msgpack/JSON 응답은 따로 저장
+    const variant = wantsMsgpack(req) ? 'mp' : 'json'
+    const key = `${storeId}:${scope}:${variant}:${req.originalUrl}`
+
+    // 브라우저는 매번 ETag 로 재검증
+    res.setHeader('Cache-Control', 'private, no-cache')
+    res.vary('Accept')
+
+    const cached = store.get(key)
+    if (cached) {
+      hits.inc({ route })
+      res.setHeader('ETag', cached.etag)
+      res.setHeader('X-Cache', 'HIT')
+      if (etagMatches(req.headers['if-none-match'], cached.etag)) {
+        return res.status(304).end()
+      }
+      return res.type(cached.contentType).send(cached.body)
+    }
+
+    misses.inc({ route })
+    res.setHeader('X-Cache', 'MISS')
+
+    const startGeneration = generationOf(storeId, tags)
+    const originalSend = res.send.bind(res)
+
+    // res.json → res.send(string) 로 이어지므로 문자열/버퍼 단계에서 가로챈다
+    res.send = ((body?: unknown) => {
+      if (typeof body !== 'string' && !Buffer.isBuffer(body)) {
+        return originalSend(body)
+      }
+      res.send = originalSend
+
+      if (res.statusCode === 200 && generationOf(storeId, tags) === startGeneration) {
+        const buf = Buffer.isBuffer(body) ? body : Buffer.from(body)
+        const etag = `"${crypto.createHash('sha1').update(buf).digest('base64url')}"`
+        store.set(
+          key,
+          {
+            body: buf,
+            etag,
+            contentType: String(res.getHeader('Content-Type') ?? 'application/json'),
+            tags,
+            storeId,
+          },
+          ttl
+        )
+        // Express 가 If-None-Match 와 비교해 304 처리
+        res.setHeader('ETag', etag)
+      }
+      return originalSend(body)
+    }) as Response['send']
+
+    next()
+  }
+
+// 쓰기 라우트: 성공 응답 후 관련 태그 캐시 무효화
+export const invalidates =
+  (...tags: string[]) =>
+  (_req: Request, res: Response, next: NextFunction) => {
+    // finish 콜백은 요청 컨텍스트 밖에서 실행될 수 있으므로 매장은 미리 잡아둔다
+    const storeId = currentStoreId()
+    res.on('finish', () => {
+      if (res.statusCode < 400) invalidateTags(tags, storeId)
+    })
+    next()
+  }
@@ -0,0 +1,35 @@
+import { Request, Response, NextFunction } from 'express'
+import { currentContext } from '../utils/requestContext'
+import { DEFAULT_STORE_ID, isValidStoreId } from '../utils/tenant'
+import { DecodedToken } from '../types/token'
+
+// 🔹 요청 대상 매장 결정
+// - storeScope (/api 전체): X-Store-Id 헤더, 없으면 기본 매장. 로그인 없이 쓰는 키오스크/QR 에 적용
+// - resolveStore (인증 미들웨어): 토큰의 소속 매장 기준. 헤더로 다른 매장을 고르면 사장 + 허용 매장일 때만
+
+export const STORE_HEADER = 'x-store-id'
+
+const requestedStore = (req: Request) => req.get(STORE_HEADER)?.trim().toLowerCase() || undefined
+
+export const enterStore = (storeId: string) => {
+  const ctx = currentContext()
+  if (ctx) ctx.storeId = storeId
+}
+
+export const storeScope = (req: Request, res: Response, next: NextFunction) => {
+  const requested = requestedStore(req)
+  if (requested !== undefined && !isValidStoreId(requested)) {
+    return res.status(400).json({ message: '잘못된 매장 ID 입니다.' })
+  }
+  enterStore(requested ?? DEFAULT_STORE_ID)
+  next()
+}
+
+// 접근할 수 없는 매장이면 null
+export const resolveStore = (req: Request, token: DecodedToken) => {
+  const home = token.storeId ?? DEFAULT_STORE_ID
+  const requested = requestedStore(req)
+  if (!requested || requested === home) return home
+  if (token.role === 'owner' && token.stores?.includes(requested)) return requested
+  return null
+}
@@ -1,4 +1,5 @@
 import mongoose, { Document, Schema } from 'mongoose';
+import { storeIdField } from '../utils/tenant';
 
 export interface IAnnouncement extends Document {
   title: string;
@@ -7,6 +8,9 @@ export interface IAnnouncement extends Document {
   important: boolean;
   views: number;
   likes: string[]; // 좋아요를 누른 유저 ID 목록
+  readMask: Record<string, number>; // 열람한 직원 비트맵 { w0, w1, ... } (services/readReceipts)
+  readCount: number; // 열람한 직원 수
+  storeId: string;
   createdAt: Date;
   updatedAt: Date;
 }
@@ -19,8 +23,13 @@ const AnnouncementSchema: Schema = new Schema(
     important: { type: Boolean, default: false },
     views: { type: Number, default: 0 },
     likes: [{ type: String }], // 유저 ID 문자열 저장
+    readMask: { type: Schema.Types.Mixed, default: {} },
+    readCount: { type: Number, default: 0 },
+    storeId: storeIdField,
   },
   { timestamps: true }
 );
 
+AnnouncementSchema.index({ storeId: 1, important: -1, createdAt: -1 });
+
 export default mongoose.model<IAnnouncement>('Announcement', AnnouncementSchema);
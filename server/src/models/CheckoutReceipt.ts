@@ -0,0 +1,40 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 키오스크 오프라인 결제 수신 기록 (멱등성 키 → 발급한 주문번호)
+// 주문(time-series)은 unique 인덱스를 가질 수 없어서 중복 판정은 이 컬렉션이 맡는다.
+// 키오스크가 같은 판매를 다시 보내도(응답 유실 후 재전송 등) 주문은 한 번만 만들어진다.
+export const RECEIPT_RETENTION_DAYS = Number(process.env.CHECKOUT_RECEIPT_RETENTION_DAYS) || 30
+
+// 주문은 time-series 라 수신 기록과 한 트랜잭션으로 묶을 수 없다
+// → pending 으로 먼저 기록하고 주문 저장 후 committed. 멈춘 pending 은 주문 존재 여부로 정리 (services/offlineSales)
+// status 가 없는 예전 기록은 committed 로 본다
+export type ReceiptStatus = 'pending' | 'committed'
+
+export interface ICheckoutReceipt extends Document {
+  key: string // 키오스크가 판매마다 만든 UUID
+  orderNumber: string
+  status?: ReceiptStatus
+  soldAt?: Date // 주문의 createdAt (pending 정리 시 주문 조회 범위)
+  storeId: string
+  createdAt: Date
+}
+
+const CheckoutReceiptSchema: Schema = new Schema({
+  key: { type: String, required: true },
+  orderNumber: { type: String, required: true },
+  status: { type: String, enum: ['pending', 'committed'] },
+  soldAt: { type: Date },
+  storeId: storeIdField,
+  createdAt: { type: Date, default: Date.now },
+})
+
+CheckoutReceiptSchema.index({ storeId: 1, key: 1 }, { unique: true })
+// 보관 기간이 지나면 자동 삭제 (키오스크 큐는 그보다 훨씬 빨리 비워진다)
+CheckoutReceiptSchema.index(
+  { createdAt: 1 },
+  { expireAfterSeconds: RECEIPT_RETENTION_DAYS * 86_400 }
+)
+
+export default (models.CheckoutReceipt as mongoose.Model<ICheckoutReceipt>) ||
+  model<ICheckoutReceipt>('CheckoutReceipt', CheckoutReceiptSchema)
@@ -1,4 +1,5 @@
 import mongoose, { Document, Schema } from 'mongoose';
+import { storeIdField } from '../utils/tenant';
 
 export interface IComment extends Document {
   postId: string;
@@ -7,6 +8,7 @@ export interface IComment extends Document {
   authorId: string;
   authorName: string;
   likes: string[];
+  storeId: string;
   createdAt: Date;
 }
 
@@ -18,8 +20,13 @@ const CommentSchema: Schema = new Schema(
     authorId: { type: String, required: true },
     authorName: { type: String, default: '익명' },
     likes: [{ type: String }],
+    storeId: storeIdField,
   },
   { timestamps: true }
 );
 
+CommentSchema.index({ storeId: 1, postId: 1, createdAt: 1 });
+// 최근 댓글 수 (커뮤니티 통계)
+CommentSchema.index({ storeId: 1, createdAt: 1 });
+
 export default mongoose.model<IComment>('Comment', CommentSchema);
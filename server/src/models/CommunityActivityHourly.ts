@@ -0,0 +1,33 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 커뮤니티 시간당 활동 (Post/Comment 변경 스트림 프로젝션, services/projections)
+// 커뮤니티 통계의 "최근 24시간" 값은 최근 버킷 합계로 계산한다
+export const ACTIVITY_RETENTION_DAYS = 3
+
+export interface ICommunityActivityHourly extends Document {
+  hour: Date // 해당 시간의 시작 (UTC 정시)
+  tips: number // 새 게시글 (카테고리별)
+  suggestions: number
+  comments: number
+  reports: number
+  storeId: string
+}
+
+const CommunityActivityHourlySchema: Schema = new Schema({
+  hour: { type: Date, required: true },
+  tips: { type: Number, default: 0 },
+  suggestions: { type: Number, default: 0 },
+  comments: { type: Number, default: 0 },
+  reports: { type: Number, default: 0 },
+  storeId: storeIdField,
+})
+
+CommunityActivityHourlySchema.index({ storeId: 1, hour: 1 }, { unique: true })
+CommunityActivityHourlySchema.index(
+  { hour: 1 },
+  { expireAfterSeconds: ACTIVITY_RETENTION_DAYS * 86_400 }
+)
+
+export default (models.CommunityActivityHourly as mongoose.Model<ICommunityActivityHourly>) ||
+  model<ICommunityActivityHourly>('CommunityActivityHourly', CommunityActivityHourlySchema)
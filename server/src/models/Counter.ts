@@ -0,0 +1,21 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 매장별 순번 (findOneAndUpdate $inc upsert 로 발급, 되돌리거나 재사용하지 않음)
+// - staffIndex: 직원 고유 번호 → 공지 열람 비트맵의 비트 위치 (services/readReceipts)
+export interface ICounter extends Document {
+  name: string
+  seq: number // 지금까지 발급한 개수 (다음 값 = seq)
+  storeId: string
+}
+
+const CounterSchema: Schema = new Schema({
+  name: { type: String, required: true },
+  seq: { type: Number, default: 0 },
+  storeId: storeIdField,
+})
+
+CounterSchema.index({ storeId: 1, name: 1 }, { unique: true })
+
+export default (models.Counter as mongoose.Model<ICounter>) ||
+  model<ICounter>('Counter', CounterSchema)
@@ -1,4 +1,5 @@
 import mongoose, { Schema, Document } from 'mongoose';
+import { storeIdField } from '../utils/tenant';
 
 export interface IHandover extends Document {
   writer: mongoose.Types.ObjectId; // User (Staff) who wrote this
@@ -7,6 +8,7 @@ export interface IHandover extends Document {
   confirmed: boolean;
   confirmedBy: mongoose.Types.ObjectId[]; // Array of Users who confirmed
   isImportant: boolean;
+  storeId: string;
   createdAt: Date;
   updatedAt: Date;
 }
@@ -24,8 +26,16 @@ const HandoverSchema: Schema = new Schema(
     confirmed: { type: Boolean, default: false },
     confirmedBy: [{ type: Schema.Types.ObjectId, ref: 'User' }],
     isImportant: { type: Boolean, default: false },
+    storeId: storeIdField,
   },
   { timestamps: true }
 );
 
+// 피드 커서 페이징 (createdAt, _id 역순)
+HandoverSchema.index({ storeId: 1, createdAt: -1, _id: -1 });
+// 대시보드: 미확인 중요 인수인계
+HandoverSchema.index({ storeId: 1, isImportant: 1, confirmed: 1, createdAt: -1 });
+// 사용자별 미확인 건수 / 일괄 확인 (매장 + 가입 이후 createdAt 범위)
+HandoverSchema.index({ storeId: 1, createdAt: -1, confirmedBy: 1 });
+
 export default mongoose.model<IHandover>('Handover', HandoverSchema);
@@ -0,0 +1,43 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 재고 알림 (alertEngine 이 유지하는 materialized 컬렉션)
+// 상품당 종류별로 최대 1건: 대시보드는 상품 전체가 아니라 이 컬렉션만 읽는다
+export type AlertKind = 'expired' | 'expiring' | 'low_stock'
+
+export interface IInventoryAlert extends Document {
+  productId: mongoose.Types.ObjectId
+  kind: AlertKind
+  name: string
+  category?: string
+  stock: number
+  minStock: number
+  expiryDate?: Date
+  storeId: string
+  createdAt: Date // 알림이 처음 발생한 시각
+  updatedAt: Date
+}
+
+const InventoryAlertSchema: Schema = new Schema(
+  {
+    productId: { type: Schema.Types.ObjectId, ref: 'Product', required: true },
+    kind: {
+      type: String,
+      enum: ['expired', 'expiring', 'low_stock'],
+      required: true,
+    },
+    name: { type: String, default: '이름 없음' },
+    category: String,
+    stock: { type: Number, default: 0 },
+    minStock: { type: Number, default: 0 },
+    expiryDate: Date,
+    storeId: storeIdField,
+  },
+  { timestamps: true }
+)
+
+InventoryAlertSchema.index({ storeId: 1, productId: 1, kind: 1 }, { unique: true })
+InventoryAlertSchema.index({ storeId: 1, kind: 1, expiryDate: 1 })
+
+export default (models.InventoryAlert as mongoose.Model<IInventoryAlert>) ||
+  model<IInventoryAlert>('InventoryAlert', InventoryAlertSchema)
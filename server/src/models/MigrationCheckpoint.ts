@@ -0,0 +1,24 @@
+import { Schema, model, models, Model, Types } from 'mongoose'
+
+// 데이터 마이그레이션 진행 위치 (중단 후 이어서 실행하기 위한 체크포인트)
+export interface IMigrationCheckpoint {
+  name: string
+  lastId: Types.ObjectId | null
+  scanned: number
+  modified: number
+  completedAt: Date | null
+}
+
+const MigrationCheckpointSchema = new Schema<IMigrationCheckpoint>(
+  {
+    name: { type: String, required: true, unique: true },
+    lastId: { type: Schema.Types.ObjectId, default: null },
+    scanned: { type: Number, default: 0 },
+    modified: { type: Number, default: 0 },
+    completedAt: { type: Date, default: null },
+  },
+  { timestamps: true }
+)
+
+export default (models.MigrationCheckpoint as Model<IMigrationCheckpoint>) ||
+  model<IMigrationCheckpoint>('MigrationCheckpoint', MigrationCheckpointSchema)
@@ -1,4 +1,9 @@
 import mongoose, { Schema, Document } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 원본 주문 보관 기간. 지난 주문은 time-series TTL 로 버킷 단위 삭제되고
+// 그 전에 orderRetention 이 월별 파일로 보관한다 (집계는 SalesHourly/ProductSalesDaily 에 남음)
+export const ORDER_RETENTION_DAYS = Number(process.env.ORDER_RETENTION_DAYS) || 730
 
 export interface IOrder extends Document {
   orderNumber: string
@@ -10,12 +15,14 @@ export interface IOrder extends Document {
   }[]
   totalAmount: number
   paymentMethod: 'card' | 'cash'
+  storeId: string
   createdAt: Date
 }
 
 const OrderSchema: Schema = new Schema(
   {
-    orderNumber: { type: String, required: true, unique: true },
+    // utils/orderNumber 로 발급 (time-series 는 unique 인덱스 불가)
+    orderNumber: { type: String, required: true },
     items: [
       {
         productId: { type: Schema.Types.ObjectId, ref: 'Product' },
@@ -26,8 +33,17 @@ const OrderSchema: Schema = new Schema(
     ],
     totalAmount: { type: Number, required: true },
     paymentMethod: { type: String, default: 'card' },
+    storeId: storeIdField,
   },
-  { timestamps: true }
+  {
+    // 주문은 추가만 되므로 updatedAt 없음
+    timestamps: { createdAt: true, updatedAt: false },
+    // 📌 time-series 컬렉션: 매장(metaField)별로 createdAt 순 버킷에 묶어 압축 저장
+    // 매장 + 시간 범위 조회는 버킷 단위 스캔, 샤드 키도 { storeId, createdAt }
+    // 매장 주문량(분당 수 건)에는 hours 단위 버킷이 문서 수/압축률 면에서 유리하다
+    timeseries: { timeField: 'createdAt', metaField: 'storeId', granularity: 'hours' },
+    expireAfterSeconds: ORDER_RETENTION_DAYS * 86_400,
+  }
 )
 
 export default mongoose.model<IOrder>('Order', OrderSchema)
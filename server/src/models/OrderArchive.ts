@@ -0,0 +1,25 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+
+// 월별 원본 주문 보관 기록 (orderRetention 이 TTL 삭제 전에 파일로 내보낸 결과)
+export interface IOrderArchive extends Document {
+  month: string // YYYY-MM
+  file: string
+  orders: number
+  revenue: number
+  bytes: number
+  archivedAt: Date
+}
+
+const OrderArchiveSchema: Schema = new Schema({
+  month: { type: String, required: true },
+  file: { type: String, required: true },
+  orders: { type: Number, default: 0 },
+  revenue: { type: Number, default: 0 },
+  bytes: { type: Number, default: 0 },
+  archivedAt: { type: Date, default: Date.now },
+})
+
+OrderArchiveSchema.index({ month: 1 }, { unique: true })
+
+export default (models.OrderArchive as mongoose.Model<IOrderArchive>) ||
+  model<IOrderArchive>('OrderArchive', OrderArchiveSchema)
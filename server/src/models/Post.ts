@@ -1,4 +1,5 @@
 import mongoose, { Document, Schema } from 'mongoose';
+import { storeIdField } from '../utils/tenant';
 
 export interface IReport {
   userId: string;
@@ -14,6 +15,9 @@ export interface IPost extends Document {
   views: number;
   likes: string[];
   reports: IReport[]; // 변경됨: 객체 배열
+  commentCount: number; // 댓글 수 (작성/삭제 시 증감, postRanking 배치가 보정)
+  hotScore: number; // 인기글 정렬 점수 (services/postRanking)
+  storeId: string;
   createdAt: Date;
 }
 
@@ -30,8 +34,17 @@ const PostSchema: Schema = new Schema(
       userId: { type: String, required: true },
       createdAt: { type: Date, default: Date.now }
     }], 
+    commentCount: { type: Number, default: 0 },
+    hotScore: { type: Number, default: 0 },
+    storeId: storeIdField,
   },
   { timestamps: true }
 );
 
+// 목록 커서 페이지: 최신순 / 인기순 (같은 값은 _id 로 순서 고정)
+PostSchema.index({ storeId: 1, createdAt: -1, _id: -1 });
+PostSchema.index({ storeId: 1, hotScore: -1, _id: -1 });
+// 최근 신고 수 (커뮤니티 통계)
+PostSchema.index({ storeId: 1, 'reports.createdAt': 1 });
+
 export default mongoose.model<IPost>('Post', PostSchema);
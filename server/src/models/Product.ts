@@ -1,4 +1,5 @@
 import mongoose, { Schema, Document, models, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
 
 export interface IProduct extends Document {
   name: string
@@ -8,6 +9,7 @@ export interface IProduct extends Document {
   price: number
   barcode: string
   expiryDate?: Date
+  storeId: string
 }
 
 const ProductSchema: Schema = new Schema(
@@ -17,11 +19,22 @@ const ProductSchema: Schema = new Schema(
     stock: { type: Number, default: 0 },
     minStock: { type: Number, default: 0 },
     price: { type: Number, default: 0 },
-    barcode: { type: String, unique: true, sparse: true },
+    barcode: { type: String },
     expiryDate: { type: Date },
+    storeId: storeIdField,
   },
   { timestamps: true }
 )
 
+// 바코드는 매장 안에서만 unique (같은 상품을 여러 지점이 취급)
+ProductSchema.index(
+  { storeId: 1, barcode: 1 },
+  { unique: true, partialFilterExpression: { barcode: { $type: 'string' } } }
+)
+// 상품 목록 (최신 등록순)
+ProductSchema.index({ storeId: 1, createdAt: -1 })
+// 유통기한 임박/만료 스윕 (alertEngine, 전체 매장 대상)
+ProductSchema.index({ expiryDate: 1 })
+
 export default (models.Product as mongoose.Model<IProduct>) ||
   model<IProduct>('Product', ProductSchema)
@@ -0,0 +1,27 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 상품별 일 판매 집계 (Order.items 롤업)
+// 결제 시 $inc 로 증분 반영, 필요 시 Order 전체에서 재구성 (reorderEngine.rebuildSalesRollup)
+export interface IProductSalesDaily extends Document {
+  productId: mongoose.Types.ObjectId
+  date: string // YYYY-MM-DD (Asia/Seoul)
+  qty: number
+  revenue: number
+  storeId: string
+}
+
+const ProductSalesDailySchema: Schema = new Schema({
+  productId: { type: Schema.Types.ObjectId, ref: 'Product', required: true },
+  date: { type: String, required: true },
+  qty: { type: Number, default: 0 },
+  revenue: { type: Number, default: 0 },
+  storeId: storeIdField,
+})
+
+ProductSalesDailySchema.index({ storeId: 1, productId: 1, date: 1 }, { unique: true })
+// 예측 배치: 최근 N일 구간 스캔
+ProductSalesDailySchema.index({ date: 1 })
+
+export default (models.ProductSalesDaily as mongoose.Model<IProductSalesDaily>) ||
+  model<IProductSalesDaily>('ProductSalesDaily', ProductSalesDailySchema)
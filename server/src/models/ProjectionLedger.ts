@@ -0,0 +1,29 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+
+// 원본 문서별로 파생 컬렉션에 마지막으로 더한 값 (services/projector)
+// 원본이 바뀌거나 삭제되면 여기 적힌 값을 빼고 새 값을 더한다 → 같은 이벤트를 다시 받아도 결과가 같다
+export interface ProjectionEntry {
+  target: string // 파생 모델 이름
+  filter: Record<string, unknown> // 파생 문서 키 (storeId 포함)
+  inc: Record<string, number>
+}
+
+export interface IProjectionLedger extends Document {
+  projection: string
+  source: string // 컬렉션:_id
+  entries: ProjectionEntry[]
+  expireAt: Date | null // 이후 변경은 파생 데이터에 의미가 없는 원본 (예: 24시간 지난 댓글)
+}
+
+const ProjectionLedgerSchema: Schema = new Schema({
+  projection: { type: String, required: true },
+  source: { type: String, required: true },
+  entries: { type: Schema.Types.Mixed, default: [] },
+  expireAt: { type: Date, default: null },
+})
+
+ProjectionLedgerSchema.index({ projection: 1, source: 1 }, { unique: true })
+ProjectionLedgerSchema.index({ expireAt: 1 }, { expireAfterSeconds: 0 })
+
+export default (models.ProjectionLedger as mongoose.Model<IProjectionLedger>) ||
+  model<IProjectionLedger>('ProjectionLedger', ProjectionLedgerSchema)
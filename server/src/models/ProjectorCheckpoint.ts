@@ -0,0 +1,26 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+
+// 변경 스트림 프로젝터 진행 상태 (services/projector)
+// 한 번에 한 프로세스만 스트림을 처리하도록 임대(owner, leaseUntil)도 함께 둔다
+export interface IProjectorCheckpoint extends Document {
+  name: string
+  resumeToken: unknown // 마지막으로 반영한 변경 이벤트 위치 (재기동 시 resumeAfter)
+  owner: string | null // 임대를 가진 프로세스 (host:pid)
+  leaseUntil: Date
+  rebuilt: string[] // 전체 재계산이 끝나 증분 반영 중인 프로젝션
+  appliedAt: Date | null
+}
+
+const ProjectorCheckpointSchema: Schema = new Schema({
+  name: { type: String, required: true },
+  resumeToken: { type: Schema.Types.Mixed, default: null },
+  owner: { type: String, default: null },
+  leaseUntil: { type: Date, default: () => new Date(0) },
+  rebuilt: { type: [String], default: [] },
+  appliedAt: { type: Date, default: null },
+})
+
+ProjectorCheckpointSchema.index({ name: 1 }, { unique: true })
+
+export default (models.ProjectorCheckpoint as mongoose.Model<IProjectorCheckpoint>) ||
+  model<IProjectorCheckpoint>('ProjectorCheckpoint', ProjectorCheckpointSchema)
@@ -1,4 +1,5 @@
 import mongoose, { Schema, model, models, Document, Model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
 
 export interface IQrLog {
   productName: string
@@ -8,6 +9,7 @@ export interface IQrLog {
   expireDate: string
   quantity: number
   scannedAt?: Date
+  storeId: string
 }
 
 export interface IQrLogDocument extends IQrLog, Document {}
@@ -20,8 +22,11 @@ const QrLogSchema = new Schema<IQrLogDocument>({
   expireDate: { type: String, required: true },
   quantity: { type: Number, required: true },
   scannedAt: { type: Date, default: Date.now },
+  storeId: storeIdField,
 })
 
+QrLogSchema.index({ storeId: 1, scannedAt: -1 })
+
 const QrLog =
   (models.QrLog as Model<IQrLogDocument>) ||
   model<IQrLogDocument>('QrLog', QrLogSchema)
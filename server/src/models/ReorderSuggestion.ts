@@ -0,0 +1,39 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 상품별 발주 제안 (reorderEngine 배치 결과)
+export interface IReorderSuggestion extends Document {
+  productId: mongoose.Types.ObjectId
+  name: string
+  category?: string
+  stock: number
+  forecastDaily: number // 향후 하루 평균 예상 판매량
+  leadTimeDemand: number // 리드타임 동안 예상 판매량
+  safetyStock: number
+  reorderPoint: number
+  suggestedQty: number
+  daysOfCover: number // 현재 재고로 버틸 수 있는 일수
+  computedAt: Date
+  storeId: string
+}
+
+const ReorderSuggestionSchema: Schema = new Schema({
+  productId: { type: Schema.Types.ObjectId, ref: 'Product', required: true },
+  name: { type: String, default: '이름 없음' },
+  category: String,
+  stock: { type: Number, default: 0 },
+  forecastDaily: { type: Number, default: 0 },
+  leadTimeDemand: { type: Number, default: 0 },
+  safetyStock: { type: Number, default: 0 },
+  reorderPoint: { type: Number, default: 0 },
+  suggestedQty: { type: Number, default: 0 },
+  daysOfCover: { type: Number, default: 0 },
+  computedAt: { type: Date, default: Date.now },
+  storeId: storeIdField,
+})
+
+ReorderSuggestionSchema.index({ storeId: 1, productId: 1 }, { unique: true })
+ReorderSuggestionSchema.index({ storeId: 1, suggestedQty: -1, daysOfCover: 1 })
+
+export default (models.ReorderSuggestion as mongoose.Model<IReorderSuggestion>) ||
+  model<IReorderSuggestion>('ReorderSuggestion', ReorderSuggestionSchema)
@@ -0,0 +1,26 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 시간당 매출 집계 (Order 롤업)
+// 결제 시 $inc 로 증분 반영, 매일 최근 구간을 Order 에서 재계산 (salesRollup.rebuildHourlySales)
+// 원본 주문이 보관 기간 후 삭제되어도 매출 통계는 이 컬렉션에 남는다
+export interface ISalesHourly extends Document {
+  hour: Date // 해당 시간의 시작 (UTC 정시)
+  orders: number
+  revenue: number
+  items: number // 판매 수량 합계
+  storeId: string
+}
+
+const SalesHourlySchema: Schema = new Schema({
+  hour: { type: Date, required: true },
+  orders: { type: Number, default: 0 },
+  revenue: { type: Number, default: 0 },
+  items: { type: Number, default: 0 },
+  storeId: storeIdField,
+})
+
+SalesHourlySchema.index({ storeId: 1, hour: 1 }, { unique: true })
+
+export default (models.SalesHourly as mongoose.Model<ISalesHourly>) ||
+  model<ISalesHourly>('SalesHourly', SalesHourlySchema)
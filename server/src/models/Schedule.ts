@@ -1,5 +1,6 @@
 // server/src/models/Schedule.ts
 import { Schema, model, Types } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
 
 interface ScheduleType {
   staff: Types.ObjectId
@@ -7,6 +8,7 @@ interface ScheduleType {
   startTime: string
   endTime: string
   status: 'scheduled' | 'completed' | 'cancelled'
+  storeId: string
 }
 const ScheduleSchema = new Schema(
   {
@@ -32,10 +34,13 @@ const ScheduleSchema = new Schema(
       enum: ['scheduled', 'completed', 'cancelled'],
       default: 'scheduled',
     },
+    storeId: storeIdField,
   },
   { timestamps: true }
 )
 
-ScheduleSchema.index({ staff: 1, date: 1 })
+ScheduleSchema.index({ storeId: 1, staff: 1, date: 1 })
+// 날짜 범위 조회 (월간/주간 근무표)
+ScheduleSchema.index({ storeId: 1, date: 1 })
 
 export default model('Schedule', ScheduleSchema)
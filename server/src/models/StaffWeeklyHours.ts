@@ -0,0 +1,24 @@
+import mongoose, { Schema, Document, Types, models, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 직원별 주간 근무 시간 (Schedule 변경 스트림 프로젝션, services/projections)
+export interface IStaffWeeklyHours extends Document {
+  staff: Types.ObjectId
+  week: string // 해당 주 월요일 (YYYY-MM-DD)
+  hours: number
+  shifts: number
+  storeId: string
+}
+
+const StaffWeeklyHoursSchema: Schema = new Schema({
+  staff: { type: Schema.Types.ObjectId, ref: 'User', required: true },
+  week: { type: String, required: true },
+  hours: { type: Number, default: 0 },
+  shifts: { type: Number, default: 0 },
+  storeId: storeIdField,
+})
+
+StaffWeeklyHoursSchema.index({ storeId: 1, week: 1, staff: 1 }, { unique: true })
+
+export default (models.StaffWeeklyHours as mongoose.Model<IStaffWeeklyHours>) ||
+  model<IStaffWeeklyHours>('StaffWeeklyHours', StaffWeeklyHoursSchema)
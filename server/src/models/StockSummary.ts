@@ -0,0 +1,20 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 매장별 상품 수 / 재고 합계 (Product 변경 스트림 프로젝션, services/projections)
+export interface IStockSummary extends Document {
+  products: number
+  stock: number
+  storeId: string
+}
+
+const StockSummarySchema: Schema = new Schema({
+  products: { type: Number, default: 0 },
+  stock: { type: Number, default: 0 },
+  storeId: storeIdField,
+})
+
+StockSummarySchema.index({ storeId: 1 }, { unique: true })
+
+export default (models.StockSummary as mongoose.Model<IStockSummary>) ||
+  model<IStockSummary>('StockSummary', StockSummarySchema)
@@ -1,7 +1,16 @@
 import { Schema, model, Types, Document } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
+
+// 요청 당시 근무 정보 사본 (목록 조회 시 populate 없이 표시)
+export interface ShiftSnapshot {
+  date: string // YYYY-MM-DD
+  startTime: string
+  endTime: string
+}
 
 export interface ISubRequest extends Document {
   scheduleId: Types.ObjectId
+  shift: ShiftSnapshot
   requester: Types.ObjectId
   substitute: Types.ObjectId | null
   requesterName: string
@@ -13,15 +22,33 @@ export interface ISubRequest extends Document {
     | 'accepted_by_sub'
     | 'approved_final'
     | 'cancelled'
+  storeId: string
 }
 
-const subRequestSchema = new Schema<ISubRequest>(
+// 진행 중인 상태 (나머지는 끝난 요청)
+export const ACTIVE_SUB_STATUSES = [
+  'requested',
+  'approved_by_owner',
+  'accepted_by_sub',
+] as const
+
+const shiftSnapshotSchema = new Schema<ShiftSnapshot>(
+  {
+    date: { type: String, required: true },
+    startTime: { type: String, required: true },
+    endTime: { type: String, required: true },
+  },
+  { _id: false }
+)
+
+export const subRequestSchema = new Schema<ISubRequest>(
   {
     scheduleId: {
       type: Types.ObjectId,
       ref: 'Schedule',
       required: true,
     },
+    shift: shiftSnapshotSchema,
     requester: {
       type: Types.ObjectId,
       ref: 'User',
@@ -56,8 +83,13 @@ const subRequestSchema = new Schema<ISubRequest>(
       ],
       default: 'requested',
     },
+    storeId: storeIdField,
   },
   { timestamps: true }
 )
 
+// 목록 조회: 상태 + 근무일 범위 (지난 근무의 요청은 보관 컬렉션으로 이동)
+subRequestSchema.index({ storeId: 1, status: 1, 'shift.date': 1 })
+subRequestSchema.index({ storeId: 1, scheduleId: 1 })
+
 export default model<ISubRequest>('SubRequest', subRequestSchema)
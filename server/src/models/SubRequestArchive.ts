@@ -0,0 +1,15 @@
+import { Schema, model } from 'mongoose'
+import { ISubRequest, subRequestSchema } from './SubRequest'
+
+// 근무일이 지난 대타 요청 보관 (subRequestArchive 서비스가 원본에서 옮긴다)
+// 원본과 같은 문서 + 보관 시각. 목록 API 는 원본만 조회한다
+export interface ISubRequestArchive extends ISubRequest {
+  archivedAt: Date
+}
+
+const subRequestArchiveSchema = subRequestSchema.clone()
+subRequestArchiveSchema.add({ archivedAt: { type: Date, default: Date.now } })
+subRequestArchiveSchema.clearIndexes()
+subRequestArchiveSchema.index({ storeId: 1, 'shift.date': -1 })
+
+export default model<ISubRequestArchive>('SubRequestArchive', subRequestArchiveSchema)
@@ -1,4 +1,5 @@
 import { Schema, model } from 'mongoose'
+import { storeIdField } from '../utils/tenant'
 
 const substituteRequestSchema = new Schema(
   {
@@ -11,8 +12,11 @@ const substituteRequestSchema = new Schema(
       enum: ['pending', 'accepted', 'approved', 'rejected'],
       default: 'pending',
     },
+    storeId: storeIdField,
   },
   { timestamps: true }
 )
 
+substituteRequestSchema.index({ storeId: 1, status: 1 })
+
 export default model('SubstituteRequest', substituteRequestSchema)
@@ -0,0 +1,22 @@
+import mongoose, { Schema, Document, models, model } from 'mongoose'
+
+// 토큰 폐기 기록 (utils/tokenCache)
+// 살아 있는 워커에는 메시지 버스로 바로 전파되고, 재기동/교체된 워커는 기동 시 이 컬렉션에서 다시 읽는다
+// 발급 토큰 최대 수명이 지나면 TTL 로 삭제 (그 전에 발급된 토큰은 이미 만료)
+export interface ITokenRevocation extends Document {
+  userId: string
+  revokedAt: Date // 이 시각 이전에 발급된 토큰 거절
+}
+
+export const TOKEN_LIFETIME_SECONDS = 24 * 60 * 60
+
+const TokenRevocationSchema: Schema = new Schema({
+  userId: { type: String, required: true },
+  revokedAt: { type: Date, required: true },
+})
+
+TokenRevocationSchema.index({ userId: 1 }, { unique: true })
+TokenRevocationSchema.index({ revokedAt: 1 }, { expireAfterSeconds: TOKEN_LIFETIME_SECONDS })
+
+export default (models.TokenRevocation as mongoose.Model<ITokenRevocation>) ||
+  model<ITokenRevocation>('TokenRevocation', TokenRevocationSchema)
@@ -1,5 +1,6 @@
 // src/models/User.ts
 import mongoose from 'mongoose'
+import { storeIdField } from '../utils/tenant'
 
 const UserSchema = new mongoose.Schema(
   {
@@ -13,8 +14,21 @@ const UserSchema = new mongoose.Schema(
     phone: String,
     joinDate: Date,
     status: String,
+
+    // 매장 안 직원 고유 번호 (0부터, 재사용 안 함): 공지 열람 비트맵의 비트 위치
+    staffIndex: Number,
+
+    storeId: storeIdField, // 소속 매장
+    stores: [String], // 사장: 추가로 운영하는 매장
   },
   { timestamps: true }
 )
 
+// username 은 로그인 식별자라 전역 unique, 매장 내 직원 목록은 아래 인덱스
+UserSchema.index({ storeId: 1, role: 1 })
+UserSchema.index(
+  { storeId: 1, staffIndex: 1 },
+  { unique: true, partialFilterExpression: { staffIndex: { $exists: true } } }
+)
+
 export default mongoose.model('User', UserSchema)
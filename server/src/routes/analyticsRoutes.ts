@@ -1,125 +1,79 @@
 import express from 'express'
-import Order from '../models/Order'
+import Product from '../models/Product'
+import ProductSalesDaily from '../models/ProductSalesDaily'
 import { authMiddleware } from '../middleware/auth'
+import { cacheResponse } from '../middleware/responseCache'
+import { salesBy, storeStartOf } from '../services/salesRollup'
+import { logger } from '../utils/logger'
 
 const router = express.Router()
 
-router.get('/dashboard', authMiddleware, async (req, res) => {
-  try {
-    const now = new Date()
-    const startOfDay = new Date(now.getFullYear(), now.getMonth(), now.getDate())
-    const startOfWeek = new Date(
-      now.getFullYear(),
-      now.getMonth(),
-      now.getDate() - now.getDay()
-    ) // 이번 주 일요일부터
-    const startOfMonth = new Date(now.getFullYear(), now.getMonth(), 1)
-    const startOfYear = new Date(now.getFullYear(), 0, 1)
+const dashboardCache = cacheResponse({ tags: ['orders'], ttl: 60_000 })
 
-    // 1. 시간대별 매출 (오늘 기준)
-    const hourlyStats = await Order.aggregate([
-      { $match: { createdAt: { $gte: startOfDay } } },
-      {
-        $group: {
-          _id: { $hour: '$createdAt' },
-          sales: { $sum: '$totalAmount' },
-        },
-      },
-      { $sort: { _id: 1 } },
-    ])
+router.get('/dashboard', authMiddleware, dashboardCache, async (req, res) => {
+  try {
+    // 📌 원본 주문 대신 시간당 집계(SalesHourly)/상품별 일 집계(ProductSalesDaily)를 읽는다
+    // 구간 경계와 시/요일/월 구분은 매장 시간대(STORE_TZ) 기준
+    const [hourlyStats, weeklyStats, monthlyStats, monthTotals, productStats] =
+      await Promise.all([
+        salesBy('hour', storeStartOf('day')), // 1. 시간대별 매출 (오늘 기준)
+        salesBy('dayOfWeek', storeStartOf('week')), // 2. 요일별 매출 (이번 주 일요일부터)
+        salesBy('month', storeStartOf('year')), // 3. 월별 매출 (올해)
+        salesBy('month', storeStartOf('month')), // 5. 이번 달 판매 수량
+        // 4. 인기/비인기 상품 분석 (전체 집계 기준)
+        ProductSalesDaily.aggregate<{ _id: unknown; sales: number; revenue: number }>([
+          {
+            $group: {
+              _id: '$productId',
+              sales: { $sum: '$qty' },
+              revenue: { $sum: '$revenue' },
+            },
+          },
+          { $match: { sales: { $gt: 0 } } },
+          { $sort: { sales: -1 } },
+        ]),
+      ])
 
     const formattedHourly = Array.from({ length: 17 }, (_, i) => {
       const hour = i + 6 // 06시부터 시작
-      const found = hourlyStats.find((h) => h._id === hour)
       return {
         hour: `${String(hour).padStart(2, '0')}:00`,
-        sales: found ? found.sales : 0,
+        sales: hourlyStats.get(hour)?.sales ?? 0,
       }
     })
 
-    // 2. 요일별 매출 (이번 주)
-    const weeklyStats = await Order.aggregate([
-      { $match: { createdAt: { $gte: startOfWeek } } },
-      {
-        $group: {
-          _id: { $dayOfWeek: '$createdAt' },
-          sales: { $sum: '$totalAmount' },
-        },
-      },
-    ])
-
     const daysMap = ['일', '월', '화', '수', '목', '금', '토']
-    const formattedWeekly = daysMap.map((day, idx) => {
-      const found = weeklyStats.find((w) => w._id === idx + 1)
-      return { day, sales: found ? found.sales : 0 }
-    })
-
-    // 3. 월별 매출 (올해)
-    const monthlyStats = await Order.aggregate([
-      { $match: { createdAt: { $gte: startOfYear } } },
-      {
-        $group: {
-          _id: { $month: '$createdAt' },
-          sales: { $sum: '$totalAmount' },
-        },
-      },
-    ])
-
-    const formattedMonthly = Array.from({ length: 12 }, (_, i) => {
-      const found = monthlyStats.find((m) => m._id === i + 1)
-      return {
-        month: `${i + 1}월`,
-        sales: found ? found.sales : 0,
-      }
-    })
+    const formattedWeekly = daysMap.map((day, idx) => ({
+      day,
+      sales: weeklyStats.get(idx + 1)?.sales ?? 0,
+    }))
 
-    // 4. 인기/비인기 상품 분석 (전체 데이터 기준)
-    const productStats = await Order.aggregate([
-      { $unwind: '$items' },
-      {
-        $group: {
-          _id: '$items.productName',
-          sales: { $sum: '$items.quantity' },
-          revenue: { $sum: { $multiply: ['$items.price', '$items.quantity'] } },
-        },
-      },
-      { $sort: { sales: -1 } },
-    ])
+    const formattedMonthly = Array.from({ length: 12 }, (_, i) => ({
+      month: `${i + 1}월`,
+      sales: monthlyStats.get(i + 1)?.sales ?? 0,
+    }))
 
-    const popularProducts = productStats.slice(0, 5).map((p) => ({
-      name: p._id,
+    // 상위/하위 5개 상품 이름만 조회
+    const top = productStats.slice(0, 5)
+    const bottom = productStats.slice(-5).reverse()
+    const names = new Map(
+      (
+        await Product.find({ _id: { $in: [...top, ...bottom].map((p) => p._id) } })
+          .select('name')
+          .lean()
+      ).map((p) => [String(p._id), p.name])
+    )
+    const toProduct = (p: (typeof productStats)[number]) => ({
+      name: names.get(String(p._id)) ?? '삭제된 상품',
       sales: p.sales,
       revenue: p.revenue,
-    }))
-
-    const unpopularProducts = productStats
-      .filter((p) => p.sales > 0)
-      .slice(-5)
-      .reverse()
-      .map((p) => ({
-        name: p._id,
-        sales: p.sales,
-        revenue: p.revenue,
-      }))
+    })
+    const popularProducts = top.map(toProduct)
+    const unpopularProducts = bottom.map(toProduct)
 
     // 5. 요약 통계: 이번 주 매출 + 이번 달 판매 수량
     const totalSales = formattedWeekly.reduce((acc, cur) => acc + cur.sales, 0)
-
-    // 이번 달 판매 수량만 집계
-    const monthlyItems = await Order.aggregate([
-      { $match: { createdAt: { $gte: startOfMonth } } },
-      { $unwind: '$items' },
-      {
-        $group: {
-          _id: null,
-          totalQty: { $sum: '$items.quantity' },
-        },
-      },
-    ])
-    const totalItems =
-      monthlyItems.length > 0 && typeof monthlyItems[0].totalQty === 'number'
-        ? monthlyItems[0].totalQty
-        : 0
+    const totalItems = [...monthTotals.values()].reduce((acc, m) => acc + m.items, 0)
 
     res.json({
       hourlySales: formattedHourly,
@@ -133,7 +87,7 @@ router.get('/dashboard', authMiddleware, async (req, res) => {
       },
     })
   } catch (error) {
-    console.error('Analytics Error:', error)
+    logger.error('매출 분석 실패', { err: error })
     res.status(500).json({ message: '데이터 분석 실패' })
   }
 })
@@ -1,24 +1,36 @@
 import { Router } from 'express';
-import { authMiddleware } from '../middleware/auth';
+import { authMiddleware, ownerOnly } from '../middleware/auth';
+import { cacheResponse, invalidates } from '../middleware/responseCache';
 import {
   getAnnouncements,
   createAnnouncement,
   updateAnnouncement,
   deleteAnnouncement,
   increaseView,
-  toggleLike
+  toggleLike,
+  getUnreadImportant,
+  getReadCoverage
 } from '../controllers/announcementController';
 
 const router = Router();
 
 // 공통 (읽기, 조회수, 좋아요)
-router.get('/list', authMiddleware, getAnnouncements);
+router.get(
+  '/list',
+  authMiddleware,
+  cacheResponse({ tags: ['announcements'], perUser: true }),
+  getAnnouncements
+);
+// 열람 기록 조회 (열람마다 바뀌므로 캐시하지 않음)
+router.get('/unread', authMiddleware, getUnreadImportant);
+router.get('/coverage', authMiddleware, ownerOnly, getReadCoverage);
+// 조회수는 캐시 TTL 동안 지연 반영 (열람마다 무효화하지 않음)
 router.put('/:id/view', authMiddleware, increaseView);
-router.put('/:id/like', authMiddleware, toggleLike);
+router.put('/:id/like', authMiddleware, invalidates('announcements'), toggleLike);
 
 // 관리자 전용 (작성, 수정, 삭제)
-router.post('/create', authMiddleware, createAnnouncement);
-router.put('/:id', authMiddleware, updateAnnouncement); // 수정 라우트 추가
-router.delete('/:id', authMiddleware, deleteAnnouncement);
+router.post('/create', authMiddleware, invalidates('announcements'), createAnnouncement);
+router.put('/:id', authMiddleware, invalidates('announcements'), updateAnnouncement); // 수정 라우트 추가
+router.delete('/:id', authMiddleware, invalidates('announcements'), deleteAnnouncement);
 
 export default router;
@@ -1,117 +1,80 @@
 import express from 'express'
-import Order from '../models/Order'
 import Product from '../models/Product'
 import User from '../models/User'
 import Schedule from '../models/Schedule'
 import Handover from '../models/Handover'
 import Announcement from '../models/Announcement'
+import InventoryAlert from '../models/InventoryAlert'
 import { authMiddleware } from '../middleware/auth'
+import { cacheResponse } from '../middleware/responseCache'
+import { salesBy, storeStartOf } from '../services/salesRollup'
+import { stockTotals } from '../services/projections'
 import dayjs from 'dayjs'
 import utc from 'dayjs/plugin/utc'
 import timezone from 'dayjs/plugin/timezone'
+import { logger } from '../utils/logger'
 
 dayjs.extend(utc)
 dayjs.extend(timezone)
 
 const router = express.Router()
 
-router.get('/summary', authMiddleware, async (req, res) => {
+// 상품 수 / 재고 합계: 변경 스트림 프로젝션(StockSummary), 준비 전이면 상품 컬렉션에서 계산
+const inventoryTotals = async () => {
+  const projected = await stockTotals()
+  if (projected) return projected
+  const [products, stock] = await Promise.all([
+    Product.countDocuments(), // 매장 범위 카운트 ({ storeId, createdAt } 인덱스)
+    Product.aggregate([{ $group: { _id: null, total: { $sum: '$stock' } } }]),
+  ])
+  return { products, stock: stock[0]?.total ?? 0 }
+}
+
+// 오늘 근무 상태(근무중/퇴근)는 시간에 따라 바뀌므로 TTL 을 짧게 유지
+const summaryCache = cacheResponse({
+  tags: ['orders', 'products', 'alerts', 'users', 'schedules', 'handovers', 'announcements'],
+  ttl: 30_000,
+})
+
+router.get('/summary', authMiddleware, summaryCache, async (req, res) => {
   try {
-    const todayStart = new Date()
-    todayStart.setHours(0, 0, 0, 0)
-
-    // 1. 오늘 매출 & 시간대별 차트 데이터 (분석 페이지와 동일한 로직)
-    const hourlyStats = await Order.aggregate([
-      { $match: { createdAt: { $gte: todayStart } } },
-      {
-        $group: {
-          _id: { $hour: '$createdAt' },
-          sales: { $sum: '$totalAmount' },
-        },
-      },
-      { $sort: { _id: 1 } },
-    ])
+    // 1. 오늘 매출 & 시간대별 차트 데이터 (분석 페이지와 동일한 시간당 집계 사용)
+    const hourlyStats = await salesBy('hour', storeStartOf('day'))
 
     const salesData = Array.from({ length: 17 }, (_, i) => {
       const hour = i + 6 // 06시부터 22시까지
-      const found = hourlyStats.find((h) => h._id === hour)
       return {
         time: `${String(hour).padStart(2, '0')}:00`,
-        sales: found ? found.sales : 0,
+        sales: hourlyStats.get(hour)?.sales ?? 0,
       }
     })
 
     const todaySalesTotal = salesData.reduce((acc, cur) => acc + cur.sales, 0)
 
-    // 2. 재고 현황 (파이 차트용) - 인벤토리/발주 페이지와 동일한 부족 기준 사용
-    const products = await Product.find({})
-    const defaultMinStock = 5 // 프런트 인벤토리 페이지 기본 minStock과 맞춤
-
-    const normalizeQty = (p: any) => {
-      const qty = typeof p.stock === 'number' ? p.stock : 0
-      // 유통기한 지난 상품은 인벤토리 페이지에서 quantity 0으로 취급
-      if (p.expiryDate) {
-        const expDate = new Date(p.expiryDate)
-        const todayStart = new Date()
-        todayStart.setHours(0, 0, 0, 0)
-        if (!isNaN(expDate.getTime()) && expDate < todayStart) return 0
-      }
-      return qty
-    }
-
-    const totalInventoryCount = products.reduce(
-      (acc, cur) => acc + normalizeQty(cur),
-      0
+    // 2. 재고 현황 (파이 차트용) - alertEngine 이 유지하는 알림만 읽는다 (상품 전체 순회 없음)
+    const [alerts, totals] = await Promise.all([
+      InventoryAlert.find({}).select('productId kind stock').lean(),
+      inventoryTotals(),
+    ])
+    const productCount = totals.products
+
+    // 유통기한 지난 상품은 인벤토리 페이지에서 quantity 0으로 취급
+    const expiredStock = alerts
+      .filter((a) => a.kind === 'expired')
+      .reduce((acc, a) => acc + (a.stock ?? 0), 0)
+    const totalInventoryCount = totals.stock - expiredStock
+
+    // 파이 차트 분류는 임박(만료 포함) 우선, 그 외 부족/정상 순으로 반영
+    const expiringIds = new Set(
+      alerts
+        .filter((a) => a.kind === 'expired' || a.kind === 'expiring')
+        .map((a) => a.productId.toString())
     )
-
-    // 재고 상태 분류
-    let normal = 0,
-      low = 0,
-      expiring = 0
-    const now = new Date()
-    const threeDaysLater = new Date()
-    threeDaysLater.setDate(now.getDate() + 3)
-
-    const lowStockItems: {
-      id: string
-      name: string
-      stock: number
-      minStock: number
-      category?: string
-    }[] = []
-
-    products.forEach((p) => {
-      const qty = normalizeQty(p)
-      const rawMin =
-        typeof (p as any).minStock === 'number'
-          ? (p as any).minStock
-          : defaultMinStock
-      const minStock = rawMin > 0 ? rawMin : defaultMinStock
-
-      const isExpiring =
-        p.expiryDate && new Date(p.expiryDate) <= threeDaysLater
-      const isLow = qty < minStock
-
-      // 대시보드 부족 카운트는 인벤토리 페이지의 부족 알림과 동일하게 "minStock 미만" 기준으로 계산
-      if (isLow) {
-        lowStockItems.push({
-          id: p._id.toString(),
-          name: (p as any).name ?? '이름 없음',
-          stock: qty,
-          minStock,
-          category: (p as any).category,
-        })
-      }
-
-      // 파이 차트 분류는 임박 우선, 그 외 부족/정상 순으로 반영
-      if (isExpiring) {
-        expiring++
-      } else if (isLow) {
-        low++
-      } else {
-        normal++
-      }
-    })
+    const expiring = expiringIds.size
+    const low = alerts.filter(
+      (a) => a.kind === 'low_stock' && !expiringIds.has(a.productId.toString())
+    ).length
+    const normal = Math.max(0, productCount - expiring - low)
 
     const inventoryData = [
       { name: '정상', value: normal, color: 'hsl(var(--success))' },
@@ -125,7 +88,10 @@ router.get('/summary', authMiddleware, async (req, res) => {
     const todayStr = dayjs().tz('Asia/Seoul').format('YYYY-MM-DD')
     const nowTime = dayjs().tz('Asia/Seoul').format('HH:mm')
 
-    const schedules = await Schedule.find({ date: todayStr }).populate('staff', 'name')
+    const schedules = await Schedule.find({ date: todayStr })
+      .select('staff startTime endTime')
+      .populate('staff', 'name')
+      .lean()
     
     const todayStaff = schedules.map((s: any) => {
         let status = '대기'
@@ -152,16 +118,20 @@ router.get('/summary', authMiddleware, async (req, res) => {
         isImportant: true, 
         confirmed: false 
     })
+    .select('writer content createdAt')
     .populate('writer', 'name')
     .sort({ createdAt: -1 })
     .limit(3)
+    .lean()
 
     // 중요 공지사항 (최신순 3개)
     const importantAnnouncements = await Announcement.find({ 
         important: true 
     })
+    .select('title important createdAt readCount')
     .sort({ createdAt: -1 })
     .limit(3)
+    .lean()
 
     res.json({
       stats: {
@@ -179,9 +149,26 @@ router.get('/summary', authMiddleware, async (req, res) => {
       }
     })
   } catch (error) {
-    console.error(error)
+    logger.error('대시보드 로드 실패', { err: error })
     res.status(500).json({ message: '대시보드 로드 실패' })
   }
 })
 
+// 재고 알림 목록 (만료 → 임박 → 부족 순)
+const alertsCache = cacheResponse({ tags: ['alerts'], ttl: 60_000 })
+
+router.get('/alerts', authMiddleware, alertsCache, async (req, res) => {
+  try {
+    const kind = typeof req.query.kind === 'string' ? req.query.kind : undefined
+    const alerts = await InventoryAlert.find(kind ? { kind } : {})
+      .select('productId kind name category stock minStock expiryDate createdAt')
+      .sort({ kind: 1, expiryDate: 1 })
+      .lean()
+    res.json(alerts)
+  } catch (error) {
+    logger.error('재고 알림 로드 실패', { err: error })
+    res.status(500).json({ message: '재고 알림 로드 실패' })
+  }
+})
+
 export default router
@@ -1,17 +1,22 @@
 import express from 'express';
 import { authMiddleware } from '../middleware/auth';
+import { invalidates } from '../middleware/responseCache';
 import {
   createHandover,
   getHandovers,
+  getHandoverFeed,
   confirmHandover,
+  confirmAllHandovers,
   updateHandover,
 } from '../controllers/handoverController';
 
 const router = express.Router();
 
-router.post('/', authMiddleware, createHandover);
+router.post('/', authMiddleware, invalidates('handovers'), createHandover);
 router.get('/', authMiddleware, getHandovers);
-router.put('/:id/confirm', authMiddleware, confirmHandover);
-router.put('/:id', authMiddleware, updateHandover);
+router.get('/feed', authMiddleware, getHandoverFeed);
+router.post('/confirm-all', authMiddleware, invalidates('handovers'), confirmAllHandovers);
+router.put('/:id/confirm', authMiddleware, invalidates('handovers'), confirmHandover);
+router.put('/:id', authMiddleware, invalidates('handovers'), updateHandover);
 
 export default router;
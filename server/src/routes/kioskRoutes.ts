@@ -2,6 +2,15 @@ import express from 'express'
 import mongoose from 'mongoose'
 import Product from '../models/Product'
 import Order from '../models/Order'
+import { KIOSK_PRODUCT_FIELDS, serializeProductList } from '../dto/productDto'
+import { sendSerialized } from '../utils/serializer'
+import { cacheResponse, invalidates } from '../middleware/responseCache'
+import { queueAlertRefresh, rebuildAlerts } from '../services/alertEngine'
+import { recordSales } from '../services/reorderEngine'
+import { recordOrder } from '../services/salesRollup'
+import { MAX_SYNC_BATCH, syncOfflineSales } from '../services/offlineSales'
+import { nextOrderNumber } from '../utils/orderNumber'
+import { logger } from '../utils/logger'
 
 const router = express.Router()
 
@@ -16,13 +25,13 @@ router.get('/scan/:barcode', async (req, res) => {
     }
     res.json(product)
   } catch (error) {
-    console.error(error)
+    logger.error('바코드 조회 실패', { err: error })
     res.status(500).json({ message: '서버 에러 발생' })
   }
 })
 
 // 2. 결제 처리 및 주문 저장
-router.post('/checkout', async (req, res) => {
+router.post('/checkout', invalidates('products', 'orders'), async (req, res) => {
   try {
     const { items, totalAmount, paymentMethod } = req.body
 
@@ -36,17 +45,25 @@ router.post('/checkout', async (req, res) => {
       { product: any; qty: number; name: string; barcode?: string }
     > = {}
 
-    for (const raw of items) {
-      const qty = Number(raw.quantity) || 0
-      if (qty <= 0) continue
-
-      let product = null
-      if (raw.productId && mongoose.Types.ObjectId.isValid(raw.productId)) {
-        product = await Product.findById(raw.productId)
-      }
-      if (!product && raw.barcode) {
-        product = await Product.findOne({ barcode: raw.barcode })
-      }
+    // 요청 상품을 한 번에 조회 (줄마다 findById/findOne 하지 않음)
+    const lines = items
+      .map((raw: any) => ({ raw, qty: Number(raw.quantity) || 0 }))
+      .filter((line: { qty: number }) => line.qty > 0)
+    const ids = lines
+      .map(({ raw }: any) => raw.productId)
+      .filter((id: unknown) => id && mongoose.Types.ObjectId.isValid(id as string))
+    const barcodes = lines.map(({ raw }: any) => raw.barcode).filter(Boolean)
+    const found = await Product.find({
+      $or: [{ _id: { $in: ids } }, { barcode: { $in: barcodes } }],
+    }).lean()
+    const byId = new Map(found.map((p) => [p._id.toString(), p]))
+    const byBarcode = new Map(found.map((p) => [p.barcode, p]))
+
+    for (const { raw, qty } of lines) {
+      const product =
+        (raw.productId && byId.get(String(raw.productId))) ||
+        (raw.barcode && byBarcode.get(raw.barcode)) ||
+        null
 
       if (!product) {
         return res.status(404).json({
@@ -68,8 +85,13 @@ router.post('/checkout', async (req, res) => {
       }
     }
 
+    const sold = Object.values(aggregated)
+    if (sold.length === 0) {
+      return res.status(400).json({ message: '구매할 상품이 없습니다.' })
+    }
+
     // 재고 부족 여부 확인
-    for (const { product, qty, name, barcode } of Object.values(aggregated)) {
+    for (const { product, qty, name, barcode } of sold) {
       if (product.stock < qty) {
         return res.status(400).json({
           message: '재고가 부족합니다.',
@@ -81,19 +103,36 @@ router.post('/checkout', async (req, res) => {
       }
     }
 
-    // 2) 재고 차감
-    for (const { product, qty } of Object.values(aggregated)) {
-      product.stock = Math.max(0, product.stock - qty)
-      await product.save()
-      console.log(`✅ 재고 차감: ${product.name} (-${qty})`)
-    }
+    // 2) 재고 차감 (상품 수와 관계없이 bulkWrite 한 번)
+    // 검증 이후 다른 결제가 먼저 차감했을 수 있으므로 상품별로 max(0, stock - qty) 를 서버에서 계산한다
+    // 파이프라인 업데이트는 모델 캐스팅을 거치지 않도록 드라이버 컬렉션으로 보낸다 (_id 조건이라 매장 조건 불필요)
+    await Product.collection.bulkWrite(
+      sold.map(({ product, qty }) => ({
+        updateOne: {
+          filter: { _id: product._id },
+          update: [{ $set: { stock: { $max: [0, { $subtract: ['$stock', qty] }] } } }],
+        },
+      })),
+      { ordered: false }
+    )
+    // 재고 부족 알림 증분 갱신 (응답 후 비동기)
+    queueAlertRefresh(Object.keys(aggregated))
+    // 수요 예측용 일별 판매 롤업 (실패해도 결제는 성공 처리)
+    recordSales(
+      sold.map(({ product, qty }) => ({
+        storeId: product.storeId,
+        productId: product._id,
+        qty,
+        revenue: (product.price ?? 0) * qty,
+      }))
+    ).catch((err) => logger.error('판매 롤업 기록 실패', { err }))
 
     // 재고 차감 로직
     // (위에서 선검증 했으므로 여기서는 성공 로그만 남김)
 
     // 주문 기록 저장
     const newOrder = await Order.create({
-      orderNumber: `ORD-${Date.now()}`,
+      orderNumber: nextOrderNumber(),
       items: items.map((item: any) => ({
         productId: mongoose.Types.ObjectId.isValid(item.productId)
           ? item.productId
@@ -105,24 +144,61 @@ router.post('/checkout', async (req, res) => {
       totalAmount,
       paymentMethod,
     })
+    // 분석/대시보드용 시간당 매출 집계 (실패해도 매일 재계산에서 보정)
+    await recordOrder(newOrder).catch((err) => logger.error('매출 집계 기록 실패', { err }))
+    // 상품별 로그 대신 주문당 한 줄
+    logger.info('결제 완료', {
+      orderNumber: newOrder.orderNumber,
+      products: Object.keys(aggregated).length,
+      totalAmount,
+    })
 
     res.status(200).json({ success: true, order: newOrder })
   } catch (error) {
-    console.error('결제 에러:', error)
+    logger.error('결제 처리 실패', { err: error })
     res.status(500).json({ message: '결제 처리에 실패했습니다.' })
   }
 })
 
-router.get('/products/quick', async (req, res) => {
+// 2-1. 오프라인 판매 일괄 동기화 (키오스크 로컬 큐 → 서버)
+// 판매마다 idempotencyKey 를 보내면 같은 판매를 여러 번 보내도 주문은 한 번만 저장된다
+// 응답: 판매별 created | duplicate (주문번호) / rejected (큐에서 제거) / retry (다음에 다시)
+router.post('/checkout/batch', invalidates('products', 'orders'), async (req, res) => {
+  try {
+    const { sales } = req.body
+
+    if (!Array.isArray(sales) || sales.length === 0) {
+      return res.status(400).json({ message: '동기화할 판매가 없습니다.' })
+    }
+    if (sales.length > MAX_SYNC_BATCH) {
+      return res
+        .status(413)
+        .json({ message: `한 번에 최대 ${MAX_SYNC_BATCH}건까지 보낼 수 있습니다.` })
+    }
+
+    const results = await syncOfflineSales(sales)
+    res.status(200).json({ results })
+  } catch (error) {
+    logger.error('오프라인 판매 동기화 실패', { err: error })
+    res.status(500).json({ message: '판매 동기화에 실패했습니다.' })
+  }
+})
+
+const quickMenuCache = cacheResponse({ tags: ['products'] })
+
+router.get('/products/quick', quickMenuCache, async (req, res) => {
   try {
-    const products = await Product.find({}).sort({ stock: -1 })
-    res.json(products)
+    const products = await Product.find({})
+      .select(KIOSK_PRODUCT_FIELDS)
+      .sort({ stock: -1 })
+      .lean()
+    sendSerialized(req, res, serializeProductList, products)
   } catch (error) {
     res.status(500).json({ message: '목록 조회 실패' })
   }
 })
 
-router.post('/init-data', async (req, res) => {
+router.post('/init-data', invalidates('products'), async (req, res) => {
   try {
     await Product.deleteMany({})
 
@@ -165,9 +241,10 @@ router.post('/init-data', async (req, res) => {
     ]
 
     await Product.insertMany(initialItems)
+    rebuildAlerts().catch((err) => logger.error('재고 알림 재계산 실패', { err }))
     res.json({ message: '초기 상품 데이터 등록 완료!' })
   } catch (error) {
-    console.error(error)
+    logger.error('초기 상품 등록 실패', { err: error })
     res.status(500).json({ message: '등록 실패' })
   }
 })
@@ -1,9 +1,44 @@
 import { Router } from 'express'
-import { authMiddleware } from '../middleware/auth'
+import { authMiddleware, ownerOnly } from '../middleware/auth'
 import Product from '../models/Product'
+import ReorderSuggestion from '../models/ReorderSuggestion'
+import { PRODUCT_LIST_FIELDS, serializeProductList } from '../dto/productDto'
+import { sendSerialized } from '../utils/serializer'
+import { cacheResponse, invalidates } from '../middleware/responseCache'
+import { queueAlertRefresh } from '../services/alertEngine'
+import { recomputeSuggestions } from '../services/reorderEngine'
+import { logger } from '../utils/logger'
 
 const router = Router()
 
+// 발주 제안은 하루 한 번 배치로 갱신되므로 태그 무효화 전까지 캐시
+const reorderCache = cacheResponse({ tags: ['reorder'], ttl: 10 * 60_000 })
+
+// 🔹 발주 제안 목록 (재고 소진이 빠른 순)
+router.get('/reorder-suggestions', authMiddleware, reorderCache, async (req, res) => {
+  try {
+    const suggestions = await ReorderSuggestion.find({ suggestedQty: { $gt: 0 } })
+      .select('-_id -__v')
+      .sort({ daysOfCover: 1 })
+      .lean()
+    res.json(suggestions)
+  } catch (err) {
+    logger.error('발주 제안 로드 실패', { err })
+    res.status(500).json({ message: '발주 제안 로드 실패' })
+  }
+})
+
+// 발주 제안 즉시 재계산 (사장 전용)
+router.post('/reorder-suggestions/recompute', authMiddleware, ownerOnly, async (req, res) => {
+  try {
+    const stats = await recomputeSuggestions()
+    res.json(stats)
+  } catch (err) {
+    logger.error('발주 제안 재계산 실패', { err })
+    res.status(500).json({ message: '발주 제안 재계산 실패' })
+  }
+})
+
 router.get('/', authMiddleware, async (req, res) => {
   try {
     const { q, category } = req.query
@@ -25,16 +60,19 @@ router.get('/', authMiddleware, async (req, res) => {
       filter.name = { $regex: q as string, $options: 'i' }
     }
 
-    const products = await Product.find(filter).sort({ createdAt: -1 })
-    res.json(products)
+    const products = await Product.find(filter)
+      .select(PRODUCT_LIST_FIELDS)
+      .sort({ createdAt: -1 })
+      .lean()
+    sendSerialized(req, res, serializeProductList, products)
   } catch (err) {
-    console.error('상품 목록 로드 에러:', err)
+    logger.error('상품 목록 로드 실패', { err })
     res.status(500).json({ message: '상품 목록 로드 실패' })
   }
 })
 
 // 재고 증감 (발주 승인 시 사용)
-router.patch('/:id/stock', authMiddleware, async (req, res) => {
+router.patch('/:id/stock', authMiddleware, invalidates('products', 'reorder'), async (req, res) => {
   try {
     const { quantity } = req.body
     const delta = Number(quantity)
@@ -50,10 +88,25 @@ router.patch('/:id/stock', authMiddleware, async (req, res) => {
 
     product.stock += delta
     await product.save()
+    queueAlertRefresh([product._id])
+    // 입고로 재주문점을 넘기면 다음 배치 전까지 제안 목록에서 제외
+    // (Mongoose 9 는 파이프라인 업데이트를 updatePipeline 없이 거부한다)
+    await ReorderSuggestion.updateOne(
+      { productId: product._id },
+      [
+        {
+          $set: {
+            stock: product.stock,
+            suggestedQty: { $cond: [{ $gt: [product.stock, '$reorderPoint'] }, 0, '$suggestedQty'] },
+          },
+        },
+      ],
+      { updatePipeline: true }
+    )
 
     res.json(product)
   } catch (err) {
-    console.error('재고 업데이트 에러:', err)
+    logger.error('재고 업데이트 실패', { err })
     res.status(500).json({ message: '재고 업데이트 실패' })
   }
 })
@@ -1,13 +1,18 @@
 import express from 'express'
 import QrLog from '../models/QrLog'
 import Product from '../models/Product'
+import { QR_LOG_LIST_FIELDS, serializeQrLogList } from '../dto/qrLogDto'
+import { sendSerialized } from '../utils/serializer'
+import { invalidates } from '../middleware/responseCache'
+import { queueAlertRefresh } from '../services/alertEngine'
+import { logger } from '../utils/logger'
 
 const router = express.Router()
 
-router.post('/save-qr', async (req, res) => {
+router.post('/save-qr', invalidates('products'), async (req, res) => {
   try {
     const body = req.body
-    console.log('📦 QR 스캔 데이터 수신:', body)
+    logger.debug('QR 스캔 수신', { body })
 
     let realData
     if (body.data && typeof body.data === 'string') {
@@ -48,7 +53,7 @@ router.post('/save-qr', async (req, res) => {
 
         if (priceNum > 0) {
           product.price = priceNum
-          console.log(`💰 가격 업데이트: ${priceNum}원`)
+          logger.debug('가격 업데이트', { productId: product._id, price: priceNum })
         }
 
         if (expireDate) {
@@ -62,12 +67,15 @@ router.post('/save-qr', async (req, res) => {
         }
 
         await product.save()
-        console.log(
-          `✅ [재고반영] ${productName}: +${qtyNum}개 (현재: ${product.stock}개)`
-        )
+        queueAlertRefresh([product._id])
+        logger.info('입고 재고 반영', {
+          productId: product._id,
+          quantity: qtyNum,
+          stock: product.stock,
+        })
       } else {
-        console.log(`✨ [신규등록] ${productName} (가격: ${priceNum}원)`)
-        await Product.create({
+        logger.info('입고 신규 상품 등록', { name: productName, price: priceNum })
+        const created = await Product.create({
           name: productName,
           barcode: targetBarcode,
           price: priceNum,
@@ -76,6 +84,7 @@ router.post('/save-qr', async (req, res) => {
           minStock: 5,
           expiryDate: expireDate ? new Date(expireDate) : undefined,
         })
+        queueAlertRefresh([created._id])
       }
     }
 
@@ -83,15 +92,18 @@ router.post('/save-qr', async (req, res) => {
       .status(200)
       .json({ message: '입고 및 가격 반영 성공', result: newLog })
   } catch (error) {
-    console.error('서버 에러:', error)
+    logger.error('QR 입고 저장 실패', { err: error })
     return res.status(500).json({ error: '저장 실패' })
   }
 })
 
 router.get('/get-qr', async (req, res) => {
   try {
-    const logs = await QrLog.find().sort({ scannedAt: -1 })
-    res.json(logs)
+    const logs = await QrLog.find()
+      .select(QR_LOG_LIST_FIELDS)
+      .sort({ scannedAt: -1 })
+      .lean()
+    sendSerialized(req, res, serializeQrLogList, logs)
   } catch (error) {
     res.status(500).json({ error: '데이터 불러오기 실패' })
   }
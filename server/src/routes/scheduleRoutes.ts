@@ -6,7 +6,11 @@ import timezone from 'dayjs/plugin/timezone'
 import isoWeek from 'dayjs/plugin/isoWeek'
 import mongoose from 'mongoose'
 import Schedule from '../models/Schedule'
+import SubRequest from '../models/SubRequest'
+import { weekOf, weeklyHours } from '../services/projections'
 import { auth, ownerOnly, UserRequest } from '../middleware/auth'
+import { invalidates } from '../middleware/responseCache'
+import { logger } from '../utils/logger'
 
 dayjs.extend(utc)
 dayjs.extend(timezone)
@@ -34,7 +38,7 @@ const getStatus = (dateStr: string) => {
 }
 
 // 📌 스케줄 추가
-router.post('/add', auth, ownerOnly, async (req: UserRequest, res) => {
+router.post('/add', auth, ownerOnly, invalidates('schedules'), async (req: UserRequest, res) => {
   try {
     const { staffId, date, startTime, endTime } = req.body
     if (!staffId || !date)
@@ -51,7 +55,7 @@ router.post('/add', auth, ownerOnly, async (req: UserRequest, res) => {
 
     res.json(created)
   } catch (e) {
-    console.error(e)
+    logger.error('스케줄 추가 실패', { err: e })
     res.status(500).json({ message: '스케줄 추가 실패' })
   }
 })
@@ -82,6 +86,40 @@ router.get('/week', auth, ownerOnly, async (_req, res) => {
   }
 })
 
+// 📌 점주: 직원별 주간 근무 시간 (?week=YYYY-MM-DD 가 속한 주, 기본 이번 주)
+// 변경 스트림 프로젝션(StaffWeeklyHours)을 읽고, 준비 전이면 해당 주 스케줄에서 계산
+router.get('/hours', auth, ownerOnly, async (req, res) => {
+  try {
+    const base = typeof req.query.week === 'string' ? dayjs(req.query.week) : dayjs().tz()
+    if (!base.isValid()) return res.status(400).json({ message: '잘못된 날짜' })
+    const week = weekOf(base.format('YYYY-MM-DD'))
+
+    const projected = await weeklyHours(week)
+    if (projected) {
+      return res.json(
+        projected.map((h) => ({ staffId: h.staff.toString(), hours: h.hours, shifts: h.shifts }))
+      )
+    }
+
+    const end = dayjs(week).add(6, 'day').format('YYYY-MM-DD')
+    const schedules = await Schedule.find({ date: { $gte: week, $lte: end } })
+      .select('staff startTime endTime')
+      .lean()
+    const totals = new Map<string, { staffId: string; hours: number; shifts: number }>()
+    for (const s of schedules) {
+      const staffId = s.staff.toString()
+      const t = totals.get(staffId) ?? { staffId, hours: 0, shifts: 0 }
+      t.hours += calcHours(s.startTime, s.endTime)
+      t.shifts += 1
+      totals.set(staffId, t)
+    }
+    res.json([...totals.values()])
+  } catch (e) {
+    logger.error('주간 근무 시간 조회 실패', { err: e })
+    res.status(500).json({ message: '로딩 실패' })
+  }
+})
+
 // 📌 알바: 내 스케줄 조회
 router.get('/my', auth, async (req: UserRequest, res) => {
   try {
@@ -106,7 +144,7 @@ router.get('/my', auth, async (req: UserRequest, res) => {
 })
 
 // 📌 반복 스케줄 등록
-router.post('/template', auth, ownerOnly, async (req: UserRequest, res) => {
+router.post('/template', auth, ownerOnly, invalidates('schedules'), async (req: UserRequest, res) => {
   try {
     const { staffId, startDate, endDate, days, startTime, endTime } = req.body
     const staffObjId = new mongoose.Types.ObjectId(staffId)
@@ -114,30 +152,29 @@ router.post('/template', auth, ownerOnly, async (req: UserRequest, res) => {
     let cur = dayjs(startDate).tz().startOf('day')
     const end = dayjs(endDate).tz().startOf('day')
 
-    let created = 0
-
+    // 날짜별 create 대신 모아서 insertMany 한 번
+    const docs = []
     while (cur.isSame(end) || cur.isBefore(end)) {
       if (days.includes(cur.isoWeekday())) {
-        const dateStr = cur.format('YYYY-MM-DD')
-        await Schedule.create({
+        docs.push({
           staff: staffObjId,
-          date: dateStr,
+          date: cur.format('YYYY-MM-DD'),
           startTime,
           endTime,
         })
-        created++
       }
       cur = cur.add(1, 'day')
     }
+    if (docs.length > 0) await Schedule.insertMany(docs)
 
-    res.json({ created })
+    res.json({ created: docs.length })
   } catch {
     res.status(500).json({ message: '오류 발생' })
   }
 })
 
 // 📌 수정
-router.put('/:id', auth, ownerOnly, async (req: UserRequest, res) => {
+router.put('/:id', auth, ownerOnly, invalidates('schedules'), async (req: UserRequest, res) => {
   try {
     const target = await Schedule.findById(req.params.id)
     if (!target) return res.status(404).json({ message: '없음' })
@@ -153,16 +190,25 @@ router.put('/:id', auth, ownerOnly, async (req: UserRequest, res) => {
     target.endTime = req.body.endTime ?? target.endTime
 
     await target.save()
+    // 대타 요청의 근무 정보 사본도 함께 갱신 ({ storeId, scheduleId } 인덱스)
+    await SubRequest.updateMany(
+      { scheduleId: target._id },
+      {
+        $set: {
+          shift: { date: target.date, startTime: target.startTime, endTime: target.endTime },
+        },
+      }
+    )
 
     res.json(target)
   } catch (e) {
-    console.error(e)
+    logger.error('스케줄 수정 실패', { err: e })
     res.status(500).json({ message: '수정 오류' })
   }
 })
 
 // 📌 삭제
-router.delete('/:id', auth, ownerOnly, async (req: UserRequest, res) => {
+router.delete('/:id', auth, ownerOnly, invalidates('schedules'), async (req: UserRequest, res) => {
   try {
     await Schedule.findByIdAndDelete(req.params.id)
     res.json({ message: '삭제 완료' })
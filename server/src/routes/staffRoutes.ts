@@ -1,5 +1,6 @@
 import { Router } from 'express'
-import { authMiddleware } from '../middleware/auth'
+import { authMiddleware, ownerOnly } from '../middleware/auth'
+import { cacheResponse, invalidates } from '../middleware/responseCache'
 import {
   addStaff,
   getStaffList,
@@ -8,8 +9,19 @@ import {
 
 const router = Router()
 
-router.post('/add', authMiddleware, addStaff)
-router.get('/list', authMiddleware, getStaffList)
-router.delete('/delete/:id', authMiddleware, deleteStaff)
+router.post('/add', authMiddleware, invalidates('users'), addStaff)
+router.get(
+  '/list',
+  authMiddleware,
+  cacheResponse({ tags: ['users'] }),
+  getStaffList
+)
+router.delete(
+  '/delete/:id',
+  authMiddleware,
+  ownerOnly,
+  invalidates('users'),
+  deleteStaff
+)
 
 export default router
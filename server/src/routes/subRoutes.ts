@@ -1,6 +1,7 @@
 // src/routes/subRoutes.ts
 import { Router } from 'express'
 import { auth, ownerOnly } from '../middleware/auth'
+import { invalidates } from '../middleware/responseCache'
 import {
   requestSub,
   approveRecruit,
@@ -33,7 +34,13 @@ router.patch('/owner/approve/:id', auth, ownerOnly, approveRecruit)
 router.patch('/accept/:id', auth, acceptBySub)
 
 // 관리자 → 최종 승인 (스케줄 교체)
-router.patch('/owner/final/:id', auth, ownerOnly, finalApprove)
+router.patch(
+  '/owner/final/:id',
+  auth,
+  ownerOnly,
+  invalidates('schedules'),
+  finalApprove
+)
 
 // 관리자 → 목록 조회 (Pending / Approved)
 router.get('/owner', auth, ownerOnly, getSubListForOwner)
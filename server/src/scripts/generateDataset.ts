@@ -0,0 +1,445 @@
+// 대용량 합성 데이터셋 생성기
+//
+// 사용법:
+//   npx ts-node src/scripts/generateDataset.ts --orders 5000000 --days 365 --drop
+//   npx ts-node src/scripts/generateDataset.ts --products 3000 --posts 20000 --batch 5000
+//   npx ts-node src/scripts/generateDataset.ts --store gangnam --orders 200000   (지점별 데이터)
+//
+// 모든 문서는 제너레이터로 한 건씩 만들어 batch 단위로 insertMany 하므로
+// 메모리 사용량은 주문 수와 무관하게 batch 크기 + 상품/직원 목록 수준으로 유지된다.
+import mongoose, { Model, Types } from 'mongoose'
+import dotenv from 'dotenv'
+import path from 'path'
+import dayjs from 'dayjs'
+import User from '../models/User'
+import Product from '../models/Product'
+import Order from '../models/Order'
+import QrLog from '../models/QrLog'
+import Post from '../models/Post'
+import Comment from '../models/Comment'
+import Schedule from '../models/Schedule'
+import SalesHourly from '../models/SalesHourly'
+import ProductSalesDaily from '../models/ProductSalesDaily'
+import { createRandom, Random } from '../utils/random'
+import { rebuildHourlySales } from '../services/salesRollup'
+import { rebuildSalesRollup } from '../services/reorderEngine'
+import { DEFAULT_STORE_ID, isValidStoreId } from '../utils/tenant'
+
+dotenv.config({ path: path.join(__dirname, '../../.env') })
+
+export interface DatasetOptions {
+  days: number // 주문/입고/스케줄 생성 기간 (오늘 기준 과거 N일)
+  products: number
+  orders: number
+  qrLogs: number
+  staff: number
+  posts: number
+  commentsPerPost: number
+  batch: number
+  seed: number
+  drop: boolean
+  store: string // 생성 데이터의 storeId (--drop 도 이 매장 데이터만 삭제)
+}
+
+export const DEFAULT_OPTIONS: DatasetOptions = {
+  days: 365,
+  products: 1500,
+  orders: 500_000,
+  qrLogs: 50_000,
+  staff: 12,
+  posts: 5000,
+  commentsPerPost: 4,
+  batch: 5000,
+  seed: 7,
+  drop: false,
+  store: DEFAULT_STORE_ID,
+}
+
+// 📌 시간대별 가중치 (0~23시): 출근/점심/퇴근 시간대 피크, 새벽 저점
+const HOUR_WEIGHTS = [
+  2, 1.5, 1, 0.8, 0.8, 1, 2, 5, 8, 6, 5, 6, 9, 8, 6, 5, 6, 8, 10, 9, 7, 5, 4, 3,
+]
+// 요일별 가중치 (일~토): 주말, 금요일 저녁 매출이 높다
+const WEEKDAY_WEIGHTS = [1.25, 0.9, 0.9, 0.95, 1.0, 1.2, 1.35]
+
+const cumulative = (weights: number[]) => {
+  let acc = 0
+  return weights.map((w) => (acc += w))
+}
+const HOUR_CUMULATIVE = cumulative(HOUR_WEIGHTS)
+
+const CATEGORIES: Record<string, { names: string[]; price: [number, number]; shelfDays: [number, number] }> = {
+  커피: { names: ['아메리카노', '라떼', '콜드브루', '캔커피'], price: [12, 45], shelfDays: [60, 180] },
+  음료: { names: ['생수', '콜라', '사이다', '이온음료', '주스'], price: [8, 30], shelfDays: [90, 365] },
+  식품: { names: ['삼각김밥', '도시락', '샌드위치', '컵라면', '햄버거'], price: [12, 65], shelfDays: [1, 5] },
+  과자: { names: ['감자칩', '초코바', '쿠키', '젤리', '팝콘'], price: [10, 40], shelfDays: [120, 300] },
+  생활용품: { names: ['물티슈', '칫솔', '건전지', '우산', '마스크'], price: [15, 120], shelfDays: [700, 1500] },
+  기타: { names: ['라이터', '봉투', '휴대폰충전기'], price: [5, 150], shelfDays: [700, 1500] },
+}
+
+const POST_WORDS = ['재고', '청소', '야간', '손님', '발주', '폐기', '시재', '포스', '택배', '유통기한']
+
+export interface ProductSeed {
+  _id: Types.ObjectId
+  name: string
+  price: number
+  barcode: string
+  popularity: number
+}
+
+// 🔹 제너레이터: 다른 스크립트/벤치에서도 그대로 재사용 가능
+
+export function* generateStaff(count: number, store = DEFAULT_STORE_ID) {
+  // username 은 전체 매장에서 unique 이므로 다른 지점은 매장 ID 를 붙인다
+  const prefix = store === DEFAULT_STORE_ID ? 'gen_' : `gen_${store}_`
+  for (let i = 0; i < count; i++) {
+    yield {
+      _id: new Types.ObjectId(),
+      username: `${prefix}staff${i + 1}`,
+      password: 'generated', // 로그인 대상 아님 (해시 비용 제외)
+      role: 'staff',
+      name: `직원${i + 1}`,
+      phone: `010-${String(1000 + i).slice(-4)}-${String(i).padStart(4, '0')}`,
+      joinDate: dayjs().subtract(i * 17, 'day').toDate(),
+      status: '활성',
+    }
+  }
+}
+
+export function* generateProducts(count: number, rand: Random) {
+  const categories = Object.keys(CATEGORIES)
+  for (let i = 0; i < count; i++) {
+    const category = rand.pick(categories)
+    const spec = CATEGORIES[category]
+    yield {
+      _id: new Types.ObjectId(),
+      name: `${rand.pick(spec.names)} ${i + 1}호`,
+      category,
+      stock: rand.int(0, 80),
+      minStock: rand.int(3, 15),
+      price: rand.int(spec.price[0], spec.price[1]) * 100,
+      barcode: `880${String(i).padStart(10, '0')}`,
+      // 일부는 이미 유통기한이 지난 상태로 생성 (임박/폐기 알림 대상)
+      expiryDate: dayjs()
+        .add(
+          rand.next() < 0.03
+            ? rand.int(-3, 0)
+            : rand.int(spec.shelfDays[0], spec.shelfDays[1]),
+          'day'
+        )
+        .startOf('day')
+        .toDate(),
+    }
+  }
+}
+
+// 하루 주문 수를 요일 가중치로 배분 (소수점 이월로 총합을 정확히 맞춘다)
+function* dailyOrderCounts(total: number, days: number) {
+  const start = dayjs().subtract(days - 1, 'day').startOf('day')
+  let weightSum = 0
+  for (let d = 0; d < days; d++) weightSum += WEEKDAY_WEIGHTS[start.add(d, 'day').day()]
+
+  let carry = 0
+  let emitted = 0
+  for (let d = 0; d < days; d++) {
+    const day = start.add(d, 'day')
+    const exact = (total * WEEKDAY_WEIGHTS[day.day()]) / weightSum + carry
+    const count = d === days - 1 ? total - emitted : Math.floor(exact)
+    carry = exact - Math.floor(exact)
+    emitted += count
+    yield { day, count }
+  }
+}
+
+export function* generateOrders(
+  total: number,
+  days: number,
+  products: ProductSeed[],
+  rand: Random
+) {
+  // 인기 상품 쏠림(롱테일)을 위한 누적 가중치
+  const popularity = cumulative(products.map((p) => p.popularity))
+
+  for (const { day, count } of dailyOrderCounts(total, days)) {
+    // 하루치 시각만 만들어 정렬 → 시간 순으로 삽입
+    const times = new Float64Array(count)
+    for (let i = 0; i < count; i++) {
+      const hour = rand.weighted(HOUR_CUMULATIVE)
+      times[i] = day.valueOf() + hour * 3_600_000 + rand.int(0, 3_599_999)
+    }
+    times.sort()
+
+    const prefix = day.format('YYYYMMDD')
+    for (let i = 0; i < count; i++) {
+      const lines = rand.next() < 0.6 ? 1 : rand.int(2, 5)
+      const items = []
+      let totalAmount = 0
+      for (let l = 0; l < lines; l++) {
+        const p = products[rand.weighted(popularity)]
+        const quantity = rand.next() < 0.85 ? 1 : rand.int(2, 4)
+        totalAmount += p.price * quantity
+        items.push({
+          _id: new Types.ObjectId(),
+          productId: p._id,
+          productName: p.name,
+          price: p.price,
+          quantity,
+        })
+      }
+      const createdAt = new Date(times[i])
+      yield {
+        orderNumber: `GEN-${prefix}-${String(i).padStart(6, '0')}`,
+        items,
+        totalAmount,
+        paymentMethod: rand.next() < 0.82 ? 'card' : 'cash',
+        createdAt,
+      }
+    }
+  }
+}
+
+export function* generateQrLogs(
+  count: number,
+  days: number,
+  products: ProductSeed[],
+  rand: Random
+) {
+  const start = dayjs().subtract(days - 1, 'day').startOf('day')
+  for (let i = 0; i < count; i++) {
+    const p = rand.pick(products)
+    // 입고는 오전 시간대에 몰린다
+    const scannedAt = start
+      .add(rand.int(0, days - 1), 'day')
+      .add(rand.int(6, 11), 'hour')
+      .add(rand.int(0, 59), 'minute')
+    yield {
+      productName: p.name,
+      barcode: p.barcode,
+      price: p.price,
+      entryDate: scannedAt.format('YYYY-MM-DD'),
+      expireDate: scannedAt.add(rand.int(1, 365), 'day').format('YYYY-MM-DD'),
+      quantity: rand.int(1, 24),
+      scannedAt: scannedAt.toDate(),
+    }
+  }
+}
+
+export function* generatePosts(
+  count: number,
+  days: number,
+  staffIds: string[],
+  rand: Random
+) {
+  const now = Date.now()
+  for (let i = 0; i < count; i++) {
+    const createdAt = new Date(now - rand.int(0, days * 86_400_000))
+    const title = `${rand.pick(POST_WORDS)} ${rand.pick(POST_WORDS)} 관련 ${i + 1}`
+    yield {
+      _id: new Types.ObjectId(),
+      title,
+      content: Array.from({ length: rand.int(3, 12) }, () => rand.pick(POST_WORDS)).join(' '),
+      category: rand.next() < 0.65 ? 'tips' : 'suggestions',
+      authorId: rand.pick(staffIds),
+      authorName: '익명',
+      views: rand.int(0, 500),
+      likes: staffIds.filter(() => rand.next() < 0.15),
+      reports: [],
+      createdAt,
+      updatedAt: createdAt,
+    }
+  }
+}
+
+export function* generateComments(
+  posts: { _id: Types.ObjectId; createdAt: Date }[],
+  perPost: number,
+  staffIds: string[],
+  rand: Random
+) {
+  for (const post of posts) {
+    const n = rand.int(0, perPost * 2)
+    for (let i = 0; i < n; i++) {
+      const createdAt = new Date(post.createdAt.getTime() + rand.int(60_000, 3 * 86_400_000))
+      yield {
+        postId: post._id,
+        parentCommentId: null,
+        content: `${rand.pick(POST_WORDS)} 공감합니다`,
+        authorId: rand.pick(staffIds),
+        authorName: '익명',
+        likes: [],
+        createdAt,
+        updatedAt: createdAt,
+      }
+    }
+  }
+}
+
+// 24시간을 3교대로 채우는 스케줄 (직원을 교대조로 순환)
+export function* generateSchedules(days: number, staffIds: Types.ObjectId[]) {
+  const shifts = [
+    { startTime: '00:00', endTime: '08:00' },
+    { startTime: '08:00', endTime: '16:00' },
+    { startTime: '16:00', endTime: '24:00' },
+  ]
+  const start = dayjs().subtract(days - 1, 'day').startOf('day')
+  // 미래 4주까지 포함
+  for (let d = 0; d < days + 28; d++) {
+    const date = start.add(d, 'day').format('YYYY-MM-DD')
+    for (let s = 0; s < shifts.length; s++) {
+      yield {
+        staff: staffIds[(d + s * 2) % staffIds.length],
+        date,
+        ...shifts[s],
+        status: d < days - 1 ? 'completed' : 'scheduled',
+      }
+    }
+  }
+}
+
+// 생성 문서에 매장 ID 부여 (lean insertMany 는 스키마 기본값을 채우지 않는다)
+export function* withStore<T extends object>(docs: Iterable<T>, storeId: string) {
+  for (const doc of docs) yield { ...doc, storeId }
+}
+
+// 🔹 제너레이터를 batch 단위로 끊어 insertMany (이전 batch 가 끝나야 다음 생성)
+export const insertStream = async <T>(
+  model: Model<any>,
+  docs: Iterable<T>,
+  batchSize: number,
+  label = model.modelName
+) => {
+  const started = Date.now()
+  let batch: T[] = []
+  let inserted = 0
+  let lastLog = started
+
+  const flush = async () => {
+    if (batch.length === 0) return
+    // lean: 문서 hydrate/검증 생략, ordered:false: 서버가 병렬로 처리
+    await model.insertMany(batch, { ordered: false, lean: true })
+    inserted += batch.length
+    batch = []
+
+    if (Date.now() - lastLog > 2000) {
+      lastLog = Date.now()
+      const rate = Math.round(inserted / ((lastLog - started) / 1000))
+      console.log(`  ${label}: ${inserted.toLocaleString()} (${rate.toLocaleString()}/s)`)
+    }
+  }
+
+  for (const doc of docs) {
+    batch.push(doc)
+    if (batch.length >= batchSize) await flush()
+  }
+  await flush()
+
+  const sec = (Date.now() - started) / 1000
+  console.log(`✅ ${label}: ${inserted.toLocaleString()}건 (${sec.toFixed(1)}s)`)
+  return inserted
+}
+
+export const generateDataset = async (options: Partial<DatasetOptions> = {}) => {
+  const opts = { ...DEFAULT_OPTIONS, ...options }
+  if (!isValidStoreId(opts.store)) throw new Error(`잘못된 매장 ID: ${opts.store}`)
+  const rand = createRandom(opts.seed)
+  const insert = <T extends object>(model: Model<any>, docs: Iterable<T>) =>
+    insertStream(model, withStore(docs, opts.store), opts.batch)
+  // orders 는 time-series 컬렉션: insertMany 가 일반 컬렉션을 먼저 만들지 않도록 생성 완료 대기
+  await Order.init()
+
+  if (opts.drop) {
+    const models = [
+      User, Product, Order, QrLog, Post, Comment, Schedule, SalesHourly, ProductSalesDaily,
+    ]
+    await Promise.all(
+      models.map((m) =>
+        m.deleteMany(
+          m === User ? { storeId: opts.store, username: /^gen_/ } : { storeId: opts.store }
+        )
+      )
+    )
+    console.log(`🧹 기존 데이터 삭제 (${opts.store})`)
+  }
+
+  // 상품/직원 목록은 다른 컬렉션 생성에 참조되므로 메모리에 보관 (수천 건 수준)
+  const staff = [...generateStaff(opts.staff, opts.store)]
+  await insert(User, staff)
+  const staffIds = staff.map((s) => s._id.toString())
+
+  const products: ProductSeed[] = []
+  await insert(
+    Product,
+    (function* () {
+      for (const p of generateProducts(opts.products, rand)) {
+        products.push({
+          _id: p._id,
+          name: p.name,
+          price: p.price,
+          barcode: p.barcode,
+          // 1/rank 형태의 인기도 분포
+          popularity: 1 / (products.length + 1),
+        })
+        yield p
+      }
+    })()
+  )
+
+  await insert(Order, generateOrders(opts.orders, opts.days, products, rand))
+  // 분석/발주 제안이 읽는 집계를 생성 기간 전체로 구성
+  await rebuildHourlySales(dayjs().subtract(opts.days, 'day').startOf('day').toDate())
+  await rebuildSalesRollup(opts.days + 1)
+  console.log('✅ 매출 집계 재구성')
+  await insert(QrLog, generateQrLogs(opts.qrLogs, opts.days, products, rand))
+
+  const posts: { _id: Types.ObjectId; createdAt: Date }[] = []
+  await insert(
+    Post,
+    (function* () {
+      for (const p of generatePosts(opts.posts, opts.days, staffIds, rand)) {
+        posts.push({ _id: p._id, createdAt: p.createdAt })
+        yield p
+      }
+    })()
+  )
+  await insert(Comment, generateComments(posts, opts.commentsPerPost, staffIds, rand))
+
+  await insert(Schedule, generateSchedules(opts.days, staff.map((s) => s._id)))
+}
+
+const parseArgs = (argv: string[]): Partial<DatasetOptions> => {
+  const opts: Partial<DatasetOptions> = {}
+  const numeric: (keyof DatasetOptions)[] = [
+    'days', 'products', 'orders', 'qrLogs', 'staff', 'posts', 'commentsPerPost', 'batch', 'seed',
+  ]
+  for (let i = 0; i < argv.length; i++) {
+    // --qr-logs → qrLogs
+    const key = argv[i].replace(/^--/, '').replace(/-(\w)/g, (_, c) => c.toUpperCase())
+    if (key === 'drop') opts.drop = true
+    else if (key === 'store') opts.store = argv[++i]
+    else if ((numeric as string[]).includes(key)) {
+      ;(opts as Record<string, number>)[key] = Number(argv[++i])
+    }
+  }
+  return opts
+}
+
+if (require.main === module) {
+  ;(async () => {
+    try {
+      if (!process.env.MONGO_URI) {
+        throw new Error('MONGO_URI is not defined')
+      }
+      await mongoose.connect(process.env.MONGO_URI)
+      console.log('MongoDB Connected')
+
+      const started = Date.now()
+      await generateDataset(parseArgs(process.argv.slice(2)))
+      console.log(`🎉 완료 (${((Date.now() - started) / 1000).toFixed(1)}s)`)
+    } catch (error) {
+      console.error('❌ 에러:', error)
+      process.exitCode = 1
+    } finally {
+      await mongoose.disconnect()
+    }
+  })()
+}
@@ -0,0 +1,196 @@
+// orders 일반 컬렉션 → time-series 컬렉션 전환
+//
+// 사용법:
+//   npx ts-node src/scripts/migrateOrdersTimeseries.ts                  # 체크포인트부터 이어서
+//   npx ts-node src/scripts/migrateOrdersTimeseries.ts --batch 5000
+//   npx ts-node src/scripts/migrateOrdersTimeseries.ts --drop-legacy    # 완료 후 기존 컬렉션 삭제
+//
+// 1) orders → orders_legacy 로 rename 후 같은 이름으로 time-series 컬렉션 생성
+//    (time-series 는 rename 이 안 되므로 기존 쪽을 옮긴다. rename 직후 생성까지 짧은 틈에
+//     결제가 들어오면 일반 컬렉션이 생기므로 결제가 없는 시간에 실행)
+// 2) legacy 를 _id 순으로 복사 — 새 결제는 이미 time-series 쪽으로 들어간다
+// 3) SalesHourly / ProductSalesDaily 집계를 전체 기간으로 재구성
+// 요구 사항: MongoDB 7.0+ (time-series 컬렉션의 _id 조건 삭제, 재개 시 중복 제거에 사용)
+import mongoose, { Types } from 'mongoose'
+import dotenv from 'dotenv'
+import path from 'path'
+import Order from '../models/Order'
+import MigrationCheckpoint from '../models/MigrationCheckpoint'
+import { rebuildHourlySales } from '../services/salesRollup'
+import { rebuildSalesRollup } from '../services/reorderEngine'
+
+dotenv.config({ path: path.join(__dirname, '../../.env') })
+
+const MIGRATION = 'orders-timeseries'
+const LEGACY = 'orders_legacy'
+
+interface Options {
+  batch: number
+  dropLegacy: boolean
+}
+
+const parseArgs = (argv: string[]): Options => {
+  const idx = argv.indexOf('--batch')
+  return {
+    batch: (idx !== -1 && Number(argv[idx + 1])) || 2000,
+    dropLegacy: argv.includes('--drop-legacy'),
+  }
+}
+
+const db = () => mongoose.connection.db!
+
+const collectionInfo = async (name: string) =>
+  (await db().listCollections({ name }).toArray())[0] as
+    | { name: string; type?: string }
+    | undefined
+
+// 📌 저장 용량: 데이터/인덱스 크기 (time-series 는 압축된 버킷 기준)
+export const storageFootprint = async (name: string) => {
+  const [stats] = await db()
+    .collection(name)
+    .aggregate([{ $collStats: { storageStats: {} } }])
+    .toArray()
+  const s = stats?.storageStats ?? {}
+  return {
+    collection: name,
+    count: s.count ?? s.timeseries?.bucketCount ?? 0,
+    storageMB: Math.round(((s.storageSize ?? 0) / 1024 / 1024) * 10) / 10,
+    indexMB: Math.round(((s.totalIndexSize ?? 0) / 1024 / 1024) * 10) / 10,
+  }
+}
+
+// legacy 문서 → time-series 문서 (updatedAt/__v 제거, createdAt 누락 보정)
+const toTimeseries = (doc: any) => {
+  const { updatedAt, __v, ...rest } = doc
+  return {
+    ...rest,
+    orderNumber: rest.orderNumber ?? `LEGACY-${doc._id}`,
+    createdAt: rest.createdAt ?? (doc._id as Types.ObjectId).getTimestamp(),
+  }
+}
+
+export const migrateOrdersTimeseries = async (options: Partial<Options> = {}) => {
+  const opts = { ...parseArgs([]), ...options }
+  const ordersName = Order.collection.collectionName
+
+  const checkpoint =
+    (await MigrationCheckpoint.findOne({ name: MIGRATION })) ??
+    (await MigrationCheckpoint.create({ name: MIGRATION }))
+  if (checkpoint.completedAt) {
+    console.log(`✅ 이미 완료된 마이그레이션 (${checkpoint.completedAt.toISOString()})`)
+    return checkpoint
+  }
+
+  // 1) 전환 (재실행 시: 이미 time-series 면 건너뜀)
+  const current = await collectionInfo(ordersName)
+  if (current && current.type !== 'timeseries') {
+    if (await collectionInfo(LEGACY)) {
+      throw new Error(`${LEGACY} 와 일반 ${ordersName} 가 모두 존재합니다 — 수동 확인 필요`)
+    }
+    await db().renameCollection(ordersName, LEGACY)
+    console.log(`🔹 ${ordersName} → ${LEGACY}`)
+  }
+  if (!(await collectionInfo(ordersName))) {
+    await Order.createCollection()
+    await Order.createIndexes()
+    console.log(`🔹 time-series ${ordersName} 생성`)
+  }
+  if ((await collectionInfo(ordersName))?.type !== 'timeseries') {
+    throw new Error(`${ordersName} 가 일반 컬렉션으로 다시 생성되었습니다 — 결제를 멈추고 재실행`)
+  }
+
+  // 2) 복사
+  const legacy = db().collection(LEGACY)
+  const hasLegacy = !!(await collectionInfo(LEGACY))
+  const remaining = hasLegacy
+    ? await legacy.countDocuments(checkpoint.lastId ? { _id: { $gt: checkpoint.lastId } } : {})
+    : 0
+  console.log(`🔹 복사 대상 ${remaining.toLocaleString()}건`)
+
+  const started = Date.now()
+  let copied = 0
+  // 중단 직전 batch 는 삽입 후 체크포인트 저장 전에 끊겼을 수 있다 (time-series 는 _id 중복을 막지 않음)
+  let resumed = !!checkpoint.lastId
+
+  const flush = async (batch: any[]) => {
+    if (batch.length === 0) return
+    if (resumed) {
+      await Order.collection.deleteMany({ _id: { $in: batch.map((d) => d._id) } })
+      resumed = false
+    }
+    await Order.collection.insertMany(batch.map(toTimeseries), { ordered: false })
+    copied += batch.length
+
+    checkpoint.lastId = batch[batch.length - 1]._id
+    checkpoint.scanned += batch.length
+    checkpoint.modified += batch.length
+    await checkpoint.save()
+
+    const sec = (Date.now() - started) / 1000
+    console.log(
+      `  ${copied.toLocaleString()}/${remaining.toLocaleString()} ` +
+        `(${Math.round(copied / (sec || 1)).toLocaleString()} docs/s)`
+    )
+  }
+
+  if (hasLegacy) {
+    const cursor = legacy
+      .find(checkpoint.lastId ? { _id: { $gt: checkpoint.lastId } } : {})
+      .sort({ _id: 1 })
+      .batchSize(opts.batch)
+    let batch: any[] = []
+    for await (const doc of cursor) {
+      batch.push(doc)
+      if (batch.length >= opts.batch) {
+        await flush(batch)
+        batch = []
+      }
+    }
+    await flush(batch)
+  }
+
+  // 3) 집계 재구성 (원본 전체 기간)
+  const oldest = await Order.collection
+    .find({}, { projection: { createdAt: 1 } })
+    .sort({ createdAt: 1 })
+    .limit(1)
+    .next()
+  if (oldest?.createdAt) {
+    const days = Math.ceil((Date.now() - oldest.createdAt.getTime()) / 86_400_000) + 1
+    await rebuildHourlySales(oldest.createdAt)
+    await rebuildSalesRollup(days)
+    console.log(`🔹 매출 집계 재구성 (${days}일)`)
+  }
+
+  checkpoint.completedAt = new Date()
+  await checkpoint.save()
+
+  if (hasLegacy) {
+    console.table([await storageFootprint(LEGACY), await storageFootprint(ordersName)])
+    if (opts.dropLegacy) {
+      await legacy.drop()
+      console.log(`🧹 ${LEGACY} 삭제`)
+    }
+  }
+  const sec = (Date.now() - started) / 1000
+  console.log(`✅ copied ${copied.toLocaleString()} in ${sec.toFixed(1)}s`)
+  return checkpoint
+}
+
+if (require.main === module) {
+  ;(async () => {
+    try {
+      if (!process.env.MONGO_URI) {
+        throw new Error('MONGO_URI is not defined')
+      }
+      await mongoose.connect(process.env.MONGO_URI)
+      console.log('MongoDB Connected')
+      await migrateOrdersTimeseries(parseArgs(process.argv.slice(2)))
+    } catch (error) {
+      console.error('❌ 에러:', error)
+      process.exitCode = 1
+    } finally {
+      await mongoose.disconnect()
+    }
+  })()
+}
@@ -0,0 +1,205 @@
+// Post.reports 마이그레이션: ['userId', ...] → [{ userId, createdAt }, ...]
+//
+// 사용법:
+//   npx ts-node src/scripts/migratePostReports.ts                 # 체크포인트부터 이어서
+//   npx ts-node src/scripts/migratePostReports.ts --restart       # 처음부터 다시
+//   npx ts-node src/scripts/migratePostReports.ts --batch 500 --pause 50
+//
+// - _id 순 커서로 스트리밍하므로 메모리는 batch 크기만큼만 사용
+// - batch 마다 bulkWrite(ordered:false) 후 체크포인트 저장 → 중단돼도 이어서 실행
+// - 문서 단위 updateOne 이라 컬렉션 전체를 오래 잠그지 않는다
+import mongoose, { Types } from 'mongoose'
+import dotenv from 'dotenv'
+import path from 'path'
+import Post from '../models/Post'
+import MigrationCheckpoint from '../models/MigrationCheckpoint'
+
+dotenv.config({ path: path.join(__dirname, '../../.env') })
+
+const MIGRATION = 'post-reports-objects'
+
+interface Options {
+  batch: number
+  pause: number // batch 사이 대기(ms): 운영 중 부하 조절
+  restart: boolean
+}
+
+type LegacyReport = string | { userId: string; createdAt?: Date; _id?: Types.ObjectId }
+
+interface RawPost {
+  _id: Types.ObjectId
+  reports: LegacyReport[]
+  createdAt?: Date
+}
+
+// 문자열 항목이 하나라도 남아 있는 문서만 대상
+const LEGACY_FILTER = { reports: { $elemMatch: { $type: 'string' } } }
+
+const parseArgs = (argv: string[]): Options => {
+  const get = (name: string) => {
+    const idx = argv.indexOf(`--${name}`)
+    return idx !== -1 ? argv[idx + 1] : undefined
+  }
+  return {
+    batch: Number(get('batch')) || 1000,
+    pause: Number(get('pause')) || 0,
+    restart: argv.includes('--restart'),
+  }
+}
+
+// 📌 레거시 항목 변환
+// 신고 시각이 기록되어 있지 않으므로 게시글 작성 시각을 하한값으로 사용한다.
+// (updatedAt 은 조회수 증가에도 갱신되어 "오늘 신고" 통계를 부풀리게 된다)
+export const convertReports = (post: RawPost) => {
+  const fallback = post.createdAt ?? post._id.getTimestamp()
+  const seen = new Set<string>()
+  const converted: { _id: Types.ObjectId; userId: string; createdAt: Date }[] = []
+
+  for (const r of post.reports) {
+    const entry =
+      typeof r === 'string'
+        ? { _id: new Types.ObjectId(), userId: r, createdAt: fallback }
+        : {
+            _id: r._id ?? new Types.ObjectId(),
+            userId: r.userId,
+            createdAt: r.createdAt ?? fallback,
+          }
+    // 같은 사용자의 중복 신고는 하나로
+    if (seen.has(entry.userId)) continue
+    seen.add(entry.userId)
+    converted.push(entry)
+  }
+  return converted
+}
+
+const sleep = (ms: number) => new Promise((r) => setTimeout(r, ms))
+
+export const migratePostReports = async (options: Partial<Options> = {}) => {
+  const opts = { ...parseArgs([]), ...options }
+  const collection = Post.collection
+
+  if (opts.restart) {
+    await MigrationCheckpoint.deleteOne({ name: MIGRATION })
+  }
+  const checkpoint =
+    (await MigrationCheckpoint.findOne({ name: MIGRATION })) ??
+    (await MigrationCheckpoint.create({ name: MIGRATION }))
+
+  if (checkpoint.completedAt) {
+    console.log(`✅ 이미 완료된 마이그레이션 (${checkpoint.completedAt.toISOString()})`)
+    return checkpoint
+  }
+
+  const remaining = await collection.countDocuments(
+    checkpoint.lastId ? { ...LEGACY_FILTER, _id: { $gt: checkpoint.lastId } } : LEGACY_FILTER
+  )
+  console.log(
+    `🔹 대상 ${remaining.toLocaleString()}건` +
+      (checkpoint.lastId ? ` (체크포인트 ${checkpoint.lastId} 이후)` : '')
+  )
+
+  const started = Date.now()
+  let scanned = 0
+  let modified = 0
+  const conflicts: Types.ObjectId[] = []
+
+  const cursor = collection
+    .find<RawPost>(
+      checkpoint.lastId ? { ...LEGACY_FILTER, _id: { $gt: checkpoint.lastId } } : LEGACY_FILTER,
+      { projection: { reports: 1, createdAt: 1 } }
+    )
+    .sort({ _id: 1 })
+    .batchSize(opts.batch)
+
+  const flush = async (batch: RawPost[], retry = false) => {
+    if (batch.length === 0) return
+    const result = await collection.bulkWrite(
+      batch.map((post) => ({
+        updateOne: {
+          // 읽은 이후 신고가 토글됐다면 덮어쓰지 않고 재시도 목록으로
+          filter: { _id: post._id, reports: post.reports },
+          update: { $set: { reports: convertReports(post) } },
+        },
+      })),
+      { ordered: false }
+    )
+    if (!retry) scanned += batch.length
+    modified += result.modifiedCount
+    if (result.matchedCount < batch.length) {
+      const ids = batch.map((p) => p._id)
+      const stillLegacy = await collection
+        .find({ _id: { $in: ids }, ...LEGACY_FILTER }, { projection: { _id: 1 } })
+        .toArray()
+      conflicts.push(...stillLegacy.map((d) => d._id as Types.ObjectId))
+    }
+
+    // 재시도 batch 는 커서 위치(lastId)를 되돌리지 않는다
+    if (!retry) {
+      checkpoint.lastId = batch[batch.length - 1]._id
+      checkpoint.scanned += batch.length
+    }
+    checkpoint.modified += result.modifiedCount
+    await checkpoint.save()
+
+    const sec = (Date.now() - started) / 1000
+    console.log(
+      `  ${scanned.toLocaleString()}/${remaining.toLocaleString()} ` +
+        `(${Math.round(scanned / (sec || 1)).toLocaleString()} docs/s)`
+    )
+    if (opts.pause > 0) await sleep(opts.pause)
+  }
+
+  let batch: RawPost[] = []
+  for await (const post of cursor) {
+    batch.push(post)
+    if (batch.length >= opts.batch) {
+      await flush(batch)
+      batch = []
+    }
+  }
+  await flush(batch)
+
+  // 동시 수정으로 건너뛴 문서는 최신 상태로 다시 읽어 재시도
+  for (let attempt = 0; attempt < 3 && conflicts.length > 0; attempt++) {
+    const retry = await collection
+      .find<RawPost>(
+        { _id: { $in: conflicts.splice(0) }, ...LEGACY_FILTER },
+        { projection: { reports: 1, createdAt: 1 } }
+      )
+      .toArray()
+    await flush(retry, true)
+  }
+
+  // 커서가 지나간 뒤 레거시 형식으로 쓰인 문서가 없을 때만 완료 처리
+  const leftover = await collection.countDocuments(LEGACY_FILTER)
+  if (leftover === 0) checkpoint.completedAt = new Date()
+  await checkpoint.save()
+
+  const sec = (Date.now() - started) / 1000
+  console.log(
+    `✅ scanned ${scanned.toLocaleString()}, modified ${modified.toLocaleString()} ` +
+      `in ${sec.toFixed(1)}s (${Math.round(scanned / (sec || 1)).toLocaleString()} docs/s)`
+  )
+  if (leftover > 0) {
+    console.log(`⚠️ 레거시 형식 ${leftover}건 남음 — --restart 로 다시 실행하세요`)
+  }
+  return checkpoint
+}
+
+if (require.main === module) {
+  ;(async () => {
+    try {
+      if (!process.env.MONGO_URI) {
+        throw new Error('MONGO_URI is not defined')
+      }
+      await mongoose.connect(process.env.MONGO_URI)
+      console.log('MongoDB Connected')
+      await migratePostReports(parseArgs(process.argv.slice(2)))
+    } catch (error) {
+      console.error('❌ 에러:', error)
+      process.exitCode = 1
+    } finally {
+      await mongoose.disconnect()
+    }
+  })()
+}
@@ -0,0 +1,96 @@
+// 매장(테넌트) 도입 마이그레이션: 기존 데이터를 기본 매장으로 지정하고 인덱스를 매장 기준으로 교체
+//
+// 사용법:
+//   npx ts-node src/scripts/migrateStoreId.ts                  # storeId 없는 문서 → DEFAULT_STORE_ID
+//   npx ts-node src/scripts/migrateStoreId.ts --store main
+//
+// - storeId 가 없는 문서만 갱신하므로 여러 번 실행해도 안전하다
+// - 이후 syncIndexes 로 스키마에 없는 이전 인덱스(barcode_1, productId_1 unique 등)를 삭제하고
+//   { storeId, ... } 인덱스를 만든다. 배포 전에 실행해야 서버 인덱스 동기화가 실패하지 않는다
+import mongoose, { Model } from 'mongoose'
+import dotenv from 'dotenv'
+import path from 'path'
+import User from '../models/User'
+import Announcement from '../models/Announcement'
+import CheckoutReceipt from '../models/CheckoutReceipt'
+import Comment from '../models/Comment'
+import Handover from '../models/Handover'
+import InventoryAlert from '../models/InventoryAlert'
+import Order from '../models/Order'
+import Post from '../models/Post'
+import Product from '../models/Product'
+import ProductSalesDaily from '../models/ProductSalesDaily'
+import QrLog from '../models/QrLog'
+import ReorderSuggestion from '../models/ReorderSuggestion'
+import SalesHourly from '../models/SalesHourly'
+import Schedule from '../models/Schedule'
+import SubRequest from '../models/SubRequest'
+import SubRequestArchive from '../models/SubRequestArchive'
+import SubstituteRequest from '../models/SubstituteRequest'
+import { DEFAULT_STORE_ID, isValidStoreId } from '../utils/tenant'
+
+dotenv.config({ path: path.join(__dirname, '../../.env') })
+
+// storeId 필드를 가진 매장 데이터 모델
+export const TENANT_MODELS: Model<any>[] = [
+  User,
+  Announcement,
+  CheckoutReceipt,
+  Comment,
+  Handover,
+  InventoryAlert,
+  Order,
+  Post,
+  Product,
+  ProductSalesDaily,
+  QrLog,
+  ReorderSuggestion,
+  SalesHourly,
+  Schedule,
+  SubRequest,
+  SubRequestArchive,
+  SubstituteRequest,
+]
+
+export const migrateStoreId = async (storeId = DEFAULT_STORE_ID) => {
+  if (!isValidStoreId(storeId)) throw new Error(`잘못된 매장 ID: ${storeId}`)
+
+  for (const model of TENANT_MODELS) {
+    // 드라이버 컬렉션으로 직접 갱신 (모델 쿼리는 매장 플러그인/스키마 캐스팅을 거친다)
+    // orders 는 time-series 지만 metaField(storeId) 갱신은 허용된다
+    const result = await model.collection.updateMany(
+      { storeId: { $exists: false } },
+      { $set: { storeId } }
+    )
+    console.log(`  ${model.collection.collectionName}: ${result.modifiedCount.toLocaleString()}건`)
+  }
+  console.log(`✅ storeId 채움 (${storeId})`)
+
+  for (const model of TENANT_MODELS) {
+    await model.init()
+    const dropped = await model.syncIndexes()
+    if (dropped.length > 0) {
+      console.log(`  ${model.collection.collectionName}: 삭제 ${dropped.join(', ')}`)
+    }
+  }
+  console.log('✅ 인덱스 교체')
+}
+
+if (require.main === module) {
+  ;(async () => {
+    try {
+      if (!process.env.MONGO_URI) {
+        throw new Error('MONGO_URI is not defined')
+      }
+      await mongoose.connect(process.env.MONGO_URI)
+      console.log('MongoDB Connected')
+      const idx = process.argv.indexOf('--store')
+      await migrateStoreId(idx !== -1 ? process.argv[idx + 1] : undefined)
+    } catch (error) {
+      console.error('❌ 에러:', error)
+      process.exitCode = 1
+    } finally {
+      await mongoose.disconnect()
+    }
+  })()
+}
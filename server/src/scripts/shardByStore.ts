@@ -0,0 +1,63 @@
+// 매장 단위 샤딩 설정 (mongos 에 연결해서 실행)
+//
+// 사용법:
+//   npx ts-node src/scripts/shardByStore.ts            # 설정만 출력
+//   npx ts-node src/scripts/shardByStore.ts --apply
+//
+// 📌 샤드 키
+// - 매장 데이터: { storeId, _id } → 한 매장의 조회는 대상 샤드로만 라우팅, 매장이 커지면 _id 로 분할
+// - orders(time-series): { storeId(metaField), createdAt }
+// - users 는 username 이 전체 매장에서 unique 여야 하므로 샤딩하지 않는다
+//   (샤드 컬렉션의 unique 인덱스는 샤드 키를 접두사로 가져야 함)
+// migrateStoreId 로 storeId 를 모두 채운 뒤 실행해야 한다
+import mongoose from 'mongoose'
+import dotenv from 'dotenv'
+import path from 'path'
+import Order from '../models/Order'
+import User from '../models/User'
+import { TENANT_MODELS } from './migrateStoreId'
+
+dotenv.config({ path: path.join(__dirname, '../../.env') })
+
+export const shardPlan = () =>
+  TENANT_MODELS.filter((model) => model !== User).map((model) => ({
+    model,
+    key: model === Order ? { storeId: 1, createdAt: 1 } : { storeId: 1, _id: 1 },
+  }))
+
+export const shardByStore = async (apply = false) => {
+  const db = mongoose.connection.db!
+  const admin = db.admin()
+
+  if (apply) await admin.command({ enableSharding: db.databaseName })
+
+  for (const { model, key } of shardPlan()) {
+    const ns = `${db.databaseName}.${model.collection.collectionName}`
+    console.log(`  ${ns} → ${JSON.stringify(key)}`)
+    if (!apply) continue
+
+    await model.init()
+    // 샤드 키 인덱스 (time-series 는 shardCollection 이 버킷 인덱스를 직접 만든다)
+    if (model !== Order) await model.collection.createIndex(key)
+    await admin.command({ shardCollection: ns, key })
+  }
+  console.log(apply ? '✅ 샤딩 설정 완료' : 'ℹ️ --apply 로 실행하면 적용됩니다')
+}
+
+if (require.main === module) {
+  ;(async () => {
+    try {
+      if (!process.env.MONGO_URI) {
+        throw new Error('MONGO_URI is not defined')
+      }
+      await mongoose.connect(process.env.MONGO_URI)
+      console.log('MongoDB Connected')
+      await shardByStore(process.argv.includes('--apply'))
+    } catch (error) {
+      console.error('❌ 에러:', error)
+      process.exitCode = 1
+    } finally {
+      await mongoose.disconnect()
+    }
+  })()
+}
@@ -1,44 +1,157 @@
-import express from 'express'
-import dotenv from 'dotenv'
-import cors from 'cors'
-import { connectDB } from './config/db'
-
-import authRoutes from './routes/authRoutes'
-import staffRoutes from './routes/staffRoutes'
-import announcementRoutes from './routes/announcementRoutes'
-import communityRoutes from './routes/communityRoutes'
-import qrRoutes from './routes/qrRoutes'
-import productRoutes from './routes/productRoutes'
-import kioskRoutes from './routes/kioskRoutes'
-import analyticsRoutes from './routes/analyticsRoutes'
-import dashboardRoutes from './routes/dashboardRoutes'
-import scheduleRoutes from './routes/scheduleRoutes'
-import subRoutes from './routes/subRoutes'
-import handoverRoutes from './routes/handoverRoutes'
-dotenv.config()
-
-const app = express()
-
-app.use(cors())
-app.use(express.json())
-
-// DB 연결
-connectDB()
-
-// Routes
-app.use('/api/auth', authRoutes)
-app.use('/api/staff', staffRoutes)
-app.use('/api/announcements', announcementRoutes)
-app.use('/api/community', communityRoutes)
-app.use('/api/products', productRoutes)
-app.use('/api/kiosk', kioskRoutes)
-app.use('/api/analytics', analyticsRoutes)
-app.use('/api/dashboard', dashboardRoutes)
-app.use('/api/schedule', scheduleRoutes)
-app.use('/api/sub', subRoutes)
-app.use('/api/handovers', handoverRoutes)
-app.use('/api', qrRoutes)
+// 환경 변수는 다른 모듈이 읽기 전에 가장 먼저 로드
+import 'dotenv/config'
+import cluster from 'cluster'
+import os from 'os'
+import { Server } from 'http'
+import mongoose from 'mongoose'
+import { connectDB, syncIndexes } from './config/db'
+import { relayWorkerMessages } from './utils/messageBus'
+import { relayMetricsScrapes } from './utils/clusterMetrics'
+import { setDraining } from './utils/readiness'
+import { flushLogs, logger } from './utils/logger'
 
 const PORT = process.env.PORT || 5000
 
-app.listen(PORT, () => console.log(`Server running on port ${PORT}`))
+// CLUSTER_WORKERS: 미설정/1 → 단일 프로세스, 'auto' → CPU 코어 수, 숫자 → 해당 개수
+const resolveWorkers = (value = '') => {
+  if (value === 'auto') return os.availableParallelism()
+  return Math.max(1, Number(value) || 1)
+}
+const WORKERS = resolveWorkers(process.env.CLUSTER_WORKERS)
+
+// SIGTERM 후 진행 중인 요청을 기다리는 최대 시간
+const SHUTDOWN_TIMEOUT = Number(process.env.SHUTDOWN_TIMEOUT_MS) || 10_000
+
+// 🔹 주기 작업 (스윕/집계/보관/프로젝터)
+// 워커마다 돌리면 같은 스윕이 N 번 실행되고, 발주 제안처럼 이전 결과를 지우는 작업은 서로의 결과를 지운다
+// → primary 가 워커 하나에만 CLUSTER_ROLE=jobs 를 주고, 그 워커가 죽으면 교체 워커가 역할을 이어받는다
+const RUNS_JOBS = !cluster.isWorker || process.env.CLUSTER_ROLE === 'jobs'
+
+const startBackgroundJobs = async () => {
+  // 재고 알림 엔진 (기동 시 전체 재계산 + 주기 스윕)
+  const { startAlertEngine } = await import('./services/alertEngine')
+  const stopAlertEngine = startAlertEngine()
+
+  // 수요 예측 + 발주 제안 (기동 시 1회 + 매일 새벽)
+  const { startReorderEngine } = await import('./services/reorderEngine')
+  const stopReorderEngine = startReorderEngine()
+
+  // 주문 보관 정책 (월별 파일 보관 + 시간당 매출 집계 보정, 매일 새벽)
+  const { startOrderMaintenance } = await import('./services/orderRetention')
+  const stopOrderMaintenance = startOrderMaintenance()
+
+  // 커뮤니티 인기글 점수 보정 (기동 시 1회 + 주기)
+  const { startPostRanking } = await import('./services/postRanking')
+  const stopPostRanking = startPostRanking()
+
+  // 근무일이 지난 대타 요청 보관 (기동 시 1회 + 주기)
+  const { startSubRequestArchive } = await import('./services/subRequestArchive')
+  const stopSubRequestArchive = startSubRequestArchive()
+
+  // 파생 데이터 프로젝터 (변경 스트림, 레플리카셋에서만. 여러 서버에서도 임대를 가진 프로세스 하나가 처리)
+  const { startProjections } = await import('./services/projections')
+  const stopProjections = startProjections()
+
+  return () => {
+    stopAlertEngine()
+    stopReorderEngine()
+    stopOrderMaintenance()
+    stopPostRanking()
+    stopSubRequestArchive()
+    stopProjections()
+  }
+}
+
+// 🔹 워커 (또는 단일 프로세스)
+// 포트는 바로 열어 /healthz 에 응답하고, API 는 DB 연결 + 인덱스 동기화 후 /readyz 가 200 이 되면서 열린다
+const startWorker = async () => {
+  // primary 는 라우트/모델을 로드할 필요가 없으므로 워커에서만 앱을 불러온다
+  const { default: app } = await import('./app')
+  const server: Server = app.listen(PORT, () =>
+    logger.info(`Server running on port ${PORT}`, { worker: cluster.isWorker, jobs: RUNS_JOBS })
+  )
+
+  await connectDB()
+  await syncIndexes()
+
+  // 이 프로세스가 떠 있지 않던 동안의 토큰 폐기 반영
+  const { loadRevocations } = await import('./utils/tokenCache')
+  await loadRevocations().catch((err) => logger.error('토큰 폐기 기록 로드 실패', { err }))
+
+  // 백그라운드 작업은 클러스터에서 지정된 워커 하나만 (단일 프로세스면 그 프로세스)
+  const stopBackgroundJobs = RUNS_JOBS ? await startBackgroundJobs() : () => {}
+
+  let closing = false
+  const shutdown = () => {
+    if (closing) return
+    closing = true
+    setDraining()
+    stopBackgroundJobs()
+    logger.info('종료 중: 새 연결 차단, 진행 중 요청 대기')
+
+    // 응답이 끝나면 keep-alive 연결도 닫히도록
+    server.close(async () => {
+      await mongoose.disconnect()
+      await flushLogs()
+      process.exit(0)
+    })
+    server.closeIdleConnections()
+
+    setTimeout(async () => {
+      logger.warn('종료 대기 시간 초과, 강제 종료')
+      server.closeAllConnections()
+      await flushLogs()
+      process.exit(1)
+    }, SHUTDOWN_TIMEOUT).unref()
+  }
+
+  process.on('SIGTERM', shutdown)
+  process.on('SIGINT', shutdown)
+}
+
+// 🔹 primary: 워커 생성/재시작, 메시지 중계, 종료 신호 전달
+const startPrimary = () => {
+  logger.info('cluster primary started', { workers: WORKERS })
+  let shuttingDown = false
+
+  // 백그라운드 작업을 맡은 워커 (재시작 시 역할 유지)
+  const jobWorkers = new Set<number>()
+  const fork = (jobs = false) => {
+    const worker = cluster.fork({ CLUSTER_ROLE: jobs ? 'jobs' : '' })
+    if (jobs) jobWorkers.add(worker.id)
+    relayWorkerMessages(worker)
+    relayMetricsScrapes(worker)
+  }
+
+  for (let i = 0; i < WORKERS; i++) fork(i === 0)
+
+  cluster.on('exit', (worker, code, signal) => {
+    const wasJobWorker = jobWorkers.delete(worker.id)
+    if (shuttingDown) {
+      if (Object.keys(cluster.workers ?? {}).length === 0) process.exit(0)
+      return
+    }
+    // 비정상 종료된 워커는 바로 교체
+    logger.error('worker exited, restarting', { workerPid: worker.process.pid, code, signal })
+    fork(wasJobWorker)
+  })
+
+  const shutdown = (signal: NodeJS.Signals) => {
+    if (shuttingDown) return
+    shuttingDown = true
+    logger.info('워커 종료 대기', { signal })
+    for (const worker of Object.values(cluster.workers ?? {})) {
+      worker?.process.kill('SIGTERM')
+    }
+    setTimeout(() => process.exit(1), SHUTDOWN_TIMEOUT + 1000).unref()
+  }
+
+  process.on('SIGTERM', shutdown)
+  process.on('SIGINT', shutdown)
+}
+
+if (cluster.isPrimary && WORKERS > 1) {
+  startPrimary()
+} else {
+  startWorker()
+}
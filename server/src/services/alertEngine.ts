@@ -0,0 +1,204 @@
+import mongoose from 'mongoose'
+import Product from '../models/Product'
+import InventoryAlert, { AlertKind } from '../models/InventoryAlert'
+import { invalidateTags } from '../middleware/responseCache'
+import { counter } from '../utils/metrics'
+import { DEFAULT_STORE_ID, outsideRequest } from '../utils/tenant'
+import { logger } from '../utils/logger'
+
+const log = logger.child({ module: 'alertEngine' })
+
+// 🔹 유통기한/재고 부족 알림 엔진
+// - 결제/입고/재고 수정 시 해당 상품만 증분 갱신 (queueAlertRefresh)
+// - 주기 스윕: expiryDate 인덱스로 임박 상품 + 기존 알림 상품만 재평가 (날짜 경과 반영)
+// - 기동 시 전체 재계산 1회
+// 판정 기준은 대시보드/인벤토리 페이지와 동일하다.
+// 상품 id 기준으로 동작하므로 매장 구분 없이 처리하고, 알림에는 상품의 storeId 를 그대로 기록한다.
+
+const EXPIRY_DAYS = Number(process.env.ALERT_EXPIRY_DAYS) || 3
+const DEFAULT_MIN_STOCK = 5 // 프런트 인벤토리 페이지 기본 minStock과 맞춤
+const SWEEP_INTERVAL = Number(process.env.ALERT_SWEEP_MS) || 10 * 60_000
+const FLUSH_DELAY = 200 // 연속 결제를 묶어서 처리
+const BATCH = 500
+
+const PRODUCT_FIELDS = 'name category stock minStock expiryDate storeId'
+
+const runs = counter('inventory_alert_refresh_total', 'Alert engine refresh runs by trigger')
+const changes = counter('inventory_alert_changes_total', 'Alert documents inserted/updated/removed')
+
+interface ProductSnapshot {
+  _id: mongoose.Types.ObjectId
+  name?: string
+  category?: string
+  stock?: number
+  minStock?: number
+  expiryDate?: Date
+  storeId?: string
+}
+
+// 상품 하나에 대해 있어야 할 알림 목록
+export const evaluateProduct = (p: ProductSnapshot, now = new Date()) => {
+  const todayStart = new Date(now)
+  todayStart.setHours(0, 0, 0, 0)
+  const horizon = new Date(now)
+  horizon.setDate(now.getDate() + EXPIRY_DAYS)
+
+  const expiry = p.expiryDate ? new Date(p.expiryDate) : null
+  const hasExpiry = !!expiry && !isNaN(expiry.getTime())
+  const expired = hasExpiry && expiry! < todayStart
+
+  const stock = typeof p.stock === 'number' ? p.stock : 0
+  // 유통기한 지난 상품은 판매 가능 수량 0 으로 취급
+  const qty = expired ? 0 : stock
+  const rawMin = typeof p.minStock === 'number' ? p.minStock : DEFAULT_MIN_STOCK
+  const minStock = rawMin > 0 ? rawMin : DEFAULT_MIN_STOCK
+
+  const alerts: { kind: AlertKind; stock: number }[] = []
+  if (expired) alerts.push({ kind: 'expired', stock }) // 폐기 대상 수량 그대로 보관
+  else if (hasExpiry && expiry! <= horizon) alerts.push({ kind: 'expiring', stock })
+  if (qty < minStock) alerts.push({ kind: 'low_stock', stock: qty })
+
+  return alerts.map((a) => ({
+    ...a,
+    name: p.name ?? '이름 없음',
+    category: p.category,
+    minStock,
+    expiryDate: hasExpiry ? expiry! : undefined,
+  }))
+}
+
+// 주어진 상품들의 알림을 현재 상태에 맞게 upsert/삭제
+const applyAlerts = async (ids: mongoose.Types.ObjectId[], trigger: string) => {
+  runs.inc({ trigger })
+  let changed = 0
+  const now = new Date()
+
+  for (let i = 0; i < ids.length; i += BATCH) {
+    const chunk = ids.slice(i, i + BATCH)
+    const products = await Product.find({ _id: { $in: chunk } })
+      .select(PRODUCT_FIELDS)
+      .lean<ProductSnapshot[]>()
+    const found = new Set(products.map((p) => p._id.toString()))
+
+    const ops: any[] = []
+    for (const p of products) {
+      const alerts = evaluateProduct(p, now)
+      for (const { kind, ...fields } of alerts) {
+        ops.push({
+          updateOne: {
+            filter: { storeId: p.storeId ?? DEFAULT_STORE_ID, productId: p._id, kind },
+            // 값이 같으면 modified 0 → 불필요한 캐시 무효화 방지
+            update: { $set: fields, $setOnInsert: { createdAt: now, updatedAt: now } },
+            upsert: true,
+          },
+        })
+      }
+      ops.push({
+        deleteMany: {
+          filter: { productId: p._id, kind: { $nin: alerts.map((a) => a.kind) } },
+        },
+      })
+    }
+    // 삭제된 상품의 알림 정리
+    const missing = chunk.filter((id) => !found.has(id.toString()))
+    if (missing.length > 0) {
+      ops.push({ deleteMany: { filter: { productId: { $in: missing } } } })
+    }
+
+    if (ops.length === 0) continue
+    const result = await InventoryAlert.bulkWrite(ops, { ordered: false, timestamps: false })
+    changed += result.upsertedCount + result.modifiedCount + result.deletedCount
+  }
+
+  if (changed > 0) {
+    changes.inc({ trigger }, changed)
+    invalidateTags(['alerts'])
+  }
+  return changed
+}
+
+// 🔹 증분 갱신: 요청 처리 경로에서는 id 만 모아 두고 응답 후 묶어서 처리
+const pending = new Set<string>()
+let flushTimer: NodeJS.Timeout | null = null
+
+const flush = async () => {
+  flushTimer = null
+  const ids = [...pending].map((id) => new mongoose.Types.ObjectId(id))
+  pending.clear()
+  try {
+    await applyAlerts(ids, 'write')
+  } catch (err) {
+    log.error('재고 알림 갱신 실패', { err })
+  }
+}
+
+export const queueAlertRefresh = (ids: Iterable<unknown>) => {
+  for (const id of ids) {
+    if (id && mongoose.Types.ObjectId.isValid(String(id))) pending.add(String(id))
+  }
+  if (pending.size > 0 && !flushTimer) {
+    // 요청 컨텍스트를 물려받으면 여러 매장의 상품이 한 매장 범위로 조회되므로 밖에서 실행
+    flushTimer = outsideRequest(() => setTimeout(flush, FLUSH_DELAY))
+  }
+}
+
+// 🔹 스윕: 날짜가 바뀌면서 임박/만료로 넘어간 상품 + 기존 알림 대상만 재평가
+export const sweepAlerts = async () => {
+  const horizon = new Date()
+  horizon.setDate(horizon.getDate() + EXPIRY_DAYS)
+
+  const [nearExpiry, alerted] = await Promise.all([
+    Product.find({ expiryDate: { $lte: horizon } }).select('_id').lean(),
+    InventoryAlert.distinct('productId'),
+  ])
+  const ids = new Map<string, mongoose.Types.ObjectId>()
+  for (const p of nearExpiry) ids.set(p._id.toString(), p._id)
+  for (const id of alerted) ids.set(id.toString(), id)
+
+  return applyAlerts([...ids.values()], 'sweep')
+}
+
+// 전체 재계산 (기동 시, 상품 일괄 초기화 후)
+export const rebuildAlerts = async () => {
+  let changed = 0
+  let batch: mongoose.Types.ObjectId[] = []
+  for await (const p of Product.find({}).select('_id').lean().cursor()) {
+    batch.push(p._id as mongoose.Types.ObjectId)
+    if (batch.length >= BATCH * 4) {
+      changed += await applyAlerts(batch, 'rebuild')
+      batch = []
+    }
+  }
+  changed += await applyAlerts(batch, 'rebuild')
+  // 상품 전체가 삭제된 경우 등 남은 알림 정리
+  return changed + (await sweepAlerts())
+}
+
+export const startAlertEngine = () => {
+  const run = (job: () => Promise<number>, label: string) =>
+    job().catch((err) => log.error(`재고 알림 ${label} 실패`, { err }))
+
+  run(rebuildAlerts, '초기화')
+
+  const interval = setInterval(() => run(sweepAlerts, '스윕'), SWEEP_INTERVAL)
+  interval.unref()
+
+  // 자정 직후 한 번 더 (임박 → 만료 전환을 바로 반영)
+  let midnight: NodeJS.Timeout
+  const scheduleMidnight = () => {
+    const next = new Date()
+    next.setHours(24, 0, 5, 0)
+    midnight = setTimeout(() => {
+      run(sweepAlerts, '스윕')
+      scheduleMidnight()
+    }, next.getTime() - Date.now())
+    midnight.unref()
+  }
+  scheduleMidnight()
+
+  return () => {
+    clearInterval(interval)
+    clearTimeout(midnight)
+    if (flushTimer) clearTimeout(flushTimer)
+  }
+}
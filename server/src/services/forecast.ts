@@ -0,0 +1,91 @@
+// 수요 예측 커널 (DB 접근 없음 — 벤치/테스트에서 그대로 사용)
+//
+// 입력: 상품 × 일자 판매량 행렬 (row-major Float64Array, 상품 i 의 t 번째 날 = sales[i * days + t])
+// 방식: 요일별 지수가중 이동평균(최근 주일수록 가중치 큼) × 최근 2주 추세 보정
+// 모든 상품을 한 번에 typed array 루프로 계산해 객체 할당 없이 O(상품 × 일수)
+
+export interface ForecastParams {
+  days: number // 히스토리 일수 (행렬 열 수)
+  startDow: number // 0번째 날의 요일 (0=일)
+  horizon: number // 예측 구간 일수 (리드타임 + 발주 주기)
+  leadTime: number // 안전재고 계산용 리드타임 일수
+  weekDecay?: number // 주 단위 감쇠율 (0~1, 작을수록 최근 위주)
+}
+
+export interface ForecastResult {
+  daily: Float64Array // 예측 구간 하루 평균 판매량
+  horizonDemand: Float64Array // 예측 구간 총 판매량
+  leadTimeDemand: Float64Array // 리드타임 동안 판매량
+  sigma: Float64Array // 일 판매량 잔차 표준편차
+}
+
+const TREND_DAYS = 14
+
+export const forecastDemand = (
+  sales: Float64Array,
+  skuCount: number,
+  { days, startDow, horizon, leadTime, weekDecay = 0.85 }: ForecastParams
+): ForecastResult => {
+  const daily = new Float64Array(skuCount)
+  const horizonDemand = new Float64Array(skuCount)
+  const leadTimeDemand = new Float64Array(skuCount)
+  const sigma = new Float64Array(skuCount)
+
+  // 날짜별 가중치/요일은 상품과 무관하므로 한 번만 계산
+  const weight = new Float64Array(days)
+  const dowOf = new Uint8Array(days)
+  for (let t = 0; t < days; t++) {
+    const weeksAgo = Math.floor((days - 1 - t) / 7)
+    weight[t] = Math.pow(weekDecay, weeksAgo)
+    dowOf[t] = (startDow + t) % 7
+  }
+  const dowWeight = new Float64Array(7)
+  for (let t = 0; t < days; t++) dowWeight[dowOf[t]] += weight[t]
+
+  const futureDow = new Uint8Array(horizon)
+  for (let h = 0; h < horizon; h++) futureDow[h] = (startDow + days + h) % 7
+
+  const trendFrom = Math.max(0, days - TREND_DAYS)
+  const dowAvg = new Float64Array(7)
+
+  for (let s = 0; s < skuCount; s++) {
+    const base = s * days
+    dowAvg.fill(0)
+
+    for (let t = 0; t < days; t++) {
+      dowAvg[dowOf[t]] += sales[base + t] * weight[t]
+    }
+    for (let d = 0; d < 7; d++) {
+      dowAvg[d] = dowWeight[d] > 0 ? dowAvg[d] / dowWeight[d] : 0
+    }
+
+    // 최근 2주 실적 / 요일 패턴 기대치 → 급증/급감 보정 (0.5~2배)
+    let actual = 0
+    let expected = 0
+    let sq = 0
+    for (let t = 0; t < days; t++) {
+      const e = dowAvg[dowOf[t]]
+      const r = sales[base + t] - e
+      sq += r * r
+      if (t >= trendFrom) {
+        actual += sales[base + t]
+        expected += e
+      }
+    }
+    const trend = Math.min(2, Math.max(0.5, (actual + 1) / (expected + 1)))
+    sigma[s] = days > 1 ? Math.sqrt(sq / (days - 1)) : 0
+
+    let total = 0
+    let lead = 0
+    for (let h = 0; h < horizon; h++) {
+      const v = dowAvg[futureDow[h]] * trend
+      total += v
+      if (h < leadTime) lead += v
+    }
+    horizonDemand[s] = total
+    leadTimeDemand[s] = lead
+    daily[s] = horizon > 0 ? total / horizon : 0
+  }
+
+  return { daily, horizonDemand, leadTimeDemand, sigma }
+}
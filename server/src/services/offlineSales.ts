@@ -0,0 +1,339 @@
+import mongoose from 'mongoose'
+import Product from '../models/Product'
+import Order, { ORDER_RETENTION_DAYS } from '../models/Order'
+import CheckoutReceipt, { RECEIPT_RETENTION_DAYS } from '../models/CheckoutReceipt'
+import { queueAlertRefresh } from './alertEngine'
+import { recordSales } from './reorderEngine'
+import { recordOrders } from './salesRollup'
+import { nextOrderNumber } from '../utils/orderNumber'
+import { currentStoreId, DEFAULT_STORE_ID } from '../utils/tenant'
+import { logger } from '../utils/logger'
+
+// 🔹 키오스크 오프라인 판매 일괄 동기화
+// 키오스크는 결제를 로컬 큐에 먼저 기록하고 손님 응대를 끝낸 뒤, 큐를 모아 한 번에 보낸다.
+// 판매마다 키오스크가 만든 멱등성 키가 있어 재전송돼도 주문은 한 번만 생긴다.
+// 이미 끝난 판매이므로 재고가 부족해도 거절하지 않고 0 에서 멈춘다.
+//
+// 처리 순서 (판매 건수와 관계없이 DB 왕복 수 고정)
+// 1) 수신 기록 upsert (pending): 새 키만 이번 요청이 처리, 나머지는 기존 주문번호로 응답
+// 2) 상품 일괄 조회 → 주문 insertMany → 수신 기록 committed
+// 3) 재고 차감 bulkWrite, 매출/판매 롤업 (실패해도 주문은 유지, 로그만)
+// 주문(time-series)은 트랜잭션에 넣을 수 없어, 1 과 2 사이에 멈추면 pending 이 남는다.
+// 재전송 때 pending 이 RECEIPT_PENDING_TIMEOUT 보다 오래됐으면 주문이 저장됐는지 보고
+// 저장됐으면 committed 로 확정(duplicate), 아니면 기록을 지워 다음 재전송 때 새로 처리(retry)
+
+const log = logger.child({ module: 'offlineSales' })
+
+export const MAX_SYNC_BATCH = 100
+
+// 이보다 오래된 pending 수신 기록은 처리하던 요청이 멈춘 것으로 본다
+const RECEIPT_PENDING_TIMEOUT = 2 * 60_000
+
+const KEY_PATTERN = /^[\w-]{8,64}$/
+
+export interface OfflineSaleItem {
+  productId?: string
+  barcode?: string
+  name?: string
+  price?: number
+  quantity: number
+}
+
+export interface OfflineSale {
+  idempotencyKey: string
+  items: OfflineSaleItem[]
+  totalAmount: number
+  paymentMethod?: 'card' | 'cash'
+  soldAt?: string // 키오스크에서 결제한 시각 (ISO)
+}
+
+export type SyncResult =
+  | { idempotencyKey: string; status: 'created' | 'duplicate'; orderNumber: string }
+  | { idempotencyKey: string; status: 'rejected' | 'retry'; message: string }
+
+interface AcceptedSale {
+  sale: OfflineSale
+  soldAt: Date
+  orderNumber: string
+}
+
+// 항목: 수량(양의 유한수) + 상품을 찾을 단서(productId 또는 barcode)
+const isValidItem = (item: any) =>
+  typeof item === 'object' &&
+  item !== null &&
+  Number.isFinite(Number(item.quantity)) &&
+  Number(item.quantity) > 0 &&
+  ((typeof item.productId === 'string' && item.productId !== '') ||
+    (typeof item.barcode === 'string' && item.barcode !== ''))
+
+// 형식이 잘못된 판매는 다시 보내도 결과가 같으므로 rejected 로 돌려준다 (키오스크는 큐에서 제거)
+// retry 는 큐에 남겨 다음 동기화 때 다시 보낸다
+const validate = (raw: any): string | null => {
+  if (!raw || typeof raw.idempotencyKey !== 'string' || !KEY_PATTERN.test(raw.idempotencyKey)) {
+    return '멱등성 키가 올바르지 않습니다.'
+  }
+  if (!Array.isArray(raw.items) || raw.items.length === 0) {
+    return '구매할 상품이 없습니다.'
+  }
+  // 항목 하나라도 잘못되면 판매 전체를 거절 (수신 기록을 남기기 전에 걸러야 배치의 다른 판매가 막히지 않는다)
+  if (!raw.items.every(isValidItem)) {
+    return '상품 항목이 올바르지 않습니다.'
+  }
+  if (!Number.isFinite(Number(raw.totalAmount)) || Number(raw.totalAmount) < 0) {
+    return '결제 금액이 올바르지 않습니다.'
+  }
+  return null
+}
+
+// 받아들이는 판매 시각 범위: 수신 기록이 남아 있는 기간 안이어야 재전송을 중복으로 알아본다
+// (수신 기록은 판매 시각 이후에 만들어지므로 판매 시각 + 보관 기간까지는 반드시 남아 있다)
+const ACCEPT_WINDOW_MS = Math.min(RECEIPT_RETENTION_DAYS, ORDER_RETENTION_DAYS) * 86_400_000
+
+// 키오스크 시계를 그대로 믿지 않는다: 미래 시각은 지금으로, 수신 기록 보관 기간 밖은 거절
+const saleTime = (soldAt: unknown, now: number) => {
+  const at = typeof soldAt === 'string' ? Date.parse(soldAt) : NaN
+  if (Number.isNaN(at) || at > now) return new Date(now)
+  return at < now - ACCEPT_WINDOW_MS ? null : new Date(at)
+}
+
+// 중복 키 경합(같은 판매를 두 워커가 동시에 받은 경우)은 upsert 실패로 나타난다
+const isDuplicateOnly = (err: any) =>
+  Array.isArray(err?.writeErrors) && err.writeErrors.every((e: any) => e.code === 11000)
+
+const claimReceipts = async (sales: AcceptedSale[], storeId: string) => {
+  const result = await CheckoutReceipt.bulkWrite(
+    sales.map(({ sale, soldAt, orderNumber }) => ({
+      updateOne: {
+        filter: { storeId, key: sale.idempotencyKey },
+        update: {
+          $setOnInsert: { orderNumber, soldAt, status: 'pending', createdAt: new Date() },
+        },
+        upsert: true,
+      },
+    })),
+    { ordered: false }
+  ).catch((err) => {
+    if (isDuplicateOnly(err) && err.result) return err.result
+    throw err
+  })
+  const upserted = result.upsertedIds as Record<number, unknown>
+  return sales.filter((_, i) => upserted[i] !== undefined)
+}
+
+const orderItems = (sale: OfflineSale, byId: Map<string, any>, byBarcode: Map<string, any>) =>
+  sale.items
+    .filter((item) => Number(item.quantity) > 0)
+    .map((item) => {
+      const product =
+        (item.productId && byId.get(String(item.productId))) ||
+        (item.barcode && byBarcode.get(item.barcode)) ||
+        null
+      return {
+        product,
+        line: {
+          productId: product?._id ?? null,
+          productName: product?.name ?? item.name ?? '상품',
+          price: Number(item.price ?? product?.price) || 0,
+          quantity: Number(item.quantity),
+        },
+      }
+    })
+
+export const syncOfflineSales = async (rawSales: unknown[]): Promise<SyncResult[]> => {
+  const storeId = currentStoreId() ?? DEFAULT_STORE_ID
+  const now = Date.now()
+  const results = new Map<string, SyncResult>()
+  const accepted = new Map<string, AcceptedSale>() // 같은 배치 안의 중복 키는 한 번만
+
+  for (const raw of rawSales as any[]) {
+    const message = validate(raw)
+    const key = String(raw?.idempotencyKey ?? '')
+    if (message) {
+      results.set(key, { idempotencyKey: key, status: 'rejected', message })
+      continue
+    }
+    const soldAt = saleTime(raw.soldAt, now)
+    if (!soldAt) {
+      results.set(key, {
+        idempotencyKey: key,
+        status: 'rejected',
+        message: '보관 기간이 지난 판매입니다.',
+      })
+      continue
+    }
+    if (!accepted.has(key)) {
+      accepted.set(key, { sale: raw, soldAt, orderNumber: nextOrderNumber() })
+    }
+  }
+
+  const sales = [...accepted.values()]
+  const fresh = sales.length > 0 ? await claimReceipts(sales, storeId) : []
+  const freshKeys = new Set(fresh.map(({ sale }) => sale.idempotencyKey))
+
+  // 이미 받은 판매: 처음 발급한 주문번호로 응답
+  const duplicates = sales.filter(({ sale }) => !freshKeys.has(sale.idempotencyKey))
+  if (duplicates.length > 0) {
+    const receipts = await CheckoutReceipt.find({
+      key: { $in: duplicates.map(({ sale }) => sale.idempotencyKey) },
+    })
+      .select('key orderNumber status soldAt createdAt')
+      .lean()
+    const stale: typeof receipts = []
+    for (const receipt of receipts) {
+      if (receipt.status !== 'pending') {
+        results.set(receipt.key, {
+          idempotencyKey: receipt.key,
+          status: 'duplicate',
+          orderNumber: receipt.orderNumber,
+        })
+      } else if (receipt.createdAt.getTime() < now - RECEIPT_PENDING_TIMEOUT) {
+        stale.push(receipt)
+      }
+      // 다른 요청이 처리 중인 pending → 결과 없음 (retry)
+    }
+    for (const { key, orderNumber } of await resolveStaleReceipts(stale, storeId, now)) {
+      results.set(key, { idempotencyKey: key, status: 'duplicate', orderNumber })
+    }
+  }
+
+  if (fresh.length > 0) {
+    await recordFreshSales(fresh, storeId)
+    for (const { sale, orderNumber } of fresh) {
+      results.set(sale.idempotencyKey, {
+        idempotencyKey: sale.idempotencyKey,
+        status: 'created',
+        orderNumber,
+      })
+    }
+  }
+
+  // 다른 요청이 같은 키를 처리 중이거나 멈춘 기록을 지운 경우: 키오스크가 다음 동기화에 다시 보낸다
+  return (rawSales as any[]).map((raw) => {
+    const key = String(raw?.idempotencyKey ?? '')
+    return (
+      results.get(key) ?? { idempotencyKey: key, status: 'retry', message: '다시 전송해주세요.' }
+    )
+  })
+}
+
+// 처리 도중 멈춘 수신 기록 정리
+// 주문이 저장됐으면 committed 로 확정해 주문번호 반환, 아니면 기록을 지워 다음 재전송 때 새로 처리
+const resolveStaleReceipts = async (
+  stale: { key: string; orderNumber: string; soldAt?: Date }[],
+  storeId: string,
+  now: number
+) => {
+  if (stale.length === 0) return []
+  const saved = await Order.find({
+    $or: stale.map(({ orderNumber, soldAt }) => ({
+      orderNumber,
+      ...(soldAt ? { createdAt: soldAt } : {}),
+    })),
+  })
+    .select('orderNumber')
+    .lean()
+  const savedNumbers = new Set(saved.map((order) => order.orderNumber))
+  const committed = stale.filter(({ orderNumber }) => savedNumbers.has(orderNumber))
+  const abandoned = stale.filter(({ orderNumber }) => !savedNumbers.has(orderNumber))
+
+  await Promise.all([
+    committed.length > 0 &&
+      CheckoutReceipt.updateMany(
+        { storeId, key: { $in: committed.map(({ key }) => key) } },
+        { $set: { status: 'committed' } }
+      ),
+    abandoned.length > 0 &&
+      CheckoutReceipt.deleteMany({
+        storeId,
+        key: { $in: abandoned.map(({ key }) => key) },
+        status: 'pending',
+        createdAt: { $lt: new Date(now - RECEIPT_PENDING_TIMEOUT) },
+      }),
+  ])
+  if (abandoned.length > 0) log.warn('멈춘 오프라인 판매 수신 기록 정리', { count: abandoned.length })
+  return committed
+}
+
+const recordFreshSales = async (fresh: AcceptedSale[], storeId: string) => {
+  const items = fresh.flatMap(({ sale }) => sale.items)
+  const ids = items
+    .map((item) => item.productId)
+    .filter((id) => id && mongoose.Types.ObjectId.isValid(id))
+  const barcodes = items.map((item) => item.barcode).filter(Boolean)
+  const found = await Product.find({
+    $or: [{ _id: { $in: ids } }, { barcode: { $in: barcodes } }],
+  })
+    .select('name price barcode storeId')
+    .lean()
+  const byId = new Map(found.map((p) => [p._id.toString(), p]))
+  const byBarcode = new Map(found.map((p) => [p.barcode, p]))
+
+  const resolved = fresh.map((accepted) => ({
+    ...accepted,
+    lines: orderItems(accepted.sale, byId, byBarcode),
+  }))
+
+  // 실패하면 수신 기록은 pending 으로 남고, 재전송 때 주문 존재 여부로 정리된다 (일부만 저장된 경우 포함)
+  const orders = await Order.insertMany(
+    resolved.map(({ sale, soldAt, orderNumber, lines }) => ({
+      orderNumber,
+      items: lines.map(({ line }) => line),
+      totalAmount: Number(sale.totalAmount),
+      paymentMethod: sale.paymentMethod === 'cash' ? 'cash' : 'card',
+      storeId,
+      createdAt: soldAt,
+    }))
+  )
+  await CheckoutReceipt.updateMany(
+    { storeId, key: { $in: fresh.map(({ sale }) => sale.idempotencyKey) } },
+    { $set: { status: 'committed' } }
+  )
+
+  // 상품별 판매 수량 합계 (판매일이 다르면 롤업은 날짜별로)
+  const sold = new Map<string, { product: any; qty: number }>()
+  const salesLines: Parameters<typeof recordSales>[0] = []
+  for (const { soldAt, lines } of resolved) {
+    for (const { product, line } of lines) {
+      if (!product) continue
+      const key = product._id.toString()
+      const entry = sold.get(key) ?? { product, qty: 0 }
+      entry.qty += line.quantity
+      sold.set(key, entry)
+      salesLines.push({
+        storeId: product.storeId,
+        productId: product._id,
+        qty: line.quantity,
+        revenue: (product.price ?? 0) * line.quantity,
+        at: soldAt,
+      })
+    }
+  }
+
+  if (sold.size > 0) {
+    try {
+      await decrementStock([...sold.values()])
+      queueAlertRefresh(sold.keys())
+    } catch (err) {
+      log.error('오프라인 판매 재고 차감 실패', { err, orders: orders.length })
+    }
+  }
+  await Promise.all([
+    recordSales(salesLines).catch((err) => log.error('판매 롤업 기록 실패', { err })),
+    recordOrders(orders).catch((err) => log.error('매출 집계 기록 실패', { err })),
+  ])
+
+  log.info('오프라인 판매 동기화', { orders: orders.length, products: sold.size })
+}
+
+// 결제 라우트와 같은 방식: 상품별 max(0, stock - qty) 를 bulkWrite 한 번으로 (드라이버 컬렉션, _id 조건)
+const decrementStock = async (sold: { product: any; qty: number }[]) => {
+  await Product.collection.bulkWrite(
+    sold.map(({ product, qty }) => ({
+      updateOne: {
+        filter: { _id: product._id },
+        update: [{ $set: { stock: { $max: [0, { $subtract: ['$stock', qty] }] } } }],
+      },
+    })),
+    { ordered: false }
+  )
+}
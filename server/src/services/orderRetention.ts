@@ -0,0 +1,166 @@
+import fs from 'fs'
+import path from 'path'
+import { Readable } from 'stream'
+import { pipeline } from 'stream/promises'
+import { createGzip } from 'zlib'
+import mongoose from 'mongoose'
+import dayjs from 'dayjs'
+import utc from 'dayjs/plugin/utc'
+import timezone from 'dayjs/plugin/timezone'
+import Order, { ORDER_RETENTION_DAYS } from '../models/Order'
+import OrderArchive from '../models/OrderArchive'
+import { histogram } from '../utils/metrics'
+import { rebuildHourlySales, STORE_TZ } from './salesRollup'
+import { logger } from '../utils/logger'
+
+const log = logger.child({ module: 'orderRetention' })
+
+dayjs.extend(utc)
+dayjs.extend(timezone)
+
+// 🔹 주문 보관 정책
+// - 원본 주문: time-series TTL(ORDER_RETENTION_DAYS)로 버킷 단위 자동 삭제
+// - 삭제 전: 끝난 달을 월별 NDJSON(gzip) 파일로 내보내고 OrderArchive 에 기록
+// - 매일: 최근 이틀 시간당 집계를 원본에서 재계산 (결제 중 증분 누락 보정)
+
+const ARCHIVE_DIR = process.env.ORDER_ARCHIVE_DIR || path.join(process.cwd(), 'archive', 'orders')
+const ARCHIVE_LEAD_DAYS = 31 // TTL 삭제보다 한 달 먼저 보관
+const RECONCILE_HOURS = 48
+const RUN_HOUR = Number(process.env.ORDER_MAINTENANCE_HOUR ?? 3)
+
+const jobDuration = histogram(
+  'order_maintenance_duration_seconds',
+  'Order retention job duration by phase',
+  [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+)
+
+const ordersCollection = () => Order.collection
+
+// 스키마의 보관 기간이 바뀌었으면 기존 time-series 컬렉션에도 반영
+const syncRetention = async () => {
+  const db = Order.db.db!
+  const [info] = await db
+    .listCollections({ name: ordersCollection().collectionName })
+    .toArray()
+  if (!info) return
+  if (info.type !== 'timeseries') {
+    log.warn('orders 가 time-series 컬렉션이 아닙니다 — npm run migrate:orders-timeseries')
+    return
+  }
+  const expireAfterSeconds = ORDER_RETENTION_DAYS * 86_400
+  if ((info as any).options?.expireAfterSeconds !== expireAfterSeconds) {
+    await db.command({ collMod: info.name, expireAfterSeconds })
+  }
+}
+
+// 한 달치 원본 주문을 파일로 내보낸다 (임시 파일 → rename 으로 중간 상태 노출 없음)
+// Extended JSON 이라 mongoimport 로 그대로 복원 가능
+export const archiveMonth = async (month: string) => {
+  const from = dayjs.tz(`${month}-01`, STORE_TZ)
+  const to = from.add(1, 'month')
+  const file = path.join(ARCHIVE_DIR, `orders-${month}.ndjson.gz`)
+  const tmp = `${file}.${process.pid}.tmp`
+  await fs.promises.mkdir(ARCHIVE_DIR, { recursive: true })
+
+  let orders = 0
+  let revenue = 0
+  const cursor = ordersCollection()
+    .find({ createdAt: { $gte: from.toDate(), $lt: to.toDate() } })
+    .sort({ createdAt: 1 })
+    .batchSize(5000)
+
+  await pipeline(
+    Readable.from(
+      (async function* () {
+        for await (const doc of cursor) {
+          orders++
+          revenue += doc.totalAmount ?? 0
+          yield mongoose.mongo.BSON.EJSON.stringify(doc, { relaxed: true }) + '\n'
+        }
+      })()
+    ),
+    createGzip(),
+    fs.createWriteStream(tmp)
+  )
+  await fs.promises.rename(tmp, file)
+  const { size } = await fs.promises.stat(file)
+
+  await OrderArchive.updateOne(
+    { month },
+    { $set: { file, orders, revenue, bytes: size, archivedAt: new Date() } },
+    { upsert: true }
+  )
+  return { month, orders, bytes: size }
+}
+
+// TTL 삭제 시점이 다가오는데 아직 보관하지 않은 달
+const pendingMonths = async () => {
+  const oldest = await ordersCollection()
+    .find({}, { projection: { createdAt: 1 } })
+    .sort({ createdAt: 1 })
+    .limit(1)
+    .next()
+  if (!oldest?.createdAt) return []
+
+  const cutoff = dayjs()
+    .tz(STORE_TZ)
+    .subtract(ORDER_RETENTION_DAYS - ARCHIVE_LEAD_DAYS, 'day')
+  const archived = new Set(await OrderArchive.distinct('month'))
+  const months: string[] = []
+  // 달이 완전히 끝난 경우만 보관 (끝난 뒤에는 새 주문이 들어오지 않음)
+  for (
+    let m = dayjs(oldest.createdAt).tz(STORE_TZ).startOf('month');
+    !m.add(1, 'month').isAfter(cutoff);
+    m = m.add(1, 'month')
+  ) {
+    const key = m.format('YYYY-MM')
+    if (!archived.has(key)) months.push(key)
+  }
+  return months
+}
+
+export const runOrderMaintenance = async () => {
+  const started = performance.now()
+  await syncRetention()
+
+  await rebuildHourlySales(new Date(Date.now() - RECONCILE_HOURS * 3_600_000))
+  const reconciledAt = performance.now()
+  jobDuration.observe({ phase: 'reconcile' }, (reconciledAt - started) / 1000)
+
+  const archived = []
+  for (const month of await pendingMonths()) {
+    archived.push(await archiveMonth(month))
+  }
+  jobDuration.observe({ phase: 'archive' }, (performance.now() - reconciledAt) / 1000)
+  return archived
+}
+
+export const startOrderMaintenance = () => {
+  const run = async () => {
+    try {
+      const archived = await runOrderMaintenance()
+      for (const a of archived) {
+        log.info('주문 월별 보관', { month: a.month, orders: a.orders, bytes: a.bytes })
+      }
+    } catch (err) {
+      log.error('주문 보관 작업 실패', { err })
+    }
+  }
+
+  run()
+
+  let timer: NodeJS.Timeout
+  const scheduleNext = () => {
+    const now = dayjs().tz(STORE_TZ)
+    let next = now.hour(RUN_HOUR).minute(0).second(0).millisecond(0)
+    if (!next.isAfter(now)) next = next.add(1, 'day')
+    timer = setTimeout(async () => {
+      await run()
+      scheduleNext()
+    }, next.valueOf() - now.valueOf())
+    timer.unref()
+  }
+  scheduleNext()
+
+  return () => clearTimeout(timer)
+}
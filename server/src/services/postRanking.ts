@@ -0,0 +1,120 @@
+import Post from '../models/Post'
+import Comment from '../models/Comment'
+import { logger } from '../utils/logger'
+
+// 🔹 커뮤니티 인기글 점수 (hotScore)
+// hotScore = log10(max(1, 반응)) + 작성 시각 / DECAY
+//   반응 = 좋아요 × 2 + 댓글 × 3 + 조회수 × 0.1
+// 반응이 10배면 DECAY 만큼 늦게 쓴 글과 같은 점수: 새 글이 오래된 인기글을 자연스럽게 밀어낸다.
+// 시간 항이 작성 시각에만 의존하므로 점수를 주기적으로 낮출 필요 없이 반응이 생길 때만 갱신하면 되고,
+// { storeId, hotScore, _id } 인덱스로 최신순과 같은 비용으로 페이지를 넘길 수 있다.
+//
+// 갱신 경로
+// - 조회/댓글: 카운터 증가와 같은 파이프라인 업데이트에서 함께 계산 (추가 왕복 없음)
+// - 좋아요: 저장 전에 문서 값으로 계산 (hotScoreOf)
+// - 배치(rebuildHotScores): 댓글 수를 Comment 에서 다시 세고 전체 재계산 (기동 시 + 주기)
+
+const log = logger.child({ module: 'postRanking' })
+
+const DECAY_MS = (Number(process.env.POST_HOT_DECAY_HOURS) || 12) * 3_600_000
+const REBUILD_INTERVAL = (Number(process.env.POST_HOT_REBUILD_HOURS) || 24) * 3_600_000
+
+const WEIGHTS = { likes: 2, comments: 3, views: 0.1 }
+
+// 서버 측 계산식 (파이프라인 업데이트/집계용)
+export const HOT_SCORE_EXPR = {
+  $add: [
+    {
+      $log10: {
+        $max: [
+          1,
+          {
+            $add: [
+              { $multiply: [{ $size: { $ifNull: ['$likes', []] } }, WEIGHTS.likes] },
+              { $multiply: [{ $ifNull: ['$commentCount', 0] }, WEIGHTS.comments] },
+              { $multiply: [{ $ifNull: ['$views', 0] }, WEIGHTS.views] },
+            ],
+          },
+        ],
+      },
+    },
+    { $divide: [{ $toLong: '$createdAt' }, DECAY_MS] },
+  ],
+}
+
+// 같은 식의 JS 버전 (저장 전 문서에 바로 반영)
+export const hotScoreOf = (post: {
+  likes?: unknown[]
+  commentCount?: number
+  views?: number
+  createdAt?: Date
+}) => {
+  const engagement =
+    (post.likes?.length ?? 0) * WEIGHTS.likes +
+    (post.commentCount ?? 0) * WEIGHTS.comments +
+    (post.views ?? 0) * WEIGHTS.views
+  const createdAt = post.createdAt ? new Date(post.createdAt).getTime() : Date.now()
+  return Math.log10(Math.max(1, engagement)) + createdAt / DECAY_MS
+}
+
+// 카운터 증가 + 점수 재계산을 한 번의 업데이트로
+const bump = (field: 'views' | 'commentCount', delta: number) => [
+  { $set: { [field]: { $max: [0, { $add: [{ $ifNull: [`$${field}`, 0] }, delta] }] } } },
+  { $set: { hotScore: HOT_SCORE_EXPR } },
+]
+
+// 게시글 상세 조회: 조회수 +1 후 문서 반환
+export const viewPost = (id: string) =>
+  Post.findByIdAndUpdate(id, bump('views', 1), { new: true, updatePipeline: true })
+
+// 댓글 작성/삭제
+export const adjustCommentCount = (postId: unknown, delta: number) =>
+  Post.updateOne({ _id: postId }, bump('commentCount', delta), { updatePipeline: true })
+
+// 댓글 수를 Comment 에서 다시 세고 점수 전체 재계산 (서버 측 $merge, 앱으로 데이터 전송 없음)
+export const rebuildHotScores = async () => {
+  await Post.aggregate([
+    {
+      $lookup: {
+        from: Comment.collection.collectionName,
+        let: { storeId: '$storeId', postId: '$_id' },
+        pipeline: [
+          {
+            $match: {
+              $expr: {
+                $and: [{ $eq: ['$storeId', '$$storeId'] }, { $eq: ['$postId', '$$postId'] }],
+              },
+            },
+          },
+          { $count: 'count' },
+        ],
+        as: 'comments',
+      },
+    },
+    { $set: { commentCount: { $ifNull: [{ $first: '$comments.count' }, 0] } } },
+    { $project: { _id: 1, commentCount: 1, hotScore: HOT_SCORE_EXPR } },
+    {
+      $merge: {
+        into: Post.collection.collectionName,
+        on: '_id',
+        whenMatched: [
+          { $set: { commentCount: '$$new.commentCount', hotScore: '$$new.hotScore' } },
+        ],
+        whenNotMatched: 'discard',
+      },
+    },
+  ])
+}
+
+export const startPostRanking = () => {
+  const run = () =>
+    rebuildHotScores().catch((err) => log.error('인기글 점수 재계산 실패', { err }))
+
+  // 기동 시 1회: 점수가 없는 기존 게시글 채우기
+  run()
+
+  const interval = setInterval(run, REBUILD_INTERVAL)
+  interval.unref()
+
+  return () => clearInterval(interval)
+}
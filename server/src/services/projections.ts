@@ -0,0 +1,204 @@
+import dayjs from 'dayjs'
+import isoWeek from 'dayjs/plugin/isoWeek'
+import Post from '../models/Post'
+import Comment from '../models/Comment'
+import Product from '../models/Product'
+import Schedule from '../models/Schedule'
+import CommunityActivityHourly from '../models/CommunityActivityHourly'
+import StaffWeeklyHours from '../models/StaffWeeklyHours'
+import StockSummary from '../models/StockSummary'
+import { Projection, projectionReady, startProjector } from './projector'
+import { DEFAULT_STORE_ID } from '../utils/tenant'
+
+dayjs.extend(isoWeek)
+
+// 🔹 변경 스트림으로 유지하는 파생 데이터 (services/projector)
+// - communityActivity: Post/Comment → 매장 시간당 새 글(카테고리별)/댓글/신고 수 (커뮤니티 통계)
+// - stockSummary: Product → 매장 상품 수 / 재고 합계 (대시보드 재고 현황)
+// - staffWeeklyHours: Schedule → 직원별 주간 근무 시간/횟수
+// 주문(Order)은 time-series 컬렉션이라 변경 스트림을 열 수 없고, 매출은 이미 결제 시 SalesHourly 로 증분 집계된다.
+// 읽는 함수는 프로젝션이 준비되지 않았으면 null 을 돌려주고, 호출하는 쪽이 원본에서 계산한다.
+
+const HOUR_MS = 3_600_000
+// 통계 창(24시간)이 지난 원본은 이후 변경을 반영할 필요가 없다
+const ACTIVITY_WINDOW_MS = 26 * HOUR_MS
+
+const hourOf = (at: unknown) => new Date(Math.floor(new Date(at as any).getTime() / HOUR_MS) * HOUR_MS)
+
+const storeOf = (doc: any) => doc.storeId ?? DEFAULT_STORE_ID
+
+// 근무시간 (scheduleRoutes 와 같은 계산: 종료가 시작보다 이르면 다음 날)
+const shiftHours = (start: string, end: string) => {
+  const [sh, sm] = start.split(':').map(Number)
+  const [eh, em] = end.split(':').map(Number)
+  const s = sh * 60 + sm
+  let e = eh * 60 + em
+  if (e <= s) e += 1440
+  return (e - s) / 60
+}
+
+export const weekOf = (date: string) => dayjs(date).isoWeekday(1).format('YYYY-MM-DD')
+
+const communityActivity: Projection = {
+  name: 'communityActivity',
+  sources: [
+    {
+      model: Post,
+      fields: ['category', 'reports', 'createdAt'],
+      rebuildFilter: () => {
+        const since = new Date(Date.now() - ACTIVITY_WINDOW_MS)
+        return { $or: [{ createdAt: { $gte: since } }, { 'reports.createdAt': { $gte: since } }] }
+      },
+    },
+    {
+      model: Comment,
+      fields: ['createdAt'],
+      rebuildFilter: () => ({ createdAt: { $gte: new Date(Date.now() - ACTIVITY_WINDOW_MS) } }),
+    },
+  ],
+  targets: [CommunityActivityHourly],
+  entries: (collection, doc) => {
+    const storeId = storeOf(doc)
+    const entry = (at: unknown, field: string) => ({
+      target: CommunityActivityHourly.modelName,
+      filter: { storeId, hour: hourOf(at) },
+      inc: { [field]: 1 },
+    })
+    if (collection === Comment.collection.collectionName) {
+      return doc.createdAt ? [entry(doc.createdAt, 'comments')] : []
+    }
+    const entries = []
+    if (doc.createdAt && ['tips', 'suggestions'].includes(doc.category)) {
+      entries.push(entry(doc.createdAt, doc.category))
+    }
+    for (const report of doc.reports ?? []) {
+      if (report?.createdAt) entries.push(entry(report.createdAt, 'reports'))
+    }
+    return entries
+  },
+  expireAt: (_collection, doc) => {
+    const times = [doc.createdAt, ...(doc.reports ?? []).map((r: any) => r?.createdAt)]
+      .filter(Boolean)
+      .map((t) => new Date(t).getTime())
+    return new Date(Math.max(Date.now(), ...times) + ACTIVITY_WINDOW_MS)
+  },
+}
+
+const stockSummary: Projection = {
+  name: 'stockSummary',
+  sources: [{ model: Product, fields: ['stock'] }],
+  targets: [StockSummary],
+  entries: (_collection, doc) => [
+    {
+      target: StockSummary.modelName,
+      filter: { storeId: storeOf(doc) },
+      inc: { products: 1, stock: Number(doc.stock) || 0 },
+    },
+  ],
+}
+
+const staffWeeklyHours: Projection = {
+  name: 'staffWeeklyHours',
+  sources: [{ model: Schedule, fields: ['staff', 'date', 'startTime', 'endTime'] }],
+  targets: [StaffWeeklyHours],
+  entries: (_collection, doc) =>
+    doc.staff && doc.date && doc.startTime && doc.endTime
+      ? [
+          {
+            target: StaffWeeklyHours.modelName,
+            filter: { storeId: storeOf(doc), week: weekOf(doc.date), staff: doc.staff },
+            inc: { hours: shiftHours(doc.startTime, doc.endTime), shifts: 1 },
+          },
+        ]
+      : [],
+}
+
+export const PROJECTIONS = [communityActivity, stockSummary, staffWeeklyHours]
+
+export const startProjections = () => startProjector(PROJECTIONS)
+
+const ACTIVITY_FIELDS = ['tips', 'suggestions', 'comments', 'reports'] as const
+type ActivityTotals = Record<(typeof ACTIVITY_FIELDS)[number], number>
+
+// [from, to) 구간 활동을 원본에서 직접 (1시간 미만 구간만: 게시글 집계 1 + 댓글 count 1)
+const sourceActivity = async (from: Date, to: Date): Promise<ActivityTotals> => {
+  const range = { $gte: from, $lt: to }
+  const inRange = (field: string) => ({ $and: [{ $gte: [field, from] }, { $lt: [field, to] }] })
+  const createdIn = (category: string) => ({
+    $cond: [{ $and: [{ $eq: ['$category', category] }, inRange('$createdAt')] }, 1, 0],
+  })
+  const [[posts], comments] = await Promise.all([
+    Post.aggregate([
+      {
+        $match: {
+          $or: [
+            { category: { $in: ['tips', 'suggestions'] }, createdAt: range },
+            { 'reports.createdAt': range },
+          ],
+        },
+      },
+      {
+        $group: {
+          _id: null,
+          tips: { $sum: createdIn('tips') },
+          suggestions: { $sum: createdIn('suggestions') },
+          reports: {
+            $sum: {
+              $size: {
+                $filter: { input: { $ifNull: ['$reports', []] }, cond: inRange('$$this.createdAt') },
+              },
+            },
+          },
+        },
+      },
+    ]),
+    Comment.countDocuments({ createdAt: range }),
+  ])
+  return {
+    tips: posts?.tips ?? 0,
+    suggestions: posts?.suggestions ?? 0,
+    comments,
+    reports: posts?.reports ?? 0,
+  }
+}
+
+// 최근 활동 합계 (since 부터)
+// 버킷은 시간 단위라 since 가 속한 시간의 버킷에는 since 이전 몇 분이 섞여 있다.
+// 그 부분([시간 시작, since))은 원본에서 세어 빼서 원본 countDocuments 결과와 맞춘다
+export const communityActivitySince = async (since: Date): Promise<ActivityTotals | null> => {
+  if (!(await projectionReady(communityActivity.name))) return null
+  const start = hourOf(since)
+  const [[totals], head] = await Promise.all([
+    CommunityActivityHourly.aggregate([
+      { $match: { hour: { $gte: start } } },
+      {
+        $group: {
+          _id: null,
+          tips: { $sum: '$tips' },
+          suggestions: { $sum: '$suggestions' },
+          comments: { $sum: '$comments' },
+          reports: { $sum: '$reports' },
+        },
+      },
+    ]),
+    since > start ? sourceActivity(start, since) : null,
+  ])
+  // 프로젝션 반영이 원본보다 늦을 수 있어 음수는 0 으로
+  return Object.fromEntries(
+    ACTIVITY_FIELDS.map((field) => [field, Math.max(0, (totals?.[field] ?? 0) - (head?.[field] ?? 0))])
+  ) as ActivityTotals
+}
+
+export const stockTotals = async () => {
+  if (!(await projectionReady(stockSummary.name))) return null
+  const summary = await StockSummary.findOne().select('products stock').lean()
+  return { products: summary?.products ?? 0, stock: summary?.stock ?? 0 }
+}
+
+// 해당 주(월요일 날짜) 직원별 근무 시간
+export const weeklyHours = async (week: string) => {
+  if (!(await projectionReady(staffWeeklyHours.name))) return null
+  return StaffWeeklyHours.find({ week, shifts: { $gt: 0 } })
+    .select('staff hours shifts')
+    .lean()
+}
@@ -0,0 +1,415 @@
+import os from 'os'
+import mongoose from 'mongoose'
+import ProjectorCheckpoint from '../models/ProjectorCheckpoint'
+import ProjectionLedger, { ProjectionEntry } from '../models/ProjectionLedger'
+import { counter, gauge } from '../utils/metrics'
+import { logger } from '../utils/logger'
+
+const log = logger.child({ module: 'projector' })
+
+// 🔹 변경 스트림 프로젝터
+// 원본 컬렉션의 변경 이벤트(DB 단위 change stream 하나)를 받아 파생 컬렉션을 증분 갱신한다.
+// 쓰기 핸들러는 원본만 저장하고, 파생 데이터는 이 백그라운드 루프가 맞춘다.
+//
+// - 프로젝션은 "원본 문서 하나 → 파생 문서들에 더할 값(entries)" 함수로 정의한다
+// - 원본별로 마지막에 더한 값을 ProjectionLedger 에 남겨, 변경/삭제 시 이전 값을 빼고 새 값을 더한다
+//   (updateLookup 은 이벤트 시점이 아닌 현재 문서를 주지만, 이 방식이면 결과는 항상 현재 상태로 수렴)
+// - 파생 컬렉션 갱신 + 원장 + resume token 저장을 한 트랜잭션으로 → 재기동 후 이어받아도 중복 반영 없음
+// - resume token 이 oplog 에서 밀려났거나 처음 실행이면 전체 재계산 후 증분으로 전환
+// - 여러 워커/인스턴스 중 임대(lease)를 가진 하나만 스트림을 처리한다
+// 변경 스트림은 레플리카셋에서만 동작한다. 단일 서버면 경고만 남기고 꺼지며,
+// 읽는 쪽(projectionReady 확인)은 기존처럼 요청 시 계산한다.
+
+const CHECKPOINT = 'projector'
+const OWNER = `${os.hostname()}:${process.pid}`
+const LEASE_MS = Number(process.env.PROJECTOR_LEASE_MS) || 30_000
+const BATCH = 200
+const IDLE_TOKEN_SAVE_MS = 30_000
+const RETRY_MS = 5_000
+const READY_CACHE_MS = 15_000
+
+// 서버 오류 코드
+const NOT_REPLICA_SET = 40573
+const HISTORY_LOST = [280, 286] // ChangeStreamFatalError, ChangeStreamHistoryLost
+
+const events = counter('projector_events_total', 'Change events applied by the projector')
+const lagSeconds = gauge('projector_lag_seconds', 'Seconds between a change and its projection')
+
+export interface ProjectionSource {
+  model: mongoose.Model<any>
+  fields: string[] // 이 필드가 바뀐 update 만 처리 (나머지 update 이벤트는 스트림에서 거름)
+  rebuildFilter?: () => Record<string, unknown> // 전체 재계산 대상 (기본: 전체)
+}
+
+export interface Projection {
+  name: string
+  sources: ProjectionSource[]
+  targets: mongoose.Model<any>[]
+  entries: (collection: string, doc: any) => ProjectionEntry[]
+  expireAt?: (collection: string, doc: any) => Date | null
+}
+
+interface SourceState {
+  projection: string
+  source: string
+  entries: ProjectionEntry[]
+  expireAt: Date | null
+}
+
+class LeaseLostError extends Error {}
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms).unref())
+
+const escapeRegex = (value: string) => value.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')
+
+// 컬렉션별 관심 필드가 바뀐 update 와 insert/replace/delete 만 받는다
+const changePipeline = (projections: Projection[]) => {
+  const fields = new Map<string, Set<string>>()
+  for (const p of projections) {
+    for (const s of p.sources) {
+      const coll = s.model.collection.collectionName
+      const set = fields.get(coll) ?? new Set(['storeId'])
+      s.fields.forEach((f) => set.add(f))
+      fields.set(coll, set)
+    }
+  }
+  const changedKeys = {
+    $concatArrays: [
+      { $map: { input: { $objectToArray: '$updateDescription.updatedFields' }, in: '$$this.k' } },
+      { $ifNull: ['$updateDescription.removedFields', []] },
+    ],
+  }
+  return [
+    {
+      $match: {
+        'ns.coll': { $in: [...fields.keys()] },
+        operationType: { $in: ['insert', 'update', 'replace', 'delete'] },
+        $or: [
+          { operationType: { $ne: 'update' } },
+          ...[...fields].map(([coll, set]) => ({
+            'ns.coll': coll,
+            $expr: {
+              $anyElementTrue: {
+                $map: {
+                  input: { $ifNull: [changedKeys, []] },
+                  in: {
+                    $regexMatch: {
+                      input: '$$this',
+                      regex: `^(${[...set].map(escapeRegex).join('|')})(\\.|$)`,
+                    },
+                  },
+                },
+              },
+            },
+          })),
+        ],
+      },
+    },
+  ]
+}
+
+const entryKey = (entry: ProjectionEntry) => `${entry.target}|${JSON.stringify(entry.filter)}`
+
+// 원본 상태 목록을 파생 컬렉션 + 원장에 반영 (이전 값 빼기 + 새 값 더하기)
+const applyStates = async (states: SourceState[], session?: mongoose.ClientSession) => {
+  if (states.length === 0) return
+
+  const byProjection = new Map<string, string[]>()
+  for (const s of states) {
+    byProjection.set(s.projection, [...(byProjection.get(s.projection) ?? []), s.source])
+  }
+  const previous = await ProjectionLedger.find({
+    $or: [...byProjection].map(([projection, sources]) => ({
+      projection,
+      source: { $in: sources },
+    })),
+  })
+    .session(session ?? null)
+    .lean()
+  const before = new Map(previous.map((l) => [`${l.projection}|${l.source}`, l.entries]))
+
+  const deltas = new Map<string, ProjectionEntry>()
+  const add = (entry: ProjectionEntry, sign: number) => {
+    const key = entryKey(entry)
+    const delta = deltas.get(key) ?? { target: entry.target, filter: entry.filter, inc: {} }
+    for (const [field, value] of Object.entries(entry.inc)) {
+      delta.inc[field] = (delta.inc[field] ?? 0) + sign * value
+    }
+    deltas.set(key, delta)
+  }
+  for (const s of states) {
+    for (const entry of before.get(`${s.projection}|${s.source}`) ?? []) add(entry, -1)
+    for (const entry of s.entries) add(entry, 1)
+  }
+
+  const byTarget = new Map<string, any[]>()
+  for (const { target, filter, inc } of deltas.values()) {
+    const changed = Object.fromEntries(Object.entries(inc).filter(([, v]) => v !== 0))
+    if (Object.keys(changed).length === 0) continue
+    byTarget.set(target, [
+      ...(byTarget.get(target) ?? []),
+      { updateOne: { filter, update: { $inc: changed }, upsert: true } },
+    ])
+  }
+  for (const [target, ops] of byTarget) {
+    await mongoose.model(target).bulkWrite(ops, { ordered: false, session })
+  }
+
+  await ProjectionLedger.bulkWrite(
+    states.map((s) =>
+      s.entries.length === 0
+        ? { deleteOne: { filter: { projection: s.projection, source: s.source } } }
+        : {
+            updateOne: {
+              filter: { projection: s.projection, source: s.source },
+              update: { $set: { entries: s.entries, expireAt: s.expireAt } },
+              upsert: true,
+            },
+          }
+    ),
+    { ordered: false, session }
+  )
+}
+
+const stateOf = (p: Projection, collection: string, id: unknown, doc: any): SourceState => ({
+  projection: p.name,
+  source: `${collection}:${String(id)}`,
+  entries: doc ? p.entries(collection, doc) : [],
+  expireAt: doc && p.expireAt ? p.expireAt(collection, doc) : null,
+})
+
+// 임대 획득 (비어 있거나 만료됐거나 이미 내 것)
+const acquireLease = async () => {
+  const now = new Date()
+  try {
+    const doc = await ProjectorCheckpoint.findOneAndUpdate(
+      { name: CHECKPOINT, $or: [{ owner: OWNER }, { owner: null }, { leaseUntil: { $lt: now } }] },
+      { $set: { owner: OWNER, leaseUntil: new Date(now.getTime() + LEASE_MS) } },
+      { upsert: true, new: true }
+    ).lean()
+    return doc
+  } catch (err: any) {
+    // 다른 프로세스가 먼저 가져간 경우 upsert 가 중복 키로 실패
+    if (err?.code === 11000) return null
+    throw err
+  }
+}
+
+const renewLease = async () => {
+  const result = await ProjectorCheckpoint.updateOne(
+    { name: CHECKPOINT, owner: OWNER },
+    { $set: { leaseUntil: new Date(Date.now() + LEASE_MS) } }
+  )
+  return result.matchedCount > 0
+}
+
+const releaseLease = () =>
+  ProjectorCheckpoint.updateOne(
+    { name: CHECKPOINT, owner: OWNER },
+    { $set: { owner: null, leaseUntil: new Date(0) } }
+  )
+
+// token 저장 (임대를 잃었으면 예외 → 트랜잭션 롤백)
+const saveCheckpoint = async (
+  resumeToken: unknown,
+  session?: mongoose.ClientSession,
+  applied = false
+) => {
+  const result = await ProjectorCheckpoint.updateOne(
+    { name: CHECKPOINT, owner: OWNER },
+    { $set: { resumeToken, ...(applied ? { appliedAt: new Date() } : {}) } },
+    { session }
+  )
+  if (result.matchedCount === 0) throw new LeaseLostError('프로젝터 임대를 잃었습니다')
+}
+
+// 프로젝션 하나를 원본에서 다시 계산 (파생 컬렉션/원장 비우고 원본 순회)
+const rebuild = async (p: Projection) => {
+  const started = Date.now()
+  await ProjectorCheckpoint.updateOne({ name: CHECKPOINT }, { $pull: { rebuilt: p.name } })
+  await ProjectionLedger.deleteMany({ projection: p.name })
+  for (const target of p.targets) await target.deleteMany({})
+
+  let scanned = 0
+  for (const source of p.sources) {
+    const collection = source.model.collection.collectionName
+    const cursor = source.model
+      .find(source.rebuildFilter?.() ?? {})
+      .lean()
+      .cursor({ batchSize: 1000 })
+    let chunk: SourceState[] = []
+    for await (const doc of cursor) {
+      chunk.push(stateOf(p, collection, doc._id, doc))
+      if (chunk.length >= 500) {
+        await applyStates(chunk)
+        scanned += chunk.length
+        chunk = []
+      }
+    }
+    await applyStates(chunk)
+    scanned += chunk.length
+  }
+
+  const result = await ProjectorCheckpoint.updateOne(
+    { name: CHECKPOINT, owner: OWNER },
+    { $addToSet: { rebuilt: p.name } }
+  )
+  if (result.matchedCount === 0) throw new LeaseLostError('프로젝터 임대를 잃었습니다')
+  log.info('프로젝션 재계산', { projection: p.name, scanned, ms: Date.now() - started })
+}
+
+export const startProjector = (projections: Projection[]) => {
+  const byCollection = new Map<string, Projection[]>()
+  for (const p of projections) {
+    for (const s of p.sources) {
+      const coll = s.model.collection.collectionName
+      byCollection.set(coll, [...(byCollection.get(coll) ?? []), p])
+    }
+  }
+  const pipeline = changePipeline(projections)
+
+  let stopped = false
+  let leaseLost = false
+  let stream: mongoose.mongo.ChangeStream | null = null
+
+  // 한 배치: 원본별 최종 상태로 모아 트랜잭션 하나로 반영 + token 저장
+  const applyBatch = async (changes: any[], resumeToken: unknown) => {
+    const states = new Map<string, SourceState>()
+    for (const change of changes) {
+      const coll = change.ns.coll
+      const doc = change.operationType === 'delete' ? null : change.fullDocument
+      for (const p of byCollection.get(coll) ?? []) {
+        const state = stateOf(p, coll, change.documentKey._id, doc)
+        states.set(`${state.projection}|${state.source}`, state)
+      }
+    }
+
+    const session = await mongoose.startSession()
+    try {
+      await session.withTransaction(async () => {
+        await applyStates([...states.values()], session)
+        await saveCheckpoint(resumeToken, session, true)
+      })
+    } finally {
+      await session.endSession()
+    }
+
+    events.inc(undefined, changes.length)
+    const last = changes[changes.length - 1]
+    if (last.clusterTime) {
+      lagSeconds.set(undefined, Math.max(0, Date.now() / 1000 - last.clusterTime.getHighBits()))
+    }
+  }
+
+  // 드라이버 스트림을 직접 사용 (tryNext / resumeToken)
+  const openStream = (resumeToken: unknown) =>
+    mongoose.connection.db!.watch(pipeline, {
+      fullDocument: 'updateLookup',
+      maxAwaitTimeMS: 1000,
+      ...(resumeToken ? { resumeAfter: resumeToken as mongoose.mongo.ResumeToken } : {}),
+    })
+
+  const run = async (checkpoint: { resumeToken?: unknown; rebuilt?: string[] }) => {
+    let pending: any = null
+    let stale = projections.filter((p) => !checkpoint.rebuilt?.includes(p.name))
+
+    // 스트림을 먼저 열어 두고 재계산해야 그 사이 변경을 놓치지 않는다
+    stream = openStream(checkpoint.resumeToken)
+    try {
+      pending = await stream.tryNext()
+    } catch (err: any) {
+      if (!HISTORY_LOST.includes(err?.code)) throw err
+      log.warn('resume token 만료: 전체 재계산', { code: err.code })
+      await stream.close()
+      stream = openStream(null)
+      pending = await stream.tryNext()
+      stale = projections
+    }
+    for (const p of stale) await rebuild(p)
+
+    let lastSaved = Date.now()
+    while (!stopped) {
+      const batch = pending ? [pending] : []
+      pending = null
+      while (batch.length < BATCH) {
+        const change = await stream.tryNext()
+        if (!change) break
+        batch.push(change)
+      }
+      if (stopped) break
+
+      if (batch.length > 0) {
+        await applyBatch(batch, stream.resumeToken)
+        lastSaved = Date.now()
+      } else if (Date.now() - lastSaved > IDLE_TOKEN_SAVE_MS) {
+        // 변경이 없어도 위치를 앞으로 옮겨 둔다 (오래 쉬다 재기동해도 oplog 안에서 이어받도록)
+        await saveCheckpoint(stream.resumeToken)
+        lastSaved = Date.now()
+      }
+    }
+  }
+
+  const loop = async () => {
+    while (!stopped) {
+      let renewTimer: NodeJS.Timeout | undefined
+      leaseLost = false
+      try {
+        const checkpoint = await acquireLease()
+        if (!checkpoint || checkpoint.owner !== OWNER) {
+          await sleep(LEASE_MS / 2)
+          continue
+        }
+        renewTimer = setInterval(() => {
+          renewLease()
+            .then((held) => {
+              if (held) return
+              leaseLost = true
+              stream?.close().catch(() => {})
+            })
+            .catch((err) => log.error('프로젝터 임대 갱신 실패', { err }))
+        }, LEASE_MS / 3)
+        renewTimer.unref()
+
+        await run(checkpoint)
+      } catch (err: any) {
+        if (stopped) break
+        if (err?.code === NOT_REPLICA_SET) {
+          log.warn('변경 스트림 사용 불가 (레플리카셋 아님): 파생 데이터는 요청 시 계산')
+          await releaseLease().catch(() => {})
+          return
+        }
+        if (err instanceof LeaseLostError || leaseLost) log.warn('프로젝터 임대를 다른 프로세스가 가져감')
+        else log.error('프로젝터 오류, 재시도', { err })
+        await sleep(RETRY_MS)
+      } finally {
+        clearInterval(renewTimer)
+        await stream?.close().catch(() => {})
+        stream = null
+      }
+    }
+  }
+
+  const running = loop()
+
+  return async () => {
+    stopped = true
+    await stream?.close().catch(() => {})
+    await running
+    await releaseLease().catch(() => {})
+  }
+}
+
+// 파생 데이터를 읽어도 되는지 (재계산이 끝났고 프로젝터가 살아 있음)
+// 아니면 호출하는 쪽이 원본에서 직접 계산한다
+let readyCache: { at: number; rebuilt: Set<string> } | null = null
+
+export const projectionReady = async (name: string) => {
+  if (!readyCache || Date.now() - readyCache.at > READY_CACHE_MS) {
+    const checkpoint = await ProjectorCheckpoint.findOne({ name: CHECKPOINT })
+      .select('rebuilt leaseUntil')
+      .lean()
+    const alive = !!checkpoint && checkpoint.leaseUntil.getTime() > Date.now() - LEASE_MS
+    readyCache = { at: Date.now(), rebuilt: new Set(alive ? checkpoint!.rebuilt : []) }
+  }
+  return readyCache.rebuilt.has(name)
+}
@@ -0,0 +1,102 @@
+import mongoose from 'mongoose'
+import Announcement from '../models/Announcement'
+import Counter from '../models/Counter'
+import User from '../models/User'
+import { currentStoreId, DEFAULT_STORE_ID } from '../utils/tenant'
+
+// 🔹 공지 열람 기록 (직원별 비트맵)
+// 직원마다 매장 안에서 고유한 staffIndex(0, 1, 2 ...)를 주고, 공지의 readMask 에서 그 비트를 켠다.
+// readMask 는 32비트 정수 워드 묶음 { w0, w1, ... } → 직원 100명이면 공지당 4개 워드.
+// - 열람 기록: 해당 워드 하나에 $bit or (비트가 꺼져 있을 때만 readCount +1, 왕복 1회)
+// - 안 읽은 중요 공지: { important, 워드 없음 또는 $bitsAllClear } 한 번의 인덱스 조회
+// - 열람률: 공지의 readMask 를 풀어 직원 목록과 대조
+
+const WORD_BITS = 32
+
+const STAFF_INDEX_COUNTER = 'staffIndex'
+
+// staffIndex → 워드 필드 경로 + 워드 안 비트 위치
+export const maskPosition = (staffIndex: number) => ({
+  field: `readMask.w${Math.floor(staffIndex / WORD_BITS)}`,
+  bit: staffIndex % WORD_BITS,
+})
+
+// readMask 에서 켜진 staffIndex 목록
+export const readerIndexes = (readMask: Record<string, number> | undefined) => {
+  const indexes: number[] = []
+  for (const [key, word] of Object.entries(readMask ?? {})) {
+    const base = Number(key.slice(1)) * WORD_BITS
+    for (let bit = 0; bit < WORD_BITS; bit++) {
+      if ((word >>> bit) & 1) indexes.push(base + bit)
+    }
+  }
+  return indexes
+}
+
+// 안 읽음 조건 (워드가 아직 없으면 그 범위 직원은 아무도 안 읽은 것)
+export const unreadFilter = (staffIndex: number) => {
+  const { field, bit } = maskPosition(staffIndex)
+  return { $or: [{ [field]: { $exists: false } }, { [field]: { $bitsAllClear: [bit] } }] }
+}
+
+interface StaffRef {
+  _id: unknown
+  role?: string | null
+  staffIndex?: number | null
+  storeId?: string | null
+}
+
+// 직원 번호 발급 (이미 있으면 그대로). 삭제된 직원 번호는 재사용하지 않으므로 이전 열람 비트가 섞이지 않는다
+// 로그인 시점에는 요청 매장이 정해지지 않았을 수 있어 사용자 문서의 매장을 직접 쓴다
+export const assignStaffIndex = async (user: StaffRef): Promise<number | null> => {
+  if (user.role !== 'staff') return null
+  if (typeof user.staffIndex === 'number') return user.staffIndex
+
+  const storeId = user.storeId ?? DEFAULT_STORE_ID
+  const counter = await Counter.findOneAndUpdate(
+    { storeId, name: STAFF_INDEX_COUNTER },
+    { $inc: { seq: 1 } },
+    { upsert: true, new: true, allStores: true }
+  ).lean()
+  // 동시에 두 요청이 발급한 경우 먼저 저장된 번호를 쓴다 (진 쪽 번호는 버림)
+  await User.updateOne(
+    { _id: user._id, staffIndex: { $exists: false } },
+    { $set: { staffIndex: counter!.seq - 1 } },
+    { allStores: true }
+  )
+  const saved = await User.findById(user._id)
+    .select('staffIndex')
+    .setOptions({ allStores: true })
+    .lean<{ staffIndex?: number }>()
+  return saved?.staffIndex ?? null
+}
+
+// 요청 사용자의 직원 번호: 토큰에 있으면 그대로, 없으면(이전 토큰) 조회 후 필요 시 발급
+export const staffIndexOf = async (user?: {
+  userId: string
+  role: string
+  staffIndex?: number
+}) => {
+  if (!user || user.role !== 'staff') return null
+  if (typeof user.staffIndex === 'number') return user.staffIndex
+  const doc = await User.findById(user.userId)
+    .select('role staffIndex storeId')
+    .lean<StaffRef>()
+  return doc ? assignStaffIndex(doc) : null
+}
+
+// 열람 기록: 처음 읽을 때만 비트를 켜고 readCount 증가 (다시 열어도 변화 없음)
+// Mixed 경로의 $bit 은 모델 캐스팅을 거치지 않도록 드라이버 컬렉션으로 보낸다 (매장 조건은 직접)
+export const markRead = async (announcementId: string, staffIndex: number) => {
+  if (!mongoose.Types.ObjectId.isValid(announcementId)) return false
+  const { field, bit } = maskPosition(staffIndex)
+  const result = await Announcement.collection.updateOne(
+    {
+      _id: new mongoose.Types.ObjectId(announcementId),
+      storeId: currentStoreId() ?? DEFAULT_STORE_ID,
+      ...unreadFilter(staffIndex),
+    },
+    { $bit: { [field]: { or: (1 << bit) | 0 } }, $inc: { readCount: 1 } }
+  )
+  return result.modifiedCount > 0
+}
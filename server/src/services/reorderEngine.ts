@@ -0,0 +1,247 @@
+import mongoose from 'mongoose'
+import dayjs from 'dayjs'
+import utc from 'dayjs/plugin/utc'
+import timezone from 'dayjs/plugin/timezone'
+import Order from '../models/Order'
+import Product from '../models/Product'
+import ProductSalesDaily from '../models/ProductSalesDaily'
+import ReorderSuggestion from '../models/ReorderSuggestion'
+import { invalidateTags } from '../middleware/responseCache'
+import { histogram } from '../utils/metrics'
+import { forecastDemand } from './forecast'
+import { DEFAULT_STORE_ID } from '../utils/tenant'
+import { logger } from '../utils/logger'
+
+const log = logger.child({ module: 'reorderEngine' })
+
+dayjs.extend(utc)
+dayjs.extend(timezone)
+
+// 🔹 발주 제안 엔진
+// 1) ProductSalesDaily 롤업: 결제 시 증분($inc), 필요 시 Order 에서 재구성($merge)
+// 2) 배치: 최근 N일 롤업 → 상품×일 행렬 → forecastDemand → ReorderSuggestion
+// 상품 단위 계산이라 매장 전체를 한 번에 처리한다 (요청에서 호출되면 해당 매장만)
+
+const TZ = process.env.STORE_TZ || 'Asia/Seoul'
+const HISTORY_DAYS = Number(process.env.REORDER_HISTORY_DAYS) || 182
+const LEAD_TIME = Number(process.env.REORDER_LEAD_DAYS) || 2 // 발주 → 입고
+const REVIEW_PERIOD = Number(process.env.REORDER_REVIEW_DAYS) || 7 // 발주 주기
+const SERVICE_Z = Number(process.env.REORDER_SERVICE_Z) || 1.65 // 서비스 수준 95%
+const RUN_HOUR = Number(process.env.REORDER_RUN_HOUR ?? 4) // 매일 새벽 재계산
+const DEFAULT_MIN_STOCK = 5
+const WRITE_BATCH = 1000
+
+const jobDuration = histogram(
+  'reorder_job_duration_seconds',
+  'Reorder suggestion batch duration by phase',
+  [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+)
+
+const dateKey = (d: Date | dayjs.Dayjs = new Date()) => dayjs(d).tz(TZ).format('YYYY-MM-DD')
+
+// 결제 시 호출: 판매일(기본 오늘) 롤업에 증분 반영
+// 오프라인 동기화처럼 지난 판매는 줄마다 at 으로 판매 시각을 넘긴다
+export const recordSales = async (
+  lines: { storeId?: string; productId: unknown; qty: number; revenue: number; at?: Date }[],
+  at = new Date()
+) => {
+  const ops = lines
+    .filter((l) => l.productId && l.qty > 0)
+    .map((l) => ({
+      updateOne: {
+        filter: {
+          storeId: l.storeId ?? DEFAULT_STORE_ID,
+          productId: l.productId,
+          date: dateKey(l.at ?? at),
+        },
+        update: { $inc: { qty: l.qty, revenue: l.revenue } },
+        upsert: true,
+      },
+    }))
+  if (ops.length > 0) await ProductSalesDaily.bulkWrite(ops, { ordered: false })
+}
+
+// Order 컬렉션에서 최근 N일 롤업 재구성 (서버 측 $merge, 앱으로 데이터 전송 없음)
+export const rebuildSalesRollup = async (days = 365) => {
+  const started = performance.now()
+  const since = dayjs().tz(TZ).subtract(days, 'day').startOf('day')
+
+  await ProductSalesDaily.deleteMany({ date: { $gte: dateKey(since) } })
+  await Order.aggregate([
+    { $match: { createdAt: { $gte: since.toDate() } } },
+    { $unwind: '$items' },
+    { $match: { 'items.productId': { $ne: null } } },
+    {
+      $group: {
+        _id: {
+          storeId: '$storeId',
+          productId: '$items.productId',
+          date: { $dateToString: { format: '%Y-%m-%d', date: '$createdAt', timezone: TZ } },
+        },
+        qty: { $sum: '$items.quantity' },
+        revenue: { $sum: { $multiply: ['$items.price', '$items.quantity'] } },
+      },
+    },
+    {
+      $project: {
+        _id: 0,
+        storeId: { $ifNull: ['$_id.storeId', DEFAULT_STORE_ID] },
+        productId: '$_id.productId',
+        date: '$_id.date',
+        qty: 1,
+        revenue: 1,
+      },
+    },
+    {
+      $merge: {
+        into: ProductSalesDaily.collection.collectionName,
+        on: ['storeId', 'productId', 'date'],
+        whenMatched: [{ $set: { qty: '$$new.qty', revenue: '$$new.revenue' } }],
+        whenNotMatched: 'insert',
+      },
+    },
+  ])
+
+  jobDuration.observe({ phase: 'rollup' }, (performance.now() - started) / 1000)
+}
+
+interface ProductRow {
+  _id: mongoose.Types.ObjectId
+  name?: string
+  category?: string
+  stock?: number
+  minStock?: number
+  storeId?: string
+}
+
+// 전체 상품 발주 제안 재계산
+export const recomputeSuggestions = async () => {
+  const started = performance.now()
+  const runAt = new Date()
+
+  const products = await Product.find({})
+    .select('name category stock minStock storeId')
+    .lean<ProductRow[]>()
+  const skuCount = products.length
+  const row = new Map<string, number>()
+  products.forEach((p, i) => row.set(p._id.toString(), i))
+
+  // 상품 × 일 행렬 채우기 (없는 날은 0)
+  const today = dayjs().tz(TZ).startOf('day')
+  const first = today.subtract(HISTORY_DAYS, 'day')
+  // 날짜 키(YYYY-MM-DD) 차이만 필요하므로 UTC 자정으로 파싱 (문서마다 tz 변환 비용 회피)
+  const dayIndex = (key: string) => Date.parse(`${key}T00:00:00Z`) / 86_400_000
+  const firstDay = dayIndex(dateKey(first))
+  const sales = new Float64Array(skuCount * HISTORY_DAYS)
+
+  // 롤업 수가 많으므로 mongoose 문서화 없이 드라이버 커서로 읽는다
+  const cursor = ProductSalesDaily.collection
+    .find(
+      { date: { $gte: dateKey(first), $lt: dateKey(today) } },
+      { projection: { _id: 0, productId: 1, date: 1, qty: 1 } }
+    )
+    .batchSize(10_000)
+  for await (const doc of cursor) {
+    const i = row.get(String(doc.productId))
+    if (i === undefined) continue
+    const t = dayIndex(doc.date) - firstDay
+    if (t >= 0 && t < HISTORY_DAYS) sales[i * HISTORY_DAYS + t] += doc.qty ?? 0
+  }
+  const loadedAt = performance.now()
+
+  const horizon = LEAD_TIME + REVIEW_PERIOD
+  const forecast = forecastDemand(sales, skuCount, {
+    days: HISTORY_DAYS,
+    startDow: first.day(),
+    horizon,
+    leadTime: LEAD_TIME,
+  })
+  const computedAt = performance.now()
+
+  // 재주문점(ROP) = 리드타임 수요 + 안전재고, 재고가 ROP 이하이면 목표재고까지 발주
+  const ops = products.map((p, i) => {
+    const stock = typeof p.stock === 'number' ? p.stock : 0
+    const rawMin = typeof p.minStock === 'number' ? p.minStock : DEFAULT_MIN_STOCK
+    const minStock = rawMin > 0 ? rawMin : DEFAULT_MIN_STOCK
+
+    const safetyStock = SERVICE_Z * forecast.sigma[i] * Math.sqrt(LEAD_TIME)
+    const reorderPoint = Math.max(minStock, forecast.leadTimeDemand[i] + safetyStock)
+    const orderUpTo = Math.max(minStock, forecast.horizonDemand[i] + safetyStock)
+    const suggestedQty = stock <= reorderPoint ? Math.max(0, Math.ceil(orderUpTo - stock)) : 0
+    const daily = forecast.daily[i]
+
+    const storeId = p.storeId ?? DEFAULT_STORE_ID
+    return {
+      replaceOne: {
+        filter: { storeId, productId: p._id },
+        replacement: {
+          storeId,
+          productId: p._id,
+          name: p.name ?? '이름 없음',
+          category: p.category,
+          stock,
+          forecastDaily: Math.round(daily * 100) / 100,
+          leadTimeDemand: Math.round(forecast.leadTimeDemand[i] * 100) / 100,
+          safetyStock: Math.ceil(safetyStock),
+          reorderPoint: Math.ceil(reorderPoint),
+          suggestedQty,
+          daysOfCover: daily > 0 ? Math.round((stock / daily) * 10) / 10 : 999,
+          computedAt: runAt,
+        },
+        upsert: true,
+      },
+    }
+  })
+
+  for (let i = 0; i < ops.length; i += WRITE_BATCH) {
+    await ReorderSuggestion.bulkWrite(ops.slice(i, i + WRITE_BATCH), { ordered: false })
+  }
+  // 삭제된 상품의 제안 정리
+  await ReorderSuggestion.deleteMany({ computedAt: { $lt: runAt } })
+  invalidateTags(['reorder'])
+
+  const finished = performance.now()
+  jobDuration.observe({ phase: 'load' }, (loadedAt - started) / 1000)
+  jobDuration.observe({ phase: 'compute' }, (computedAt - loadedAt) / 1000)
+  jobDuration.observe({ phase: 'write' }, (finished - computedAt) / 1000)
+
+  return {
+    skus: skuCount,
+    historyDays: HISTORY_DAYS,
+    loadMs: Math.round(loadedAt - started),
+    computeMs: Math.round(computedAt - loadedAt),
+    writeMs: Math.round(finished - computedAt),
+  }
+}
+
+export const startReorderEngine = () => {
+  const run = async () => {
+    try {
+      // 롤업이 비어 있으면(최초 배포) 주문 이력에서 먼저 구성
+      if (!(await ProductSalesDaily.exists({})) && (await Order.exists({}))) {
+        await rebuildSalesRollup()
+      }
+      const stats = await recomputeSuggestions()
+      log.info('발주 제안 갱신', { ...stats })
+    } catch (err) {
+      log.error('발주 제안 계산 실패', { err })
+    }
+  }
+
+  run()
+
+  let timer: NodeJS.Timeout
+  const scheduleNext = () => {
+    const now = dayjs().tz(TZ)
+    let next = now.hour(RUN_HOUR).minute(0).second(0).millisecond(0)
+    if (!next.isAfter(now)) next = next.add(1, 'day')
+    timer = setTimeout(async () => {
+      await run()
+      scheduleNext()
+    }, next.valueOf() - now.valueOf())
+    timer.unref()
+  }
+  scheduleNext()
+
+  return () => clearTimeout(timer)
+}
@@ -0,0 +1,120 @@
+import dayjs from 'dayjs'
+import utc from 'dayjs/plugin/utc'
+import timezone from 'dayjs/plugin/timezone'
+import Order from '../models/Order'
+import SalesHourly from '../models/SalesHourly'
+import { DEFAULT_STORE_ID } from '../utils/tenant'
+
+dayjs.extend(utc)
+dayjs.extend(timezone)
+
+// 🔹 시간당 매출 롤업
+// 분석/대시보드는 원본 주문 대신 이 집계를 읽는다 (매장당 1년 = 최대 8,760건)
+
+export const STORE_TZ = process.env.STORE_TZ || 'Asia/Seoul'
+
+const HOUR_MS = 3_600_000
+
+interface RolledOrder {
+  storeId?: string
+  createdAt: Date
+  totalAmount: number
+  items: { quantity: number }[]
+}
+
+// 결제 시 호출: 해당 시간 집계에 증분 반영
+export const recordOrder = (order: RolledOrder) => recordOrders([order])
+
+// 여러 주문 (키오스크 오프라인 동기화): 매장/시간별로 합쳐 bulkWrite 한 번
+export const recordOrders = async (orders: RolledOrder[]) => {
+  const buckets = new Map<
+    string,
+    { storeId: string; hour: Date; orders: number; revenue: number; items: number }
+  >()
+  for (const order of orders) {
+    const at = new Date(order.createdAt).getTime()
+    const hour = new Date(Math.floor(at / HOUR_MS) * HOUR_MS)
+    const storeId = order.storeId ?? DEFAULT_STORE_ID
+    const key = `${storeId}:${hour.getTime()}`
+    const bucket = buckets.get(key) ?? { storeId, hour, orders: 0, revenue: 0, items: 0 }
+    bucket.orders += 1
+    bucket.revenue += order.totalAmount || 0
+    bucket.items += order.items.reduce((acc, it) => acc + (Number(it.quantity) || 0), 0)
+    buckets.set(key, bucket)
+  }
+  if (buckets.size === 0) return
+
+  await SalesHourly.bulkWrite(
+    [...buckets.values()].map(({ storeId, hour, orders, revenue, items }) => ({
+      updateOne: {
+        filter: { storeId, hour },
+        update: { $inc: { orders, revenue, items } },
+        upsert: true,
+      },
+    })),
+    { ordered: false }
+  )
+}
+
+// since 이후 구간을 Order 에서 다시 계산해 덮어쓴다 (증분 누락 보정, 마이그레이션 후 초기 구성)
+export const rebuildHourlySales = async (since: Date) => {
+  await Order.aggregate([
+    { $match: { createdAt: { $gte: since } } },
+    {
+      $group: {
+        _id: {
+          storeId: { $ifNull: ['$storeId', DEFAULT_STORE_ID] },
+          hour: { $dateTrunc: { date: '$createdAt', unit: 'hour' } },
+        },
+        orders: { $sum: 1 },
+        revenue: { $sum: '$totalAmount' },
+        items: { $sum: { $sum: '$items.quantity' } },
+      },
+    },
+    {
+      $project: { _id: 0, storeId: '$_id.storeId', hour: '$_id.hour', orders: 1, revenue: 1, items: 1 },
+    },
+    {
+      $merge: {
+        into: SalesHourly.collection.collectionName,
+        on: ['storeId', 'hour'],
+        whenMatched: [
+          { $set: { orders: '$$new.orders', revenue: '$$new.revenue', items: '$$new.items' } },
+        ],
+        whenNotMatched: 'insert',
+      },
+    },
+  ])
+}
+
+export type SalesUnit = 'hour' | 'dayOfWeek' | 'month'
+
+const UNIT_EXPR: Record<SalesUnit, string> = {
+  hour: '$hour',
+  dayOfWeek: '$dayOfWeek',
+  month: '$month',
+}
+
+// [from, to) 구간 매출을 매장 시간대 기준 시/요일/월 단위로 합산
+// 반환: 단위 값(시 0~23, 요일 1~7, 월 1~12) → 합계
+export const salesBy = async (unit: SalesUnit, from: Date, to = new Date()) => {
+  const rows = await SalesHourly.aggregate<{
+    _id: number
+    sales: number
+    items: number
+  }>([
+    { $match: { hour: { $gte: from, $lt: to } } },
+    {
+      $group: {
+        _id: { [UNIT_EXPR[unit]]: { date: '$hour', timezone: STORE_TZ } },
+        sales: { $sum: '$revenue' },
+        items: { $sum: '$items' },
+      },
+    },
+  ])
+  return new Map(rows.map((r) => [r._id, { sales: r.sales, items: r.items }]))
+}
+
+// 매장 시간대 기준 구간 시작 시각
+export const storeStartOf = (unit: 'day' | 'week' | 'month' | 'year') =>
+  dayjs().tz(STORE_TZ).startOf(unit).toDate()
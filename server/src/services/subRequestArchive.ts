@@ -0,0 +1,105 @@
+import dayjs from 'dayjs'
+import utc from 'dayjs/plugin/utc'
+import timezone from 'dayjs/plugin/timezone'
+import SubRequest from '../models/SubRequest'
+import SubRequestArchive from '../models/SubRequestArchive'
+import Schedule from '../models/Schedule'
+import { STORE_TZ } from './salesRollup'
+import { logger } from '../utils/logger'
+
+dayjs.extend(utc)
+dayjs.extend(timezone)
+
+const log = logger.child({ module: 'subRequestArchive' })
+
+// 🔹 대타 요청 보관
+// 목록 API 는 { storeId, status, shift.date } 인덱스로 진행 중/다가오는 요청만 읽는다.
+// 근무일이 지난 요청은 상태와 관계없이 SubRequestArchive 로 옮겨 원본 컬렉션 크기를 일정하게 유지한다.
+// - 근무일 + SUB_REQUEST_KEEP_DAYS 까지는 원본에 남김 (점주 "승인 완료" 목록에서 최근 이력 확인)
+// - 근무 정보 사본(shift)이 없는 예전 요청은 먼저 스케줄에서 채운다 (스케줄이 삭제됐으면 바로 보관)
+
+export const SUB_REQUEST_KEEP_DAYS = Number(process.env.SUB_REQUEST_KEEP_DAYS) || 7
+const RUN_INTERVAL = 6 * 3_600_000
+const ARCHIVE_BATCH = 1000
+
+// 매장 기준 오늘 (YYYY-MM-DD, 스케줄 date 와 같은 형식이라 문자열 비교 가능)
+export const storeToday = () => dayjs().tz(STORE_TZ).format('YYYY-MM-DD')
+
+export const keepSince = () =>
+  dayjs.tz(storeToday(), STORE_TZ).subtract(SUB_REQUEST_KEEP_DAYS, 'day').format('YYYY-MM-DD')
+
+// 스케줄에서 근무 정보 사본 채우기 (서버 측 $lookup + $merge)
+export const backfillShiftSnapshots = async () => {
+  await SubRequest.aggregate([
+    { $match: { shift: { $exists: false } } },
+    {
+      $lookup: {
+        from: Schedule.collection.collectionName,
+        localField: 'scheduleId',
+        foreignField: '_id',
+        pipeline: [{ $project: { _id: 0, date: 1, startTime: 1, endTime: 1 } }],
+        as: 'schedule',
+      },
+    },
+    { $match: { 'schedule.0': { $exists: true } } },
+    { $project: { shift: { $first: '$schedule' } } },
+    {
+      $merge: {
+        into: SubRequest.collection.collectionName,
+        on: '_id',
+        whenMatched: [{ $set: { shift: '$$new.shift' } }],
+        whenNotMatched: 'discard',
+      },
+    },
+  ])
+}
+
+// 보관 기간이 지난 요청을 보관 컬렉션으로 복사 후 원본에서 삭제 (배치 단위)
+// 복사는 _id 기준 replace 라 중간에 실패해도 다시 실행하면 된다
+export const archiveFinishedSubRequests = async () => {
+  await backfillShiftSnapshots()
+
+  const filter = {
+    $or: [{ 'shift.date': { $lt: keepSince() } }, { shift: { $exists: false } }],
+  }
+  let archived = 0
+  for (;;) {
+    const ids = (await SubRequest.find(filter).select('_id').limit(ARCHIVE_BATCH).lean()).map(
+      (doc) => doc._id
+    )
+    if (ids.length === 0) break
+
+    await SubRequest.aggregate([
+      { $match: { _id: { $in: ids } } },
+      { $set: { archivedAt: new Date() } },
+      {
+        $merge: {
+          into: SubRequestArchive.collection.collectionName,
+          on: '_id',
+          whenMatched: 'replace',
+          whenNotMatched: 'insert',
+        },
+      },
+    ])
+    const { deletedCount } = await SubRequest.deleteMany({ _id: { $in: ids } })
+    archived += deletedCount
+    if (ids.length < ARCHIVE_BATCH) break
+  }
+  return archived
+}
+
+export const startSubRequestArchive = () => {
+  const run = () =>
+    archiveFinishedSubRequests()
+      .then((archived) => {
+        if (archived > 0) log.info('대타 요청 보관', { archived })
+      })
+      .catch((err) => log.error('대타 요청 보관 실패', { err }))
+
+  run()
+
+  const interval = setInterval(run, RUN_INTERVAL)
+  interval.unref()
+
+  return () => clearInterval(interval)
+}
@@ -6,6 +6,8 @@ declare module 'express-serve-static-core' {
     user?: {
       userId: string
       role: string
+      storeId?: string
+      staffIndex?: number
     }
   }
 }
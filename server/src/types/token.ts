@@ -1,4 +1,7 @@
 export interface DecodedToken {
   userId: string
   role: string
+  storeId?: string // 소속 매장 (없으면 DEFAULT_STORE_ID)
+  stores?: string[] // 사장: 추가로 접근 가능한 매장
+  staffIndex?: number // 직원: 매장 안 고유 번호 (공지 열람 비트맵)
 }
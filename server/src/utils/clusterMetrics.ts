@@ -0,0 +1,103 @@
+import cluster, { Worker } from 'cluster'
+import { collectMetrics, formatMetrics, MetricFamily, renderMetrics } from './metrics'
+
+// 🔹 클러스터 모드 /metrics
+// 레지스트리는 워커마다 따로라, 공유 포트로 들어온 수집 요청이 임의의 워커 값만 보게 된다.
+// 요청을 받은 워커가 primary 에 부탁하면 primary 가 모든 워커의 값을 모아 돌려준다.
+// 시계열은 worker 라벨로 구분 (전체 합계는 Prometheus 에서 sum without (worker) 로)
+// 단일 프로세스 모드에서는 로컬 레지스트리를 그대로 렌더링한다.
+
+// 응답이 늦은 워커는 빼고 응답
+const SCRAPE_TIMEOUT = 1000
+
+interface MetricsMessage {
+  __metrics: 'scrape' | 'collect' | 'report' | 'result'
+  id: number
+  families?: MetricFamily[]
+  text?: string
+}
+
+const isMetricsMessage = (msg: unknown): msg is MetricsMessage =>
+  typeof msg === 'object' && msg !== null && typeof (msg as MetricsMessage).__metrics === 'string'
+
+const workerLabels = () => ({ worker: cluster.worker!.id })
+
+// 워커: primary 를 거쳐 모든 워커의 메트릭 텍스트
+let scrapeSeq = 0
+const scrapes = new Map<number, (text: string) => void>()
+
+export const scrapeMetrics = (): Promise<string> => {
+  if (!cluster.isWorker || !process.send || !process.connected) {
+    return Promise.resolve(renderMetrics())
+  }
+  return new Promise((resolve) => {
+    const id = ++scrapeSeq
+    const done = (text: string) => {
+      clearTimeout(timer)
+      scrapes.delete(id)
+      resolve(text)
+    }
+    // primary 가 응답하지 않으면 이 워커 값만
+    const timer = setTimeout(
+      () => done(formatMetrics(collectMetrics(workerLabels()))),
+      SCRAPE_TIMEOUT * 2
+    )
+    scrapes.set(id, done)
+    process.send!({ __metrics: 'scrape', id } satisfies MetricsMessage)
+  })
+}
+
+if (cluster.isWorker) {
+  process.on('message', (msg) => {
+    if (!isMetricsMessage(msg)) return
+    if (msg.__metrics === 'collect') {
+      const report: MetricsMessage = {
+        __metrics: 'report',
+        id: msg.id,
+        families: collectMetrics(workerLabels()),
+      }
+      process.send?.(report)
+    } else if (msg.__metrics === 'result') {
+      scrapes.get(msg.id)?.(msg.text ?? '')
+    }
+  })
+}
+
+// primary: 수집 요청을 받으면 연결된 모든 워커에 collect → report 를 모아 요청한 워커에 result
+let gatherSeq = 0
+const gathers = new Map<number, (worker: Worker, families: MetricFamily[]) => void>()
+
+const gather = () =>
+  new Promise<string>((resolve) => {
+    const workers = Object.values(cluster.workers ?? {}).filter(
+      (w): w is Worker => !!w && w.isConnected()
+    )
+    const id = ++gatherSeq
+    const reports = new Map<number, MetricFamily[]>()
+    const finish = () => {
+      clearTimeout(timer)
+      gathers.delete(id)
+      resolve(formatMetrics([...reports.values()].flat()))
+    }
+    const timer = setTimeout(finish, SCRAPE_TIMEOUT)
+    gathers.set(id, (worker, families) => {
+      reports.set(worker.id, families)
+      if (reports.size >= workers.length) finish()
+    })
+    for (const worker of workers) worker.send({ __metrics: 'collect', id } satisfies MetricsMessage)
+  })
+
+export const relayMetricsScrapes = (worker: Worker) => {
+  worker.on('message', (msg) => {
+    if (!isMetricsMessage(msg)) return
+    if (msg.__metrics === 'report') {
+      gathers.get(msg.id)?.(worker, msg.families ?? [])
+    } else if (msg.__metrics === 'scrape') {
+      gather().then((text) => {
+        if (worker.isConnected()) {
+          worker.send({ __metrics: 'result', id: msg.id, text } satisfies MetricsMessage)
+        }
+      })
+    }
+  })
+}
@@ -0,0 +1,151 @@
+import fs from 'fs'
+import { currentContext } from './requestContext'
+import { counter, gauge } from './metrics'
+
+// 🔹 구조화 로그 (한 줄 = JSON 이벤트 하나)
+// 요청 경로에서는 문자열을 버퍼에 쌓기만 하고, stdout 쓰기는 다음 이벤트 루프 턴에 한 번에 한다.
+// 출력은 fs 스트림(libuv 스레드풀)이라 파이프/파일로 연결돼도 요청 처리 스레드를 막지 않는다.
+// 요청 컨텍스트의 requestId/storeId 는 자동으로 붙는다.
+//
+// 환경 변수
+// - LOG_LEVEL: debug | info | warn | error (기본 info)
+// - LOG_SAMPLE_RATE: 요청 안에서 남기는 debug/info 비율 (기본 1)
+// - LOG_SAMPLE_RATES: 경로 접두사별 비율 예) /api/kiosk/checkout=0.1,/api/save-qr=0.2
+// - LOG_MAX_PENDING_BYTES: 출력이 밀릴 때 쌓아두는 상한, 넘으면 debug/info 부터 버림 (기본 4MB)
+// warn/error 는 샘플링/상한과 관계없이 항상 남긴다.
+
+export type LogLevel = 'debug' | 'info' | 'warn' | 'error'
+export type LogFields = Record<string, unknown>
+
+const LEVELS: Record<LogLevel, number> = { debug: 10, info: 20, warn: 30, error: 40 }
+
+const parseLevel = (value?: string): LogLevel =>
+  value && value in LEVELS ? (value as LogLevel) : 'info'
+
+const MIN_LEVEL = LEVELS[parseLevel(process.env.LOG_LEVEL)]
+const MAX_PENDING_BYTES = Number(process.env.LOG_MAX_PENDING_BYTES) || 4 * 1024 * 1024
+
+// 📌 경로별 샘플링 비율 (긴 접두사 우선)
+const parseRates = (value = '') =>
+  value
+    .split(',')
+    .map((pair) => pair.split('='))
+    .filter(([prefix, rate]) => prefix && rate !== undefined && !isNaN(Number(rate)))
+    .map(([prefix, rate]) => ({ prefix: prefix.trim(), rate: Number(rate) }))
+    .sort((a, b) => b.prefix.length - a.prefix.length)
+
+const DEFAULT_RATE = Number(process.env.LOG_SAMPLE_RATE ?? 1)
+const ROUTE_RATES = parseRates(process.env.LOG_SAMPLE_RATES)
+
+export const sampleRateFor = (path: string) =>
+  ROUTE_RATES.find((r) => path.startsWith(r.prefix))?.rate ?? DEFAULT_RATE
+
+const linesTotal = counter('log_lines_total', 'Log lines written by level')
+const droppedTotal = counter('log_dropped_total', 'Log lines dropped by reason')
+
+// fd 1 을 그대로 쓰되 process.stdout(파이프/파일이면 동기 쓰기) 대신 비동기 fs 스트림으로
+const out = fs.createWriteStream('', { fd: process.stdout.fd, autoClose: false })
+
+// 쓰기 실패 시 프로세스를 죽이지 않는다 (리스너 없는 'error' 는 uncaught 예외)
+// - EPIPE: 로그를 읽던 쪽이 사라짐 → 이후 로그는 버림
+// - 그 밖(논블로킹 파이프의 EAGAIN 등): process.stdout 으로 전환 (libuv 가 재시도)
+let sink: 'stream' | 'stdout' | 'closed' = 'stream'
+const onWriteError = (err: NodeJS.ErrnoException) => {
+  sink = err.code === 'EPIPE' || sink === 'stdout' ? 'closed' : 'stdout'
+  droppedTotal.inc({ reason: 'write_error' })
+}
+out.on('error', onWriteError)
+process.stdout.on('error', onWriteError)
+
+gauge('log_pending_bytes', 'Log bytes buffered or waiting on stdout', (g) =>
+  g.set(undefined, bufferBytes + out.writableLength)
+)
+
+let buffer: string[] = []
+let bufferBytes = 0
+let scheduled = false
+
+const flush = () => {
+  scheduled = false
+  if (buffer.length === 0) return
+  const chunk = buffer.join('')
+  const lines = buffer.length
+  buffer = []
+  bufferBytes = 0
+  if (sink === 'stream') out.write(chunk)
+  else if (sink === 'stdout') process.stdout.write(chunk)
+  else droppedTotal.inc({ reason: 'closed' }, lines)
+}
+
+// Error 는 JSON.stringify 시 {} 가 되므로 필요한 필드만 꺼낸다
+const replacer = (_key: string, value: unknown) =>
+  value instanceof Error
+    ? { name: value.name, message: value.message, stack: value.stack, ...(value as any) }
+    : value
+
+const write = (level: LogLevel, msg: string, fields: LogFields | undefined, bindings: LogFields) => {
+  const severity = LEVELS[level]
+  if (severity < MIN_LEVEL) return
+
+  const ctx = currentContext()
+  if (severity < LEVELS.warn) {
+    if (ctx?.logSampled === false) return droppedTotal.inc({ reason: 'sampled' })
+    if (bufferBytes + out.writableLength > MAX_PENDING_BYTES) {
+      return droppedTotal.inc({ reason: 'backpressure' })
+    }
+  }
+
+  const entry = {
+    time: new Date().toISOString(),
+    level,
+    msg,
+    pid: process.pid,
+    requestId: ctx?.requestId,
+    storeId: ctx?.storeId,
+    ...bindings,
+    ...fields,
+  }
+  let line: string
+  try {
+    line = JSON.stringify(entry, replacer) + '\n'
+  } catch {
+    // 순환 참조 등: 메시지만이라도 남긴다
+    line = JSON.stringify({ time: entry.time, level, msg, requestId: entry.requestId }) + '\n'
+  }
+
+  buffer.push(line)
+  bufferBytes += line.length
+  linesTotal.inc({ level })
+  if (!scheduled) {
+    scheduled = true
+    setImmediate(flush)
+  }
+}
+
+export interface Logger {
+  debug(msg: string, fields?: LogFields): void
+  info(msg: string, fields?: LogFields): void
+  warn(msg: string, fields?: LogFields): void
+  error(msg: string, fields?: LogFields): void
+  // 모듈 이름 등 고정 필드를 붙인 로거
+  child(bindings: LogFields): Logger
+}
+
+const createLogger = (bindings: LogFields = {}): Logger => ({
+  debug: (msg, fields) => write('debug', msg, fields, bindings),
+  info: (msg, fields) => write('info', msg, fields, bindings),
+  warn: (msg, fields) => write('warn', msg, fields, bindings),
+  error: (msg, fields) => write('error', msg, fields, bindings),
+  child: (more) => createLogger({ ...bindings, ...more }),
+})
+
+export const logger = createLogger()
+
+// 종료 전 호출: 버퍼와 스트림에 남은 로그를 모두 내보낸 뒤 resolve
+export const flushLogs = () =>
+  new Promise<void>((resolve) => {
+    flush()
+    if (sink === 'stream') out.write('', () => resolve())
+    else if (sink === 'stdout') process.stdout.write('', () => resolve())
+    else resolve()
+  })
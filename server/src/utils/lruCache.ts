@@ -0,0 +1,99 @@
+// TTL + 크기 제한이 있는 LRU 캐시
+// Map 의 삽입 순서를 이용해 가장 오래 사용되지 않은 항목부터 제거한다.
+
+interface Entry<V> {
+  value: V
+  size: number
+  expiresAt: number
+}
+
+export interface LruCacheOptions<V> {
+  maxEntries: number
+  maxSize?: number // sizeOf 합계 상한 (예: 바이트)
+  ttl: number // ms
+  sizeOf?: (value: V) => number
+  onEvict?: (key: string, value: V) => void
+}
+
+export class LruCache<V> {
+  private map = new Map<string, Entry<V>>()
+  private totalSize = 0
+
+  constructor(private options: LruCacheOptions<V>) {}
+
+  get size() {
+    return this.map.size
+  }
+
+  get bytes() {
+    return this.totalSize
+  }
+
+  get(key: string): V | undefined {
+    const entry = this.map.get(key)
+    if (!entry) return undefined
+
+    if (entry.expiresAt <= Date.now()) {
+      this.remove(key, entry)
+      return undefined
+    }
+
+    // 최근 사용으로 갱신
+    this.map.delete(key)
+    this.map.set(key, entry)
+    return entry.value
+  }
+
+  set(key: string, value: V, ttl = this.options.ttl) {
+    const existing = this.map.get(key)
+    if (existing) this.remove(key, existing)
+
+    const size = this.options.sizeOf ? this.options.sizeOf(value) : 1
+    // 단일 항목이 상한보다 크면 저장하지 않는다
+    if (this.options.maxSize && size > this.options.maxSize) return
+
+    this.map.set(key, { value, size, expiresAt: Date.now() + ttl })
+    this.totalSize += size
+    this.evict()
+  }
+
+  delete(key: string) {
+    const entry = this.map.get(key)
+    if (entry) this.remove(key, entry)
+  }
+
+  // 조건에 맞는 항목 일괄 삭제 (태그 무효화 등)
+  deleteWhere(predicate: (value: V, key: string) => boolean) {
+    let removed = 0
+    for (const [key, entry] of this.map) {
+      if (predicate(entry.value, key)) {
+        this.remove(key, entry)
+        removed++
+      }
+    }
+    return removed
+  }
+
+  clear() {
+    this.map.clear()
+    this.totalSize = 0
+  }
+
+  private remove(key: string, entry: Entry<V>) {
+    this.map.delete(key)
+    this.totalSize -= entry.size
+  }
+
+  private evict() {
+    const { maxEntries, maxSize, onEvict } = this.options
+    while (
+      this.map.size > maxEntries ||
+      (maxSize !== undefined && this.totalSize > maxSize)
+    ) {
+      const oldestKey = this.map.keys().next().value as string
+      const oldest = this.map.get(oldestKey)!
+      this.remove(oldestKey, oldest)
+      onEvict?.(oldestKey, oldest.value)
+    }
+  }
+}
@@ -0,0 +1,69 @@
+import cluster, { Worker } from 'cluster'
+import { logger } from './logger'
+
+// 🔹 워커 간 메시지 버스
+// 워커가 publish 하면 IPC 로 primary 에 보내고, primary 가 나머지 워커에 중계한다.
+// 단일 프로세스 모드(IPC 채널 없음)에서는 로컬 핸들러만 호출된다.
+// 용도: 프로세스 메모리 캐시(응답 캐시, 토큰 캐시 등) 무효화 전파
+
+type Handler = (payload: any) => void
+
+interface BusMessage {
+  __bus: true
+  topic: string
+  payload: unknown
+}
+
+const handlers = new Map<string, Set<Handler>>()
+
+const isBusMessage = (msg: unknown): msg is BusMessage =>
+  typeof msg === 'object' && msg !== null && (msg as BusMessage).__bus === true
+
+const deliver = (topic: string, payload: unknown) => {
+  for (const handler of handlers.get(topic) ?? []) {
+    try {
+      handler(payload)
+    } catch (err) {
+      logger.error('messageBus handler error', { topic, err })
+    }
+  }
+}
+
+export const subscribe = (topic: string, handler: Handler) => {
+  if (!handlers.has(topic)) handlers.set(topic, new Set())
+  handlers.get(topic)!.add(handler)
+  return () => handlers.get(topic)?.delete(handler)
+}
+
+// 다른 워커에만 전달 (호출한 프로세스는 이미 로컬에서 처리했다고 가정)
+export const broadcast = (topic: string, payload: unknown) => {
+  if (process.send && process.connected) {
+    const msg: BusMessage = { __bus: true, topic, payload }
+    process.send(msg)
+  }
+}
+
+// 로컬 핸들러 호출 + 다른 워커로 전파
+export const publish = (topic: string, payload: unknown) => {
+  deliver(topic, payload)
+  broadcast(topic, payload)
+}
+
+// 워커: primary 가 중계한 메시지 수신
+if (cluster.isWorker) {
+  process.on('message', (msg) => {
+    if (isBusMessage(msg)) deliver(msg.topic, msg.payload)
+  })
+}
+
+// primary: 보낸 워커를 제외한 모든 워커에 중계
+export const relayWorkerMessages = (worker: Worker) => {
+  worker.on('message', (msg) => {
+    if (!isBusMessage(msg)) return
+    for (const other of Object.values(cluster.workers ?? {})) {
+      if (other && other.id !== worker.id && other.isConnected()) {
+        other.send(msg)
+      }
+    }
+  })
+}
@@ -0,0 +1,178 @@
+// Prometheus 텍스트 포맷 메트릭 레지스트리 (외부 의존성 없이 최소 구현)
+
+type Labels = Record<string, string | number>
+
+const labelKey = (labels: Labels = {}) =>
+  Object.keys(labels)
+    .sort()
+    .map((k) => `${k}="${String(labels[k]).replace(/["\\]/g, '\\$&').replace(/\n/g, '\\n')}"`)
+    .join(',')
+
+const formatLine = (name: string, key: string, value: number) =>
+  `${name}${key ? `{${key}}` : ''} ${value}`
+
+// 모든 시계열에 붙는 공통 라벨 (클러스터 수집 시 worker)
+const withBase = (base: string, key: string) => [base, key].filter(Boolean).join(',')
+
+interface Metric {
+  name: string
+  help: string
+  type: 'counter' | 'gauge' | 'histogram'
+  render(base: string): string[]
+}
+
+export class Counter implements Metric {
+  readonly type = 'counter' as const
+  private values = new Map<string, number>()
+
+  constructor(readonly name: string, readonly help: string) {}
+
+  inc(labels?: Labels, value = 1) {
+    const key = labelKey(labels)
+    this.values.set(key, (this.values.get(key) ?? 0) + value)
+  }
+
+  get(labels?: Labels) {
+    return this.values.get(labelKey(labels)) ?? 0
+  }
+
+  render(base: string) {
+    return [...this.values].map(([key, v]) => formatLine(this.name, withBase(base, key), v))
+  }
+}
+
+export class Gauge implements Metric {
+  readonly type = 'gauge' as const
+  private values = new Map<string, number>()
+
+  // collect: 렌더링 직전에 현재 값을 채워 넣는 콜백
+  constructor(
+    readonly name: string,
+    readonly help: string,
+    private collect?: (gauge: Gauge) => void
+  ) {}
+
+  set(labels: Labels | undefined, value: number) {
+    this.values.set(labelKey(labels), value)
+  }
+
+  inc(labels?: Labels, value = 1) {
+    const key = labelKey(labels)
+    this.values.set(key, (this.values.get(key) ?? 0) + value)
+  }
+
+  dec(labels?: Labels, value = 1) {
+    this.inc(labels, -value)
+  }
+
+  render(base: string) {
+    this.collect?.(this)
+    return [...this.values].map(([key, v]) => formatLine(this.name, withBase(base, key), v))
+  }
+}
+
+export class Histogram implements Metric {
+  readonly type = 'histogram' as const
+  private series = new Map<
+    string,
+    { labels: Labels; counts: number[]; sum: number; count: number }
+  >()
+
+  constructor(
+    readonly name: string,
+    readonly help: string,
+    private buckets: number[]
+  ) {}
+
+  observe(labels: Labels | undefined, value: number) {
+    const key = labelKey(labels)
+    let s = this.series.get(key)
+    if (!s) {
+      s = {
+        labels: labels ?? {},
+        counts: new Array(this.buckets.length).fill(0),
+        sum: 0,
+        count: 0,
+      }
+      this.series.set(key, s)
+    }
+    // 누적 버킷은 렌더링 시 계산
+    const idx = this.buckets.findIndex((b) => value <= b)
+    if (idx !== -1) s.counts[idx]++
+    s.sum += value
+    s.count++
+  }
+
+  render(base: string) {
+    const lines: string[] = []
+    for (const [key, s] of this.series) {
+      let cumulative = 0
+      this.buckets.forEach((b, i) => {
+        cumulative += s.counts[i]
+        const le = labelKey({ ...s.labels, le: b })
+        lines.push(formatLine(`${this.name}_bucket`, withBase(base, le), cumulative))
+      })
+      const inf = labelKey({ ...s.labels, le: '+Inf' })
+      lines.push(formatLine(`${this.name}_bucket`, withBase(base, inf), s.count))
+      lines.push(formatLine(`${this.name}_sum`, withBase(base, key), s.sum))
+      lines.push(formatLine(`${this.name}_count`, withBase(base, key), s.count))
+    }
+    return lines
+  }
+}
+
+const metrics = new Map<string, Metric>()
+
+const register = <T extends Metric>(metric: T): T => {
+  const existing = metrics.get(metric.name)
+  if (existing) return existing as T
+  metrics.set(metric.name, metric)
+  return metric
+}
+
+export const counter = (name: string, help: string) =>
+  register(new Counter(name, help))
+
+export const gauge = (
+  name: string,
+  help: string,
+  collect?: (gauge: Gauge) => void
+) => register(new Gauge(name, help, collect))
+
+export const histogram = (name: string, help: string, buckets: number[]) =>
+  register(new Histogram(name, help, buckets))
+
+// 메트릭 하나의 렌더링 결과 (클러스터 모드에서 워커 → primary 로 전달)
+export interface MetricFamily {
+  name: string
+  help: string
+  type: Metric['type']
+  lines: string[]
+}
+
+export const collectMetrics = (labels?: Labels): MetricFamily[] => {
+  const base = labelKey(labels)
+  return [...metrics.values()].map((m) => ({
+    name: m.name,
+    help: m.help,
+    type: m.type,
+    lines: m.render(base),
+  }))
+}
+
+// 같은 이름의 메트릭은 HELP/TYPE 한 번 아래에 모은다 (텍스트 포맷 요구사항)
+export const formatMetrics = (families: MetricFamily[]) => {
+  const merged = new Map<string, MetricFamily>()
+  for (const f of families) {
+    const existing = merged.get(f.name)
+    if (existing) existing.lines.push(...f.lines)
+    else merged.set(f.name, { ...f, lines: [...f.lines] })
+  }
+  return (
+    [...merged.values()]
+      .flatMap((m) => [`# HELP ${m.name} ${m.help}`, `# TYPE ${m.name} ${m.type}`, ...m.lines])
+      .join('\n') + '\n'
+  )
+}
+
+export const renderMetrics = () => formatMetrics(collectMetrics())
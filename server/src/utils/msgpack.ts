@@ -0,0 +1,292 @@
+import type { Request } from 'express'
+import type { SerializerSchema } from './serializer'
+
+// 🔹 MessagePack 인코딩 (외부 의존성 없이 필요한 만큼만 구현)
+// 대용량 목록 응답을 Accept: application/msgpack 로 요청한 클라이언트에 보낸다.
+// compileSerializer 와 같은 스키마로 인코더를 만들고, JSON 과 같은 모양으로 복원되도록
+// - id  : ext 1 (ObjectId 12바이트) → 클라이언트에서 24자리 16진수 문자열
+// - date: timestamp ext(-1)        → 클라이언트에서 ISO 문자열
+// 로 보낸다 (src/lib/msgpack.ts 가 같은 규칙으로 디코딩).
+
+export const MSGPACK_TYPE = 'application/msgpack'
+export const EXT_OBJECT_ID = 1
+const EXT_TIMESTAMP = -1
+
+// JSON 보다 msgpack 을 명시적으로 선호하는 요청만 (브라우저 기본 Accept 는 JSON)
+export const wantsMsgpack = (req: Request) =>
+  req.accepts(['application/json', MSGPACK_TYPE]) === MSGPACK_TYPE
+
+class Writer {
+  private buf: Buffer
+  private pos = 0
+
+  constructor(size = 64 * 1024) {
+    this.buf = Buffer.allocUnsafe(size)
+  }
+
+  private ensure(n: number) {
+    if (this.pos + n <= this.buf.length) return
+    const next = Buffer.allocUnsafe(Math.max(this.buf.length * 2, this.pos + n))
+    this.buf.copy(next, 0, 0, this.pos)
+    this.buf = next
+  }
+
+  // 타입 바이트 + 부호 없는 정수 (크기 1/2/4)
+  private head(type: number, size: 0 | 1 | 2 | 4, value = 0) {
+    this.ensure(1 + size)
+    this.buf[this.pos++] = type
+    if (size === 1) this.buf[this.pos++] = value
+    else if (size === 2) this.pos = this.buf.writeUInt16BE(value, this.pos)
+    else if (size === 4) this.pos = this.buf.writeUInt32BE(value >>> 0, this.pos)
+  }
+
+  bytes(b: Buffer) {
+    this.ensure(b.length)
+    b.copy(this.buf, this.pos)
+    this.pos += b.length
+  }
+
+  nil() {
+    this.head(0xc0, 0)
+  }
+
+  bool(v: boolean) {
+    this.head(v ? 0xc3 : 0xc2, 0)
+  }
+
+  num(v: number) {
+    if (Number.isInteger(v) && v >= 0 && v <= 0xffffffff) {
+      if (v < 0x80) this.head(v, 0)
+      else if (v <= 0xff) this.head(0xcc, 1, v)
+      else if (v <= 0xffff) this.head(0xcd, 2, v)
+      else this.head(0xce, 4, v)
+    } else if (Number.isInteger(v) && v < 0 && v >= -0x80000000) {
+      if (v >= -32) this.head(v & 0xff, 0)
+      else if (v >= -0x80) this.head(0xd0, 1, v & 0xff)
+      else if (v >= -0x8000) this.head(0xd1, 2, v & 0xffff)
+      else this.head(0xd2, 4, v)
+    } else {
+      this.ensure(9)
+      this.buf[this.pos++] = 0xcb
+      this.pos = this.buf.writeDoubleBE(v, this.pos)
+    }
+  }
+
+  str(v: string) {
+    const len = Buffer.byteLength(v)
+    if (len < 32) this.head(0xa0 | len, 0)
+    else if (len <= 0xff) this.head(0xd9, 1, len)
+    else if (len <= 0xffff) this.head(0xda, 2, len)
+    else this.head(0xdb, 4, len)
+    this.ensure(len)
+    this.pos += this.buf.write(v, this.pos, len, 'utf8')
+  }
+
+  arrayHeader(n: number) {
+    if (n < 16) this.head(0x90 | n, 0)
+    else if (n <= 0xffff) this.head(0xdc, 2, n)
+    else this.head(0xdd, 4, n)
+  }
+
+  mapHeader(n: number) {
+    if (n < 16) this.head(0x80 | n, 0)
+    else if (n <= 0xffff) this.head(0xde, 2, n)
+    else this.head(0xdf, 4, n)
+  }
+
+  // timestamp 64: 상위 30비트 나노초 + 하위 34비트 초
+  date(d: Date) {
+    const ms = d.getTime()
+    const sec = Math.floor(ms / 1000)
+    const nsec = (ms - sec * 1000) * 1_000_000
+    if (sec < 0 || sec >= 2 ** 34) return this.str(d.toISOString())
+    this.head(0xd7, 1, EXT_TIMESTAMP & 0xff)
+    this.ensure(8)
+    this.pos = this.buf.writeUInt32BE(((nsec << 2) | Math.floor(sec / 2 ** 32)) >>> 0, this.pos)
+    this.pos = this.buf.writeUInt32BE(sec >>> 0, this.pos)
+  }
+
+  objectId(hex: string) {
+    this.head(0xc7, 1, 12)
+    this.head(EXT_OBJECT_ID, 0)
+    this.bytes(Buffer.from(hex, 'hex'))
+  }
+
+  any(v: unknown): void {
+    if (v == null) return this.nil()
+    switch (typeof v) {
+      case 'boolean':
+        return this.bool(v)
+      case 'number':
+        return Number.isFinite(v) ? this.num(v) : this.nil()
+      case 'string':
+        return this.str(v)
+    }
+    if (v instanceof Date) return isNaN(v.getTime()) ? this.nil() : this.date(v)
+    if (Array.isArray(v)) {
+      this.arrayHeader(v.length)
+      for (const item of v) this.any(item)
+      return
+    }
+    // ObjectId 등 toJSON 을 가진 값은 JSON 과 같은 값으로
+    const json = (v as { toJSON?: () => unknown }).toJSON
+    if (typeof json === 'function') return this.any(json.call(v))
+    const entries = Object.entries(v as object).filter(([, x]) => x !== undefined)
+    this.mapHeader(entries.length)
+    for (const [k, x] of entries) {
+      this.str(k)
+      this.any(x)
+    }
+  }
+
+  // 작은 결과가 큰 버퍼를 붙잡고 있지 않도록 복사
+  finish() {
+    const out = this.buf.subarray(0, this.pos)
+    return this.pos < this.buf.length / 2 ? Buffer.from(out) : out
+  }
+}
+
+type Encode = (w: Writer, v: any) => void
+
+const OBJECT_ID_HEX = /^[0-9a-f]{24}$/i
+
+const scalar: Record<string, Encode> = {
+  string: (w, v) => (v == null ? w.nil() : w.str(String(v))),
+  number: (w, v) => (typeof v === 'number' && Number.isFinite(v) ? w.num(v) : w.nil()),
+  boolean: (w, v) => (v == null ? w.nil() : w.bool(!!v)),
+  date: (w, v) => {
+    if (v == null) return w.nil()
+    const d = v instanceof Date ? v : new Date(v)
+    return isNaN(d.getTime()) ? w.nil() : w.date(d)
+  },
+  id: (w, v) => {
+    if (v == null) return w.nil()
+    const hex = String(v)
+    return OBJECT_ID_HEX.test(hex) ? w.objectId(hex) : w.str(hex)
+  },
+  any: (w, v) => w.any(v),
+}
+
+// 스키마 → 인코더 (키 문자열은 미리 인코딩해 둔다)
+const build = (node: SerializerSchema): Encode => {
+  if (typeof node === 'string') return scalar[node]
+
+  if (node.type === 'array') {
+    const item = build(node.items)
+    return (w, a) => {
+      if (!Array.isArray(a)) return w.nil()
+      w.arrayHeader(a.length)
+      for (let i = 0; i < a.length; i++) item(w, a[i])
+    }
+  }
+
+  const props = Object.entries(node.properties).map(([key, child]) => {
+    const kw = new Writer(64)
+    kw.str(key)
+    return { key, header: Buffer.from(kw.finish()), encode: build(child) }
+  })
+  return (w, o) => {
+    if (o == null) return w.nil()
+    let n = 0
+    for (const p of props) if (o[p.key] !== undefined) n++
+    w.mapHeader(n)
+    for (const p of props) {
+      const v = o[p.key]
+      if (v === undefined) continue
+      w.bytes(p.header)
+      p.encode(w, v)
+    }
+  }
+}
+
+export const compileMsgpack = <T = unknown>(schema: SerializerSchema) => {
+  const encode = build(schema)
+  return (value: T) => {
+    const w = new Writer()
+    encode(w, value)
+    return w.finish()
+  }
+}
+
+export const encodeMsgpack = (value: unknown) => {
+  const w = new Writer()
+  w.any(value)
+  return w.finish()
+}
+
+// 🔹 디코더 (벤치/검증용, 브라우저 쪽은 src/lib/msgpack.ts)
+export const decodeMsgpack = (input: Uint8Array): unknown => {
+  const view = new DataView(input.buffer, input.byteOffset, input.byteLength)
+  const text = new TextDecoder()
+  let pos = 0
+
+  const u8 = () => input[pos++]
+  const u16 = () => ((pos += 2), view.getUint16(pos - 2))
+  const u32 = () => ((pos += 4), view.getUint32(pos - 4))
+
+  const str = (len: number) => text.decode(input.subarray(pos, (pos += len)))
+  const array = (n: number) => {
+    const a = new Array(n)
+    for (let i = 0; i < n; i++) a[i] = read()
+    return a
+  }
+  const map = (n: number) => {
+    const o: Record<string, unknown> = {}
+    for (let i = 0; i < n; i++) {
+      const k = read() as string
+      o[k] = read()
+    }
+    return o
+  }
+  const ext = (len: number) => {
+    const type = view.getInt8(pos++)
+    const start = pos
+    pos += len
+    if (type === EXT_OBJECT_ID) {
+      return Buffer.from(input.subarray(start, pos)).toString('hex')
+    }
+    if (type === EXT_TIMESTAMP && len === 8) {
+      const hi = view.getUint32(start)
+      const sec = (hi & 0x3) * 2 ** 32 + view.getUint32(start + 4)
+      return new Date(sec * 1000 + Math.floor((hi >>> 2) / 1e6)).toISOString()
+    }
+    if (type === EXT_TIMESTAMP && len === 4) {
+      return new Date(view.getUint32(start) * 1000).toISOString()
+    }
+    return input.subarray(start, pos)
+  }
+
+  const read = (): unknown => {
+    const b = u8()
+    if (b < 0x80) return b
+    if (b < 0x90) return map(b & 0x0f)
+    if (b < 0xa0) return array(b & 0x0f)
+    if (b < 0xc0) return str(b & 0x1f)
+    if (b >= 0xe0) return b - 0x100
+    switch (b) {
+      case 0xc0: return null
+      case 0xc2: return false
+      case 0xc3: return true
+      case 0xcc: return u8()
+      case 0xcd: return u16()
+      case 0xce: return u32()
+      case 0xd0: return view.getInt8(pos++)
+      case 0xd1: return ((pos += 2), view.getInt16(pos - 2))
+      case 0xd2: return ((pos += 4), view.getInt32(pos - 4))
+      case 0xcb: return ((pos += 8), view.getFloat64(pos - 8))
+      case 0xd9: return str(u8())
+      case 0xda: return str(u16())
+      case 0xdb: return str(u32())
+      case 0xdc: return array(u16())
+      case 0xdd: return array(u32())
+      case 0xde: return map(u16())
+      case 0xdf: return map(u32())
+      case 0xd6: return ext(4)
+      case 0xd7: return ext(8)
+      case 0xc7: return ext(u8())
+    }
+    throw new Error(`unsupported msgpack byte 0x${b.toString(16)}`)
+  }
+
+  return read()
+}
@@ -0,0 +1,30 @@
+import crypto from 'crypto'
+
+// 🔹 주문번호: ORD-<발급 시각(ms) base36>-<프로세스 태그><순번>
+// - 같은 ms 에 여러 건이 들어오면 순번으로 구분 (기존 ORD-${Date.now()} 는 동시 결제 시 충돌)
+// - 클러스터 워커/서버 간에는 기동 시 정한 랜덤 태그로 구분 → DB 왕복 없이 충돌 없음
+// - 프로세스 안에서는 단조 증가 (시계가 뒤로 가도 역전되지 않음)
+// time-series 컬렉션은 unique 인덱스를 지원하지 않으므로 발급 단계에서 유일성을 보장한다.
+
+const PROCESS_TAG = (crypto.randomBytes(4).readUInt32BE() % 36 ** 6)
+  .toString(36)
+  .padStart(6, '0')
+  .toUpperCase()
+const SEQ_MAX = 36 ** 3
+
+let lastMs = 0
+let seq = 0
+
+export const nextOrderNumber = (now = Date.now()) => {
+  if (now > lastMs) {
+    lastMs = now
+    seq = 0
+  } else if (++seq >= SEQ_MAX) {
+    // 1ms 에 46,656건을 넘으면 다음 ms 를 미리 사용
+    lastMs += 1
+    seq = 0
+  }
+  const time = lastMs.toString(36).toUpperCase()
+  const counter = seq.toString(36).toUpperCase().padStart(3, '0')
+  return `ORD-${time}-${PROCESS_TAG}${counter}`
+}
@@ -0,0 +1,142 @@
+import os from 'os'
+import path from 'path'
+import { Worker } from 'worker_threads'
+import { counter, gauge, histogram } from './metrics'
+import type { PasswordTask } from './passwordWorker'
+
+// 🔹 bcrypt 해시/검증을 worker_threads 풀에서 실행
+// bcryptjs 는 순수 JS 라 메인 스레드에서 돌리면 한 번에 수십 ms 동안 이벤트 루프가 멈춘다.
+// 대기열이 가득 차면 PasswordPoolBusyError 로 즉시 거절 → 컨트롤러가 503 응답
+
+const POOL_SIZE =
+  Number(process.env.PASSWORD_POOL_SIZE) ||
+  Math.max(1, Math.min(4, os.availableParallelism() - 1))
+const MAX_QUEUE = Number(process.env.PASSWORD_POOL_MAX_QUEUE) || 64
+
+export class PasswordPoolBusyError extends Error {
+  constructor() {
+    super('password pool queue is full')
+    this.name = 'PasswordPoolBusyError'
+  }
+}
+
+type TaskInput =
+  | { op: 'hash'; password: string; rounds: number }
+  | { op: 'compare'; password: string; hash: string }
+
+interface Pending {
+  task: PasswordTask
+  enqueuedAt: number
+  resolve: (value: any) => void
+  reject: (err: Error) => void
+}
+
+interface PoolWorker {
+  worker: Worker
+  current: Pending | null
+}
+
+const taskDuration = histogram(
+  'password_pool_task_seconds',
+  'bcrypt task time including queue wait',
+  [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5]
+)
+const rejected = counter(
+  'password_pool_rejected_total',
+  'Tasks rejected because the queue was full'
+)
+
+const queue: Pending[] = []
+const workers: PoolWorker[] = []
+let nextId = 1
+
+gauge('password_pool_queue_depth', 'Tasks waiting for a worker', (g) =>
+  g.set(undefined, queue.length)
+)
+gauge('password_pool_busy_workers', 'Workers running a task', (g) =>
+  g.set(undefined, workers.filter((w) => w.current).length)
+)
+
+// ts-node 실행 시 워커도 TS 로 로드
+const workerFile = path.join(__dirname, `passwordWorker${path.extname(__filename)}`)
+const workerOptions =
+  path.extname(__filename) === '.ts'
+    ? { execArgv: ['--require', 'ts-node/register/transpile-only'] }
+    : {}
+
+// 작업 중인 워커만 ref: 대기 작업이 없으면 프로세스 종료를 막지 않는다
+const dispatch = (pw: PoolWorker) => {
+  const next = queue.shift()
+  if (!next) {
+    pw.worker.unref()
+    return
+  }
+  pw.current = next
+  pw.worker.ref()
+  pw.worker.postMessage(next.task)
+}
+
+const spawn = (): PoolWorker => {
+  const pw: PoolWorker = { worker: new Worker(workerFile, workerOptions), current: null }
+  pw.worker.unref()
+
+  pw.worker.on('message', (msg: { id: number; result?: unknown; error?: string }) => {
+    const done = pw.current
+    pw.current = null
+    if (done && done.task.id === msg.id) {
+      taskDuration.observe(undefined, (performance.now() - done.enqueuedAt) / 1000)
+      if (msg.error) done.reject(new Error(msg.error))
+      else done.resolve(msg.result)
+    }
+    dispatch(pw)
+  })
+
+  // 워커가 죽으면 진행 중 작업은 실패 처리하고 새 워커로 교체
+  pw.worker.on('error', (err) => {
+    pw.current?.reject(err)
+    pw.current = null
+  })
+  pw.worker.on('exit', () => {
+    const idx = workers.indexOf(pw)
+    if (idx === -1) return
+    const replacement = spawn()
+    workers[idx] = replacement
+    dispatch(replacement)
+  })
+
+  return pw
+}
+
+const run = <T>(input: TaskInput): Promise<T> => {
+  if (workers.length === 0) {
+    for (let i = 0; i < POOL_SIZE; i++) workers.push(spawn())
+  }
+
+  const idle = workers.find((w) => !w.current)
+  if (!idle && queue.length >= MAX_QUEUE) {
+    rejected.inc()
+    return Promise.reject(new PasswordPoolBusyError())
+  }
+
+  return new Promise<T>((resolve, reject) => {
+    queue.push({
+      task: { id: nextId++, ...input } as PasswordTask,
+      enqueuedAt: performance.now(),
+      resolve,
+      reject,
+    })
+    if (idle) dispatch(idle)
+  })
+}
+
+export const hashPassword = (password: string, rounds = 10) =>
+  run<string>({ op: 'hash', password, rounds })
+
+export const comparePassword = (password: string, hash: string) =>
+  run<boolean>({ op: 'compare', password, hash })
+
+// 테스트/벤치 종료 시 정리
+export const closePasswordPool = async () => {
+  const closing = workers.splice(0)
+  await Promise.all(closing.map((w) => w.worker.terminate()))
+}
@@ -0,0 +1,19 @@
+// passwordPool 의 worker_threads 작업자: bcrypt 연산만 수행
+import { parentPort } from 'worker_threads'
+import bcrypt from 'bcryptjs'
+
+export type PasswordTask =
+  | { id: number; op: 'hash'; password: string; rounds: number }
+  | { id: number; op: 'compare'; password: string; hash: string }
+
+parentPort!.on('message', async (task: PasswordTask) => {
+  try {
+    const result =
+      task.op === 'hash'
+        ? await bcrypt.hash(task.password, task.rounds)
+        : await bcrypt.compare(task.password, task.hash)
+    parentPort!.postMessage({ id: task.id, result })
+  } catch (err) {
+    parentPort!.postMessage({ id: task.id, error: (err as Error).message })
+  }
+})
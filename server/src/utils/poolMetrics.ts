@@ -0,0 +1,115 @@
+import mongoose from 'mongoose'
+import { counter, gauge, histogram } from './metrics'
+
+// 🔹 MongoDB 커넥션 풀(CMAP 이벤트) 계측
+// in_use 가 max_size 에 가까워지고 wait_queue 가 쌓이기 시작하면 곧 지연시간이 튄다
+
+interface PoolState {
+  maxSize: number
+  open: number
+  inUse: number
+  waiting: number
+}
+
+const pools = new Map<string, PoolState>()
+let defaultMaxSize = 0
+
+const poolOf = (address: string) => {
+  let pool = pools.get(address)
+  if (!pool) {
+    pool = { maxSize: defaultMaxSize, open: 0, inUse: 0, waiting: 0 }
+    pools.set(address, pool)
+  }
+  return pool
+}
+
+gauge('mongo_pool_connections', 'Pool connections by state', (g) => {
+  for (const [address, p] of pools) {
+    g.set({ address, state: 'open' }, p.open)
+    g.set({ address, state: 'in_use' }, p.inUse)
+  }
+})
+gauge('mongo_pool_max_size', 'Configured maxPoolSize', (g) => {
+  for (const [address, p] of pools) g.set({ address }, p.maxSize)
+})
+gauge('mongo_pool_utilization', 'Checked-out connections / maxPoolSize', (g) => {
+  for (const [address, p] of pools) {
+    g.set({ address }, p.maxSize > 0 ? p.inUse / p.maxSize : 0)
+  }
+})
+gauge('mongo_pool_wait_queue', 'Operations waiting for a connection', (g) => {
+  for (const [address, p] of pools) g.set({ address }, p.waiting)
+})
+
+const checkoutWait = histogram(
+  'mongo_pool_checkout_seconds',
+  'Time spent waiting to check out a connection',
+  [0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5]
+)
+const checkoutFailures = counter(
+  'mongo_pool_checkout_failures_total',
+  'Connection check-outs that failed (timeout, pool closed ...)'
+)
+
+// 드라이버 내부의 서버별 풀 (공개 타입이 없어 필요한 값만)
+interface TopologyPool {
+  address: string
+  options?: { maxPoolSize?: number }
+  totalConnectionCount?: number
+  currentCheckedOutCount?: number
+  waitQueueSize?: number
+}
+
+// connect() 가 끝난 뒤에 붙이면 그동안 만들어진 풀/연결(minPoolSize 만큼의 초기 연결 등) 이벤트는 놓친다.
+// 붙이는 시점에 토폴로지의 현재 풀 상태로 채워 두고 이후 변화는 이벤트로 따라간다
+const seedFromTopology = (client: mongoose.mongo.MongoClient) => {
+  const servers: Map<string, { pool?: TopologyPool }> | undefined = (client as any).topology?.s
+    ?.servers
+  for (const { pool } of servers?.values() ?? []) {
+    if (!pool?.address) continue
+    const p = poolOf(pool.address)
+    p.maxSize = pool.options?.maxPoolSize ?? p.maxSize
+    p.open = pool.totalConnectionCount ?? p.open
+    p.inUse = pool.currentCheckedOutCount ?? p.inUse
+    p.waiting = pool.waitQueueSize ?? p.waiting
+  }
+}
+
+// 연결 직후 호출: 이미 만들어진 풀은 토폴로지에서, 없으면 클라이언트 설정값으로 maxSize 를 채운다
+export const instrumentPool = (client: mongoose.mongo.MongoClient) => {
+  defaultMaxSize = client.options.maxPoolSize
+  seedFromTopology(client)
+  for (const p of pools.values()) p.maxSize ||= defaultMaxSize
+
+  client.on('connectionPoolCreated', (e) => {
+    poolOf(e.address).maxSize = e.options?.maxPoolSize ?? 0
+  })
+  client.on('connectionPoolCleared', (e) => {
+    const p = poolOf(e.address)
+    p.open = 0
+    p.inUse = 0
+  })
+  client.on('connectionCreated', (e) => poolOf(e.address).open++)
+  client.on('connectionClosed', (e) => {
+    const p = poolOf(e.address)
+    p.open = Math.max(0, p.open - 1)
+  })
+  client.on('connectionCheckOutStarted', (e) => poolOf(e.address).waiting++)
+  client.on('connectionCheckedOut', (e) => {
+    const p = poolOf(e.address)
+    p.waiting = Math.max(0, p.waiting - 1)
+    p.inUse++
+    if (e.durationMS !== undefined) {
+      checkoutWait.observe(undefined, e.durationMS / 1000)
+    }
+  })
+  client.on('connectionCheckOutFailed', (e) => {
+    const p = poolOf(e.address)
+    p.waiting = Math.max(0, p.waiting - 1)
+    checkoutFailures.inc({ reason: String(e.reason) })
+  })
+  client.on('connectionCheckedIn', (e) => {
+    const p = poolOf(e.address)
+    p.inUse = Math.max(0, p.inUse - 1)
+  })
+}
@@ -0,0 +1,97 @@
+import mongoose, { Schema } from 'mongoose'
+import { histogram } from './metrics'
+import { currentContext } from './requestContext'
+
+// 🔹 Mongoose 전역 플러그인: 모델/연산별 쿼리 시간 측정 + 요청당 쿼리 수 집계
+// 모델이 컴파일되기 전에 import 되어야 한다 (app.ts 최상단)
+
+const queryDuration = histogram(
+  'mongo_query_duration_seconds',
+  'Mongo query latency by model and operation',
+  [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5]
+)
+
+const QUERY_OPS = [
+  'find',
+  'findOne',
+  'countDocuments',
+  'estimatedDocumentCount',
+  'distinct',
+  'findOneAndUpdate',
+  'findOneAndDelete',
+  'findOneAndReplace',
+  'updateOne',
+  'updateMany',
+  'replaceOne',
+  'deleteOne',
+  'deleteMany',
+]
+
+// 실패한 쿼리는 post 훅이 호출되지 않으므로 WeakMap 으로 GC 에 맡긴다
+const startedAt = new WeakMap<object, number>()
+
+const start = (target: object) => {
+  startedAt.set(target, performance.now())
+}
+
+const finish = (target: object, model: string, op: string) => {
+  const began = startedAt.get(target)
+  if (began === undefined) return
+  startedAt.delete(target)
+
+  const ms = performance.now() - began
+  queryDuration.observe({ model, op }, ms / 1000)
+
+  const ctx = currentContext()
+  if (ctx) {
+    ctx.queryCount++
+    ctx.queryTime += ms
+  }
+}
+
+const queryModel = (q: any) => q.model?.modelName ?? 'unknown'
+const aggregateModel = (a: any) => a.model?.()?.modelName ?? 'unknown'
+const docModel = (d: any) => d.constructor?.modelName ?? 'unknown'
+
+const queryMetricsPlugin = (schema: Schema) => {
+  schema.pre(QUERY_OPS as any, function (this: any) {
+    start(this)
+  })
+  schema.post(QUERY_OPS as any, function (this: any) {
+    finish(this, queryModel(this), this.op)
+  })
+
+  schema.pre('aggregate', function (this: any) {
+    start(this)
+  })
+  schema.post('aggregate', function (this: any) {
+    finish(this, aggregateModel(this), 'aggregate')
+  })
+
+  schema.pre('save', function (this: any) {
+    start(this)
+  })
+  schema.post('save', function (this: any) {
+    finish(this, docModel(this), 'save')
+  })
+}
+
+mongoose.plugin(queryMetricsPlugin)
+
+// insertMany/bulkWrite 훅의 this 는 모델 자체라 동시 호출끼리 시작 시각이 섞인다
+// → 모델 정적 메서드를 감싸 호출마다 타이머를 따로 둔다
+const Model = mongoose.Model as any
+
+const timeModelCall = (op: 'insertMany' | 'bulkWrite') => {
+  const original = Model[op]
+  Model[op] = async function (this: any, ...args: unknown[]) {
+    const call = {}
+    start(call)
+    const result = await original.apply(this, args)
+    finish(call, this.modelName ?? 'unknown', op)
+    return result
+  }
+}
+
+timeModelCall('insertMany')
+timeModelCall('bulkWrite')
@@ -0,0 +1,25 @@
+// 재현 가능한 난수 (mulberry32) — 벤치 시드/데이터셋 생성 공용
+export const createRandom = (seed = 42) => {
+  let a = seed >>> 0
+  const next = () => {
+    a = (a + 0x6d2b79f5) >>> 0
+    let t = a
+    t = Math.imul(t ^ (t >>> 15), t | 1)
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61)
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296
+  }
+  return {
+    next,
+    int: (min: number, max: number) => min + Math.floor(next() * (max - min + 1)),
+    pick: <T>(items: T[]) => items[Math.floor(next() * items.length)],
+    // weights 누적합 배열에서 인덱스 추출
+    weighted: (cumulative: number[]) => {
+      const r = next() * cumulative[cumulative.length - 1]
+      let i = 0
+      while (cumulative[i] <= r) i++
+      return i
+    },
+  }
+}
+
+export type Random = ReturnType<typeof createRandom>
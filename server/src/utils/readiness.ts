@@ -0,0 +1,27 @@
+// 🔹 준비 상태 (/readyz): Mongo 연결 + 인덱스 동기화가 끝나야 트래픽을 받는다
+// 종료(drain) 중에는 다시 not-ready 로 바꿔 로드밸런서가 새 요청을 보내지 않게 한다
+
+type IndexState = 'pending' | 'synced' | 'failed'
+
+const state = {
+  mongo: false,
+  indexes: 'pending' as IndexState,
+  draining: false,
+}
+
+export const setMongoConnected = (connected: boolean) => {
+  state.mongo = connected
+}
+
+export const setIndexState = (indexes: IndexState) => {
+  state.indexes = indexes
+}
+
+export const setDraining = () => {
+  state.draining = true
+}
+
+export const isReady = () =>
+  state.mongo && state.indexes === 'synced' && !state.draining
+
+export const readinessReport = () => ({ ready: isReady(), ...state })
@@ -0,0 +1,14 @@
+import { AsyncLocalStorage } from 'async_hooks'
+
+// 요청 단위 컨텍스트 (비동기 호출 체인 전체에서 조회 가능)
+export interface RequestContext {
+  queryCount: number
+  queryTime: number // ms
+  storeId?: string // 요청 대상 매장 (middleware/tenant)
+  requestId?: string // 로그 상관관계 (middleware/requestId)
+  logSampled?: boolean // false 면 이 요청의 debug/info 로그 생략
+}
+
+export const requestContext = new AsyncLocalStorage<RequestContext>()
+
+export const currentContext = () => requestContext.getStore()
@@ -0,0 +1,111 @@
+import { Request, Response } from 'express'
+import { compileMsgpack, MSGPACK_TYPE, wantsMsgpack } from './msgpack'
+
+// 스키마 기반 JSON 직렬화기
+// 응답 형태를 미리 선언해 두면 필드 순회/타입 판별 없이 문자열을 이어붙이는
+// 전용 함수를 한 번만 생성한다. (fast-json-stringify 방식)
+// 같은 스키마의 MessagePack 인코더도 함께 붙여 둔다 (serializer.msgpack)
+
+export type ScalarType = 'string' | 'number' | 'boolean' | 'date' | 'id' | 'any'
+
+export type SerializerSchema =
+  | ScalarType
+  | { type: 'array'; items: SerializerSchema }
+  | { type: 'object'; properties: Record<string, SerializerSchema> }
+
+const helpers = {
+  str: (v: unknown) => (v == null ? 'null' : JSON.stringify(String(v))),
+  num: (v: unknown) =>
+    typeof v === 'number' && Number.isFinite(v) ? String(v) : 'null',
+  bool: (v: unknown) => (v == null ? 'null' : v ? 'true' : 'false'),
+  date: (v: unknown) => {
+    if (v == null) return 'null'
+    const d = v instanceof Date ? v : new Date(v as string)
+    return isNaN(d.getTime()) ? 'null' : `"${d.toISOString()}"`
+  },
+  // ObjectId 는 16진수 문자열이라 이스케이프가 필요 없다
+  id: (v: unknown) => (v == null ? 'null' : `"${String(v)}"`),
+  any: (v: unknown) => JSON.stringify(v) ?? 'null',
+}
+
+const scalarFns: Record<ScalarType, keyof typeof helpers> = {
+  string: 'str',
+  number: 'num',
+  boolean: 'bool',
+  date: 'date',
+  id: 'id',
+  any: 'any',
+}
+
+export interface CompiledSerializer<T = unknown> {
+  (value: T): string
+  msgpack: (value: T) => Buffer
+}
+
+export const compileSerializer = <T = unknown>(
+  schema: SerializerSchema
+): CompiledSerializer<T> => {
+  const fns: string[] = []
+
+  // 노드마다 함수 이름을 반환 (스칼라는 helpers 함수 재사용)
+  const build = (node: SerializerSchema): string => {
+    if (typeof node === 'string') return `h.${scalarFns[node]}`
+
+    const name = `f${fns.length}`
+    fns.push('') // 자리 확보 (중첩 노드가 뒤 번호를 쓰도록)
+    const idx = fns.length - 1
+
+    if (node.type === 'array') {
+      const item = build(node.items)
+      fns[idx] =
+        `function ${name}(a) {` +
+        `if (!Array.isArray(a)) return 'null';` +
+        `let s = '[';` +
+        `for (let i = 0; i < a.length; i++) { if (i) s += ','; s += ${item}(a[i]) }` +
+        `return s + ']' }`
+      return name
+    }
+
+    const body = Object.entries(node.properties)
+      .map(([key, child]) => {
+        const fn = build(child)
+        const prop = JSON.stringify(key)
+        return (
+          `v = o[${prop}];` +
+          `if (v !== undefined) { s += (c ? ',' : '') + ${JSON.stringify(prop + ':')} + ${fn}(v); c = true }`
+        )
+      })
+      .join('')
+
+    fns[idx] =
+      `function ${name}(o) {` +
+      `if (o == null) return 'null';` +
+      `let s = '{', c = false, v;` +
+      body +
+      `return s + '}' }`
+    return name
+  }
+
+  const root = build(schema)
+  const serialize = new Function('h', `${fns.join('\n')}\nreturn ${root}`)(helpers)
+  return Object.assign(serialize, { msgpack: compileMsgpack<T>(schema) })
+}
+
+// 직렬화된 JSON 문자열을 그대로 전송 (res.json 의 재직렬화 생략)
+export const sendJson = (res: Response, json: string, status = 200) =>
+  res.status(status).type('application/json').send(json)
+
+// Accept 협상: msgpack 을 선호한 클라이언트에는 바이너리, 나머지는 JSON
+export const sendSerialized = <T>(
+  req: Request,
+  res: Response,
+  serializer: CompiledSerializer<T>,
+  value: T,
+  status = 200
+) => {
+  res.vary('Accept')
+  if (wantsMsgpack(req)) {
+    return res.status(status).type(MSGPACK_TYPE).send(serializer.msgpack(value))
+  }
+  return sendJson(res, serializer(value), status)
+}
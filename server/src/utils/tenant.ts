@@ -0,0 +1,76 @@
+import mongoose, { Schema } from 'mongoose'
+import { currentContext, requestContext } from './requestContext'
+
+// 🔹 매장(테넌트) 구분
+// 한 서버/DB 가 여러 지점을 처리한다. 매장 데이터 모델은 storeId 필드를 가지며,
+// 요청 컨텍스트에 매장이 정해져 있으면 이 플러그인이 모든 쿼리/집계에 storeId 조건을 붙인다.
+// 매장 모델은 storeIdField 를 가져오면서 이 모듈을 import 하므로 플러그인이 모델 컴파일 전에 등록된다
+//
+// 조건을 붙이지 않는 경우
+// - 요청 밖(배치/엔진/스크립트): 매장 전체 대상, 문서의 storeId 를 직접 다룬다
+// - 쿼리 옵션 allStores: 로그인처럼 매장을 모르는 상태에서 찾아야 하는 경우
+
+export const DEFAULT_STORE_ID = process.env.DEFAULT_STORE_ID || 'main'
+
+// 헤더/토큰에서 받은 값 검증 (인덱스/샤드 키로 쓰이므로 짧은 식별자만 허용)
+const STORE_ID_PATTERN = /^[a-z0-9][a-z0-9_-]{0,31}$/
+export const isValidStoreId = (value: unknown): value is string =>
+  typeof value === 'string' && STORE_ID_PATTERN.test(value)
+
+export const currentStoreId = () => currentContext()?.storeId
+
+// 매장 데이터 스키마 공통 필드: 생성 시 요청 컨텍스트의 매장으로 채운다
+export const storeIdField = {
+  type: String,
+  required: true,
+  default: () => currentStoreId() ?? DEFAULT_STORE_ID,
+}
+
+// 요청 컨텍스트 밖에서 실행 (setTimeout 등으로 요청에서 이어지는 배치 작업이 한 매장으로 좁혀지지 않도록)
+export const outsideRequest = <T>(fn: () => T) => requestContext.exit(fn)
+
+const QUERY_OPS = [
+  'find',
+  'findOne',
+  'countDocuments',
+  'distinct',
+  'findOneAndUpdate',
+  'findOneAndDelete',
+  'findOneAndReplace',
+  'updateOne',
+  'updateMany',
+  'replaceOne',
+  'deleteOne',
+  'deleteMany',
+]
+
+// allStores 는 이 플러그인 전용 옵션이므로 드라이버로 넘기지 않는다
+const takeAllStores = (options: Record<string, unknown>) => {
+  const all = !!options.allStores
+  delete options.allStores
+  return all
+}
+
+// 첫 단계여야 하는 스테이지 앞에는 $match 를 넣을 수 없다
+const FIRST_ONLY_STAGES = ['$geoNear', '$collStats', '$indexStats', '$search', '$documents']
+
+const tenantPlugin = (schema: Schema) => {
+  if (!schema.path('storeId')) return
+
+  schema.pre(QUERY_OPS as any, function (this: any) {
+    const storeId = currentStoreId()
+    if (takeAllStores(this.options) || !storeId) return
+    if (this.getFilter().storeId === undefined) this.where({ storeId })
+  })
+
+  schema.pre('aggregate', function (this: any) {
+    const storeId = currentStoreId()
+    if (takeAllStores(this.options) || !storeId) return
+    const pipeline = this.pipeline()
+    const first = pipeline[0] as Record<string, unknown> | undefined
+    if (first && FIRST_ONLY_STAGES.some((stage) => stage in first)) return
+    pipeline.unshift({ $match: { storeId } })
+  })
+}
+
+mongoose.plugin(tenantPlugin)
@@ -0,0 +1,122 @@
+import crypto from 'crypto'
+import jwt from 'jsonwebtoken'
+import { LruCache } from './lruCache'
+import { counter, gauge } from './metrics'
+import { publish, subscribe } from './messageBus'
+import { DecodedToken } from '../types/token'
+import TokenRevocation, { TOKEN_LIFETIME_SECONDS } from '../models/TokenRevocation'
+
+// 🔹 검증된 JWT 캐시
+// 키오스크/대시보드는 같은 토큰으로 하루 수백 번 요청하므로 HMAC 검증 + JSON 파싱 결과를 재사용한다.
+// - 키: 토큰의 sha256 (토큰 원문은 메모리에 보관하지 않음)
+// - 만료: 토큰의 exp 를 넘겨서 캐싱하지 않는다
+// - 폐기: revokeUser 이후 발급 시각(iat)이 그 이전인 토큰은 거절
+//   (실행 중인 워커는 메시지 버스로, 재기동한 워커는 TokenRevocation 에서 loadRevocations 로)
+
+interface VerifiedToken {
+  payload: DecodedToken & { iat?: number; exp?: number }
+  expiresAt: number // ms
+}
+
+const MAX_TTL = Number(process.env.TOKEN_CACHE_TTL_MS) || 5 * 60_000
+// 발급 토큰 최대 수명 (authController 의 expiresIn 과 맞춘다): 이 기간이 지나면 폐기 기록 삭제
+const TOKEN_LIFETIME = TOKEN_LIFETIME_SECONDS * 1000
+const REVOKE_TOPIC = 'auth:revoke'
+
+const hits = counter('auth_token_cache_hits_total', 'Verified-token cache hits')
+const misses = counter('auth_token_cache_misses_total', 'Verified-token cache misses')
+const revokedRejections = counter(
+  'auth_token_revoked_total',
+  'Requests rejected because the user was revoked'
+)
+
+const store = new LruCache<VerifiedToken>({
+  maxEntries: Number(process.env.TOKEN_CACHE_MAX_ENTRIES) || 5000,
+  ttl: MAX_TTL,
+})
+
+// userId → 폐기 시각(초)
+const revoked = new Map<string, number>()
+
+gauge('auth_token_cache_entries', 'Entries in the verified-token cache', (g) =>
+  g.set(undefined, store.size)
+)
+
+export class TokenRevokedError extends Error {
+  constructor() {
+    super('token revoked')
+    this.name = 'TokenRevokedError'
+  }
+}
+
+const keyOf = (token: string) =>
+  crypto.createHash('sha256').update(token).digest('base64url')
+
+const isRevoked = (payload: VerifiedToken['payload']) => {
+  const revokedAt = revoked.get(String(payload.userId))
+  return revokedAt !== undefined && (payload.iat ?? 0) <= revokedAt
+}
+
+// jwt.verify 와 같은 규칙으로 검증 (실패 시 throw)
+export const verifyToken = (token: string) => {
+  const key = keyOf(token)
+  const now = Date.now()
+
+  const cached = store.get(key)
+  if (cached && cached.expiresAt > now) {
+    if (isRevoked(cached.payload)) {
+      revokedRejections.inc()
+      throw new TokenRevokedError()
+    }
+    hits.inc()
+    return cached.payload
+  }
+
+  misses.inc()
+  const decoded = jwt.verify(token, process.env.JWT_SECRET!)
+  if (typeof decoded !== 'object') return decoded
+
+  const payload = decoded as VerifiedToken['payload']
+  if (isRevoked(payload)) {
+    revokedRejections.inc()
+    throw new TokenRevokedError()
+  }
+
+  const expiresAt = payload.exp ? payload.exp * 1000 : now + MAX_TTL
+  const ttl = Math.min(MAX_TTL, expiresAt - now)
+  if (ttl > 0) store.set(key, { payload, expiresAt }, ttl)
+  return payload
+}
+
+const applyRevocation = ({ userId, at }: { userId: string; at: number }) => {
+  revoked.set(userId, at)
+  store.deleteWhere((entry) => String(entry.payload.userId) === userId)
+
+  // 이미 발급된 토큰이 모두 만료된 뒤의 기록은 필요 없다
+  const cutoff = (Date.now() - TOKEN_LIFETIME) / 1000
+  for (const [id, revokedAt] of revoked) {
+    if (revokedAt < cutoff) revoked.delete(id)
+  }
+}
+
+subscribe(REVOKE_TOPIC, applyRevocation)
+
+// 계정 삭제 등: 해당 사용자에게 지금까지 발급된 토큰을 모두 무효화
+export const revokeUser = async (userId: string) => {
+  const at = Math.floor(Date.now() / 1000)
+  publish(REVOKE_TOPIC, { userId: String(userId), at })
+  await TokenRevocation.updateOne(
+    { userId: String(userId) },
+    { $set: { revokedAt: new Date(at * 1000) } },
+    { upsert: true }
+  )
+}
+
+// 기동 시 아직 유효한 폐기 기록 적재 (꺼져 있던 동안 발행된 폐기 포함)
+export const loadRevocations = async () => {
+  const records = await TokenRevocation.find().select('userId revokedAt').lean()
+  for (const { userId, revokedAt } of records) {
+    applyRevocation({ userId, at: Math.floor(revokedAt.getTime() / 1000) })
+  }
+  return records.length
+}
@@ -1,4 +1,5 @@
-import axios from 'axios'
+import axios, { AxiosInstance } from 'axios'
+import { decodeMsgpack, MSGPACK_TYPE } from './msgpack'
 
 // 1. 환경 변수에서 API 기본 URL을 가져옵니다.
 //    Vite 환경에서 프론트엔드가 사용할 환경 변수는 VITE_ 접두사가 필요하며,
@@ -15,12 +16,50 @@ const api = axios.create({
   },
 })
 
-// 요청 인터셉터 (토큰 자동 포함)
+// 2. 매장(지점) 선택: 기기별로 localStorage 'storeId' 또는 빌드 환경 변수 VITE_STORE_ID
+//    없으면 서버 기본 매장(로그인 사용자는 소속 매장)으로 처리됩니다.
+export const currentStoreId = (): string | undefined =>
+  localStorage.getItem('storeId') || import.meta.env.VITE_STORE_ID || undefined
+
+// 3. 응답 형식: 대용량 목록(상품/QR 기록/직원)은 서버가 MessagePack 으로 보낼 수 있습니다.
+//    본문을 바이트로 받아 Content-Type 에 따라 msgpack/JSON 으로 풀기 때문에
+//    화면 코드는 지금처럼 res.data 를 객체로 쓰면 됩니다. (오류 응답도 동일)
+const textDecoder = new TextDecoder()
+
+const decodeBody = (data: unknown, contentType: string) => {
+  if (!(data instanceof ArrayBuffer)) return data
+  const bytes = new Uint8Array(data)
+  if (contentType.includes(MSGPACK_TYPE)) return decodeMsgpack(bytes)
+  const text = textDecoder.decode(bytes)
+  if (!contentType.includes('json')) return text
+  try {
+    return text ? JSON.parse(text) : undefined
+  } catch {
+    return text
+  }
+}
+
+export const acceptMsgpack = (instance: AxiosInstance) => {
+  instance.defaults.headers.common.Accept = `${MSGPACK_TYPE}, application/json;q=0.9`
+  instance.defaults.responseType = 'arraybuffer'
+  instance.defaults.transformResponse = [
+    (data, headers) => decodeBody(data, String(headers?.['content-type'] ?? '')),
+  ]
+  return instance
+}
+
+acceptMsgpack(api)
+
+// 요청 인터셉터 (토큰/매장 자동 포함)
 api.interceptors.request.use((config) => {
   const token = localStorage.getItem('token')
   if (token) {
     config.headers.Authorization = `Bearer ${token}`
   }
+  const storeId = currentStoreId()
+  if (storeId) {
+    config.headers['X-Store-Id'] = storeId
+  }
   return config
 })
 
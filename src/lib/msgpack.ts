@@ -0,0 +1,90 @@
+// MessagePack 디코더 (서버 server/src/utils/msgpack.ts 와 같은 규칙)
+// - ext 1 (ObjectId 12바이트) → 24자리 16진수 문자열
+// - timestamp ext(-1)        → ISO 문자열
+// 결과가 JSON 응답과 같은 모양이라 화면 코드는 어떤 형식으로 받았는지 몰라도 된다.
+
+export const MSGPACK_TYPE = 'application/msgpack'
+
+const EXT_OBJECT_ID = 1
+const EXT_TIMESTAMP = -1
+
+const textDecoder = new TextDecoder()
+
+const toHex = (bytes: Uint8Array) => {
+  let hex = ''
+  for (let i = 0; i < bytes.length; i++) hex += bytes[i].toString(16).padStart(2, '0')
+  return hex
+}
+
+export const decodeMsgpack = (input: Uint8Array): unknown => {
+  const view = new DataView(input.buffer, input.byteOffset, input.byteLength)
+  let pos = 0
+
+  const u8 = () => input[pos++]
+  const u16 = () => ((pos += 2), view.getUint16(pos - 2))
+  const u32 = () => ((pos += 4), view.getUint32(pos - 4))
+
+  const str = (len: number) => textDecoder.decode(input.subarray(pos, (pos += len)))
+  const array = (n: number) => {
+    const a = new Array(n)
+    for (let i = 0; i < n; i++) a[i] = read()
+    return a
+  }
+  const map = (n: number) => {
+    const o: Record<string, unknown> = {}
+    for (let i = 0; i < n; i++) {
+      const k = read() as string
+      o[k] = read()
+    }
+    return o
+  }
+  const ext = (len: number) => {
+    const type = view.getInt8(pos++)
+    const start = pos
+    pos += len
+    if (type === EXT_OBJECT_ID) return toHex(input.subarray(start, pos))
+    if (type === EXT_TIMESTAMP && len === 8) {
+      const hi = view.getUint32(start)
+      const sec = (hi & 0x3) * 2 ** 32 + view.getUint32(start + 4)
+      return new Date(sec * 1000 + Math.floor((hi >>> 2) / 1e6)).toISOString()
+    }
+    if (type === EXT_TIMESTAMP && len === 4) {
+      return new Date(view.getUint32(start) * 1000).toISOString()
+    }
+    return input.subarray(start, pos)
+  }
+
+  const read = (): unknown => {
+    const b = u8()
+    if (b < 0x80) return b
+    if (b < 0x90) return map(b & 0x0f)
+    if (b < 0xa0) return array(b & 0x0f)
+    if (b < 0xc0) return str(b & 0x1f)
+    if (b >= 0xe0) return b - 0x100
+    switch (b) {
+      case 0xc0: return null
+      case 0xc2: return false
+      case 0xc3: return true
+      case 0xcc: return u8()
+      case 0xcd: return u16()
+      case 0xce: return u32()
+      case 0xd0: return view.getInt8(pos++)
+      case 0xd1: return ((pos += 2), view.getInt16(pos - 2))
+      case 0xd2: return ((pos += 4), view.getInt32(pos - 4))
+      case 0xcb: return ((pos += 8), view.getFloat64(pos - 8))
+      case 0xd9: return str(u8())
+      case 0xda: return str(u16())
+      case 0xdb: return str(u32())
+      case 0xdc: return array(u16())
+      case 0xdd: return array(u32())
+      case 0xde: return map(u16())
+      case 0xdf: return map(u32())
+      case 0xd6: return ext(4)
+      case 0xd7: return ext(8)
+      case 0xc7: return ext(u8())
+    }
+    throw new Error(`unsupported msgpack byte 0x${b.toString(16)}`)
+  }
+
+  return read()
+}
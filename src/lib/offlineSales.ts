@@ -0,0 +1,224 @@
+import { isAxiosError, type AxiosInstance } from 'axios'
+
+// 키오스크 오프라인 판매 큐
+// 결제는 먼저 이 기기(localStorage)에 기록하고 손님 응대를 바로 끝냅니다.
+// 동기화 워커가 큐를 모아 /kiosk/checkout/batch 로 보내고, 서버가 판매별 멱등성 키로
+// 중복을 걸러내므로 응답이 유실돼 다시 보내도 주문은 한 번만 저장됩니다.
+// 서버가 받지 않는 판매(형식 오류 등)는 이미 결제된 건이므로 버리지 않고 별도 보관(dead letter)해
+// 키오스크 화면에서 점주가 확인/내보내기 할 수 있게 합니다.
+
+export interface OfflineSaleItem {
+  productId?: string
+  barcode?: string
+  name: string
+  price: number
+  quantity: number
+}
+
+export interface OfflineSale {
+  idempotencyKey: string
+  items: OfflineSaleItem[]
+  totalAmount: number
+  paymentMethod: 'card' | 'cash'
+  soldAt: string
+}
+
+interface SyncResult {
+  idempotencyKey: string
+  status: 'created' | 'duplicate' | 'rejected' | 'retry'
+  orderNumber?: string
+  message?: string
+}
+
+export interface DeadLetterSale {
+  sale: OfflineSale
+  reason: string
+  failedAt: string
+}
+
+const QUEUE_KEY = 'kioskSaleQueue'
+const DEAD_LETTER_KEY = 'kioskSaleDeadLetter'
+// 서버 MAX_SYNC_BATCH(100) 이하, 요청 본문 제한(express.json 기본 100KB) 안에 들도록
+const BATCH_SIZE = 50
+const SYNC_INTERVAL = 15_000
+const MAX_BACKOFF = 5 * 60_000
+
+const listeners = new Set<(pending: number) => void>()
+
+const readQueue = (): OfflineSale[] => {
+  try {
+    return JSON.parse(localStorage.getItem(QUEUE_KEY) || '[]')
+  } catch {
+    return []
+  }
+}
+
+const writeQueue = (queue: OfflineSale[]) => {
+  localStorage.setItem(QUEUE_KEY, JSON.stringify(queue))
+  listeners.forEach((listener) => listener(queue.length))
+}
+
+export const pendingSaleCount = () => readQueue().length
+
+// 🔹 전송 실패 보관함 (서버가 거절한 판매)
+const deadLetterListeners = new Set<(sales: DeadLetterSale[]) => void>()
+
+export const readDeadLetters = (): DeadLetterSale[] => {
+  try {
+    return JSON.parse(localStorage.getItem(DEAD_LETTER_KEY) || '[]')
+  } catch {
+    return []
+  }
+}
+
+const writeDeadLetters = (sales: DeadLetterSale[]) => {
+  localStorage.setItem(DEAD_LETTER_KEY, JSON.stringify(sales))
+  deadLetterListeners.forEach((listener) => listener(sales))
+}
+
+// 큐에서 빼서 보관함으로 (같은 키가 이미 있으면 사유만 갱신)
+const moveToDeadLetter = (failed: { sale: OfflineSale; reason: string }[]) => {
+  if (failed.length === 0) return
+  const failedAt = new Date().toISOString()
+  const keys = new Set(failed.map(({ sale }) => sale.idempotencyKey))
+  writeDeadLetters([
+    ...readDeadLetters().filter(({ sale }) => !keys.has(sale.idempotencyKey)),
+    ...failed.map(({ sale, reason }) => ({ sale, reason, failedAt })),
+  ])
+  writeQueue(readQueue().filter((sale) => !keys.has(sale.idempotencyKey)))
+}
+
+// 점주가 확인(내보내기)한 뒤 비우기
+export const clearDeadLetters = () => writeDeadLetters([])
+
+export const subscribeDeadLetters = (listener: (sales: DeadLetterSale[]) => void) => {
+  deadLetterListeners.add(listener)
+  return () => {
+    deadLetterListeners.delete(listener)
+  }
+}
+
+// 미전송 건수 변화 구독 (반환값: 구독 해제)
+export const subscribeSaleQueue = (listener: (pending: number) => void) => {
+  listeners.add(listener)
+  return () => {
+    listeners.delete(listener)
+  }
+}
+
+let flushNow: (() => void) | null = null
+
+// 판매별 멱등성 키 (UUID v4)
+// crypto.randomUUID 는 보안 컨텍스트(HTTPS/localhost)에서만 있어, 매장 LAN 의 HTTP 키오스크는 getRandomValues 로 만든다
+const newSaleKey = () => {
+  if (typeof crypto.randomUUID === 'function') return crypto.randomUUID()
+  const bytes = crypto.getRandomValues(new Uint8Array(16))
+  bytes[6] = (bytes[6] & 0x0f) | 0x40 // version 4
+  bytes[8] = (bytes[8] & 0x3f) | 0x80 // variant 10
+  const hex = Array.from(bytes, (b) => b.toString(16).padStart(2, '0')).join('')
+  return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-${hex.slice(12, 16)}-${hex.slice(16, 20)}-${hex.slice(20)}`
+}
+
+// 결제 기록: 서버 응답을 기다리지 않는다
+export const enqueueSale = (sale: Omit<OfflineSale, 'idempotencyKey' | 'soldAt'>) => {
+  const queued: OfflineSale = {
+    ...sale,
+    idempotencyKey: newSaleKey(),
+    soldAt: new Date().toISOString(),
+  }
+  writeQueue([...readQueue(), queued])
+  flushNow?.()
+  return queued
+}
+
+// 동기화 워커 시작 (반환값: 정지)
+// 주기적으로 + 판매 직후 + 네트워크 복구 시 전송, 실패하면 간격을 늘려 재시도
+export const startSaleSync = (api: AxiosInstance) => {
+  let running = false
+  let stopped = false
+  let failures = 0
+  let timer: ReturnType<typeof setTimeout> | undefined
+
+  const schedule = (delay: number) => {
+    clearTimeout(timer)
+    if (!stopped) timer = setTimeout(flush, delay)
+  }
+
+  // 요청 본문이 너무 크면(413) 반으로 줄여 다시 보낸다. 성공하면 점차 원래 크기로
+  let batchSize = BATCH_SIZE
+
+  const flush = async () => {
+    if (running || stopped) return
+    const batch = readQueue().slice(0, batchSize)
+    if (batch.length === 0) return schedule(SYNC_INTERVAL)
+
+    running = true
+    let progressed = false
+    try {
+      const res = await api.post('/kiosk/checkout/batch', { sales: batch })
+      const results: SyncResult[] = res.data?.results ?? []
+      // 저장/중복은 큐에서 제거, 거절은 보관함으로, retry 는 남긴다
+      const done = new Set(
+        results
+          .filter((r) => r.status === 'created' || r.status === 'duplicate')
+          .map((r) => r.idempotencyKey)
+      )
+      const rejected = new Map(
+        results
+          .filter((r) => r.status === 'rejected')
+          .map((r) => [r.idempotencyKey, r.message ?? '서버가 거절한 판매'])
+      )
+      // 전송 중에 새로 쌓인 판매가 있으므로 키 단위로 제거
+      writeQueue(readQueue().filter((sale) => !done.has(sale.idempotencyKey)))
+      moveToDeadLetter(
+        batch
+          .filter((sale) => rejected.has(sale.idempotencyKey))
+          .map((sale) => ({ sale, reason: rejected.get(sale.idempotencyKey)! }))
+      )
+      progressed = done.size + rejected.size > 0
+      failures = 0
+      batchSize = Math.min(batchSize * 2, BATCH_SIZE)
+    } catch (err) {
+      const status = isAxiosError(err) ? err.response?.status : undefined
+      if (status === 413 && batch.length > 1) {
+        // 나눠서 다시 (판매 한 건이 제한보다 크면 아래 4xx 처리)
+        batchSize = Math.max(1, Math.floor(batch.length / 2))
+        progressed = true
+      } else if (status && status >= 400 && status < 500 && status !== 408 && status !== 429) {
+        // 다시 보내도 같은 결과인 요청 오류: 큐를 막지 않도록 이 배치는 보관함으로
+        const reason = (isAxiosError(err) && err.response?.data?.message) || `HTTP ${status}`
+        moveToDeadLetter(batch.map((sale) => ({ sale, reason })))
+        progressed = true
+      } else {
+        failures += 1
+        console.error('판매 동기화 실패 (다음에 다시 시도)', err)
+      }
+    } finally {
+      running = false
+    }
+
+    // 남은 판매가 있으면 바로 다음 배치, 실패했으면 간격을 늘린다
+    const more = progressed && readQueue().length > 0
+    schedule(
+      more ? 0 : failures > 0 ? Math.min(SYNC_INTERVAL * 2 ** failures, MAX_BACKOFF) : SYNC_INTERVAL
+    )
+  }
+
+  const onOnline = () => {
+    failures = 0
+    schedule(0)
+  }
+
+  flushNow = () => {
+    if (failures === 0) schedule(0)
+  }
+  window.addEventListener('online', onOnline)
+  schedule(0)
+
+  return () => {
+    stopped = true
+    clearTimeout(timer)
+    flushNow = null
+    window.removeEventListener('online', onOnline)
+  }
+}
@@ -10,6 +10,14 @@ import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { Badge } from '@/components/ui/badge'
 import { Separator } from '@/components/ui/separator'
+import {
+  Dialog,
+  DialogContent,
+  DialogDescription,
+  DialogFooter,
+  DialogHeader,
+  DialogTitle,
+} from '@/components/ui/dialog'
 import {
   ShoppingCart,
   Trash2,
@@ -23,6 +31,17 @@ import {
 } from 'lucide-react'
 import { useToast } from '@/hooks/use-toast'
 import axios from 'axios'
+import { acceptMsgpack, currentStoreId } from '@/lib/api'
+import {
+  clearDeadLetters,
+  enqueueSale,
+  pendingSaleCount,
+  readDeadLetters,
+  startSaleSync,
+  subscribeDeadLetters,
+  subscribeSaleQueue,
+  type DeadLetterSale,
+} from '@/lib/offlineSales'
 
 // 장바구니 아이템 타입
 interface CartItem {
@@ -34,9 +53,14 @@ interface CartItem {
 }
 
 // API 설정
-const api = axios.create({
-  baseURL: 'http://localhost:5000/api',
-})
+// 키오스크는 로그인 없이 쓰므로 기기에 설정된 매장을 헤더로 보낸다
+const storeId = currentStoreId()
+const api = acceptMsgpack(
+  axios.create({
+    baseURL: 'http://localhost:5000/api',
+    headers: storeId ? { 'X-Store-Id': storeId } : undefined,
+  })
+)
 
 const SelfCheckout = () => {
   const { toast } = useToast()
@@ -44,6 +68,9 @@ const SelfCheckout = () => {
   const [barcodeInput, setBarcodeInput] = useState('')
   const [isProcessing, setIsProcessing] = useState(false)
   const [quickMenu, setQuickMenu] = useState<any[]>([])
+  const [pendingSales, setPendingSales] = useState(pendingSaleCount())
+  const [deadLetters, setDeadLetters] = useState<DeadLetterSale[]>(readDeadLetters())
+  const [isDeadLetterOpen, setIsDeadLetterOpen] = useState(false)
   const inputRef = useRef<HTMLInputElement>(null)
 
   useEffect(() => {
@@ -79,6 +106,37 @@ const SelfCheckout = () => {
     0
   )
 
+  // 오프라인 판매 큐 동기화 (서버가 느리거나 끊겨도 결제는 계속 받는다)
+  useEffect(() => {
+    const unsubscribe = subscribeSaleQueue(setPendingSales)
+    const unsubscribeDeadLetters = subscribeDeadLetters(setDeadLetters)
+    const stop = startSaleSync(api)
+    return () => {
+      unsubscribe()
+      unsubscribeDeadLetters()
+      stop()
+    }
+  }, [])
+
+  // 전송 실패 판매 내보내기 (이미 결제된 건이라 점주가 수기로 반영할 수 있게)
+  const exportDeadLetters = () => {
+    const blob = new Blob([JSON.stringify(deadLetters, null, 2)], {
+      type: 'application/json',
+    })
+    const url = URL.createObjectURL(blob)
+    const a = document.createElement('a')
+    a.href = url
+    a.download = `kiosk-failed-sales-${new Date().toISOString().slice(0, 10)}.json`
+    a.click()
+    URL.revokeObjectURL(url)
+  }
+
+  const handleClearDeadLetters = () => {
+    if (!confirm('전송 실패 판매를 모두 비울까요? 내보내기로 먼저 보관해 두세요.')) return
+    clearDeadLetters()
+    setIsDeadLetterOpen(false)
+  }
+
   // 오토 포커스
   useEffect(() => {
     const focusInterval = setInterval(() => {
@@ -173,30 +231,30 @@ const SelfCheckout = () => {
     if (!confirm(`총 ${totalAmount.toLocaleString()}원을 결제하시겠습니까?`))
       return
 
-    try {
-      await api.post('/kiosk/checkout', {
-        items: cart.map((item) => ({
-          productId: item._id,
-          name: item.name,
-          price: item.price,
-          quantity: item.quantity,
-          barcode: item.barcode,
-        })),
-        totalAmount,
-        paymentMethod: 'card',
-      })
+    // 기기에 먼저 기록하고 바로 완료 처리, 서버 전송은 동기화 워커가 한다
+    enqueueSale({
+      items: cart.map((item) => ({
+        productId: item._id,
+        name: item.name,
+        price: item.price,
+        quantity: item.quantity,
+        barcode: item.barcode,
+      })),
+      totalAmount,
+      paymentMethod: 'card',
+    })
 
-      alert('결제가 완료되었습니다. 이용해주셔서 감사합니다! 🙇‍♂️')
-      setCart([])
-      // 결제 후 재고 반영을 위해 목록 새로고침 (선택사항)
-      window.location.reload()
-    } catch (err) {
-      toast({
-        title: '결제 실패',
-        description: '서버와 통신 중 오류가 발생했습니다.',
-        variant: 'destructive',
+    alert('결제가 완료되었습니다. 이용해주셔서 감사합니다! 🙇‍♂️')
+    // 화면의 재고 표시는 바로 차감 (새로고침하면 전송 중인 동기화가 끊긴다)
+    setQuickMenu((prev) =>
+      prev.map((product) => {
+        const sold = cart.find((item) => item._id === product._id)
+        return sold
+          ? { ...product, stock: Math.max(0, product.stock - sold.quantity) }
+          : product
       })
-    }
+    )
+    setCart([])
   }
 
   return (
@@ -214,6 +272,20 @@ const SelfCheckout = () => {
           </div>
         </div>
         <div className="flex items-center gap-3">
+          {pendingSales > 0 && (
+            <Badge variant="secondary" className="text-sm px-3 py-1">
+              미전송 {pendingSales}건
+            </Badge>
+          )}
+          {deadLetters.length > 0 && (
+            <Badge
+              variant="destructive"
+              className="text-sm px-3 py-1 cursor-pointer"
+              onClick={() => setIsDeadLetterOpen(true)}
+            >
+              전송 실패 {deadLetters.length}건
+            </Badge>
+          )}
           <Badge variant="outline" className="text-sm px-3 py-1 bg-white">
             {new Date().toLocaleDateString()}
           </Badge>
@@ -453,6 +525,52 @@ const SelfCheckout = () => {
           </Card>
         </div>
       </main>
+
+      {/* 전송 실패 판매 (서버가 거절한 결제 완료 건) */}
+      <Dialog open={isDeadLetterOpen} onOpenChange={setIsDeadLetterOpen}>
+        <DialogContent className="max-w-lg">
+          <DialogHeader>
+            <DialogTitle>전송 실패 판매</DialogTitle>
+            <DialogDescription>
+              결제는 완료됐지만 서버에 저장되지 않은 판매입니다. 내보내서 매출에
+              직접 반영해 주세요.
+            </DialogDescription>
+          </DialogHeader>
+          <div className="max-h-80 overflow-y-auto space-y-2">
+            {deadLetters.map(({ sale, reason, failedAt }) => (
+              <div
+                key={sale.idempotencyKey}
+                className="border rounded-lg p-3 text-sm space-y-1"
+              >
+                <div className="flex justify-between">
+                  <span className="text-muted-foreground">
+                    {new Date(sale.soldAt).toLocaleString()}
+                  </span>
+                  <span className="font-bold tabular-nums">
+                    ₩{sale.totalAmount.toLocaleString()}
+                  </span>
+                </div>
+                <div>
+                  {sale.items
+                    .map((item) => `${item.name} x${item.quantity}`)
+                    .join(', ')}
+                </div>
+                <div className="text-xs text-destructive">
+                  {reason} ({new Date(failedAt).toLocaleString()})
+                </div>
+              </div>
+            ))}
+          </div>
+          <DialogFooter>
+            <Button variant="outline" onClick={exportDeadLetters}>
+              내보내기 (JSON 다운로드)
+            </Button>
+            <Button variant="destructive" onClick={handleClearDeadLetters}>
+              확인 후 비우기
+            </Button>
+          </DialogFooter>
+        </DialogContent>
+      </Dialog>
     </div>
   )
 }
@@ -19,41 +19,14 @@ interface Announcement {
   author: string
   important: boolean
   views: number
-  likes: string[]
+  likeCount: number
+  liked: boolean
   createdAt: string
 }
 
 const Announcements = () => {
   const { toast } = useToast()
   const [announcements, setAnnouncements] = useState<Announcement[]>([])
-  const [currentUserId, setCurrentUserId] = useState<string>('')
-
-  // 토큰에서 UserID 추출
-  useEffect(() => {
-    const token = localStorage.getItem('token')
-    if (token) {
-      try {
-        // JWT Payload 디코딩 (라이브러리 없이 base64 decode)
-        const base64Url = token.split('.')[1]
-        const base64 = base64Url.replace(/-/g, '+').replace(/_/g, '/')
-        const jsonPayload = decodeURIComponent(
-          window
-            .atob(base64)
-            .split('')
-            .map(function (c) {
-              return '%' + ('00' + c.charCodeAt(0).toString(16)).slice(-2)
-            })
-            .join('')
-        )
-        const payload = JSON.parse(jsonPayload)
-        if (payload.userId) {
-          setCurrentUserId(payload.userId)
-        }
-      } catch (e) {
-        console.error('Token decode error', e)
-      }
-    }
-  }, [])
 
   const fetchAnnouncements = async () => {
     try {
@@ -112,7 +85,7 @@ const Announcements = () => {
         <CardContent>
           <Accordion type="single" collapsible className="w-full">
             {announcements.map((item) => {
-              const isLiked = item.likes.includes(currentUserId)
+              const isLiked = item.liked
 
               return (
                 <AccordionItem key={item._id} value={item._id}>
@@ -155,7 +128,7 @@ const Announcements = () => {
                               isLiked ? 'fill-primary' : ''
                             }`}
                           />
-                          {item.likes.length}
+                          {item.likeCount}
                         </div>
                       </div>
                     </div>
@@ -173,7 +146,7 @@ const Announcements = () => {
                           className={`w-4 h-4 ${isLiked ? 'fill-white' : ''}`}
                         />
                         {isLiked ? '좋아요 취소' : '좋아요'} (
-                        {item.likes.length})
+                        {item.likeCount})
                       </Button>
                     </div>
                   </AccordionContent>
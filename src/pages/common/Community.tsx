@@ -48,14 +48,35 @@ interface Post {
   likes: string[]
   reports?: { userId: string; createdAt: string }[] // 변경됨
   createdAt: string
-  commentCount?: number
 }
 
+// 목록 응답: likes/reports 배열 대신 개수만 내려온다
+interface PostListItem {
+  _id: string
+  title: string
+  content: string
+  category: 'tips' | 'suggestions'
+  authorId: string
+  authorName: string
+  views: number
+  likeCount: number
+  liked: boolean
+  reportCount: number
+  commentCount: number
+  createdAt: string
+}
+
+type PostSort = 'latest' | 'hot'
+
+const PAGE_SIZE = 20
+
 const Community = () => {
   const { toast } = useToast()
 
   const [activeTab, setActiveTab] = useState('tips')
-  const [posts, setPosts] = useState<Post[]>([])
+  const [posts, setPosts] = useState<PostListItem[]>([])
+  const [sort, setSort] = useState<PostSort>('latest')
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [searchQuery, setSearchQuery] = useState('')
   const [currentUserId, setCurrentUserId] = useState<string>('')
 
@@ -93,12 +114,20 @@ const Community = () => {
     }
   }, [])
 
-  const fetchPosts = async () => {
+  // 커서 페이지 조회: cursor 가 없으면 첫 페이지부터 다시
+  const fetchPosts = async (cursor?: string) => {
     try {
       const res = await api.get('/community/posts', {
-        params: { category: activeTab, search: searchQuery },
+        params: {
+          category: activeTab,
+          search: searchQuery,
+          sort,
+          limit: PAGE_SIZE,
+          cursor,
+        },
       })
-      setPosts(res.data)
+      setPosts((prev) => (cursor ? [...prev, ...res.data.posts] : res.data.posts))
+      setNextCursor(res.data.nextCursor)
     } catch (error) {
       console.error(error)
     }
@@ -106,7 +135,7 @@ const Community = () => {
 
   useEffect(() => {
     fetchPosts()
-  }, [activeTab])
+  }, [activeTab, sort])
 
   const handleSearch = (e: React.FormEvent) => {
     e.preventDefault()
@@ -167,7 +196,7 @@ const Community = () => {
     }
   }
 
-  const openDetail = async (post: Post) => {
+  const openDetail = async (post: PostListItem) => {
     try {
       const res = await api.get(`/community/posts/${post._id}`)
       setSelectedPost(res.data.post)
@@ -215,7 +244,13 @@ const Community = () => {
       const res = await api.put(`/community/posts/${postId}/like`)
       setPosts((prev) =>
         prev.map((p) =>
-          p._id === postId ? { ...p, likes: res.data.likes } : p
+          p._id === postId
+            ? {
+                ...p,
+                likeCount: res.data.likes.length,
+                liked: res.data.likes.includes(currentUserId),
+              }
+            : p
         )
       )
       if (selectedPost && selectedPost._id === postId) {
@@ -432,10 +467,28 @@ const Community = () => {
         className="space-y-4"
       >
         <div className="flex items-center justify-between gap-4">
-          <TabsList className="shrink-0">
-            <TabsTrigger value="tips">꿀팁</TabsTrigger>
-            <TabsTrigger value="suggestions">건의사항</TabsTrigger>
-          </TabsList>
+          <div className="flex items-center gap-2 shrink-0">
+            <TabsList>
+              <TabsTrigger value="tips">꿀팁</TabsTrigger>
+              <TabsTrigger value="suggestions">건의사항</TabsTrigger>
+            </TabsList>
+            <div className="flex gap-1">
+              <Button
+                size="sm"
+                variant={sort === 'latest' ? 'secondary' : 'ghost'}
+                onClick={() => setSort('latest')}
+              >
+                최신순
+              </Button>
+              <Button
+                size="sm"
+                variant={sort === 'hot' ? 'secondary' : 'ghost'}
+                onClick={() => setSort('hot')}
+              >
+                인기순
+              </Button>
+            </div>
+          </div>
           <form
             onSubmit={handleSearch}
             className="relative flex-1 md:flex-none"
@@ -452,7 +505,7 @@ const Community = () => {
 
         <TabsContent value={activeTab} className="space-y-3">
           {posts.map((post) => {
-            const isLiked = post.likes.includes(currentUserId)
+            const isLiked = post.liked
             const isMyPost = post.authorId === currentUserId
 
             return (
@@ -492,7 +545,7 @@ const Community = () => {
                       <ThumbsUp
                         className={`w-3 h-3 ${isLiked ? 'fill-primary' : ''}`}
                       />{' '}
-                      {post.likes.length}
+                      {post.likeCount}
                     </div>
                     <span className="flex items-center gap-1">
                       <MessageSquare className="w-3 h-3" />{' '}
@@ -509,6 +562,15 @@ const Community = () => {
               게시글이 없습니다.
             </div>
           )}
+          {nextCursor && (
+            <Button
+              variant="outline"
+              className="w-full"
+              onClick={() => fetchPosts(nextCursor)}
+            >
+              더 보기
+            </Button>
+          )}
         </TabsContent>
       </Tabs>
 
@@ -31,7 +31,7 @@ interface Announcement {
   date: string
   important: boolean
   views: number
-  likes: string[]
+  likeCount: number
   createdAt: string
 }
 
@@ -297,7 +297,7 @@ const AnnouncementManagement = () => {
                       </span>
                       <span className="flex items-center gap-1">
                         <ThumbsUp className="w-3 h-3" />
-                        {announcement.likes.length}
+                        {announcement.likeCount}
                       </span>
                     </div>
                   </div>
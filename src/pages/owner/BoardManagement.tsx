@@ -47,7 +47,20 @@ interface Post {
   likes: string[]
   reports?: { userId: string; createdAt: string }[] // 변경: 객체 배열
   createdAt: string
+}
+
+// 목록 응답: likes/reports 배열 대신 개수만 내려온다
+interface PostListItem {
+  _id: string
+  title: string
+  content: string
+  category: 'tips' | 'suggestions'
+  authorName: string
+  views: number
+  likeCount: number
+  reportCount: number
   commentCount: number
+  createdAt: string
 }
 
 interface Stats {
@@ -61,7 +74,7 @@ const BoardManagement = () => {
   const { toast } = useToast()
 
   const [activeTab, setActiveTab] = useState('tips')
-  const [posts, setPosts] = useState<Post[]>([])
+  const [posts, setPosts] = useState<PostListItem[]>([])
   const [stats, setStats] = useState<Stats>({
     tipsToday: 0,
     suggestionsToday: 0,
@@ -124,7 +137,7 @@ const BoardManagement = () => {
   }
 
   // 상세보기
-  const openDetail = async (post: Post) => {
+  const openDetail = async (post: PostListItem) => {
     try {
       const res = await api.get(`/community/posts/${post._id}`)
       setSelectedPost(res.data.post)
@@ -152,7 +165,7 @@ const BoardManagement = () => {
   const getFilteredPosts = (category: string) => {
     let filtered = posts.filter((p) => p.category === category)
     if (filterReported) {
-      filtered = filtered.filter((p) => p.reports && p.reports.length > 0)
+      filtered = filtered.filter((p) => p.reportCount > 0)
     }
     return filtered
   }
@@ -164,9 +177,7 @@ const BoardManagement = () => {
     (acc, curr) => acc + (curr.commentCount || 0),
     0
   )
-  const totalReported = posts.filter(
-    (p) => p.reports && p.reports.length > 0
-  ).length
+  const totalReported = posts.filter((p) => p.reportCount > 0).length
 
   // 증감량 표시 컴포넌트
   const StatBadge = ({
@@ -250,7 +261,7 @@ const BoardManagement = () => {
     })
   }
 
-  const renderPostList = (postList: Post[]) => (
+  const renderPostList = (postList: PostListItem[]) => (
     <div className="space-y-4">
       {postList.length === 0 ? (
         <div className="text-center py-8 text-muted-foreground">
@@ -261,7 +272,7 @@ const BoardManagement = () => {
           <div
             key={post._id}
             className={`p-4 border rounded-lg transition-colors cursor-pointer ${
-              post.reports && post.reports.length > 0
+              post.reportCount > 0
                 ? 'bg-destructive/5 border-destructive/20'
                 : 'hover:bg-muted/30'
             }`}
@@ -271,12 +282,12 @@ const BoardManagement = () => {
               <div className="flex-1">
                 <div className="flex items-center gap-2 mb-1">
                   <h4 className="font-medium">{post.title}</h4>
-                  {post.reports && post.reports.length > 0 && (
+                  {post.reportCount > 0 && (
                     <Badge
                       variant="destructive"
                       className="text-[10px] px-1.5 h-5"
                     >
-                      신고 {post.reports.length}
+                      신고 {post.reportCount}
                     </Badge>
                   )}
                   <Badge variant="outline" className="text-xs font-normal">
@@ -289,7 +300,7 @@ const BoardManagement = () => {
                 <div className="flex items-center gap-4 text-xs text-muted-foreground">
                   <span>{post.authorName}</span>
                   <span className="flex items-center gap-1">
-                    <ThumbsUp className="w-3 h-3" /> {post.likes.length}
+                    <ThumbsUp className="w-3 h-3" /> {post.likeCount}
                   </span>
                   <span className="flex items-center gap-1">
                     <MessageSquare className="w-3 h-3" /> {post.commentCount}
@@ -298,7 +309,7 @@ const BoardManagement = () => {
               </div>
 
               <div className="flex flex-col gap-2 ml-4">
-                {post.reports && post.reports.length > 0 && (
+                {post.reportCount > 0 && (
                   <Button
                     size="sm"
                     className="bg-success hover:bg-success/90 text-success-foreground h-8 px-2"
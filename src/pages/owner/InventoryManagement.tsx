@@ -72,6 +72,15 @@ type OrderRequest = {
    */
   /*******  34d91ae8-c998-4c15-b3f0-01d65f2cf339  *******/ orderQuantity?: number
   orderedAt?: string
+  suggestedQty?: number // 수요 예측 기반 권장 발주 수량
+  daysOfCover?: number // 현재 재고로 버틸 수 있는 예상 일수
+}
+
+// 서버 발주 제안 (GET /products/reorder-suggestions)
+type ReorderSuggestion = {
+  productId: string
+  suggestedQty: number
+  daysOfCover: number
 }
 
 const isExpired = (date?: string) => {
@@ -114,6 +123,9 @@ const mergeOrderRequests = (
     const base = low ? { ...low, ...req } : { ...req }
     merged.push({
       ...base,
+      // 예측 값은 저장된 값보다 최신 계산 결과를 우선
+      suggestedQty: low ? low.suggestedQty : req.suggestedQty,
+      daysOfCover: low ? low.daysOfCover : req.daysOfCover,
       orderQuantity: req.orderQuantity ?? low?.orderQuantity,
       orderedAt: req.orderedAt ?? low?.orderedAt,
       status: req.status ?? low?.status ?? '대기',
@@ -176,6 +188,9 @@ const InventoryManagement = () => {
     'default'
   )
   const [items, setItems] = useState<Product[]>([])
+  const [suggestions, setSuggestions] = useState<
+    Record<string, ReorderSuggestion>
+  >({})
   const [loading, setLoading] = useState(false)
   const [orderRequests, setOrderRequests] = useState<OrderRequest[]>(
     () => loadSavedOrders()
@@ -241,6 +256,20 @@ const InventoryManagement = () => {
       })
 
       setItems(mapped)
+
+      // 발주 제안은 부가 정보이므로 실패해도 목록은 그대로 표시
+      try {
+        const sug = await api.get('/products/reorder-suggestions')
+        if (Array.isArray(sug.data)) {
+          setSuggestions(
+            Object.fromEntries(
+              sug.data.map((s: ReorderSuggestion) => [s.productId, s])
+            )
+          )
+        }
+      } catch (e) {
+        console.warn('발주 제안 로드 실패:', e)
+      }
     } catch (err: any) {
       // [수정] 콘솔 에러 대신 경고로 표시하여 사용자 불안감 감소
       console.warn('API Error (using mock data):', err.message)
@@ -343,10 +372,10 @@ const InventoryManagement = () => {
     return item.quantity > 0 && d !== null && d <= 7
   })
 
-  // 자동 발주 목록 생성 로직
+  // 자동 발주 목록 생성 로직 (수량 2개 이하 + 서버 수요 예측 발주 제안)
   useEffect(() => {
     const next = items
-      .filter((item) => item.quantity <= 2)
+      .filter((item) => item.quantity <= 2 || !!suggestions[item._id])
       .map((item) => {
         // [안전장치 4] 날짜 변환 시 에러 방지
         let dateStr = '-'
@@ -366,15 +395,17 @@ const InventoryManagement = () => {
           id: item._id,
           item: item.productName,
           quantity: item.quantity,
-          requestedBy: '시스템 감지',
+          requestedBy: suggestions[item._id] ? '수요 예측' : '시스템 감지',
           date: dateStr,
           status: '대기' as const,
+          suggestedQty: suggestions[item._id]?.suggestedQty,
+          daysOfCover: suggestions[item._id]?.daysOfCover,
         }
       })
 
     // 기존 상태 유지(승인/거절) 후 새 데이터 병합
     setOrderRequests((prev) => mergeOrderRequests(next, prev))
-  }, [items])
+  }, [items, suggestions])
 
   // 승인/거절 상태 로컬 저장
   useEffect(() => {
@@ -406,7 +437,7 @@ const InventoryManagement = () => {
 
   const openApproveDialog = (request: OrderRequest) => {
     setApproveTarget(request)
-    setOrderQuantity(request.quantity.toString())
+    setOrderQuantity((request.suggestedQty ?? request.quantity).toString())
   }
 
   const handleApproveConfirm = async () => {
@@ -679,7 +710,8 @@ const InventoryManagement = () => {
             <CardHeader>
               <CardTitle>발주 요청 목록</CardTitle>
               <CardDescription>
-                수량 2개 이하 품목을 자동 감지해 보여줍니다.
+                수량 2개 이하 품목과 판매 추이로 재고 소진이 예상되는 품목을
+                보여줍니다.
               </CardDescription>
             </CardHeader>
             <CardContent>
@@ -691,6 +723,14 @@ const InventoryManagement = () => {
                   >
                     <div>
                       <h4 className="font-medium">{request.item}</h4>
+                      {request.suggestedQty !== undefined && (
+                        <p className="text-sm text-muted-foreground">
+                          권장 {request.suggestedQty}개
+                          {request.daysOfCover !== undefined &&
+                            request.daysOfCover < 999 &&
+                            ` · 약 ${request.daysOfCover}일분 남음`}
+                        </p>
+                      )}
                     </div>
                     <div className="flex items-center gap-2">
                       <Button
@@ -713,7 +753,7 @@ const InventoryManagement = () => {
                 ))}
                 {pendingOrders.length === 0 && (
                   <div className="text-center text-muted-foreground py-6">
-                    2개 이하 재고가 없습니다.
+                    발주가 필요한 품목이 없습니다.
                   </div>
                 )}
               </div>
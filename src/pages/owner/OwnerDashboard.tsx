@@ -348,6 +348,9 @@ const OwnerDashboard = () => {
                     <p className="text-xs text-muted-foreground line-clamp-1">
                       {a.title}
                     </p>
+                    <p className="text-xs text-muted-foreground">
+                      읽음 {Math.min(a.readCount ?? 0, data.stats.staffCount)}/{data.stats.staffCount}명
+                    </p>
                   </div>
                 </div>
               ))}
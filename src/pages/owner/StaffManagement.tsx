@@ -56,8 +56,8 @@ type SubStatus =
 
 interface SubRequestItem {
   _id: string
-  scheduleId: {
-    _id: string
+  scheduleId: string
+  shift: {
     date: string
     startTime: string
     endTime: string
@@ -115,6 +115,7 @@ const StaffManagement = () => {
 
   const [staffList, setStaffList] = useState<Staff[]>([])
   const [weekSchedule, setWeekSchedule] = useState<DaySchedule[]>([])
+  const [weeklyHours, setWeeklyHours] = useState<Record<string, number>>({})
   const [pendingSubs, setPendingSubs] = useState<SubRequestItem[]>([])
   const [approvedSubs, setApprovedSubs] = useState<SubRequestItem[]>([])
 
@@ -151,7 +152,13 @@ const StaffManagement = () => {
 
   const fetchWeekSchedule = async () => {
     try {
-      const res = await api.get<ScheduleItem[]>('/schedule/week')
+      const [res, hoursRes] = await Promise.all([
+        api.get<ScheduleItem[]>('/schedule/week'),
+        api.get<{ staffId: string; hours: number }[]>('/schedule/hours'),
+      ])
+      setWeeklyHours(
+        Object.fromEntries((hoursRes.data ?? []).map((h) => [h.staffId, h.hours]))
+      )
       const days = ['일', '월', '화', '수', '목', '금', '토']
 
       const source = Array.isArray(res.data) ? res.data : []
@@ -429,6 +436,9 @@ const StaffManagement = () => {
                     <p className="text-xs text-muted-foreground">
                       ID: {s.username}
                     </p>
+                    <p className="text-xs text-muted-foreground">
+                      이번 주 {weeklyHours[s._id] ?? 0}시간
+                    </p>
                   </div>
 
                   <Button
@@ -557,7 +567,7 @@ const StaffManagement = () => {
                     >
                       <div>
                         <p>
-                          {r.scheduleId?.date?.split('T')[0]} / {r.scheduleId?.startTime}~{r.scheduleId?.endTime}
+                          {r.shift?.date} / {r.shift?.startTime}~{r.shift?.endTime}
                         </p>
                         <p className="text-xs text-muted-foreground">
                           요청자: {r.requesterName}
@@ -607,7 +617,7 @@ const StaffManagement = () => {
                     >
                       <div>
                         <p>
-                          {r.scheduleId?.date?.split('T')[0]} / {r.scheduleId?.startTime}~{r.scheduleId?.endTime}
+                          {r.shift?.date} / {r.shift?.startTime}~{r.shift?.endTime}
                         </p>
                         <p className="text-xs text-muted-foreground">
                           요청자: {r.requesterName}
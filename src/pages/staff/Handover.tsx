@@ -53,10 +53,17 @@ interface HandoverItem {
   createdAt: string
 }
 
+interface HandoverFeed {
+  items: HandoverItem[]
+  nextCursor: string | null
+  unreadCount: number
+}
+
 const Handover = () => {
   const { toast } = useToast()
   const currentUserId = localStorage.getItem('userId')
   const [handovers, setHandovers] = useState<HandoverItem[]>([])
+  const [unreadCount, setUnreadCount] = useState(0)
   const [handoverContent, setHandoverContent] = useState('')
   const [myChecklist, setMyChecklist] = useState([
     { item: '시재 점검', done: false },
@@ -141,8 +148,11 @@ const Handover = () => {
 
   const fetchHandovers = async () => {
     try {
-      const res = await api.get<HandoverItem[]>('/handovers')
-      setHandovers(res.data)
+      const res = await api.get<HandoverFeed>('/handovers/feed', {
+        params: { limit: 10 },
+      })
+      setHandovers(res.data.items)
+      setUnreadCount(res.data.unreadCount)
     } catch (error) {
       console.error('Failed to fetch handovers', error)
     }
@@ -201,6 +211,24 @@ const Handover = () => {
     }
   }
 
+  // 쉬는 날 동안 쌓인 인수인계를 한 번에 확인
+  const handleConfirmAll = async () => {
+    try {
+      const res = await api.post<{ confirmed: number }>('/handovers/confirm-all')
+      toast({
+        title: '모두 확인 완료',
+        description: `${res.data.confirmed}건의 인수인계를 확인했습니다.`,
+      })
+      fetchHandovers()
+    } catch (error) {
+      toast({
+        title: '오류 발생',
+        description: '인수인계 확인 중 오류가 발생했습니다.',
+        variant: 'destructive',
+      })
+    }
+  }
+
   const handleSubmitHandover = async () => {
     if (!handoverContent.trim()) {
       toast({
@@ -371,8 +399,13 @@ const Handover = () => {
             </CardTitle>
           </CardHeader>
           <CardContent>
-            <div className="text-2xl font-bold">
-              {handovers.filter((h) => !h.confirmed).length}건
+            <div className="flex items-center justify-between">
+              <div className="text-2xl font-bold">{unreadCount}건</div>
+              {unreadCount > 0 && (
+                <Button variant="outline" size="sm" onClick={handleConfirmAll}>
+                  모두 확인
+                </Button>
+              )}
             </div>
           </CardContent>
         </Card>
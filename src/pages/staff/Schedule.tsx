@@ -40,8 +40,8 @@ interface MyShift {
 
 interface SubRequest {
   _id: string
-  scheduleId: {
-    _id: string
+  scheduleId: string
+  shift: {
     date: string
     startTime: string
     endTime: string
@@ -233,7 +233,7 @@ const Schedule = () => {
   }).length
 
   const workedDays = mySchedule.map((s) => parseDate(s.date))
-  const subRequestDays = subRequests.map((s) => parseDate(s.scheduleId.date))
+  const subRequestDays = subRequests.map((s) => parseDate(s.shift.date))
 
   const isDateSelected = date !== undefined
 
@@ -246,7 +246,7 @@ const Schedule = () => {
   const selectedDateSubRequests = isDateSelected
     ? subRequests.filter(
         (s) =>
-          parseDate(s.scheduleId.date).toDateString() === date?.toDateString()
+          parseDate(s.shift.date).toDateString() === date?.toDateString()
       )
     : []
 
@@ -366,7 +366,7 @@ const Schedule = () => {
                           {req.requesterName}님의 대타 요청
                         </p>
                         <p className="text-xs">
-                          {req.scheduleId.startTime} - {req.scheduleId.endTime}
+                          {req.shift.startTime} - {req.shift.endTime}
                         </p>
                       </div>
 